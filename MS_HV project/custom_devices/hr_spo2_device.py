@@ -7,6 +7,7 @@ email: nikolaijivkov@gmail.com
 # imports
 from devices.device_base import DeviceBase
 from settings.settings_base import SettingsBase, Setting
+from devices.polled_device_base import PolledDeviceBase
 from channels.channel_source_device_property import *
 
 import threading
@@ -16,7 +17,7 @@ import serial
 import sys, os
 import binascii
 
-class HrSpo2Device(DeviceBase, threading.Thread):
+class HrSpo2Device(DeviceBase, PolledDeviceBase):
 
     def __init__(self, name, core_services):
         self.__name = name
@@ -39,10 +40,9 @@ class HrSpo2Device(DeviceBase, threading.Thread):
         ## Initialize the DeviceBase interface:
         DeviceBase.__init__(self, self.__name, self.__core, settings_list, property_list)
 
-        ## Thread initialization:
-        self.__stopevent = threading.Event()
-        threading.Thread.__init__(self, name=name)
-        threading.Thread.setDaemon(self, True)
+        ## Polling initialization:
+        PolledDeviceBase.__init__(self, self.__core)
+        self.__errcount = 0
 
 
     ## Functions which must be implemented to conform to the DeviceBase
@@ -101,15 +101,14 @@ class HrSpo2Device(DeviceBase, threading.Thread):
             )
         
         self.runing = 1
-        threading.Thread.start(self)
+        self.__start_connect()
         
         return True
 
     def stop(self):
         """Stop the device driver.  Returns bool."""
-        self.__stopevent.set()
         self.runing = 0
-        time.sleep(1)
+        self.poll_stop()
         try:
             self.disconnect()
             self.s.close()
@@ -126,12 +125,47 @@ class HrSpo2Device(DeviceBase, threading.Thread):
         cd = cm.channel_database_get()
         return cd.channel_list()
     
-    # Threading related functions:
+    # Connection related functions:
     
+    def __start_connect(self, reconnect=0):
+        # Connecting waits on the modem for seconds at a time, which must
+        # not hold up the shared scheduler: it is done on a thread of its
+        # own which starts polling once connected.
+        connector = threading.Thread(target=self.__connect_and_poll,
+                                     args=(reconnect,),
+                                     name=self.__name + "_connect")
+        connector.setDaemon(True)
+        connector.start()
+
+    def __connect_and_poll(self, reconnect):
+        if not reconnect:
+            #self.s = serial.Serial(port=0, baudrate=9600, parity='N', stopbits=1, timeout=1)
+            self.s = serial.Serial(
+               0, #port number
+               baudrate=9600, #baudrate
+               bytesize=serial.EIGHTBITS, #number of databits
+               parity=serial.PARITY_NONE, #enable parity checking
+               stopbits=serial.STOPBITS_ONE, #number of stopbits
+               timeout=1, #set a timeout value
+               xonxoff=0, #enable software flow control
+               rtscts=0, #enable RTS/CTS flow control
+            )
+        else:
+            self.s.setTimeout(1)
+
+        if(self.connect(reconnect)):
+            return
+
+        # polls only pick up what arrived since the previous one:
+        self.s.setTimeout(0)
+        self.s.flushInput()
+        self.poll_start()
+
     def connect(self, reconnect=0):
+        abort = 1
         self.s.flushInput()
         if(reconnect):
-            while True:
+            while self.runing:
                 self.s.write('ATD\r\n')
                 time.sleep(4)
                 data = self.s.read(30).strip('\r\n')
@@ -158,7 +192,7 @@ class HrSpo2Device(DeviceBase, threading.Thread):
             time.sleep(0.5)
             print(self.s.read(10).strip('\r\n'))
             
-            while True:
+            while self.runing:
                 self.s.write('ATD001C050018EA\r\n')
                 time.sleep(4)
                 data = self.s.read(30).strip('\r\n')
@@ -171,7 +205,7 @@ class HrSpo2Device(DeviceBase, threading.Thread):
             
             if(not abort):
                 data = binascii.unhexlify('027002020803')
-                s.write(data)#+'\r\n')
+                self.s.write(data)#+'\r\n')
                 time.sleep(0.5)
                 print(self.s.read(10))
     
@@ -190,65 +224,50 @@ class HrSpo2Device(DeviceBase, threading.Thread):
         time.sleep(0.5)
         print(self.s.read(10).strip('\r\n'))
         
-    def run(self):
-        """run when our device driver thread is started"""
-        # Calculate Sleep time from update_rate
+    # Polling related functions:
+
+    def poll_interval(self):
+        # Calculate the poll interval from sample_rate_ms, at least a second
         try:
-            SLEEP = SettingsBase.get_setting(self, "sample_rate_ms") / 1000.0
+            return max(SettingsBase.get_setting(self, "sample_rate_ms") / 1000.0,
+                       1.0)
         except:
-            SLEEP = 1.0
-        
-        #self.s = serial.Serial(port=0, baudrate=9600, parity='N', stopbits=1, timeout=1)
-        self.s = serial.Serial(
-           0, #port number
-           baudrate=9600, #baudrate
-           bytesize=serial.EIGHTBITS, #number of databits
-           parity=serial.PARITY_NONE, #enable parity checking
-           stopbits=serial.STOPBITS_ONE, #number of stopbits
-           timeout=1, #set a timeout value
-           xonxoff=0, #enable software flow control
-           rtscts=0, #enable RTS/CTS flow control
-        )
-        
-        abort = self.connect()
-        
-        while(self.runing):
-            errcount = 0
-            try:
-                ########################################
-                self.s.flushInput()#self.s.flushOutput()
-                ########################################
-                time.sleep(SLEEP)
-                if(SLEEP < 1.0): time.sleep(1.0 - SLEEP)
-                
-                data = self.s.read(4)
-                if(data == ''): raise Exception('no data')
-                #print data
-                xdata0 = int(binascii.hexlify(data[0]), 16)
-                xdata1 = int(binascii.hexlify(data[1]), 16)
-                xdata2 = int(binascii.hexlify(data[2]), 16)
-                
-                hr = ((xdata0 & 0x03) << 7) | (xdata1 & 0x7f)
-                spo2 = xdata2
-                
-                print 'Heart Rate:' + str(hr)
-                self.property_set('Heart Rate', Sample(0, str(hr), 'BPM'))
-                print 'Blood Oxygen Saturation :' + str(spo2)
-                self.property_set('Blood Oxygen Saturation ', Sample(0, str(spo2), '%'))
-            except Exception, e:
-                print 'Exception: %s\n' % e
-                if(errcount % 5 == 0):
-                    time.sleep(10)
-                if(errcount > 20):    
-                    errcount = 0
-                    sys.stderr.write('Connection Lost! Trying to reconect...\n')
-                    if(self.connect(1)):
-                        self.runing = 0
-                #if(errcount > 1000):
-                #    self.runing = 0
-                else:
-                    errcount += 1
-        print 'Exiting'
+            return 1.0
+
+    def poll(self):
+        """called by the scheduler every poll_interval() seconds"""
+        try:
+            data = self.s.read(4)
+            ########################################
+            self.s.flushInput()#self.s.flushOutput()
+            ########################################
+            if(data == ''): raise Exception('no data')
+            #print data
+            xdata0 = int(binascii.hexlify(data[0]), 16)
+            xdata1 = int(binascii.hexlify(data[1]), 16)
+            xdata2 = int(binascii.hexlify(data[2]), 16)
+            
+            hr = ((xdata0 & 0x03) << 7) | (xdata1 & 0x7f)
+            spo2 = xdata2
+            
+            print 'Heart Rate:' + str(hr)
+            self.property_set('Heart Rate', Sample(0, str(hr), 'BPM'))
+            print 'Blood Oxygen Saturation :' + str(spo2)
+            self.property_set('Blood Oxygen Saturation ', Sample(0, str(spo2), '%'))
+            # only consecutive read failures count towards a reconnect:
+            self.__errcount = 0
+        except Exception, e:
+            print 'Exception: %s\n' % e
+            if(self.__errcount > 20):    
+                self.__errcount = 0
+                sys.stderr.write('Connection Lost! Trying to reconect...\n')
+                self.poll_stop()
+                self.__start_connect(1)
+                return
+            self.__errcount += 1
+            if(self.__errcount % 5 == 0):
+                # back off for a while before the next read
+                return 10
 
 # internal functions & classes
 
@@ -7,6 +7,7 @@ email: nikolaijivkov@gmail.com
 """
 
 # imports
+import os
 import traceback
 from devices.device_base import DeviceBase
 from presentations.presentation_base import PresentationBase
@@ -15,6 +16,7 @@ from channels.channel_source_device_property import *
 from channels.channel import \
     PERM_GET, PERM_SET, PERM_REFRESH, \
     OPT_AUTOTIMESTAMP, OPT_DONOTLOG, OPT_DONOTDUMPDATA
+from channels.channel_publisher import DELIVERY_ASYNC, pattern_match
 from samples.sample import Sample
 import threading
 import time, datetime
@@ -25,22 +27,39 @@ import etree.ElementTree as ET
 import sys
 from xml.dom import minidom
 import Queue
+try:
+    import zlib
+except ImportError:
+    zlib = None
 from healthvaultlib.settings import *
-from healthvaultlib.healthvault import HealthVaultConn
+from healthvaultlib.healthvault import HealthVaultConn, new_transport
 import python_ccr_creator
+from hv_outbox import Outbox
 
 if sys.platform.startswith('digi'):
     path = 'WEB/python/'
 else:
     path = 'C:/'
 
+# prop_set_input writes to the serial port, keep it off the threads
+# producing the samples:
+SUBSCRIBE_QUEUE_SIZE = 256
+
+# queued samples are moved to the outbox once this many are waiting:
+SPOOL_THRESHOLD = 256
+
+CCR_TYPE = "1e1ccbfc-a55d-4d91-8940-fa2fbf73c195"
+
+# CCR documents are written to this file in the outbox directory and
+# streamed from there:
+CCR_FILE = 'upload.xml'
+
 class MSHealthVault(PresentationBase, threading.Thread):
     
     def __init__(self, name, core_services):
         self.__name = name
         self.__core = core_services
         ## Settings Table Definition:
-        self.queue = Queue.Queue()
         settings_list = [
             Setting(
                 name='server_ip', type=str, required=False,
@@ -48,9 +67,40 @@ class MSHealthVault(PresentationBase, threading.Thread):
             Setting(
                 name='server_port', type=int, required=False,
                 default_value="8081"),
+            # threads serving the web pages, so that a page waiting on
+            # HealthVault does not hold up the others:
+            Setting(
+                name='server_workers', type=int, required=False,
+                default_value=4),
             Setting(
                 name='tx_interval', type=int, required=False,
                 default_value=30),
+            Setting(
+                name='outbox_dir', type=str, required=False,
+                default_value=path + 'hv_outbox'),
+            Setting(
+                name='outbox_max_bytes', type=int, required=False,
+                default_value=512 * 1024),
+            Setting(
+                name='retry_max_interval', type=int, required=False,
+                default_value=1800),
+            # HealthVault record name -> list of channel name patterns
+            # uploaded to that record; other channels go to the selected
+            # record:
+            Setting(
+                name='records', type=dict, required=False,
+                default_value={}),
+            Setting(
+                name='upload_workers', type=int, required=False,
+                default_value=2),
+            # limits of a single uploaded CCR document; a backlog is sent
+            # as several documents:
+            Setting(
+                name='ccr_max_samples', type=int, required=False,
+                default_value=500),
+            Setting(
+                name='ccr_max_bytes', type=int, required=False,
+                default_value=512 * 1024),
         ]
         
         ## Channel Properties Definition:
@@ -71,6 +121,16 @@ class MSHealthVault(PresentationBase, threading.Thread):
         html_path = APP_ADDR_PORT + http_path
         
         self.hvconn = None
+        # one keep-alive connection pool shared by every HealthVaultConn
+        # this presentation creates:
+        self.hv_transport = new_transport()
+        # one _RecordRoute per configured record, the selected record's
+        # route last:
+        self.routes = []
+        self.__default_route = None
+        self.__channel_routes = {}
+        self.__upload_queue = Queue.Queue()
+        self.__upload_workers = 0
         self.subscribed_channels = []
         self.tx_started = False
         self.hv_ccr_pump_runing = False
@@ -129,7 +189,7 @@ class MSHealthVault(PresentationBase, threading.Thread):
         
         @get(http_path + 'create')
         def CreateAppInstance(request):
-            self.hvconn = HealthVaultConn(path)
+            self.hvconn = HealthVaultConn(path, transport=self.hv_transport)
             
             d = {}
             d['appid'] = HV_APPID
@@ -174,8 +234,9 @@ class MSHealthVault(PresentationBase, threading.Thread):
             self.hvconn.getAuthorizedPeople()
             #users = ''
             html = html_header
-            for i in self.hvconn.user_dict:
-                name = self.hvconn.user_dict[i]["name"]
+            user_dict = self.hvconn.user_dict
+            for i in user_dict:
+                name = user_dict[i]["name"]
                 html += '\
                 <a href="' + html_path + 'select/' + name.replace(' ', '_') + '" target="_self">' + name + '</a>\
                 <br><br>'
@@ -193,8 +254,9 @@ class MSHealthVault(PresentationBase, threading.Thread):
                 message = 'User already selected.'
             else:
                 message = 'User not found.'
-                for i in self.hvconn.user_dict:
-                    if name == self.hvconn.user_dict[i]["name"]:
+                user_dict = self.hvconn.user_dict
+                for i in user_dict:
+                    if name == user_dict[i]["name"]:
                         found = 1
                         self.hvconn.userSelect(name)
                         self.hv_ccr_pump_reset()
@@ -328,38 +390,24 @@ class MSHealthVault(PresentationBase, threading.Thread):
             if(self.hvconn == None):
                 raise Redirect(APP_ADDR_PORT + '/create')
             
+            route = self.__default_route
             try:
-                personaldemographic = "92ba621e-66b3-4a01-bd73-74844aed4f5b"
-                ccr = "1e1ccbfc-a55d-4d91-8940-fa2fbf73c195"
-                
-                response_str = self.hvconn.getBasicThing(personaldemographic)
-                
-                dom = minidom.parseString(response_str)
-                
-                node = dom.getElementsByTagName("first")
-                first_name = node.pop().firstChild.nodeValue    
-                
-                node = dom.getElementsByTagName("last")
-                family_name = node.pop().firstChild.nodeValue    
-                
-                node = dom.getElementsByTagName("y")
-                year = node.pop().firstChild.nodeValue
-                
-                node = dom.getElementsByTagName("m")
-                month = node.pop().firstChild.nodeValue
-                
-                node = dom.getElementsByTagName("d")
-                day = node.pop().firstChild.nodeValue
-                
-                date_of_birth = year + '-' + month + '-' + day
-        
+                name, date_of_birth = self.get_demographics()
+                route.spool()
+                if self.send_outbox(route, None, name, date_of_birth):
+                    message = 'Outbox sent.'
+                else:
+                    message = 'Upload failed, %d batches pending.' % \
+                              route.outbox.pending()
             except:
                 traceback.print_exc()
-                
-            ccr_xml = self.Channels_to_CCR(first_name, family_name, date_of_birth)
-            response_str = self.hvconn.putBasicThing(ccr, ccr_xml)
+                message = 'Upload failed.'
             
-            return Response(response_str, content_type='text/xml')
+            html = html_header + message + '\
+                <br><br>\
+                <a href="' + html_path + 'index" target="_self">Back to Index Page</a>'
+            html += html_footer
+            return Response(html, content_type='text/html')
         
     def apply_settings(self):
         """\
@@ -381,6 +429,33 @@ class MSHealthVault(PresentationBase, threading.Thread):
 
     def start(self):
         """Start the device driver.  Returns bool."""
+        outbox_dir = SettingsBase.get_setting(self, "outbox_dir")
+        max_bytes = SettingsBase.get_setting(self, "outbox_max_bytes")
+        routes = []
+        records = SettingsBase.get_setting(self, "records")
+        for record_name, patterns in records.items():
+            if isinstance(patterns, str):
+                patterns = [ patterns ]
+            outbox = Outbox(os.path.join(outbox_dir, _file_name(record_name)),
+                            max_bytes)
+            routes.append(_RecordRoute(record_name, patterns, outbox))
+        self.__default_route = _RecordRoute(None, [ ],
+                                            Outbox(outbox_dir, max_bytes))
+        routes.append(self.__default_route)
+        self.routes = routes
+        for route in routes:
+            if route.outbox.pending():
+                print "HealthVault outbox %s: %d batches left from last run" \
+                      % (route.outbox.directory, route.outbox.pending())
+        
+        workers = SettingsBase.get_setting(self, "upload_workers")
+        self.hv_transport.max_idle = max(self.hv_transport.max_idle, workers)
+        for i in range(workers):
+            worker = threading.Thread(target=self.upload_worker,
+                                      name='%s_upload%d' % (self.__name, i))
+            worker.setDaemon(True)
+            worker.start()
+        self.__upload_workers = workers
         threading.Thread.start(self)
         return True
 
@@ -390,6 +465,12 @@ class MSHealthVault(PresentationBase, threading.Thread):
         #self.hv_ccr_pump_runing = False
         self.hv_ccr_pump_stoped = True
         self.__stopevent.set()
+        for i in range(self.__upload_workers):
+            self.__upload_queue.put(None)
+        for route in self.routes:
+            route.spool()
+            route.outbox.close()
+        self.hv_transport.close()
         return True
                 
     ## HealthVault help functions:
@@ -399,11 +480,14 @@ class MSHealthVault(PresentationBase, threading.Thread):
         try:
             if(source_name == None):
                 print 'subscribe to all channels'
-                cp.subscribe_to_all(self.prop_set_input)
+                cp.subscribe_pattern('*', self.prop_set_input,
+                                     delivery=DELIVERY_ASYNC,
+                                     queue_size=SUBSCRIBE_QUEUE_SIZE)
             else:
                 print 'subscribe to a specific channel: ', source_name
-                cp.subscribe(source_name, self.prop_set_input)
-            #cp.subscribe_new_channels(self.subscriber) #this is going to subscribe to all new channels!!!
+                cp.subscribe(source_name, self.prop_set_input,
+                             delivery=DELIVERY_ASYNC,
+                             queue_size=SUBSCRIBE_QUEUE_SIZE)
         except:
             traceback.print_exc()
         return True
@@ -426,28 +510,162 @@ class MSHealthVault(PresentationBase, threading.Thread):
     def prop_set_input(self, sample):
         if(not isinstance(sample, Sample)):
             
-            channel_name = sample.name().split('.')[1]
+            full_name = sample.name()
+            channel_name = full_name.split('.')[1]
             sample = sample.get()
             if self.sd!= None:
                 self.sd.write(sample.value)
-            self.queue.put((sample, channel_name))
+            for route in self.routes_for(full_name):
+                route.queue.put((sample, channel_name))
+                if route.queue.qsize() >= SPOOL_THRESHOLD:
+                    route.spool()
             
             #print 'New sample arived in channel: ', channel_name
         return True
     
-    def Channels_to_CCR(self, name, date_of_birth):
-        if self.queue.empty():
-            return False
-        x = {}
-        size = self.queue.qsize()
-        for i in range(0, size):
-            x[i] = self.queue.get()
-            #sample, sample_name = x[i]
+    def routes_for(self, channel_name):
+        """\
+        Return the routes of the records channel_name is uploaded to.
+        """
+        try:
+            return self.__channel_routes[channel_name]
+        except KeyError:
+            pass
+        routes = [ ]
+        for route in self.routes:
+            for pattern in route.patterns:
+                if pattern_match(pattern, channel_name):
+                    routes.append(route)
+                    break
+        if not routes:
+            routes.append(self.__default_route)
+        self.__channel_routes[channel_name] = routes
+        return routes
+    
+    def write_ccr(self, out, outbox, name, date_of_birth, max_samples,
+                  max_bytes):
+        """\
+        Write a CCR document of the oldest outbox batches to the file
+        out, stopping before max_samples samples or once max_bytes are
+        written.  Returns the ID of the last batch included, None if
+        the outbox is empty.
+        """
+        writer = python_ccr_creator.CCRWriter(out, name, date_of_birth)
+        samples = 0
+        last_id = None
+        for batch_id, payload in outbox.batches():
+            results = _decode_samples(payload)
+            if last_id is None:
+                writer.start()
+            elif (samples + len(results) > max_samples or
+                  out.tell() >= max_bytes):
+                break
+            for timestamp, channel_name, value, unit in results:
+                writer.add_result(channel_name, value, unit, timestamp)
+            samples += len(results)
+            last_id = batch_id
+        if last_id is None:
+            return None
+        writer.finish()
+        out.write('\n<common><note>ccr_' + writer.object_id +
+                  '.xml</note></common>')
+        return last_id
+    
+    def send_outbox(self, route, record, name, date_of_birth):
+        """\
+        Upload the route's outbox batches to record, oldest first, as
+        CCR documents bounded by ccr_max_samples and ccr_max_bytes.
+        Returns False as soon as an upload fails; the batches of that
+        document stay in the outbox.
+        """
+        max_samples = SettingsBase.get_setting(self, "ccr_max_samples")
+        max_bytes = SettingsBase.get_setting(self, "ccr_max_bytes")
+        route.send_lock.acquire()
+        try:
+            while 1:
+                # the document is streamed from disk when signed and
+                # sent, so only one batch at a time is held in memory:
+                ccr_file = open(os.path.join(route.outbox.directory,
+                                             CCR_FILE), 'w+b')
+                try:
+                    last_id = self.write_ccr(ccr_file, route.outbox, name,
+                                    date_of_birth, max_samples, max_bytes)
+                    if last_id is None:
+                        return True
+                    response_str = self.hvconn.putBasicThing(CCR_TYPE,
+                                                             ccr_file, record)
+                finally:
+                    ccr_file.close()
+                # putBasicThing() returns the response document on
+                # success and an error message otherwise:
+                if response_str is None or not response_str.startswith('<'):
+                    print response_str
+                    return False
+                route.outbox.ack(last_id)
+        finally:
+            route.send_lock.release()
+    
+    def upload_worker(self):
+        """\
+        Upload the routes the CCR pump hands over until stopped.
+        """
+        while 1:
+            route = self.__upload_queue.get()
+            if route is None:
+                return
+            sent = False
+            try:
+                if route.name is None:
+                    record = None
+                else:
+                    record = self.hvconn.findRecord(route.name)
+                    if record is None:
+                        raise ValueError, "no authorized record named '%s'" \
+                              % route.name
+                if route.demographics is None:
+                    route.demographics = self.get_demographics(record)
+                name, date_of_birth = route.demographics
+                sent = self.send_outbox(route, record, name, date_of_birth)
+            except:
+                traceback.print_exc()
+            
+            tx_interval = int(SettingsBase.get_setting(self, "tx_interval"))
+            if sent:
+                route.delay = 0
+            else:
+                route.delay = min(max(route.delay, tx_interval) * 2,
+                        int(SettingsBase.get_setting(self,
+                                                     "retry_max_interval")))
+                print "HealthVault upload to %s failed, %d batches " \
+                      "pending, retrying in %d seconds" % \
+                      (route.name or 'selected record',
+                       route.outbox.pending(), route.delay)
+            route.next_attempt = time.time() + route.delay
+            route.busy = False
+    
+    def get_demographics(self, record=None):
+        personaldemographic = "92ba621e-66b3-4a01-bd73-74844aed4f5b"
+        response_str = self.hvconn.getBasicThing(personaldemographic, record)
+        
+        dom = minidom.parseString(response_str)
+        
+        node = dom.getElementsByTagName("full")
+        name = node.pop().firstChild.nodeValue    
+        
+        try:
+            node = dom.getElementsByTagName("y")
+            year = node.pop().firstChild.nodeValue
+            
+            node = dom.getElementsByTagName("m")
+            month = node.pop().firstChild.nodeValue
+            
+            node = dom.getElementsByTagName("d")
+            day = node.pop().firstChild.nodeValue
             
-        #print "Created CCR with %s samples." % size
-        ccr_xml, ccr_id = python_ccr_creator.CCR_gen(name, date_of_birth, x)
-        ccr_xml += '\n<common><note>ccr_' + ccr_id + '.xml</note></common>'
-        return ccr_xml
+            date_of_birth = '%s-%s-%s' % (year, month, day)
+        except:
+            date_of_birth = 'unknown'
+        return name, date_of_birth
     
     def hv_ccr_pump_start(self):
         if self.hv_ccr_pump_runing:
@@ -482,39 +700,25 @@ class MSHealthVault(PresentationBase, threading.Thread):
         self.hv_ccr_pump_restart = False
         tx_interval = int(SettingsBase.get_setting(self, "tx_interval"))
         
-        personaldemographic = "92ba621e-66b3-4a01-bd73-74844aed4f5b"
-        ccr = "1e1ccbfc-a55d-4d91-8940-fa2fbf73c195"
-        
-        response_str = self.hvconn.getBasicThing(personaldemographic)
-        
-        dom = minidom.parseString(response_str)
-        
-        node = dom.getElementsByTagName("full")
-        name = node.pop().firstChild.nodeValue    
-        
-        try:
-            node = dom.getElementsByTagName("y")
-            year = node.pop().firstChild.nodeValue
-            
-            node = dom.getElementsByTagName("m")
-            month = node.pop().firstChild.nodeValue
-            
-            node = dom.getElementsByTagName("d")
-            day = node.pop().firstChild.nodeValue
-            
-            date_of_birth = '%s-%s-%s' % (year, month, day)
-        except:
-            date_of_birth = 'unknown'
+        # the record selection may have changed since the last run:
+        for route in self.routes:
+            route.demographics = None
+            route.next_attempt = 0
         
+        # every tx_interval the queued samples are spooled to the
+        # outboxes and the routes with pending batches are handed to the
+        # upload workers, so one slow record does not hold up the
+        # others; failed uploads are retried with exponential backoff:
         self.hv_ccr_pump_stoped = False
         while self.hv_ccr_pump_stoped==False:#self.hv_ccr_pump_runing:
             time.sleep(tx_interval)
-            
-            ccr_res = self.Channels_to_CCR(name, date_of_birth)
-            if ccr_res != False:
-                ccr_xml = ccr_res
-                response_str = self.hvconn.putBasicThing(ccr, ccr_xml)
-                print response_str
+            now = time.time()
+            for route in self.routes:
+                route.spool()
+                if (not route.busy and route.next_attempt <= now and
+                    route.outbox.pending()):
+                    route.busy = True
+                    self.__upload_queue.put(route)
         self.hv_ccr_pump_runing = False
         
         if self.hv_ccr_pump_restart:
@@ -547,7 +751,8 @@ class MSHealthVault(PresentationBase, threading.Thread):
             secret = fd.readline()
             token = fd.readline()
             fd.close()
-            self.hvconn = HealthVaultConn(path, id, secret, token)
+            self.hvconn = HealthVaultConn(path, id, secret, token,
+                                          transport=self.hv_transport)
         except:
             traceback.print_exc()
             if fd != None: fd.close()
@@ -555,8 +760,8 @@ class MSHealthVault(PresentationBase, threading.Thread):
         
         ip = SettingsBase.get_setting(self, "server_ip")
         port = int(SettingsBase.get_setting(self, "server_port"))
-        server = 'wsgiref'
-        run_itty(server, ip, port)
+        workers = SettingsBase.get_setting(self, "server_workers")
+        run_itty('threadpool', ip, port, workers=workers)
              
 # internal functions & classes
     def get_properties(self):
@@ -564,6 +769,72 @@ class MSHealthVault(PresentationBase, threading.Thread):
         cd = cm.channel_database_get()
         return cd.channel_list()
     
+class _RecordRoute(object):
+    """\
+    Upload state of one HealthVault record: the samples queued for it,
+    its outbox and its retry schedule.  The route with name None
+    uploads to the selected record.
+    """
+    def __init__(self, name, patterns, outbox):
+        self.name = name
+        self.patterns = patterns
+        self.queue = Queue.Queue()
+        self.outbox = outbox
+        self.send_lock = threading.Lock()
+        self.demographics = None
+        self.busy = False
+        self.delay = 0
+        self.next_attempt = 0
+        self.__spool_lock = threading.Lock()
+    
+    def spool(self):
+        """\
+        Move the queued samples into the outbox as one batch.
+        """
+        self.__spool_lock.acquire()
+        try:
+            samples = []
+            try:
+                while 1:
+                    samples.append(self.queue.get_nowait())
+            except Queue.Empty:
+                pass
+            batch_id = None
+            for i in range(0, len(samples), SPOOL_THRESHOLD):
+                batch_id = self.outbox.append(
+                    _encode_samples(samples[i:i + SPOOL_THRESHOLD]))
+            return batch_id
+        finally:
+            self.__spool_lock.release()
+
+def _file_name(name):
+    return ''.join([ (c.isalnum() and c) or '_' for c in name ])
+
+def _encode_samples(samples):
+    # one "timestamp<TAB>channel<TAB>value<TAB>unit" line per sample,
+    # compressed when zlib is available:
+    lines = []
+    for sample, channel_name in samples:
+        lines.append('%r\t%s\t%s\t%s' % (sample.timestamp, channel_name,
+                         str(sample.value).encode('string_escape'),
+                         str(sample.unit).encode('string_escape')))
+    payload = '\n'.join(lines)
+    if zlib is not None:
+        payload = zlib.compress(payload)
+    return payload
+
+def _decode_samples(payload):
+    # a zlib stream starts with 'x', plain lines with a timestamp:
+    if payload[:1] == 'x':
+        payload = zlib.decompress(payload)
+    results = []
+    for line in payload.split('\n'):
+        timestamp, channel_name, value, unit = line.split('\t')
+        results.append((float(timestamp), channel_name,
+                        value.decode('string_escape'),
+                        unit.decode('string_escape')))
+    return results
+
 def main():
     pass
 
@@ -36,6 +36,10 @@ changes made to support cleaner execution on Digi devices.
 # to allow for pre-emption.  "timefunc" and "delayfunc" were
 # removed from the __init__ routine as a consequence.
 
+# Canceling an event only marks it; canceled events are dropped when
+# they reach the head of the queue, or all at once when they make up
+# most of it.  Periodic events are supported with enterperiodic().
+
 import heapq
 from time import time as timefunc
 from threading import Condition
@@ -43,7 +47,38 @@ from core.tracing import get_tracer
 
 import traceback
 
-__all__ = ["scheduler"]
+__all__ = ["scheduler", "Event"]
+
+# Event states:
+PENDING = 0
+CANCELED = 1
+DONE = 2
+
+# The queue is compacted when it holds more than this many canceled
+# events and they outnumber the pending ones:
+COMPACT_MIN = 64
+
+class Event(object):
+    """
+    A scheduled event, as returned by the `enter` functions of
+    :class:`scheduler` to be used as an ID for the event.
+
+    """
+    __slots__ = ('time', 'priority', 'action', 'argument', 'interval',
+                 'state', 'queued')
+
+    def __init__(self, time, priority, action, argument, interval=None):
+        self.time = time
+        self.priority = priority
+        self.action = action
+        self.argument = argument
+        self.interval = interval
+        self.state = PENDING
+        self.queued = False
+
+    def __repr__(self):
+        return "Event(%r, %r, %r, %r)" % (self.time, self.priority,
+                                          self.action, self.argument)
 
 class scheduler:
     """
@@ -74,8 +109,13 @@ class scheduler:
 
     def __init__(self):
         """Initialize a new instance"""
+        # heap of (time, priority, sequence, Event):
         self.queue = []
         self.__preemption_condition = Condition()
+        self.__sequence = 0
+        self.__canceled = 0
+        self.__stats = { 'fired': 0, 'canceled': 0, 'late_total': 0.0,
+                         'late_max': 0.0, 'late_last': 0.0, 'max_depth': 0 }
 
         self.__tracer = get_tracer('digi_sched')
 
@@ -98,11 +138,10 @@ class scheduler:
         if necessary.
 
         """
-        event = time, priority, action, argument
+        event = Event(time, priority, action, argument)
         self.__preemption_condition.acquire()
         try:
-            heapq.heappush(self.queue, event)
-            self.__preemption_condition.notify()
+            self.__push(event)
         finally:
             self.__preemption_condition.release()
 
@@ -119,6 +158,33 @@ class scheduler:
         time = timefunc() + delay
         return self.enterabs(time, priority, action, argument)
 
+    def enterperiodic(self, interval, priority, action, argument,
+                      delay=None):
+        """Enter an event which occurs every `interval` seconds.
+
+        The first occurrence is after `delay` seconds, or `interval`
+        seconds if `delay` is None.  Later occurrences are at whole
+        multiples of `interval` after the first one, skipping those
+        missed if the scheduler got behind.
+
+        The event recurs until it is canceled with the returned ID.
+
+        """
+        if interval <= 0:
+            raise ValueError, "interval must be positive"
+        if delay is None:
+            delay = interval
+
+        event = Event(timefunc() + delay, priority, action, argument,
+                      interval)
+        self.__preemption_condition.acquire()
+        try:
+            self.__push(event)
+        finally:
+            self.__preemption_condition.release()
+
+        return event
+
     def cancel(self, event):
         """Remove an event from the queue.
 
@@ -128,15 +194,56 @@ class scheduler:
         """
         self.__preemption_condition.acquire()
         try:
-            self.queue.remove(event)
-            heapq.heapify(self.queue)
-            self.__preemption_condition.notify()
+            if getattr(event, 'state', None) != PENDING:
+                raise ValueError, "event is not scheduled"
+            event.state = CANCELED
+            self.__stats['canceled'] += 1
+            if event.queued:
+                self.__canceled += 1
+                if (self.__canceled > COMPACT_MIN and
+                    self.__canceled * 2 > len(self.queue)):
+                    self.__compact()
+        finally:
+            self.__preemption_condition.release()
+
+    def clear(self):
+        """Cancel all events in the queue."""
+        self.__preemption_condition.acquire()
+        try:
+            for entry in self.queue:
+                entry[3].state = CANCELED
+            del self.queue[:]
+            self.__canceled = 0
         finally:
             self.__preemption_condition.release()
 
     def empty(self):
         """Check whether the queue is empty."""
-        return not self.queue
+        return len(self.queue) == self.__canceled
+
+    def stats(self):
+        """Return a dictionary of statistics of the scheduler:
+
+        * fired - number of events executed
+        * canceled - number of events canceled
+        * late_last, late_max, late_avg - seconds events were executed
+          after their time: the last one, the most and on average
+        * depth - number of events in the queue
+        * max_depth - the most events there have been in the queue
+
+        """
+        self.__preemption_condition.acquire()
+        try:
+            stats = self.__stats.copy()
+            stats['depth'] = len(self.queue) - self.__canceled
+        finally:
+            self.__preemption_condition.release()
+
+        stats['late_avg'] = 0.0
+        if stats['fired']:
+            stats['late_avg'] = stats['late_total'] / stats['fired']
+        del stats['late_total']
+        return stats
 
     def run(self):
         """Execute events until the queue is empty.
@@ -160,39 +267,88 @@ class scheduler:
 
         """
         q = self.queue
+        stats = self.__stats
         while True:
             self.__preemption_condition.acquire()
-            if not q:
+            try:
+                # drop canceled events:
+                while q and q[0][3].state != PENDING:
+                    heapq.heappop(q)[3].queued = False
+                    self.__canceled -= 1
+                if not q:
+                    break
+
+                time = q[0][0]
+                now = timefunc()
+                if now < time:
+                    self.__preemption_condition.wait(time - now)
+                    continue
+
+                event = heapq.heappop(q)[3]
+                event.queued = False
+                if event.interval is None:
+                    event.state = DONE
+
+                late = now - time
+                stats['fired'] += 1
+                stats['late_last'] = late
+                stats['late_total'] += late
+                if late > stats['late_max']:
+                    stats['late_max'] = late
+            finally:
                 self.__preemption_condition.release()
-                break
 
-            time, _, action, argument = checked_event = q[0]
-            now = timefunc()
-            if now < time:
-                self.__preemption_condition.wait(time - now)
-                self.__preemption_condition.release()
-            else:
+            try:
+                event.action(*event.argument)
+            except Exception:
+                self.__tracer.error(
+                    ('Exception calling %s with args: \'%s\'.' +
+                     '\n\tDeleting scheduled event.')
+                     % (event.action, event.argument))
+
+                self.__tracer.debug(traceback.format_exc())
+                if event.interval is not None:
+                    self.__preemption_condition.acquire()
+                    event.state = DONE
+                    self.__preemption_condition.release()
+
+            if event.interval is not None:
+                self.__preemption_condition.acquire()
                 try:
-                    event = heapq.heappop(q)
-                    # Verify that the event was not removed or altered
-                    # by another thread after we last looked at q[0].
-                    if event == None or not isinstance(event, tuple):
-                        pass
-                    elif event is checked_event:
-                        self.__preemption_condition.release()
-                        try:
-                            action(*argument)
-                        except Exception:
-                            self.__tracer.error(
-                                ('Exception calling %s with args: \'%s\'.' +
-                                 '\n\tDeleting scheduled event.')
-                                 % (action, argument))
-
-                            self.__tracer.debug(traceback.format_exc())
-
-                        self.__preemption_condition.acquire()
-                        del event
-                    else:
-                        heapq.heappush(q, event)
+                    # the action may have canceled the event:
+                    if event.state == PENDING:
+                        event.time += event.interval
+                        now = timefunc()
+                        if event.time <= now:
+                            missed = int((now - event.time) /
+                                         event.interval) + 1
+                            event.time += missed * event.interval
+                        self.__push(event)
                 finally:
                     self.__preemption_condition.release()
+
+    def __push(self, event):
+        # Called with the condition held.
+        q = self.queue
+        self.__sequence += 1
+        heapq.heappush(q, (event.time, event.priority, self.__sequence,
+                           event))
+        event.queued = True
+        depth = len(q) - self.__canceled
+        if depth > self.__stats['max_depth']:
+            self.__stats['max_depth'] = depth
+        # only an event due before the one being waited for needs to
+        # wake the scheduler:
+        if q[0][3] is event:
+            self.__preemption_condition.notify()
+
+    def __compact(self):
+        # Called with the condition held.  The list is modified in place
+        # as run() holds a reference to it.
+        q = self.queue
+        for entry in q:
+            if entry[3].state != PENDING:
+                entry[3].queued = False
+        q[:] = [ entry for entry in q if entry[3].state == PENDING ]
+        heapq.heapify(q)
+        self.__canceled = 0
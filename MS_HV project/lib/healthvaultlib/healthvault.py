@@ -19,23 +19,38 @@
 #OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 #THE SOFTWARE.
 import time, datetime
+import threading
 import wsgiref.handlers
 import base64
-try:
-    import digi_httplib as httplib
-except:
-    import httplib
 import urllib
 from xml.dom import minidom
-import hmac
+from hvsigner import HVSigner, REQUEST_TAIL
+from hvtransport import HTTPSPool
 from settings import *
 try:
     from hashlib import sha1
 except:
     from sha import sha as sha1
 
+# data_xml files are hashed in blocks of this size:
+FILE_BLOCK = 16384
+
+def new_transport():
+    return HTTPSPool(HV_SERVICE_SERVER, HV_SERVICE_PORT, HV_SERVICE_PATH,
+                     idle_timeout=HV_IDLE_TIMEOUT, timeout=HV_SOCKET_TIMEOUT)
+
 class HealthVaultConn(object):
-    def __init__(self, path='', id=None, secret=None, token=None):
+    # The connection is shared by threads: the session token and signer,
+    # and the selected record, are replaced together under
+    # __session_lock; user_dict is replaced whole, never modified in
+    # place.
+    user_dict = {}
+
+    def __init__(self, path='', id=None, secret=None, token=None, transport=None):
+        self.__session_lock = threading.Lock()
+        if transport is None:
+            transport = new_transport()
+        self.transport = transport
         if(id == None and secret == None and token == None):
             header = '<header><method>NewApplicationCreationInfo</method><method-version>1</method-version><app-id>' + HV_APPID + '</app-id><language>en</language><country>US</country><msg-time>' + self.time_gen() + '</msg-time><msg-ttl>36000</msg-ttl><version>0.0.0.1</version></header>'
             info = '<info/>'
@@ -81,10 +96,9 @@ class HealthVaultConn(object):
         #3. create info with signed content 
         content = '<content><app-id>' + self.instance_app_id + '</app-id><hmac>HMACSHA1</hmac><signing-time>' + self.time_gen() + '</signing-time></content>'
         
-        hashedcontent = hmac.new(self.instance_shared_secret, content, 'sha1')
-        hashedcontent64 = base64.encodestring(hashedcontent.digest())
+        hashedcontent64 = HVSigner(self.instance_shared_secret).digest64(content)
         
-        info = '<info><auth-info><app-id>' + self.instance_app_id + '</app-id><credential><appserver2><hmacSig algName="HMACSHA1">' + hashedcontent64.strip() + '</hmacSig>' + content + '</appserver2></credential></auth-info></info>'
+        info = '<info><auth-info><app-id>' + self.instance_app_id + '</app-id><credential><appserver2><hmacSig algName="HMACSHA1">' + hashedcontent64 + '</hmacSig>' + content + '</appserver2></credential></auth-info></info>'
         payload = '<wc-request:request xmlns:wc-request="urn:com.microsoft.wc.request">' + header + info + '</wc-request:request>'
         extra_headers = {'Content-type':'text/xml'}       
         response = self.sendRequest(payload) 
@@ -97,30 +111,28 @@ class HealthVaultConn(object):
             if code!='0': print 'Error, code key: ', code
             else:
                 for node in dom.getElementsByTagName("token"):
-                    self.auth_token = node.firstChild.nodeValue.strip()
+                    auth_token = node.firstChild.nodeValue.strip()
                 for node in dom.getElementsByTagName("shared-secret"):
                     shared_secret = node.firstChild.nodeValue.strip()
-                    self.sharedsec = base64.decodestring(shared_secret)
+                    sharedsec = base64.decodestring(shared_secret)
+                self.__session_lock.acquire()
+                try:
+                    self.auth_token = auth_token
+                    self.sharedsec = sharedsec
+                    self.signer = HVSigner(sharedsec)
+                finally:
+                    self.__session_lock.release()
         else:
             return "error occured at get auth token"
     
     def getAuthorizedPeople(self):
-        #set record-id in the hearder
-        header = '<header><method>GetAuthorizedPeople</method><method-version>1</method-version><auth-session><auth-token>' + self.auth_token + '</auth-token></auth-session><language>en</language><country>US</country><msg-time>' + self.time_gen() + '</msg-time><msg-ttl>36000</msg-ttl><version>0.0.0.1</version>'
-                            
+        auth_token, signer = self.__session()
+        header = signer.header_start('GetAuthorizedPeople', None,
+                    '<auth-token>' + auth_token + '</auth-token>')
+        
         #QUERY INFO 
         info = '<info><parameters/></info>'
-        
-        infodigest = base64.encodestring(sha1(info).digest()) 
-        headerinfo = '<info-hash><hash-data algName="SHA1">' + infodigest.strip() + '</hash-data></info-hash>'
-        header = header + headerinfo + '</header>'
-        
-        hashedheader = hmac.new(self.sharedsec, header, 'sha1')
-        hashedheader64 = base64.encodestring(hashedheader.digest())
-        
-        hauthxml = '<auth><hmac-data algName="HMACSHA1">' + hashedheader64.strip() + '</hmac-data></auth>'
-        payload = '<wc-request:request xmlns:wc-request="urn:com.microsoft.wc.request">' + hauthxml + header + info + '</wc-request:request>'
-        self.user_dict = {}
+        payload = signer.sign(header, self.time_gen(), info)
         response = self.sendRequest(payload)
         if response.status == 200:
             response_str = response.read()
@@ -128,19 +140,23 @@ class HealthVaultConn(object):
             for node in dom.getElementsByTagName("code"):
                 code = node.firstChild.nodeValue
             if code == '0': 
+                # build the new dictionary aside, other threads look up
+                # records in the current one meanwhile:
+                user_dict = {}
                 i = 0
                 for outer_node in dom.getElementsByTagName("person-info"):
                     for node in outer_node.getElementsByTagName("person-id"):
-                        self.person_id = node.firstChild.nodeValue
+                        person_id = node.firstChild.nodeValue
                     for node in outer_node.getElementsByTagName("record"):
-                        self.record_id = node.getAttribute("id")
-                        self.selected_user = node.firstChild.nodeValue
-                        
-                        self.user_dict[i] = {}
-                        self.user_dict[i]["name"] = self.selected_user
-                        self.user_dict[i]["person_id"] = self.person_id
-                        self.user_dict[i]["record_id"] = self.record_id
+                        user_dict[i] = {}
+                        user_dict[i]["name"] = node.firstChild.nodeValue
+                        user_dict[i]["person_id"] = person_id
+                        user_dict[i]["record_id"] = node.getAttribute("id")
                         i += 1
+                self.user_dict = user_dict
+                if i:
+                    # the last record is selected:
+                    self.__select(user_dict[i - 1])
             elif code == '65':#session token expired -error 65-
                 print "Session token expired, getting a new one..." 
                 self.createAuthenticatedSessionToken()
@@ -148,64 +164,50 @@ class HealthVaultConn(object):
             else: return 'error in getting authorized people - error code: %s' % code
     
     def userSelect(self, name):
-        for i in self.user_dict:
-            if name.replace('_', ' ') == self.user_dict[i]["name"]:
-                self.selected_user = self.user_dict[i]["name"]
-                self.person_id = self.user_dict[i]["person_id"]
-                self.record_id = self.user_dict[i]["record_id"]
+        user_dict = self.user_dict
+        for i in user_dict:
+            if name.replace('_', ' ') == user_dict[i]["name"]:
+                self.__select(user_dict[i])
                 break
     
-    def sendRequest(self, payload):
-        conn = httplib.HTTPSConnection(HV_SERVICE_SERVER, 443)
-        conn.putrequest('POST', '/platform/wildcat.ashx')
-        conn.putheader('Content-Type', 'text/xml')
-        conn.putheader('Content-Length', '%d' % len(payload))
-        conn.endheaders()
+    def __select(self, user):
+        self.__session_lock.acquire()
         try:
-            conn.send(payload)
-        except socket.error, v:
-            if v[0] == 32:      # Broken pipe
-                conn.close()
-            raise
-        return conn.getresponse()
+            self.selected_user = user["name"]
+            self.person_id = user["person_id"]
+            self.record_id = user["record_id"]
+        finally:
+            self.__session_lock.release()
     
-    def getThings(self, hv_datatype):
-        header = '<header>\
-                        <method>GetThings</method>\
-                        <method-version>1</method-version>\
-                        <record-id>' + self.record_id + '</record-id>\
-                        <auth-session>\
-                            <auth-token>' + self.auth_token + '</auth-token>\
-                            <offline-person-info>\
-                                <offline-person-id>' + self.person_id + '</offline-person-id>\
-                            </offline-person-info>\
-                        </auth-session>\
-                        <language>en</language>\
-                        <country>US</country>\
-                        <msg-time>' + self.time_gen() + '</msg-time>\
-                        <msg-ttl>36000</msg-ttl>\
-                        <version>0.0.0.1</version>'
-        
+    def findRecord(self, name):
+        """Return (person_id, record_id) of the authorized record name."""
+        user_dict = self.user_dict
+        for i in user_dict:
+            if name.replace('_', ' ') == user_dict[i]["name"]:
+                return (user_dict[i]["person_id"],
+                        user_dict[i]["record_id"])
+        return None
+    
+    def sendRequest(self, payload):
+        return self.transport.request(payload)
+    
+    def close(self):
+        self.transport.close()
+    
+    def getThings(self, hv_datatype, record=None):
         #QUERY INFO 
         info = '<info><group><filter><type-id>' + hv_datatype + '</type-id></filter><format><section>core</section><xml/></format></group></info>'
         
         # INFO TO ADD WEIGHT.. change METHOD in header to PutThings
         #info = '<info><thing><type-id>3d34d87e-7fc1-4153-800f-f56592cb0d17</type-id><data-xml><weight><when><date><y>2008</y><m>6</m><d>15</d></date><time><h>10</h><m>23</m><s>10</s></time></when><value><kg>60</kg><display units="lb" units-code="lb">120</display></value></weight><common/> </data-xml> </thing> </info>'
         
-        infodigest = base64.encodestring(sha1(info).digest()) 
-        headerinfo = '<info-hash><hash-data algName="SHA1">' + infodigest.strip() + '</hash-data></info-hash>'
-        header = header + headerinfo + '</header>'
-        
-        hashedheader = hmac.new(self.sharedsec, header, 'sha1')
-        hashedheader64 = base64.encodestring(hashedheader.digest())
-        
-        hauthxml = '<auth><hmac-data algName="HMACSHA1">' + hashedheader64.strip() + '</hmac-data></auth>'
-        payload = '<wc-request:request xmlns:wc-request="urn:com.microsoft.wc.request">' + hauthxml + header + info + '</wc-request:request>'
+        signer, header = self.__header_start('GetThings', record)
+        payload = signer.sign(header, self.time_gen(), info)
         response = self.sendRequest(payload)
         return response
     
-    def getBasicThing(self, hv_datatype):
-        response = self.getThings(hv_datatype)
+    def getBasicThing(self, hv_datatype, record=None):
+        response = self.getThings(hv_datatype, record)
         response_str = response.read()
         
         if response.status == 200:
@@ -217,45 +219,48 @@ class HealthVaultConn(object):
             elif code == '65':#session token expired -error 65-
                 print "Session token expired, getting a new one..." 
                 self.createAuthenticatedSessionToken()
-                self.getBasicThing(hv_datatype)
+                return self.getBasicThing(hv_datatype, record)
             else: return 'error in getting thing - error code: %s' % code
         else:
             return 'error in getting thing'
     
-    def putThings(self, hv_datatype, data_xml):
-        header = '<header>\
-                        <method>PutThings</method>\
-                        <method-version>1</method-version>\
-                        <record-id>' + self.record_id + '</record-id>\
-                        <auth-session>\
-                            <auth-token>' + self.auth_token + '</auth-token>\
-                            <offline-person-info>\
-                                <offline-person-id>' + self.person_id + '</offline-person-id>\
-                            </offline-person-info>\
-                        </auth-session>\
-                        <language>en</language>\
-                        <country>US</country>\
-                        <msg-time>' + self.time_gen() + '</msg-time>\
-                        <msg-ttl>36000</msg-ttl>\
-                        <version>0.0.0.1</version>'
-        
+    def putThings(self, hv_datatype, data_xml, record=None):
+        # data_xml is a string or an open file holding the thing's xml
         #QUERY INFO
-        info = '<info><thing><type-id>' + hv_datatype + '</type-id><data-xml>' + data_xml + '</data-xml></thing></info>'
-        
-        infodigest = base64.encodestring(sha1(info).digest()) 
-        headerinfo = '<info-hash><hash-data algName="SHA1">' + infodigest.strip() + '</hash-data></info-hash>'
-        header = header + headerinfo + '</header>'
-        
-        hashedheader = hmac.new(self.sharedsec, header, 'sha1')
-        hashedheader64 = base64.encodestring(hashedheader.digest())
+        info_start = '<info><thing><type-id>' + hv_datatype + '</type-id><data-xml>'
+        info_end = '</data-xml></thing></info>'
         
-        hauthxml = '<auth><hmac-data algName="HMACSHA1">' + hashedheader64.strip() + '</hmac-data></auth>'
-        payload = '<wc-request:request xmlns:wc-request="urn:com.microsoft.wc.request">' + hauthxml + header + info + '</wc-request:request>'
+        signer, header = self.__header_start('PutThings', record)
+        if isinstance(data_xml, str):
+            payload = signer.sign(header, self.time_gen(),
+                                       info_start + data_xml + info_end)
+        else:
+            # hash the file in blocks, the transport sends it the same way:
+            info_hash = sha1(info_start)
+            data_xml.seek(0)
+            while 1:
+                block = data_xml.read(FILE_BLOCK)
+                if not block:
+                    break
+                info_hash.update(block)
+            info_hash.update(info_end)
+            head = signer.sign_head(header, self.time_gen(),
+                                         info_hash.digest())
+            payload = [ head + info_start, data_xml, info_end + REQUEST_TAIL ]
         response = self.sendRequest(payload)
         return response
     
-    def putBasicThing(self, hv_datatype, data_xml):
-        response = self.putThings(hv_datatype, data_xml)
+    def putThingsBatch(self, hv_datatype, data_xml_list, record=None):
+        """Put several things, one request each, signed in one pass."""
+        infos = []
+        for data_xml in data_xml_list:
+            infos.append('<info><thing><type-id>' + hv_datatype + '</type-id><data-xml>' + data_xml + '</data-xml></thing></info>')
+        signer, header = self.__header_start('PutThings', record)
+        payloads = signer.sign_many(header, self.time_gen(), infos)
+        return [ self.sendRequest(payload) for payload in payloads ]
+    
+    def putBasicThing(self, hv_datatype, data_xml, record=None):
+        response = self.putThings(hv_datatype, data_xml, record)
         response_str = response.read()
       
         if response.status == 200:
@@ -267,11 +272,38 @@ class HealthVaultConn(object):
             elif code == '65':#session token expired -error 65-
                 print "Session token expired, getting a new one..."
                 self.createAuthenticatedSessionToken()
-                self.putBasicThing(hv_datatype, data_xml)
+                return self.putBasicThing(hv_datatype, data_xml, record)
             else: return 'error in puting thing - error code: %s' % code
         else:
             return 'error in puting thing'
         
+    def __header_start(self, method, record):
+        # Returns the signer of the session and the header start
+        # holding its token:
+        auth_token, signer = self.__session()
+        person_id, record_id = self.__record(record)
+        return signer, signer.header_start(method, record_id,
+                    '<auth-token>' + auth_token + '</auth-token><offline-person-info><offline-person-id>' + person_id + '</offline-person-id></offline-person-info>')
+    
+    def __session(self):
+        # The current session token and its signer, as a consistent pair:
+        self.__session_lock.acquire()
+        try:
+            return self.auth_token, self.signer
+        finally:
+            self.__session_lock.release()
+    
+    def __record(self, record):
+        # record is a (person_id, record_id) pair from findRecord(),
+        # None means the selected record:
+        if record is None:
+            self.__session_lock.acquire()
+            try:
+                return self.person_id, self.record_id
+            finally:
+                self.__session_lock.release()
+        return record
+    
     def time_gen(self):
         time_stamp = datetime.datetime.utcnow()
         result = time_stamp.strftime('%Y-%m-%dT%H:%M:%S.')
@@ -0,0 +1,130 @@
+#The MIT License
+#Copyright (c) 2008 Applied Informatics, Inc.
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in
+#all copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#THE SOFTWARE.
+"""\
+Request signing for HealthVault sessions.
+
+An HVSigner is created once per session shared secret.  The HMAC-SHA1
+key pads are hashed when it is created, so signing a header only copies
+the two prepared SHA1 states instead of re-deriving the padded key with
+hmac.new() on every call.  The fixed part of each method's header is
+formatted once and reused for every request to the same record.
+"""
+
+import binascii
+try:
+    from hashlib import sha1
+except:
+    from sha import sha as sha1
+
+# constants
+REQUEST_HEAD = '<wc-request:request xmlns:wc-request="urn:com.microsoft.wc.request">'
+REQUEST_TAIL = '</wc-request:request>'
+HEADER_TAIL = '</msg-time><msg-ttl>36000</msg-ttl><version>0.0.0.1</version>'
+
+# cached header prefixes kept per signer:
+MAX_CACHED_HEADERS = 64
+
+_BLOCK_SIZE = 64
+_IPAD = ''.join([ chr(x ^ 0x36) for x in range(256) ])
+_OPAD = ''.join([ chr(x ^ 0x5C) for x in range(256) ])
+
+# classes
+class HVSigner(object):
+    def __init__(self, secret):
+        if len(secret) > _BLOCK_SIZE:
+            secret = sha1(secret).digest()
+        secret = secret + chr(0) * (_BLOCK_SIZE - len(secret))
+        self.__inner = sha1(secret.translate(_IPAD))
+        self.__outer = sha1(secret.translate(_OPAD))
+        self.__headers = { }
+
+    def digest(self, data):
+        """\
+        Return the HMAC-SHA1 digest of data.
+        """
+        inner = self.__inner.copy()
+        inner.update(data)
+        outer = self.__outer.copy()
+        outer.update(inner.digest())
+        return outer.digest()
+
+    def digest64(self, data):
+        """\
+        Return the base64 encoded HMAC-SHA1 digest of data.
+        """
+        return binascii.b2a_base64(self.digest(data))[:-1]
+
+    def header_start(self, method, record_id, auth_session):
+        """\
+        Return the header of a method call up to its <msg-time> value.
+        auth_session is the content of the <auth-session> element;
+        record_id may be None for calls not bound to a record.
+        """
+        key = (method, record_id, auth_session)
+        try:
+            return self.__headers[key]
+        except KeyError:
+            pass
+        if record_id is None:
+            record = ''
+        else:
+            record = '<record-id>' + record_id + '</record-id>'
+        start = ''.join(('<header><method>', method,
+                         '</method><method-version>1</method-version>',
+                         record, '<auth-session>', auth_session,
+                         '</auth-session><language>en</language>'
+                         '<country>US</country><msg-time>'))
+        if len(self.__headers) >= MAX_CACHED_HEADERS:
+            self.__headers.clear()
+        self.__headers[key] = start
+        return start
+
+    def sign(self, header_start, msg_time, info):
+        """\
+        Return the complete, signed request document for info.
+        """
+        return ''.join((self.sign_head(header_start, msg_time,
+                                       sha1(info).digest()),
+                        info, REQUEST_TAIL))
+
+    def sign_head(self, header_start, msg_time, info_digest):
+        """\
+        Return the signed request document up to, not including, an
+        info whose SHA1 digest is info_digest.  The document is
+        completed by the info and REQUEST_TAIL; this lets a large info
+        be hashed and sent in pieces.
+        """
+        header = ''.join((header_start, msg_time, HEADER_TAIL,
+                          '<info-hash><hash-data algName="SHA1">',
+                          binascii.b2a_base64(info_digest)[:-1],
+                          '</hash-data></info-hash></header>'))
+        return ''.join((REQUEST_HEAD,
+                        '<auth><hmac-data algName="HMACSHA1">',
+                        self.digest64(header), '</hmac-data></auth>',
+                        header))
+
+    def sign_many(self, header_start, msg_time, infos):
+        """\
+        Return a signed request document for each of infos, all with
+        the same header.
+        """
+        sign = self.sign
+        return [ sign(header_start, msg_time, info) for info in infos ]
@@ -0,0 +1,388 @@
+#The MIT License
+#Copyright (c) 2008 Applied Informatics, Inc.
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in
+#all copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#THE SOFTWARE.
+"""\
+Persistent HTTPS transport for the HealthVault platform.
+
+HTTPSPool keeps a few keep-alive connections to the platform server
+open between requests, so consecutive GetThings/PutThings calls do
+not each pay for a fresh TCP connect and TLS handshake.  Idle
+connections are closed once they have been unused for idle_timeout
+seconds.  The server is free to drop idle keep-alive connections at
+any time: an idle connection the server has closed is discarded
+before reuse, and a request which fails on a reused connection before
+it was completely sent is retried once on a new connection.  Requests
+are never sent again once the server may have received them, as
+PutThings is not idempotent.
+
+The time spent connecting, in the TLS handshake, sending the request,
+waiting for the server and reading the response is accumulated per
+pool and can be read with stats().
+"""
+
+import time
+import socket
+import select
+import threading
+try:
+    import digi_httplib as httplib
+except:
+    import httplib
+try:
+    import ssl
+except ImportError:
+    ssl = None
+
+# constants
+HTTPS_PORT = 443
+DEFAULT_PATH = '/platform/wildcat.ashx'
+DEFAULT_MAX_IDLE = 2
+DEFAULT_IDLE_TIMEOUT = 60.0
+DEFAULT_TIMEOUT = 60.0
+
+# files in a request body are sent in blocks of this size:
+SEND_BLOCK = 16384
+
+# errors which, while sending a request on a reused keep-alive
+# connection, mean the connection went stale before the server saw the
+# request:
+_RETRY_ERRORS = (socket.error, httplib.CannotSendRequest)
+
+_STAT_COUNTERS = ('requests', 'connects', 'reuses', 'retries', 'failures',
+                  'bytes_sent', 'bytes_received')
+_STAT_TIMERS = ('connect_time', 'tls_time', 'send_time', 'server_time',
+                'read_time')
+
+# classes
+class HVResponse(object):
+    """\
+    A fully read HTTP response.
+
+    The body is read as soon as the response arrives so the
+    connection can go back to the pool right away; the object keeps
+    the subset of the httplib.HTTPResponse interface HealthVaultConn
+    callers use.
+    """
+    def __init__(self, status, reason, headers, body):
+        self.status = status
+        self.reason = reason
+        self.__headers = headers
+        self.__body = body
+        self.__pos = 0
+
+    def read(self, amt=None):
+        if amt is None:
+            data = self.__body[self.__pos:]
+        else:
+            data = self.__body[self.__pos:self.__pos + amt]
+        self.__pos += len(data)
+        return data
+
+    def getheader(self, name, default=None):
+        return self.__headers.get(name.lower(), default)
+
+    def getheaders(self):
+        return self.__headers.items()
+
+
+class HTTPSPool(object):
+    """\
+    Thread-safe pool of keep-alive HTTPS connections to one server.
+
+    Each call to request() borrows a connection (or opens a new one),
+    POSTs the payload and returns an HVResponse.  Up to max_idle
+    connections are kept open afterwards for reuse.
+    """
+    def __init__(self, host, port=HTTPS_PORT, path=DEFAULT_PATH,
+                 max_idle=DEFAULT_MAX_IDLE, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                 timeout=DEFAULT_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+
+        # idle connections as (last_used, connection), oldest first:
+        self.__idle = []
+        self.__lock = threading.Lock()
+        self.reset_stats()
+
+    def request(self, payload, content_type='text/xml'):
+        """\
+        POST payload to the pool's path, return an HVResponse.
+
+        payload is a string, or a list of strings and open files whose
+        whole contents are sent in order without being read into memory
+        at once.  Files are read again if the request is retried.
+        """
+        conn, reused = self.__acquire()
+        try:
+            try:
+                response = self.__exchange(conn, payload, content_type)
+            except _NotSent, e:
+                if not reused:
+                    raise e.error
+                conn.close()
+                self.__count('retries')
+                conn = _HTTPSConnection(self.host, self.port, self.timeout)
+                try:
+                    response = self.__exchange(conn, payload, content_type)
+                except _NotSent, e:
+                    raise e.error
+        except:
+            conn.close()
+            self.__count('failures')
+            raise
+
+        self.__release(conn)
+        return response
+
+    def close_idle(self, max_age=None):
+        """\
+        Close idle connections unused for more than max_age seconds
+        (the pool's idle_timeout by default, 0 closes all of them).
+        """
+        if max_age is None:
+            max_age = self.idle_timeout
+        horizon = time.time() - max_age
+        self.__lock.acquire()
+        try:
+            expired = [ conn for used, conn in self.__idle if used <= horizon ]
+            self.__idle = [ entry for entry in self.__idle
+                            if entry[0] > horizon ]
+        finally:
+            self.__lock.release()
+        for conn in expired:
+            conn.close()
+        return len(expired)
+
+    def close(self):
+        """\
+        Close every idle connection held by the pool.
+        """
+        self.close_idle(0)
+
+    def idle_count(self):
+        return len(self.__idle)
+
+    def stats(self):
+        """\
+        Return a dictionary of request counters and accumulated phase
+        timings (in seconds).  The 'last' entry holds the timings of
+        the most recent successful request.
+        """
+        self.__lock.acquire()
+        try:
+            stats = self.__stats.copy()
+            stats['last'] = self.__stats['last'].copy()
+        finally:
+            self.__lock.release()
+        stats['idle'] = len(self.__idle)
+        return stats
+
+    def reset_stats(self):
+        stats = { 'last': { } }
+        for key in _STAT_COUNTERS:
+            stats[key] = 0
+        for key in _STAT_TIMERS:
+            stats[key] = 0.0
+        self.__stats = stats
+
+    def __acquire(self):
+        horizon = time.time() - self.idle_timeout
+        conn = None
+        self.__lock.acquire()
+        try:
+            expired = [ entry[1] for entry in self.__idle
+                        if entry[0] <= horizon ]
+            self.__idle = [ entry for entry in self.__idle
+                            if entry[0] > horizon ]
+            while self.__idle:
+                # most recently used first, it is least likely to have
+                # been dropped by the server:
+                conn = self.__idle.pop()[1]
+                if not _is_dropped(conn):
+                    break
+                expired.append(conn)
+                conn = None
+        finally:
+            self.__lock.release()
+        for stale in expired:
+            stale.close()
+
+        if conn is not None:
+            return conn, True
+        return _HTTPSConnection(self.host, self.port, self.timeout), False
+
+    def __release(self, conn):
+        if conn.sock is None:
+            # the server asked to close the connection:
+            return
+        surplus = [ ]
+        self.__lock.acquire()
+        try:
+            self.__idle.append((time.time(), conn))
+            while len(self.__idle) > self.max_idle:
+                surplus.append(self.__idle.pop(0)[1])
+        finally:
+            self.__lock.release()
+        for conn in surplus:
+            conn.close()
+
+    def __exchange(self, conn, payload, content_type):
+        timings = { 'connect_time': 0.0, 'tls_time': 0.0 }
+        reused = conn.sock is not None
+        if not reused:
+            conn.connect()
+            timings['connect_time'] = conn.connect_time
+            timings['tls_time'] = conn.tls_time
+
+        t0 = time.time()
+        length = _body_length(payload)
+        try:
+            conn.putrequest('POST', self.path)
+            conn.putheader('Content-Type', content_type)
+            conn.putheader('Content-Length', '%d' % length)
+            conn.endheaders()
+            _send_body(conn, payload)
+        except _RETRY_ERRORS, e:
+            raise _NotSent(e)
+        t1 = time.time()
+        response = conn.getresponse()
+        t2 = time.time()
+        body = response.read()
+        t3 = time.time()
+
+        timings['send_time'] = t1 - t0
+        timings['server_time'] = t2 - t1
+        timings['read_time'] = t3 - t2
+
+        headers = { }
+        for name, value in response.getheaders():
+            headers[name.lower()] = value
+
+        self.__lock.acquire()
+        try:
+            stats = self.__stats
+            stats['requests'] += 1
+            if reused:
+                stats['reuses'] += 1
+            else:
+                stats['connects'] += 1
+            stats['bytes_sent'] += length
+            stats['bytes_received'] += len(body)
+            for key in _STAT_TIMERS:
+                stats[key] += timings[key]
+            stats['last'] = timings
+        finally:
+            self.__lock.release()
+
+        return HVResponse(response.status, response.reason, headers, body)
+
+    def __count(self, key):
+        self.__lock.acquire()
+        try:
+            self.__stats[key] += 1
+        finally:
+            self.__lock.release()
+
+
+# internal functions & classes
+class _NotSent(Exception):
+    """\
+    Raised by HTTPSPool.__exchange() when the request could not be
+    completely sent, wrapping the original error.
+    """
+    def __init__(self, error):
+        Exception.__init__(self, str(error))
+        self.error = error
+
+def _is_dropped(conn):
+    # An idle connection has nothing to read unless the server closed
+    # it (or sent something unsolicited, which makes it unusable too):
+    try:
+        readable = select.select([conn.sock], [], [], 0)[0]
+    except Exception:
+        # can't tell, let the request find out:
+        return False
+    return bool(readable)
+
+def _body_length(payload):
+    if isinstance(payload, str):
+        return len(payload)
+    length = 0
+    for part in payload:
+        if isinstance(part, str):
+            length += len(part)
+        else:
+            part.seek(0, 2)
+            length += part.tell()
+    return length
+
+def _send_body(conn, payload):
+    if isinstance(payload, str):
+        conn.send(payload)
+        return
+    for part in payload:
+        if isinstance(part, str):
+            conn.send(part)
+            continue
+        part.seek(0)
+        while 1:
+            block = part.read(SEND_BLOCK)
+            if not block:
+                break
+            conn.send(block)
+
+class _HTTPSConnection(httplib.HTTPSConnection):
+    """\
+    HTTPSConnection which times the TCP connect and TLS handshake
+    separately and disables Nagle, since requests are sent as a header
+    write followed by a body write on a long-lived socket.
+    """
+    def __init__(self, host, port, timeout):
+        httplib.HTTPSConnection.__init__(self, host, port)
+        self.timeout = timeout
+        self.connect_time = 0.0
+        self.tls_time = 0.0
+
+    def connect(self):
+        t0 = time.time()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.timeout:
+            sock.settimeout(self.timeout)
+        try:
+            sock.connect((self.host, self.port))
+            t1 = time.time()
+            if ssl is not None:
+                self.sock = ssl.wrap_socket(sock, self.key_file,
+                                            self.cert_file)
+            else:
+                self.sock = httplib.FakeSocket(sock,
+                        socket.ssl(sock, self.key_file, self.cert_file))
+        except:
+            sock.close()
+            raise
+        t2 = time.time()
+        self.connect_time = t1 - t0
+        self.tls_time = t2 - t1
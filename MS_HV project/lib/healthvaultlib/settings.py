@@ -6,6 +6,12 @@
 HV_SHELL_URL = 'https://account.healthvault-ppe.co.uk'
 HV_SERVICE_SERVER= 'platform.healthvault-ppe.co.uk'
 
+#transport settings:
+HV_SERVICE_PORT = 443
+HV_SERVICE_PATH = '/platform/wildcat.ashx'
+HV_IDLE_TIMEOUT = 60      #seconds a keep-alive connection may sit unused
+HV_SOCKET_TIMEOUT = 60
+
 #APP specific security settings
 #HV_APPID ='c0b9cb16-1a6d-477b-93da-7ddfe463e355'
 HV_APPID ='a633eb71-a38f-417b-a3a8-c80f0d195652'
\ No newline at end of file
@@ -21,20 +21,19 @@
 import time
 import wsgiref.handlers
 import base64
-try:
-    import digi_httplib as httplib
-except:
-    import httplib
 import urllib
 from random import randint
 from xml.dom import minidom
-import hmac
+from hvsigner import HVSigner
+from healthvaultlib.hvtransport import HTTPSPool
 from hvcrypto import HVCrypto
 from settings import *
-try:
-    from hashlib import sha1
-except:
-    from sha import sha as sha1
+
+def new_transport():
+    return HTTPSPool(HV_SERVICE_SERVER, HV_SERVICE_PORT, HV_SERVICE_PATH,
+                     idle_timeout=HV_IDLE_TIMEOUT, timeout=HV_SOCKET_TIMEOUT)
+
+MSG_TIME = '2008-06-21T03:13:50.750-04:00'
 
 class HealthVaultConn(object):
     wctoken = None
@@ -43,12 +42,17 @@ class HealthVaultConn(object):
     signature = None
     crypto = None
     record_id = None
+    transport = None
     
-    def __init__(self, wctoken):
+    def __init__(self, wctoken, transport=None):
+        if transport is None:
+            transport = new_transport()
+        self.transport = transport
         self.wctoken = wctoken
         crypto = HVCrypto()
         sharedsec = str(randint(2 ** 64, 2 ** 65 - 1))
         self.sharedsec = sharedsec
+        self.signer = HVSigner(sharedsec)
         sharedsec64 = base64.encodestring(sharedsec)
         #2. create content with shared sec
         content = '<content><app-id>' + HV_APPID + '</app-id><shared-secret><hmac-alg algName="HMACSHA1">' + sharedsec64 + '</hmac-alg></shared-secret></content>'
@@ -69,17 +73,10 @@ class HealthVaultConn(object):
         else:
             return "error occured at get auth token"
         #5 After you get the auth_token.. get the record id
-        header = '<header><method>GetPersonInfo</method><method-version>1</method-version><auth-session><auth-token>' + self.auth_token + '</auth-token><user-auth-token>' + self.wctoken + '</user-auth-token></auth-session><language>en</language><country>US</country><msg-time>2008-06-21T03:13:50.750-04:00</msg-time><msg-ttl>36000</msg-ttl><version>0.0.0.1</version>'
+        header = self.signer.header_start('GetPersonInfo', None,
+                                          self.__auth_session())
         info = '<info/>' 
-        infodigest = base64.encodestring(sha1(info).digest()) 
-        headerinfo = '<info-hash><hash-data algName="SHA1">' + infodigest.strip() + '</hash-data></info-hash>'
-        header = header + headerinfo + '</header>'
-        
-        hashedheader = hmac.new(sharedsec, header, 'sha1')
-        hashedheader64 = base64.encodestring(hashedheader.digest())
-        
-        hauthxml = '<auth><hmac-data algName="HMACSHA1">' + hashedheader64.strip() + '</hmac-data></auth>'
-        payload = '<wc-request:request xmlns:wc-request="urn:com.microsoft.wc.request">' + hauthxml + header + info + '</wc-request:request>'
+        payload = self.signer.sign(header, MSG_TIME, info)
         
         response = self.sendRequest(payload) 
         if response.status == 200:
@@ -91,19 +88,14 @@ class HealthVaultConn(object):
         else:
             return "error occured at select record id"
     
+    def __auth_session(self):
+        return '<auth-token>' + self.auth_token + '</auth-token><user-auth-token>' + self.wctoken + '</user-auth-token>'
+    
     def sendRequest(self, payload):
-        conn = httplib.HTTPSConnection(HV_SERVICE_SERVER, 443)
-        conn.putrequest('POST', '/platform/wildcat.ashx')
-        conn.putheader('Content-Type', 'text/xml')
-        conn.putheader('Content-Length', '%d' % len(payload))
-        conn.endheaders()
-        try:
-            conn.send(payload)
-        except socket.error, v:
-            if v[0] == 32:      # Broken pipe
-                conn.close()
-            raise
-        return conn.getresponse()
+        return self.transport.request(payload)
+    
+    def close(self):
+        self.transport.close()
     
     #HV_DataTypes:
     #basicdemographic = "bf516a61-5252-4c28-a979-27f45f62f78d"
@@ -116,23 +108,15 @@ class HealthVaultConn(object):
         print 'record_id:', self.record_id
         print 'auth_token:', self.auth_token
         print 'wctoken:', self.wctoken
-        header = '<header><method>GetThings</method><method-version>1</method-version><record-id>' + self.record_id + '</record-id><auth-session><auth-token>' + self.auth_token + '</auth-token><user-auth-token>' + self.wctoken + '</user-auth-token></auth-session><language>en</language><country>US</country><msg-time>2008-06-21T03:13:50.750-04:00</msg-time><msg-ttl>36000</msg-ttl><version>0.0.0.1</version>'
-        
         #QUERY INFO 
         info = '<info><group><filter><type-id>' + hv_datatype + '</type-id></filter><format><section>core</section><xml/></format></group></info>'
         
         # INFO TO ADD WEIGHT.. change METHOD in header to PutThings
         #info = '<info><thing><type-id>3d34d87e-7fc1-4153-800f-f56592cb0d17</type-id><data-xml><weight><when><date><y>2008</y><m>6</m><d>15</d></date><time><h>10</h><m>23</m><s>10</s></time></when><value><kg>60</kg><display units="lb" units-code="lb">120</display></value></weight><common/> </data-xml> </thing> </info>'
         
-        infodigest = base64.encodestring(sha1(info).digest()) 
-        headerinfo = '<info-hash><hash-data algName="SHA1">' + infodigest.strip() + '</hash-data></info-hash>'
-        header = header + headerinfo + '</header>'
-        
-        hashedheader = hmac.new(self.sharedsec, header, 'sha1')
-        hashedheader64 = base64.encodestring(hashedheader.digest())
-        
-        hauthxml = '<auth><hmac-data algName="HMACSHA1">' + hashedheader64.strip() + '</hmac-data></auth>'
-        payload = '<wc-request:request xmlns:wc-request="urn:com.microsoft.wc.request">' + hauthxml + header + info + '</wc-request:request>'
+        header = self.signer.header_start('GetThings', self.record_id,
+                                          self.__auth_session())
+        payload = self.signer.sign(header, MSG_TIME, info)
         response = self.sendRequest(payload)
         return response
     
@@ -167,21 +151,12 @@ class HealthVaultConn(object):
             return - 1#'error in getting data'
     
     def putThings(self, hv_datatype, data_xml):
-        #set record-id in the hearder
-        header = '<header><method>PutThings</method><method-version>1</method-version><record-id>' + self.record_id + '</record-id><auth-session><auth-token>' + self.auth_token + '</auth-token><user-auth-token>' + self.wctoken + '</user-auth-token></auth-session><language>en</language><country>US</country><msg-time>2008-06-21T03:13:50.750-04:00</msg-time><msg-ttl>36000</msg-ttl><version>0.0.0.1</version>'
-        
         #QUERY INFO 
         info = '<info><thing><type-id>' + hv_datatype + '</type-id><data-xml>' + data_xml + '</data-xml></thing></info>'
         
-        infodigest = base64.encodestring(sha1(info).digest()) 
-        headerinfo = '<info-hash><hash-data algName="SHA1">' + infodigest.strip() + '</hash-data></info-hash>'
-        header = header + headerinfo + '</header>'
-
-        hashedheader = hmac.new(self.sharedsec, header, 'sha1')
-        hashedheader64 = base64.encodestring(hashedheader.digest())
-
-        hauthxml = '<auth><hmac-data algName="HMACSHA1">' + hashedheader64.strip() + '</hmac-data></auth>'
-        payload = '<wc-request:request xmlns:wc-request="urn:com.microsoft.wc.request">' + hauthxml + header + info + '</wc-request:request>'
+        header = self.signer.header_start('PutThings', self.record_id,
+                                          self.__auth_session())
+        payload = self.signer.sign(header, MSG_TIME, info)
         response = self.sendRequest(payload)
         return response
     
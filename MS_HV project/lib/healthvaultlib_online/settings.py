@@ -6,6 +6,12 @@
 HV_SHELL_URL = 'https://account.healthvault-ppe.co.uk'
 HV_SERVICE_SERVER= 'platform.healthvault-ppe.co.uk'
 
+#transport settings:
+HV_SERVICE_PORT = 443
+HV_SERVICE_PATH = '/platform/wildcat.ashx'
+HV_IDLE_TIMEOUT = 60      #seconds a keep-alive connection may sit unused
+HV_SOCKET_TIMEOUT = 60
+
 #APP_ADDR_PORT ='http%3A//localhost%3A8080'
 #APP_ACTION_URL = APP_ADDR_PORT+'/mvaultaction'
 
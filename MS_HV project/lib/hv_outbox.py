@@ -0,0 +1,361 @@
+"""\
+Durable, size-bounded outbox of upload batches.
+
+Batches are appended to segment files in an outbox directory and are
+removed only once they have been acknowledged, so data queued for an
+upload survives both failed uploads and gateway restarts:
+
+    outbox = Outbox('WEB/python/hv_outbox', max_bytes=512 * 1024)
+    outbox.append(payload)
+    batch = outbox.peek()
+    if batch is not None:
+        batch_id, payload = batch
+        if upload(payload):
+            outbox.ack(batch_id)
+
+batches() reads the pending batches one at a time, oldest first, so
+several can be combined into one upload; ack() acknowledges every batch
+up to the one given.
+
+Each batch gets a batch ID one greater than the one before it.  The
+files are only ever appended to; a segment is deleted once every batch
+in it has been acknowledged.  When the outbox grows beyond max_bytes the
+oldest segment is dropped, unsent or not, so disk use stays bounded
+during long outages.
+
+Each record is a header line "<batch id> <length> <crc32>" followed by
+the payload and a newline.  A torn or corrupt record found when the
+outbox is opened ends its segment.
+"""
+
+import os, binascii, threading
+
+# Default maximum total size of the segment files:
+DEFAULT_MAX_BYTES = 512 * 1024
+
+# The outbox is split into about this many segments, the unit in which
+# space is reclaimed:
+SEGMENTS_PER_OUTBOX = 8
+
+SEGMENT_PREFIX = 'seg-'
+SEGMENT_SUFFIX = '.log'
+ACK_FILE = 'ack'
+
+class Outbox(object):
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES,
+                 segment_bytes=None):
+        if segment_bytes is None:
+            segment_bytes = max(max_bytes // SEGMENTS_PER_OUTBOX, 1)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+
+        self.__lock = threading.RLock()
+        # [first batch ID, size] for each segment, oldest first.  The
+        # oldest unacknowledged batch is always in the first segment at
+        # self.__offset:
+        self.__segments = []
+        self.__offset = 0
+        self.__bytes = 0
+        self.__pending = 0
+        self.__acked = 0
+        self.__next_id = 1
+        self.__dropped = 0
+        self.__writer = None
+
+        self.__recover()
+
+    def append(self, payload):
+        """\
+        Durably add payload as a new batch, return its batch ID.
+        """
+        self.__lock.acquire()
+        try:
+            batch_id = self.__next_id
+            record = _encode_record(batch_id, payload)
+            if (self.__writer is None or
+                self.__segments[-1][1] >= self.segment_bytes):
+                self.__roll(batch_id)
+            self.__writer.write(record)
+            self.__writer.flush()
+            _fsync(self.__writer)
+
+            self.__segments[-1][1] += len(record)
+            self.__bytes += len(record)
+            self.__pending += 1
+            self.__next_id += 1
+
+            while self.__bytes > self.max_bytes and len(self.__segments) > 1:
+                self.__drop_oldest()
+            return batch_id
+        finally:
+            self.__lock.release()
+
+    def peek(self):
+        """\
+        Return (batch ID, payload) of the oldest unacknowledged batch,
+        or None if the outbox is empty.
+        """
+        for batch in self.batches():
+            return batch
+        return None
+
+    def batches(self):
+        """\
+        Generate (batch ID, payload) for the unacknowledged batches,
+        oldest first, reading them one at a time.  Generation stops
+        early if the batches are dropped to make room meanwhile.
+        """
+        self.__lock.acquire()
+        try:
+            segments = [ first_id for first_id, size in self.__segments ]
+            offset = self.__offset
+            remaining = self.__pending
+        finally:
+            self.__lock.release()
+
+        for first_id in segments:
+            if remaining <= 0:
+                return
+            try:
+                fd = open(self.__path(first_id), 'rb')
+            except IOError:
+                return
+            fd.seek(offset)
+            while remaining > 0:
+                record = _read_record(fd)
+                if record is None:
+                    break
+                remaining -= 1
+                yield record[0], record[1]
+            fd.close()
+            offset = 0
+
+    def ack(self, batch_id):
+        """\
+        Mark every batch up to and including batch_id as delivered.
+        Returns False if none of them was still in the outbox (they were
+        dropped to make room in the meantime).
+        """
+        self.__lock.acquire()
+        try:
+            acked = 0
+            while self.__pending:
+                fd = open(self.__path(self.__segments[0][0]), 'rb')
+                try:
+                    fd.seek(self.__offset)
+                    header = _read_header(fd)
+                finally:
+                    fd.close()
+                if header is None:
+                    raise IOError, "outbox segment %d is corrupt at %d" % \
+                        (self.__segments[0][0], self.__offset)
+                head_id, length = header
+                if head_id > batch_id:
+                    break
+                self.__offset += length
+                self.__pending -= 1
+                acked += 1
+                self.__advance()
+            if not acked:
+                return False
+            self.__acked = batch_id
+            self.__write_ack()
+            return True
+        finally:
+            self.__lock.release()
+
+    def pending(self):
+        """\
+        Return the number of batches waiting to be delivered.
+        """
+        return self.__pending
+
+    def stats(self):
+        self.__lock.acquire()
+        try:
+            return { 'pending': self.__pending,
+                     'bytes': self.__bytes,
+                     'segments': len(self.__segments),
+                     'dropped': self.__dropped,
+                     'last_acked': self.__acked,
+                     'next_id': self.__next_id }
+        finally:
+            self.__lock.release()
+
+    def close(self):
+        self.__lock.acquire()
+        try:
+            if self.__writer is not None:
+                self.__writer.close()
+                self.__writer = None
+        finally:
+            self.__lock.release()
+
+    def __path(self, first_id):
+        return os.path.join(self.directory, '%s%010d%s' %
+                            (SEGMENT_PREFIX, first_id, SEGMENT_SUFFIX))
+
+    def __roll(self, first_id):
+        if self.__writer is not None:
+            self.__writer.close()
+        self.__writer = open(self.__path(first_id), 'ab')
+        self.__segments.append([first_id, 0])
+        self.__advance()
+
+    def __advance(self):
+        # delete fully acknowledged segments, except the one written to:
+        while len(self.__segments) > 1 and \
+              self.__offset >= self.__segments[0][1]:
+            first_id, size = self.__segments.pop(0)
+            self.__bytes -= size
+            self.__offset = 0
+            os.remove(self.__path(first_id))
+
+    def __drop_oldest(self):
+        first_id, size = self.__segments.pop(0)
+        path = self.__path(first_id)
+        fd = open(path, 'rb')
+        try:
+            fd.seek(self.__offset)
+            dropped = _count_records(fd)
+        finally:
+            fd.close()
+        os.remove(path)
+        self.__bytes -= size
+        self.__offset = 0
+        self.__pending -= dropped
+        self.__dropped += dropped
+
+    def __write_ack(self):
+        path = os.path.join(self.directory, ACK_FILE)
+        fd = open(path + '.tmp', 'wb')
+        try:
+            fd.write('%d\n' % self.__acked)
+            fd.flush()
+            _fsync(fd)
+        finally:
+            fd.close()
+        try:
+            os.rename(path + '.tmp', path)
+        except OSError:
+            # rename() will not replace an existing file on all platforms:
+            os.remove(path)
+            os.rename(path + '.tmp', path)
+
+    def __recover(self):
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+        try:
+            fd = open(os.path.join(self.directory, ACK_FILE), 'rb')
+            try:
+                self.__acked = int(fd.readline())
+            finally:
+                fd.close()
+        except (IOError, ValueError):
+            self.__acked = 0
+        last_id = self.__acked
+
+        first_ids = [ ]
+        for name in os.listdir(self.directory):
+            if name.startswith(SEGMENT_PREFIX) and \
+               name.endswith(SEGMENT_SUFFIX):
+                try:
+                    first_ids.append(
+                        int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]))
+                except ValueError:
+                    pass
+        first_ids.sort()
+
+        for first_id in first_ids:
+            path = self.__path(first_id)
+            fd = open(path, 'r+b')
+            try:
+                offset = 0
+                unacked_at = None
+                unacked = 0
+                while 1:
+                    record = _read_record(fd)
+                    if record is None:
+                        break
+                    batch_id, payload, length = record
+                    if batch_id > self.__acked:
+                        if unacked_at is None:
+                            unacked_at = offset
+                        unacked += 1
+                    last_id = max(last_id, batch_id)
+                    offset += length
+                # cut off a torn or corrupt tail:
+                fd.seek(0, 2)
+                if fd.tell() != offset:
+                    fd.truncate(offset)
+            finally:
+                fd.close()
+
+            if not unacked:
+                os.remove(path)
+                continue
+            if not self.__segments:
+                self.__offset = unacked_at
+            self.__segments.append([first_id, offset])
+            self.__bytes += offset
+            self.__pending += unacked
+
+        self.__next_id = last_id + 1
+
+
+# internal functions & classes
+def _encode_record(batch_id, payload):
+    return '%d %d %d\n%s\n' % (batch_id, len(payload),
+                               binascii.crc32(payload) & 0xffffffffL, payload)
+
+def _read_record(fd):
+    """\
+    Read and verify the record at the file position, return
+    (batch ID, payload, record length) or None at the end of the valid
+    records.
+    """
+    header = fd.readline()
+    if not header.endswith('\n'):
+        return None
+    try:
+        batch_id, length, crc = [ int(field) for field in header.split() ]
+    except ValueError:
+        return None
+    payload = fd.read(length)
+    if len(payload) != length or fd.read(1) != '\n':
+        return None
+    if binascii.crc32(payload) & 0xffffffffL != crc:
+        return None
+    return batch_id, payload, len(header) + length + 1
+
+def _read_header(fd):
+    """\
+    Return (batch ID, record length) of the record at the file position
+    without reading its payload, or None at the end of the records.
+    """
+    header = fd.readline()
+    if not header.endswith('\n'):
+        return None
+    try:
+        batch_id, length = [ int(field) for field in header.split()[:2] ]
+    except ValueError:
+        return None
+    return batch_id, len(header) + length + 1
+
+def _count_records(fd):
+    count = 0
+    while 1:
+        start = fd.tell()
+        header = _read_header(fd)
+        if header is None:
+            return count
+        fd.seek(start + header[1])
+        count += 1
+
+def _fsync(fd):
+    # Not all platforms provide fsync():
+    fsync = getattr(os, "fsync", None)
+    if fsync is not None:
+        fsync(fd.fileno())
@@ -20,13 +20,18 @@ Example Usage::
 Thanks go out to Matt Croydon & Christian Metts for putting me up to this late
 at night. The joking around has become reality. :)
 """
+import BaseHTTPServer
 import cgi
 import mimetypes
 import os
+import Queue
 import re
+import socket
 import StringIO
 import sys
+import threading
 import traceback
+import urllib
 try:
     from urlparse import parse_qs
 except ImportError:
@@ -44,6 +49,27 @@ REQUEST_MAPPINGS = {
     'DELETE': [],
 }
 
+# Urls without regex syntax, by request method: path -> (position in
+# REQUEST_MAPPINGS, url_set).  They are looked up before the regexes.
+EXACT_MAPPINGS = {
+    'GET': {},
+    'POST': {},
+    'PUT': {},
+    'DELETE': {},
+}
+
+# The other urls, by request method: [(position in REQUEST_MAPPINGS,
+# url_set), ...]
+PATTERN_MAPPINGS = {
+    'GET': [],
+    'POST': [],
+    'PUT': [],
+    'DELETE': [],
+}
+
+# Characters that make a url a regex rather than a literal path:
+REGEX_CHARS = '.^$*+?{}[]\\|()'
+
 ERROR_HANDLERS = {}
 
 MEDIA_ROOT = os.path.join(os.path.dirname(__file__), 'media')
@@ -329,15 +355,40 @@ def find_matching_url(request):
     if not request.method in REQUEST_MAPPINGS:
         raise NotFound("The HTTP request method '%s' is not supported." % request.method)
 
-    for url_set in REQUEST_MAPPINGS[request.method]:
+    # A literal url wins unless a regex registered before it matches too.
+    exact = EXACT_MAPPINGS[request.method].get(request.path)
+
+    for position, url_set in PATTERN_MAPPINGS[request.method]:
+        if exact is not None and position > exact[0]:
+            break
+
         match = url_set[0].search(request.path)
 
         if match is not None:
             return (url_set, match.groupdict())
 
+    if exact is not None:
+        return (exact[1], {})
+
     raise NotFound("Sorry, nothing here.")
 
 
+def add_mapping(method, url, callback):
+    """Registers callback for the url, see the HTTP decorators."""
+    path = add_slash(url)
+    url_set = (re.compile("^%s$" % path), url, callback)
+    position = len(REQUEST_MAPPINGS[method])
+    REQUEST_MAPPINGS[method].append(url_set)
+
+    for char in path:
+        if char in REGEX_CHARS:
+            PATTERN_MAPPINGS[method].append((position, url_set))
+            break
+    else:
+        if not path in EXACT_MAPPINGS[method]:
+            EXACT_MAPPINGS[method][path] = (position, url_set)
+
+
 def add_slash(url):
     """Adds a trailing slash for consistency in urls."""
     if not url.endswith('/'):
@@ -417,8 +468,7 @@ def get(url):
     """Registers a method as capable of processing GET requests."""
     def wrapped(method):
         # Register.
-        re_url = re.compile("^%s$" % add_slash(url))
-        REQUEST_MAPPINGS['GET'].append((re_url, url, method))
+        add_mapping('GET', url, method)
         return method
     return wrapped
 
@@ -427,8 +477,7 @@ def post(url):
     """Registers a method as capable of processing POST requests."""
     def wrapped(method):
         # Register.
-        re_url = re.compile("^%s$" % add_slash(url))
-        REQUEST_MAPPINGS['POST'].append((re_url, url, method))
+        add_mapping('POST', url, method)
         return method
     return wrapped
 
@@ -437,8 +486,7 @@ def put(url):
     """Registers a method as capable of processing PUT requests."""
     def wrapped(method):
         # Register.
-        re_url = re.compile("^%s$" % add_slash(url))
-        REQUEST_MAPPINGS['PUT'].append((re_url, url, method))
+        add_mapping('PUT', url, method)
         status = 201
         return method
     return wrapped
@@ -448,8 +496,7 @@ def delete(url):
     """Registers a method as capable of processing DELETE requests."""
     def wrapped(method):
         # Register.
-        re_url = re.compile("^%s$" % add_slash(url))
-        REQUEST_MAPPINGS['DELETE'].append((re_url, url, method))
+        add_mapping('DELETE', url, method)
         return method
     return wrapped
 
@@ -497,6 +544,168 @@ def redirect(request, exception):
     return response.send(request._start_response)
 
 
+# Thread pool server
+
+THREADPOOL_WORKERS = 4
+
+# Seconds an idle keep-alive connection may hold on to its worker:
+KEEPALIVE_TIMEOUT = 5
+
+
+class WSGIRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    Serves HTTP/1.1 requests, several per connection, by handing them to
+    handle_request.
+    """
+    protocol_version = 'HTTP/1.1'
+    server_version = 'itty/%s' % '.'.join(__version__)
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        self.connection.settimeout(self.server.keepalive_timeout)
+
+    def handle_one_request(self):
+        try:
+            BaseHTTPServer.BaseHTTPRequestHandler.handle_one_request(self)
+        except socket.timeout:
+            # The client kept the connection idle for too long.
+            self.close_connection = 1
+
+    def do_request(self):
+        path = self.path
+        query = ''
+
+        if '?' in path:
+            path, query = path.split('?', 1)
+
+        content_length = int(self.headers.getheader('content-length') or 0)
+
+        # Read the body now so that the next request on the connection can
+        # be parsed whether the callback read it or not.
+        environ = {
+            'REQUEST_METHOD': self.command,
+            'SCRIPT_NAME': '',
+            'PATH_INFO': urllib.unquote(path),
+            'QUERY_STRING': query,
+            'CONTENT_TYPE': self.headers.getheader('content-type', ''),
+            'CONTENT_LENGTH': str(content_length),
+            'SERVER_NAME': self.server.server_name,
+            'SERVER_PORT': str(self.server.server_port),
+            'SERVER_PROTOCOL': self.request_version,
+            'REMOTE_ADDR': self.client_address[0],
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': StringIO.StringIO(self.rfile.read(content_length)),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+
+        for key in self.headers.keys():
+            if not key in ('content-type', 'content-length'):
+                environ['HTTP_' + key.upper().replace('-', '_')] = self.headers.getheader(key)
+
+        response = []
+        chunks = []
+
+        def start_response(status, headers, exc_info=None):
+            response[:] = [status, headers]
+            return chunks.append
+
+        result = handle_request(environ, start_response)
+
+        # Response.send() returns a plain string; don't iterate over it.
+        if isinstance(result, str):
+            chunks.append(result)
+        else:
+            try:
+                for chunk in result:
+                    chunks.append(chunk)
+            finally:
+                if hasattr(result, 'close'):
+                    result.close()
+
+        body = ''.join(chunks)
+        status, headers = response
+        self.send_response(int(status[:3]), status[4:])
+
+        for key, value in headers:
+            if not key.lower() in ('content-length', 'connection'):
+                self.send_header(key, value)
+
+        self.send_header('Content-Length', str(len(body)))
+
+        # Give the worker up to a waiting connection rather than to an idle
+        # keep-alive one.
+        if not self.server.connections.empty():
+            self.close_connection = 1
+
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+
+        self.end_headers()
+
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = do_request
+
+    def log_request(self, code='-', size='-'):
+        # Only errors are logged.
+        pass
+
+
+class ThreadPoolWSGIServer(BaseHTTPServer.HTTPServer):
+    """
+    Accepts connections on one thread and serves them from a fixed pool of
+    worker threads, so one slow request does not hold up the others.
+    """
+
+    def __init__(self, server_address, workers=None, keepalive_timeout=None):
+        if workers is None:
+            workers = THREADPOOL_WORKERS
+
+        if keepalive_timeout is None:
+            keepalive_timeout = KEEPALIVE_TIMEOUT
+
+        BaseHTTPServer.HTTPServer.__init__(self, server_address, WSGIRequestHandler)
+        self.keepalive_timeout = keepalive_timeout
+        self.connections = Queue.Queue()
+        self.workers = []
+
+        for i in range(workers):
+            worker = threading.Thread(target=self.serve_connections, name='itty-worker-%d' % i)
+            worker.setDaemon(True)
+            worker.start()
+            self.workers.append(worker)
+
+    def process_request(self, request, client_address):
+        self.connections.put((request, client_address))
+
+    def serve_connections(self):
+        while True:
+            connection = self.connections.get()
+
+            if connection is None:
+                return
+
+            request, client_address = connection
+
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+
+            self.close_request(request)
+
+    def server_close(self):
+        BaseHTTPServer.HTTPServer.server_close(self)
+
+        for worker in self.workers:
+            self.connections.put(None)
+
+
 # Servers Adapters
 
 def wsgiref_adapter(host, port):
@@ -505,6 +714,11 @@ def wsgiref_adapter(host, port):
     srv.serve_forever()
 
 
+def threadpool_adapter(host, port, workers=None, keepalive_timeout=None):
+    srv = ThreadPoolWSGIServer((host, int(port)), workers, keepalive_timeout)
+    srv.serve_forever()
+
+
 def appengine_adapter(host, port):
     from google.appengine.ext.webapp import util
     util.run_wsgi_app(handle_request)
@@ -599,6 +813,7 @@ def eventlet_adapter(host, port):
 
 WSGI_ADAPTERS = {
     'wsgiref': wsgiref_adapter,
+    'threadpool': threadpool_adapter,
     'appengine': appengine_adapter,
     'cherrypy': cherrypy_adapter,
     'flup': flup_adapter,
@@ -614,7 +829,7 @@ WSGI_ADAPTERS = {
 
 # Server
 
-def run_itty(server='wsgiref', host='localhost', port=8080, config=None):
+def run_itty(server='wsgiref', host='localhost', port=8080, config=None, **options):
     """
     Runs the itty web server.
 
@@ -622,7 +837,9 @@ def run_itty(server='wsgiref', host='localhost', port=8080, config=None):
     config (python module name/path as a string) parameters.
 
     By default, uses Python's built-in wsgiref implementation. Specify a server
-    name from WSGI_ADAPTERS to use an alternate WSGI server.
+    name from WSGI_ADAPTERS to use an alternate WSGI server. Further keyword
+    arguments are passed to the server adapter, e.g. ``workers`` and
+    ``keepalive_timeout`` for 'threadpool'.
     """
     if not server in WSGI_ADAPTERS:
         raise RuntimeError("Server '%s' is not a valid server. Please choose a different server." % server)
@@ -642,6 +859,6 @@ def run_itty(server='wsgiref', host='localhost', port=8080, config=None):
         print
 
     try:
-        WSGI_ADAPTERS[server](host, port)
+        WSGI_ADAPTERS[server](host, port, **options)
     except KeyboardInterrupt:
         print 'Shutting down. Have a nice day!'
@@ -1,23 +1,30 @@
-import time, datetime, random
+"""\
+Creation of Continuity of Care Record (CCR) documents from Dia samples.
 
-def ObjectId_gen():
-    ObjectId = ''
-    for i in range(0, 16):
-        ObjectId += hex(random.randint(0, 255))[2:]
-    return ObjectId
+CCR_gen() returns a whole document as a string.  For large numbers of
+samples use a CCRWriter, which streams the document to a write callback
+or file-like object as the samples are added:
 
-def Body_Results_gen(name, value, units, time_stamp, type=None):
-    time_stamp = datetime.datetime.fromtimestamp(float(time_stamp))
-    long_time = time_stamp.strftime('%Y-%m-%dT%H:%M:%S.') + str(time_stamp.microsecond)
-    #short_time = time_stamp.strftime('%Y-%m-%d')
-    result = '''
+    writer = CCRWriter(out_file, "John Smith", "1970-1-1")
+    writer.start()
+    for sample, channel_name in samples:
+        writer.add_sample(sample, channel_name)
+    writer.finish()
+"""
+
+import time, datetime, random, os, binascii
+
+# Number of object IDs generated per call to os.urandom():
+OBJECT_ID_BATCH = 256
+
+RESULT_FMT = '''
         <Result>
-            <CCRDataObjectID>''' + ObjectId_gen() + '''</CCRDataObjectID>
+            <CCRDataObjectID>%s</CCRDataObjectID>
             <DateTime>
                 <Type>
                     <Text>Collection start date</Text>
                 </Type>
-                <ExactDateTime>''' + long_time + '''</ExactDateTime>
+                <ExactDateTime>%s</ExactDateTime>
             </DateTime>
             <Description>
                 <Text>Vital Signs</Text>
@@ -28,12 +35,12 @@ def Body_Results_gen(name, value, units, time_stamp, type=None):
                 </Description>
             </Source>
             <Test>
-                <CCRDataObjectID>''' + ObjectId_gen() + '''</CCRDataObjectID>
+                <CCRDataObjectID>%s</CCRDataObjectID>
                 <Type>
                     <Text>Observation</Text>
                 </Type>
                 <Description>
-                    <Text>''' + name + '''</Text>
+                    <Text>%s</Text>
                 </Description>
                 <Source>
                     <Description>
@@ -41,37 +48,23 @@ def Body_Results_gen(name, value, units, time_stamp, type=None):
                     </Description>
                 </Source>
                 <TestResult>
-                    <Value>''' + str(value) + '''</Value>
+                    <Value>%s</Value>
                     <Units>
-                        <Unit>''' + units + '''</Unit>
+                        <Unit>%s</Unit>
                     </Units>
                 </TestResult>
             </Test>
         </Result>'''
-    return result
 
-def Body_gen(channel_array):
-    body = ''
-    for i in channel_array:
-        sample, name = channel_array[i]
-        body += Body_Results_gen(name, sample.value, sample.unit, sample.timestamp)
-    return body
-    
-def CCR_gen(name, date_of_birth, channel_array):
-    first_name, family_name = name.split(' ')
-    body = Body_gen(channel_array)
-    time_stamp = datetime.datetime.now()
-    long_time = time_stamp.strftime('%Y-%m-%dT%H:%M:%S.') + str(time_stamp.microsecond)
-    CCR_ObjectId = ObjectId_gen()
-    ccr = '''
+HEADER_FMT = '''
 <ContinuityOfCareRecord xmlns="urn:astm-org:CCR" xmlns:msxsl="urn:schemas-microsoft-com:xslt" xmlns:ccr="urn:astm-org:CCR" xmlns:h="urn:com.microsoft.wc.thing" xmlns:v="urn:com.microsoft.wc.ccrVocab">
-<CCRDocumentObjectID>''' + CCR_ObjectId + '''</CCRDocumentObjectID>
+<CCRDocumentObjectID>%s</CCRDocumentObjectID>
 <Language>
     <Text>English</Text>
 </Language>
 <Version>V1.0</Version>
 <DateTime>
-    <ExactDateTime>''' + long_time + '''</ExactDateTime>
+    <ExactDateTime>%s</ExactDateTime>
 </DateTime>
 <Patient>
     <ActorID>PatientActor</ActorID>
@@ -85,7 +78,9 @@ def CCR_gen(name, date_of_birth, channel_array):
     </ActorLink>
 </From>
 <Body>
-    <VitalSigns>''' + body + '''
+    <VitalSigns>'''
+
+FOOTER_FMT = '''
     </VitalSigns>
 </Body>
 <Actors>
@@ -94,13 +89,13 @@ def CCR_gen(name, date_of_birth, channel_array):
         <Person>
             <Name>
                 <CurrentName>
-                    <Given>''' + first_name + '''</Given>
-                    <Family>''' + family_name + '''</Family>
+                    <Given>%s</Given>
+                    <Family>%s</Family>
                 </CurrentName>
-                <DisplayName>''' + name + '''</DisplayName>
+                <DisplayName>%s</DisplayName>
             </Name>
             <DateOfBirth>
-                <ExactDateTime>''' + date_of_birth + '''</ExactDateTime>
+                <ExactDateTime>%s</ExactDateTime>
             </DateOfBirth>
         </Person>
         <Source>
@@ -125,4 +120,111 @@ def CCR_gen(name, date_of_birth, channel_array):
     </Actor>
 </Actors>
 </ContinuityOfCareRecord>'''
-    return ccr, CCR_ObjectId
\ No newline at end of file
+
+_object_ids = []
+
+def _refill_object_ids():
+    try:
+        data = binascii.hexlify(os.urandom(16 * OBJECT_ID_BATCH))
+        _object_ids.extend([ data[i:i + 32]
+                             for i in xrange(0, len(data), 32) ])
+    except NotImplementedError:
+        # no OS randomness source
+        _object_ids.extend([ '%032x' % random.getrandbits(128)
+                             for i in xrange(OBJECT_ID_BATCH) ])
+
+def ObjectId_gen():
+    """Returns a random 128 bit object ID as 32 hex digits."""
+    while 1:
+        try:
+            return _object_ids.pop()
+        except IndexError:
+            _refill_object_ids()
+
+class _TimeFormatter:
+    """\
+    Formats timestamps as CCR ExactDateTime strings, caching the
+    formatted date and time of the most recent second.
+    """
+    def __init__(self):
+        self.__second = None
+        self.__prefix = None
+
+    def __call__(self, time_stamp):
+        time_stamp = float(time_stamp)
+        second = int(time_stamp // 1)
+        us = int(round((time_stamp - second) * 1e6))
+        if us >= 1000000:
+            second += 1
+            us -= 1000000
+        if second != self.__second:
+            self.__prefix = datetime.datetime.fromtimestamp(second).strftime(
+                '%Y-%m-%dT%H:%M:%S.')
+            self.__second = second
+        return self.__prefix + str(us)
+
+def Time_gen(time_stamp):
+    """Returns the CCR ExactDateTime string for a timestamp."""
+    return _TimeFormatter()(time_stamp)
+
+class CCRWriter:
+    """\
+    Writes a CCR document piece by piece to 'out', which is either a
+    callable taking a string or an object with a write() method.
+
+    Call start(), then add_sample() or add_result() for each result and
+    finish() at the end.  The document's object ID is available as the
+    object_id attribute.
+    """
+    def __init__(self, out, name, date_of_birth, object_id=None):
+        if hasattr(out, 'write'):
+            out = out.write
+        self.__write = out
+        self.__name = name
+        self.__date_of_birth = date_of_birth
+        self.__time = _TimeFormatter()
+        if object_id is None:
+            object_id = ObjectId_gen()
+        self.object_id = object_id
+        self.results = 0
+
+    def start(self):
+        now = time.time()
+        self.__write(HEADER_FMT % (self.object_id, self.__time(now)))
+
+    def add_result(self, name, value, units, time_stamp):
+        self.__write(RESULT_FMT % (ObjectId_gen(), self.__time(time_stamp),
+                                    ObjectId_gen(), name, str(value), units))
+        self.results += 1
+
+    def add_sample(self, sample, name):
+        self.add_result(name, sample.value, sample.unit, sample.timestamp)
+
+    def finish(self):
+        first_name, family_name = self.__name.split(' ')
+        self.__write(FOOTER_FMT % (first_name, family_name, self.__name,
+                                    self.__date_of_birth))
+
+def Body_Results_gen(name, value, units, time_stamp, type=None):
+    return RESULT_FMT % (ObjectId_gen(), Time_gen(time_stamp),
+                         ObjectId_gen(), name, str(value), units)
+
+def Body_gen(channel_array):
+    body = []
+    time_gen = _TimeFormatter()
+    for i in channel_array:
+        sample, name = channel_array[i]
+        body.append(RESULT_FMT % (ObjectId_gen(), time_gen(sample.timestamp),
+                                  ObjectId_gen(), name, str(sample.value),
+                                  sample.unit))
+    return ''.join(body)
+
+def CCR_gen(name, date_of_birth, channel_array):
+    ccr = []
+    writer = CCRWriter(ccr.append, name, date_of_birth)
+    writer.start()
+    for i in channel_array:
+        sample, sample_name = channel_array[i]
+        writer.add_sample(sample, sample_name)
+    writer.finish()
+    return ''.join(ccr), writer.object_id
@@ -61,7 +61,7 @@ DEFAULT_OPTIONAL_TASKS = (
     # (Python task path, optional description string)
     (' '.join((sys.executable,
                "src/presentations/embedded_web/build_pyhtml.py")),
-     "building embedded_web pyhtml"),
+     "building embedded_web pyhtml and static pages"),
     )
 
 ALWAYS_ANALYZE = (
@@ -126,6 +126,27 @@ class ChannelDatabase(ChannelDatabaseInterface):
         """
         return self.__logging_manager
 
+    def snapshot(self, prefix=None, since=None):
+        """
+        Returns a consistent, read-only
+        :class:`~channels.channel_database_snapshot.DatabaseSnapshot`
+        of the channels, sorted by name and grouped by device.
+
+        The snapshot is shared by all callers until a channel changes,
+        so this is the cheap way to dump all channels.  Its `seq`
+        attribute increases with every change; its `token` identifies
+        it across restarts.
+
+        Parameters:
+
+        * `prefix`: only include channels whose names start with it
+        * `since`: only include channels changed after the snapshot
+          with this `token`; a token not handed out since start-up
+          yields all channels
+
+        """
+        return self.__channel_publisher.snapshot(prefix, since)
+
     # We are not interacting with a logger in this interface, so leave
     # those functions un-implemented
     
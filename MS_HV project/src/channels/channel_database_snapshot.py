@@ -0,0 +1,376 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, Digi International (Digi). All Rights Reserved.       #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice, and the following   #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+
+"""
+Consistent, read-only snapshots of the whole channel database.
+
+A :class:`SnapshotTracker`, owned by the
+:class:`~channels.channel_publisher.ChannelPublisher`, is told of every
+new channel, removed channel and new sample.  It gives each change a
+sequence number one greater than the one before it and rebuilds only
+the entries of the channels which changed when the next snapshot is
+asked for.  All presentations thus share one snapshot until a channel
+changes.
+
+Snapshots are obtained through
+:meth:`~channels.channel_database.ChannelDatabase.snapshot`::
+
+    snapshot = cdb.snapshot()
+    for device, entries in snapshot.devices():
+        for entry in entries:
+            if entry.dumpable():
+                print entry.name, entry.sample.value
+
+    # later, only what changed since:
+    changes = cdb.snapshot(since=snapshot.token)
+
+Sequence numbers restart at 0 with every start-up, so a snapshot is
+identified outside the process by its `token`, which also names the
+tracker which handed it out.  A token from an earlier run yields the
+complete snapshot rather than the changes since an unrelated `seq`.
+
+"""
+
+# imports
+import random
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+
+from channels.channel import PERM_GET, OPT_DONOTDUMPDATA
+
+# constants
+
+# The change log is compacted once it holds this many more entries than
+# there are changed channels:
+COMPACT_SLACK = 256
+
+# exception classes
+
+# interface functions
+
+# classes
+
+class SnapshotEntry(tuple):
+    """
+    The state of one :class:`~channels.channel.Channel` in a
+    :class:`DatabaseSnapshot`.  Entries are tuples and cannot be
+    changed.
+
+    Contains the following attributes:
+
+    * `name`: full channel name, e.g. ``"template.counter"``
+    * `device`: the device instance part of the name
+    * `channel`: the rest of the name
+    * `sample`: copy of the channel's :class:`~samples.sample.Sample`,
+      None if the channel does not grant :const:`PERM_GET` or its
+      sample could not be read.  The sample is shared by all users of
+      the snapshot and must not be modified.
+    * `perm`: permissions mask of the channel
+    * `options`: options mask of the channel
+    * `type`: type of the channel's values
+    * `seq`: sequence number of the channel's latest change
+
+    """
+    __slots__ = ()
+
+    def __new__(cls, name, sample, perm, options, type, seq):
+        if '.' in name:
+            device, channel = name.split('.', 1)
+        else:
+            device, channel = '', name
+        return tuple.__new__(cls, (name, device, channel, sample, perm,
+                                   options, type, seq))
+
+    name = property(itemgetter(0))
+    device = property(itemgetter(1))
+    channel = property(itemgetter(2))
+    sample = property(itemgetter(3))
+    perm = property(itemgetter(4))
+    options = property(itemgetter(5))
+    type = property(itemgetter(6))
+    seq = property(itemgetter(7))
+
+    def dumpable(self):
+        """
+        True if the channel may be included in channel dumps: it
+        grants :const:`PERM_GET`, does not set :const:`OPT_DONOTDUMPDATA`
+        and its sample could be read.
+
+        """
+        return bool(self[3] is not None and self[4] & PERM_GET and
+                    not self[5] & OPT_DONOTDUMPDATA)
+
+
+class DatabaseSnapshot:
+    """
+    A read-only view of the channel database at one point of its
+    history, identified by the sequence number `seq`.  `token` is the
+    string ``"<epoch>:<seq>"`` to pass back as `since`, where `epoch`
+    identifies the :class:`SnapshotTracker` of this run.
+
+    The entries are sorted by channel name, so channels of one device
+    are next to each other.  `complete` is False for the views returned
+    for `since`, which hold only the channels changed after it;
+    `removed` then lists the channels removed after it.
+
+    """
+
+    def __init__(self, epoch, seq, entries, complete=True, removed=()):
+        self.epoch = epoch
+        self.seq = seq
+        self.token = '%s:%d' % (epoch, seq)
+        self.complete = complete
+        self.removed = removed
+        self.__entries = entries
+        self.__names = None
+        self.__devices = None
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __iter__(self):
+        return iter(self.__entries)
+
+    def entries(self):
+        """Returns the tuple of :class:`SnapshotEntry` objects."""
+        return self.__entries
+
+    def channel_list(self):
+        """Returns the sorted list of channel names."""
+        return list(self.__channel_names())
+
+    def get(self, channel_name, default=None):
+        """Returns the entry of `channel_name`, or `default`."""
+        names = self.__channel_names()
+        i = bisect_left(names, channel_name)
+        if i < len(names) and names[i] == channel_name:
+            return self.__entries[i]
+        return default
+
+    def devices(self):
+        """
+        Returns a tuple of (device name, tuple of entries) pairs, one
+        per device, sorted by device name.
+
+        """
+        if self.__devices is None:
+            devices = []
+            for entry in self.__entries:
+                if not devices or devices[-1][0] != entry.device:
+                    devices.append((entry.device, []))
+                devices[-1][1].append(entry)
+            self.__devices = tuple([ (device, tuple(entries))
+                                     for device, entries in devices ])
+        return self.__devices
+
+    def select(self, prefix=None):
+        """
+        Returns a view holding only the channels whose names start
+        with `prefix`.
+
+        """
+        if not prefix:
+            return self
+        names = self.__channel_names()
+        begin = bisect_left(names, prefix)
+        end = begin
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+        return DatabaseSnapshot(self.epoch, self.seq,
+                                self.__entries[begin:end],
+                                self.complete,
+                                tuple([ name for name in self.removed
+                                        if name.startswith(prefix) ]))
+
+    def __channel_names(self):
+        if self.__names is None:
+            self.__names = tuple([ entry[0] for entry in self.__entries ])
+        return self.__names
+
+
+class SnapshotTracker:
+    """
+    Follows the changes of the channel database and hands out
+    :class:`DatabaseSnapshot` objects.
+
+    Notification only records which channel changed; its entry is
+    built, from a copy of the channel's sample, by the next call to
+    :meth:`snapshot`.
+
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        # Tells the tokens of this run from those of earlier ones:
+        self.__epoch = '%x%04x' % (int(time.time()),
+                                   random.randint(0, 0xffff))
+        self.__seq = 0
+        self.__channels = {}        # channel name -> channel
+        self.__names = []           # sorted channel names
+        self.__entries = {}         # channel name -> SnapshotEntry
+        self.__dirty = {}           # channel name -> None, to rebuild
+        self.__last_change = {}     # channel name -> seq of last change
+        self.__removed = {}         # removed channel name -> seq
+        # Changes, oldest first.  A channel may appear more than once,
+        # only its last entry counts:
+        self.__log_seqs = []
+        self.__log_names = []
+        self.__snapshot = DatabaseSnapshot(self.__epoch, 0, ())
+
+    def channel_added(self, channel):
+        self.__lock.acquire()
+        try:
+            name = channel.name()
+            if name not in self.__channels:
+                insort(self.__names, name)
+            self.__channels[name] = channel
+            self.__removed.pop(name, None)
+            self.__changed(name)
+        finally:
+            self.__lock.release()
+
+    def channel_removed(self, channel):
+        self.__lock.acquire()
+        try:
+            name = channel.name()
+            if self.__channels.get(name) is not channel:
+                return
+            del self.__channels[name]
+            del self.__names[bisect_left(self.__names, name)]
+            self.__entries.pop(name, None)
+            self.__changed(name)
+            del self.__dirty[name]
+            self.__removed[name] = self.__seq
+        finally:
+            self.__lock.release()
+
+    def channel_changed(self, channel):
+        self.__lock.acquire()
+        try:
+            name = channel.name()
+            if name in self.__channels:
+                self.__changed(name)
+        finally:
+            self.__lock.release()
+
+    def seq(self):
+        """Returns the sequence number of the latest change."""
+        return self.__seq
+
+    def snapshot(self, since=None):
+        """
+        Returns the current :class:`DatabaseSnapshot`, or the view of
+        the channels changed after the snapshot whose `token` is
+        `since`.  A `since` which was not handed out by this tracker
+        (e.g. it predates a restart) yields the complete snapshot.
+
+        """
+        since_seq = self.__since_seq(since)
+        self.__lock.acquire()
+        try:
+            snapshot = self.__snapshot
+            if snapshot.seq != self.__seq:
+                snapshot = self.__rebuild()
+            if since_seq is None or since_seq > self.__seq:
+                return snapshot
+            if since_seq == self.__seq:
+                return DatabaseSnapshot(self.__epoch, self.__seq, (), False)
+
+            last_change = self.__last_change
+            entries = self.__entries
+            changed = []
+            removed = []
+            i = bisect_right(self.__log_seqs, since_seq)
+            for change_seq, name in zip(self.__log_seqs[i:],
+                                        self.__log_names[i:]):
+                if last_change[name] != change_seq:
+                    continue
+                if name in entries:
+                    changed.append(entries[name])
+                elif self.__removed.get(name) == change_seq:
+                    removed.append(name)
+            changed.sort()
+            removed.sort()
+            return DatabaseSnapshot(self.__epoch, self.__seq,
+                                    tuple(changed), False, tuple(removed))
+        finally:
+            self.__lock.release()
+
+    def __since_seq(self, since):
+        # The seq of a token of this tracker, None for any other value.
+        if not isinstance(since, basestring):
+            return None
+        token = since.split(':', 1)
+        if (len(token) != 2 or token[0] != self.__epoch or
+            not token[1].isdigit()):
+            return None
+        return int(token[1])
+
+    def __changed(self, name):
+        # Called with the lock held.
+        self.__seq += 1
+        self.__dirty[name] = None
+        self.__last_change[name] = self.__seq
+        self.__log_seqs.append(self.__seq)
+        self.__log_names.append(name)
+        if len(self.__log_seqs) > len(self.__last_change) + COMPACT_SLACK:
+            self.__compact()
+
+    def __rebuild(self):
+        # Called with the lock held.
+        entries = self.__entries
+        for name in self.__dirty:
+            channel = self.__channels[name]
+            perm = channel.perm_mask()
+            sample = None
+            if perm & PERM_GET:
+                try:
+                    sample = channel.get()
+                except Exception:
+                    pass
+            entries[name] = SnapshotEntry(name, sample, perm,
+                                          channel.options_mask(),
+                                          channel.type(),
+                                          self.__last_change[name])
+        self.__dirty = {}
+        self.__snapshot = DatabaseSnapshot(self.__epoch, self.__seq,
+            tuple([ entries[name] for name in self.__names ]))
+        return self.__snapshot
+
+    def __compact(self):
+        # keep only the last change of each channel:
+        log = [ (change_seq, name) for name, change_seq
+                in self.__last_change.iteritems() ]
+        log.sort()
+        self.__log_seqs = [ change_seq for change_seq, name in log ]
+        self.__log_names = [ name for change_seq, name in log ]
+
+
+# internal functions & classes
@@ -28,14 +28,37 @@
 # imports
 import sys, traceback
 import threading
-from copy import copy
+import time
+import re
+from fnmatch import translate
+from collections import deque
 
 from channels.channel import Channel, OPT_DONOTLOG
 from channels.logging.logging_events import \
     LoggingEventNewSample, LoggingEventChannelNew, LoggingEventChannelRemove
+from channels.channel_database_snapshot import SnapshotTracker
 
 # constants
 
+# Subscriber delivery modes:
+DELIVERY_SYNC = "sync"
+DELIVERY_ASYNC = "async"
+
+# Overflow policies for asynchronous subscriber queues:
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_COALESCE_LATEST = "coalesce_latest"
+OVERFLOW_BLOCK = "block"
+
+OVERFLOW_POLICIES = (OVERFLOW_DROP_OLDEST, OVERFLOW_COALESCE_LATEST,
+                     OVERFLOW_BLOCK)
+
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_DISPATCH_WORKERS = 2
+
+# Maximum number of notifications a dispatch worker delivers to one
+# subscriber before serving the next one:
+DISPATCH_BATCH = 16
+
 # exception classes
 class SubscriberNotFound(KeyError):
     """
@@ -68,12 +91,18 @@ class ChannelPublisher:
     existing channels, and can specify a method to be called when new
     samples are received.
 
+    By default callbacks are called synchronously on the thread of the
+    producer of the sample.  Subscribers which may be slow can instead
+    ask for asynchronous delivery, see :meth:`subscribe`.
+
     The primary routines of interest to most users of this class are:
 
     * :meth:`subscribe`
     * :meth:`unsubscribe`
     * :meth:`subscribe_to_all`
     * :meth:`unsubscribe_from_all`
+    * :meth:`subscribe_pattern`
+    * :meth:`unsubscribe_pattern`
     * :meth:`subscribe_new_channels`
     * :meth:`unsubscribe_new_channels`
 
@@ -82,17 +111,30 @@ class ChannelPublisher:
      
     """
 
-    def __init__(self, core_services):
+    def __init__(self, core_services,
+                 dispatch_workers=DEFAULT_DISPATCH_WORKERS):
         self.__core = core_services
-        self.__new_channel_listeners = set()
-        self.__channel_listeners = {}
+
+        # The subscriber tables are never modified in place.  Writers
+        # hold the lock and replace a tuple (or the whole dictionary)
+        # with an updated copy, so notification may read them without
+        # locking or copying.
+        self.__new_channel_listeners = ()
+        self.__channel_listeners = {} # channel name -> tuple of callbacks
+        self.__async_subscribers = {} # callback -> AsyncSubscriber
+        self.__patterns = PatternTrie()
+        self.__snapshots = SnapshotTracker()
         self.__rlock = threading.RLock()
         self.__logging_manager = None
 		
         from core.tracing import get_tracer
         self.__tracer = get_tracer("ChannelPublisher")
 
-    def subscribe(self, channel_name, callback):
+        self.__dispatch_pool = DispatchPool(dispatch_workers, self.__tracer)
+
+    def subscribe(self, channel_name, callback, delivery=DELIVERY_SYNC,
+                  queue_size=DEFAULT_QUEUE_SIZE,
+                  overflow=OVERFLOW_DROP_OLDEST):
         """
         Subscribe to the :class:`~channels.channel.Channel` specified
         by `channel_name`.  Subscribers may only have one callback per
@@ -103,20 +145,69 @@ class ChannelPublisher:
         the subscription.  When they come into existence they will
         properly notify subscribers of updates.
 
+        With `delivery` set to :const:`DELIVERY_ASYNC` notifications
+        are placed on a queue private to `callback` and delivered by a
+        small pool of dispatch threads, so a slow callback cannot stall
+        the producer of the sample.  The callback is then given a
+        read-only view of the channel holding the sample which caused
+        the notification.  Notifications to one callback are delivered
+        in order and never concurrently.
+
+        When the queue holds `queue_size` notifications, `overflow`
+        selects what happens to the next one:
+
+        * :const:`OVERFLOW_DROP_OLDEST`: the oldest notification is
+          discarded.
+        * :const:`OVERFLOW_COALESCE_LATEST`: a notification for a
+          channel already queued replaces the queued sample rather than
+          being added, otherwise the oldest notification is discarded.
+        * :const:`OVERFLOW_BLOCK`: the producer waits until the
+          callback catches up.
+
+        The delivery settings belong to the callback, not to the
+        channel; the most recent call to subscribe for a callback
+        determines them for all channels it is subscribed to.
+
         Parameters:
 
         * `channel_name`: Name of channel to subscribe to 
         * `callback`: Callable object to be called
+        * `delivery`: :const:`DELIVERY_SYNC` (default) or
+          :const:`DELIVERY_ASYNC`
+        * `queue_size`: Maximum number of queued asynchronous
+          notifications
+        * `overflow`: Overflow policy of the asynchronous queue
 
         """
 
+        if delivery not in (DELIVERY_SYNC, DELIVERY_ASYNC):
+            raise ValueError, "unknown delivery mode '%s'" % delivery
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError, "unknown overflow policy '%s'" % overflow
+        if queue_size < 1:
+            raise ValueError, "queue_size must be at least 1"
+
         self.__rlock.acquire()
         
         try:
-            if channel_name not in self.__channel_listeners:
-                self.__channel_listeners[channel_name] = set()
-        
-            self.__channel_listeners[channel_name].add(callback)
+            subscriber = self.__async_subscribers.get(callback)
+            if delivery == DELIVERY_ASYNC:
+                if (subscriber is None or
+                    subscriber.queue_size != queue_size or
+                    subscriber.overflow != overflow):
+                    async_subscribers = self.__async_subscribers.copy()
+                    async_subscribers[callback] = AsyncSubscriber(
+                        callback, self.__dispatch_pool, queue_size, overflow)
+                    self.__async_subscribers = async_subscribers
+                    if subscriber is not None:
+                        subscriber.close()
+            elif subscriber is not None:
+                self.__remove_async_subscriber(callback)
+
+            listeners = self.__channel_listeners.get(channel_name, ())
+            if callback not in listeners:
+                self.__channel_listeners[channel_name] = \
+                    listeners + (callback,)
         finally:
             self.__rlock.release()
 
@@ -142,12 +233,14 @@ class ChannelPublisher:
             if callback not in self.__channel_listeners[channel_name]:
                 raise SubscriberNotFound, "Subscriber not found."
         
-            self.__channel_listeners[channel_name].remove(callback)
+            self.__channel_listeners[channel_name] = \
+                _tuple_remove(self.__channel_listeners[channel_name], callback)
+            self.__release_async_subscriber(callback)
         
         finally:
             self.__rlock.release()
 
-    def subscribe_to_all(self, callback):
+    def subscribe_to_all(self, callback, **kwargs):
         """
         Subscribe to all currently existing channels.  Subscribers may only have
         one callback per channel, so calls to this method will replace
@@ -166,6 +259,9 @@ class ChannelPublisher:
         
         * `callback`:  Callable object to register
 
+        Further keyword arguments select the delivery mode as for
+        :meth:`subscribe`.
+
         """
 
     	self.__rlock.acquire()
@@ -174,7 +270,7 @@ class ChannelPublisher:
             cdb = self.__core.get_service("channel_manager").channel_database_get()
             channel_list = cdb.channel_list()
             for channel_name in channel_list:
-                self.subscribe(channel_name, callback)
+                self.subscribe(channel_name, callback, **kwargs)
         finally:
             self.__rlock.release()
 
@@ -188,12 +284,141 @@ class ChannelPublisher:
     	self.__rlock.acquire()
     
         try:
-            for channel_name in self.__channel_listeners:
-                if callback in self.__channel_listeners[channel_name]:
-                    self.__channel_listeners[channel_name].remove(callback)
+            self.__patterns.remove_callback(callback)
+            for channel_name, listeners in self.__channel_listeners.items():
+                if callback in listeners:
+                    self.__channel_listeners[channel_name] = \
+                        _tuple_remove(listeners, callback)
+            self.__release_async_subscriber(callback)
+        finally:
+            self.__rlock.release()
+
+    def subscribe_pattern(self, pattern, callback, **kwargs):
+        """
+        Subscribe to all channels whose names match the shell style
+        wildcard `pattern`, e.g. ``"device.*"`` or ``"*.temperature"``.
+
+        Unlike :meth:`subscribe_to_all` the subscription also covers
+        channels created later.  Patterns are matched once, when the
+        pattern is subscribed and when a channel is created, so the
+        number of patterns does not affect the cost of delivering a
+        sample.
+
+        Parameters:
+
+        * `pattern`: Wildcard pattern, ``*`` matches any characters,
+          ``?`` matches a single character
+        * `callback`: Callable object to be called
+
+        Further keyword arguments select the delivery mode as for
+        :meth:`subscribe`.
+
+        """
+
+        if not pattern:
+            raise ValueError, "pattern may not be empty"
+
+        self.__rlock.acquire()
+
+        try:
+            self.__patterns.add(pattern, callback, kwargs)
+            cdb = self.__core.get_service("channel_manager").channel_database_get()
+            for channel_name in cdb.channel_list():
+                if pattern_match(pattern, channel_name):
+                    self.subscribe(channel_name, callback, **kwargs)
+        finally:
+            self.__rlock.release()
+
+    def unsubscribe_pattern(self, pattern, callback):
+        """
+        Remove a subscription made with :meth:`subscribe_pattern`.
+
+        The callback is unsubscribed from the channels matching
+        `pattern` unless another of its patterns matches them too.
+
+        Parameters:
+
+        * `pattern`: The pattern registered previously
+        * `callback`: The callback registered previously
+
+        """
+
+        self.__rlock.acquire()
+
+        try:
+            if not self.__patterns.remove(pattern, callback):
+                raise SubscriberNotFound, "Subscriber not found."
+
+            for channel_name, listeners in self.__channel_listeners.items():
+                if (callback in listeners and
+                    pattern_match(pattern, channel_name) and
+                    callback not in self.__patterns.match(channel_name)):
+                    self.__channel_listeners[channel_name] = \
+                        _tuple_remove(listeners, callback)
+            self.__release_async_subscriber(callback)
         finally:
             self.__rlock.release()
 
+    def subscriber_stats(self, callback=None):
+        """
+        Report the delivery statistics of asynchronous subscribers.
+
+        Returns a dictionary with the following keys for `callback`,
+        or a dictionary mapping every asynchronously subscribed
+        callback to such a dictionary if `callback` is None:
+
+        * `queued`: notifications currently waiting for delivery
+        * `max_queued`: the largest number of waiting notifications
+        * `delivered`: notifications delivered
+        * `dropped`: notifications discarded because the queue was full
+        * `coalesced`: notifications merged into a queued one
+        * `blocked`: times the producer had to wait for the queue
+        * `errors`: deliveries which raised an exception
+        * `lag`: seconds the last delivered notification was queued
+        * `max_lag`: the longest time a notification was queued
+
+        """
+
+        subscribers = self.__async_subscribers
+
+        if callback is not None:
+            if callback not in subscribers:
+                raise SubscriberNotFound, "Subscriber not found."
+            return subscribers[callback].stats()
+
+        stats = {}
+        for callback, subscriber in subscribers.iteritems():
+            stats[callback] = subscriber.stats()
+        return stats
+
+    def snapshot(self, prefix=None, since=None):
+        """
+        Returns a
+        :class:`~channels.channel_database_snapshot.DatabaseSnapshot`
+        of all channels, see
+        :meth:`~channels.channel_database.ChannelDatabase.snapshot`.
+
+        """
+        return self.__snapshots.snapshot(since).select(prefix)
+
+    def __release_async_subscriber(self, callback):
+        # Discard the queue of an asynchronous subscriber once it is no
+        # longer subscribed to any channel. Called with the lock held.
+        subscriber = self.__async_subscribers.get(callback)
+        if subscriber is None:
+            return
+        for listeners in self.__channel_listeners.itervalues():
+            if callback in listeners:
+                return
+        self.__remove_async_subscriber(callback)
+
+    def __remove_async_subscriber(self, callback):
+        # Called with the lock held.
+        async_subscribers = self.__async_subscribers.copy()
+        subscriber = async_subscribers.pop(callback)
+        self.__async_subscribers = async_subscribers
+        subscriber.close()
+
 
     def subscribe_new_channels(self, callback):
         """
@@ -210,7 +435,8 @@ class ChannelPublisher:
         self.__rlock.acquire()
 
         try:
-            self.__new_channel_listeners.add(callback)
+            if callback not in self.__new_channel_listeners:
+                self.__new_channel_listeners += (callback,)
         finally:
             self.__rlock.release()
 
@@ -228,7 +454,10 @@ class ChannelPublisher:
         self.__rlock.acquire()
 
         try:
-            self.__new_channel_listeners.remove(callback)
+            if callback not in self.__new_channel_listeners:
+                raise KeyError, callback
+            self.__new_channel_listeners = _tuple_remove(
+                self.__new_channel_listeners, callback)
 
         finally:
             self.__rlock.release()
@@ -295,6 +524,16 @@ class ChannelPublisher:
         * `channel`:  the new channel
         
         """
+        self.__rlock.acquire()
+        try:
+            channel_name = channel.name()
+            for callback, kwargs in \
+                    self.__patterns.match(channel_name).iteritems():
+                self.subscribe(channel_name, callback, **kwargs)
+        finally:
+            self.__rlock.release()
+
+        self.__snapshots.channel_added(channel)
         self.__notify_new_channel(channel)
         self.__dispatch_logging_event(LoggingEventChannelNew(channel))
     	channel.add_new_sample_cb(self.new_sample_cb)
@@ -311,6 +550,7 @@ class ChannelPublisher:
         * `channel`:  the channel to be removed
         
     	"""
+        self.__snapshots.channel_removed(channel)
         self.__dispatch_logging_event(LoggingEventChannelRemove(channel))
 
     def new_sample_cb(self, channel):
@@ -327,35 +567,376 @@ class ChannelPublisher:
         * `channel`:  the channel with a new sample
         
         """
+        self.__snapshots.channel_changed(channel)
         self.__dispatch_logging_event(LoggingEventNewSample(channel))
         self.__notify(channel)
 
     def __notify(self, channel):
-        self.__rlock.acquire()
-        try:
-            channel_listeners = copy(self.__channel_listeners)
-        finally:
-            self.__rlock.release()
+        # No locking: the subscriber tables are replaced, never changed.
+        listeners = self.__channel_listeners.get(channel.name())
+        if not listeners:
+            return
+        async_subscribers = self.__async_subscribers
         try:
-            if channel.name() in channel_listeners:
-                for callback in copy(channel_listeners[channel.name()]):
+            for callback in listeners:
+                if callback in async_subscribers:
+                    async_subscribers[callback].put(channel)
+                else:
                     callback(channel)
         except Exception, e:
             self.__tracer.error("exception during channel" +
 								" notification: %s", traceback.format_exc())
 
     def __notify_new_channel(self, channel):
-        self.__rlock.acquire()
-        try:
-            new_channel_listeners = copy(self.__new_channel_listeners)
-        finally:
-            self.__rlock.release()
-
         try:
-            for callback in new_channel_listeners:
+            for callback in self.__new_channel_listeners:
                 callback(channel.name())
         except Exception, e:
             self.__tracer.error("exception during channel" + 
 			"notification: %s", traceback.format_exc())
 
+def pattern_match(pattern, name):
+    """
+    Returns True if the channel `name` matches the wildcard `pattern`
+    as used by :meth:`ChannelPublisher.subscribe_pattern`.
+
+    """
+    prefix, match_fn = _compile_pattern(pattern)
+    return name.startswith(prefix) and match_fn(name[len(prefix):])
+
 # internal functions & classes
+
+_WILDCARDS = "*?["
+
+def _compile_pattern(pattern):
+    # Split pattern into its literal prefix and a function matching the
+    # remainder of a name.
+    for i in xrange(len(pattern)):
+        if pattern[i] in _WILDCARDS:
+            break
+    else:
+        i = len(pattern)
+    prefix, suffix = pattern[:i], pattern[i:]
+
+    if not suffix:
+        return prefix, lambda rest: not rest
+    if not suffix.strip("*"):
+        return prefix, lambda rest: True
+    match = re.compile(translate(suffix)).match
+    return prefix, lambda rest: match(rest) is not None
+
+class PatternTrie:
+    """
+    Wildcard subscriptions indexed by the literal prefix of their
+    pattern, so matching a channel name only considers the patterns
+    along the path of the name in the trie.
+
+    Nodes are dictionaries mapping characters to child nodes; the key
+    None holds the list of [pattern, match function, callback,
+    subscribe arguments] entries of patterns ending their prefix at
+    that node.
+
+    """
+    def __init__(self):
+        self.__root = {}
+
+    def add(self, pattern, callback, kwargs):
+        prefix, match_fn = _compile_pattern(pattern)
+        node = self.__root
+        for c in prefix:
+            node = node.setdefault(c, {})
+        entries = node.setdefault(None, [])
+        for entry in entries:
+            if entry[0] == pattern and entry[2] == callback:
+                entry[3] = kwargs
+                return
+        entries.append([ pattern, match_fn, callback, kwargs ])
+
+    def remove(self, pattern, callback):
+        """Remove a pattern, returns False if it was not found."""
+        prefix, match_fn = _compile_pattern(pattern)
+        path = [ self.__root ]
+        for c in prefix:
+            if c not in path[-1]:
+                return False
+            path.append(path[-1][c])
+
+        entries = path[-1].get(None, [])
+        for entry in entries:
+            if entry[0] == pattern and entry[2] == callback:
+                entries.remove(entry)
+                break
+        else:
+            return False
+
+        # Prune nodes left empty:
+        if not entries:
+            del path[-1][None]
+        for i in xrange(len(prefix), 0, -1):
+            if path[i]:
+                break
+            del path[i - 1][prefix[i - 1]]
+        return True
+
+    def remove_callback(self, callback):
+        """Remove all patterns of callback."""
+        patterns = []
+        stack = [ self.__root ]
+        while stack:
+            node = stack.pop()
+            for key, value in node.iteritems():
+                if key is None:
+                    patterns.extend([ e[0] for e in value
+                                      if e[2] == callback ])
+                else:
+                    stack.append(value)
+        for pattern in patterns:
+            self.remove(pattern, callback)
+
+    def match(self, name):
+        """\
+        Returns a dictionary mapping the callbacks with a pattern
+        matching name to their subscribe arguments.
+
+        """
+        matches = {}
+        node = self.__root
+        i = 0
+        while 1:
+            entries = node.get(None)
+            if entries:
+                rest = name[i:]
+                for pattern, match_fn, callback, kwargs in entries:
+                    if match_fn(rest):
+                        matches[callback] = kwargs
+            if i == len(name):
+                break
+            node = node.get(name[i])
+            if node is None:
+                break
+            i += 1
+        return matches
+
+
+def _tuple_remove(items, item):
+    # Return the tuple 'items' without 'item'.
+    return tuple([ x for x in items if x != item ])
+
+class ChannelSnapshot:
+    """
+    Read-only view of a :class:`~channels.channel.Channel` as it was
+    when a notification was queued for an asynchronous subscriber.
+
+    The sample is fixed at the time of the notification; all other
+    requests are passed on to the channel itself.
+
+    """
+    def __init__(self, channel, sample):
+        self.__channel = channel
+        self.__sample = sample
+
+    def consumer_get(self):
+        return self.__sample
+
+    get = consumer_get
+    producer_get = consumer_get
+
+    def __getattr__(self, name):
+        return getattr(self.__channel, name)
+
+
+class AsyncSubscriber:
+    """
+    The bounded notification queue of one asynchronously delivered
+    callback, see :meth:`ChannelPublisher.subscribe`.
+
+    """
+    def __init__(self, callback, dispatch_pool, queue_size, overflow):
+        self.callback = callback
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.__dispatch_pool = dispatch_pool
+
+        # entries are [channel name, channel snapshot, time queued]:
+        self.__queue = deque()
+        self.__latest = {} # channel name -> queued entry when coalescing
+        self.__scheduled = False
+        self.__closed = False
+        self.__cond = threading.Condition(threading.Lock())
+
+        self.__stats = { 'queued': 0, 'max_queued': 0, 'delivered': 0,
+                         'dropped': 0, 'coalesced': 0, 'blocked': 0,
+                         'errors': 0, 'lag': 0.0, 'max_lag': 0.0, }
+
+    def put(self, channel):
+        name = channel.name()
+        snapshot = ChannelSnapshot(channel, channel.get())
+        stats = self.__stats
+
+        self.__cond.acquire()
+        try:
+            if self.__closed:
+                return
+
+            if self.overflow == OVERFLOW_COALESCE_LATEST:
+                entry = self.__latest.get(name)
+                if entry is not None:
+                    entry[1] = snapshot
+                    stats['coalesced'] += 1
+                    return
+
+            if len(self.__queue) >= self.queue_size:
+                if self.overflow == OVERFLOW_BLOCK:
+                    stats['blocked'] += 1
+                    while (len(self.__queue) >= self.queue_size and
+                           not self.__closed):
+                        self.__cond.wait()
+                    if self.__closed:
+                        return
+                else:
+                    self.__discard_oldest()
+                    stats['dropped'] += 1
+
+            entry = [ name, snapshot, time.time() ]
+            self.__queue.append(entry)
+            if self.overflow == OVERFLOW_COALESCE_LATEST:
+                self.__latest[name] = entry
+
+            queued = len(self.__queue)
+            stats['queued'] = queued
+            if queued > stats['max_queued']:
+                stats['max_queued'] = queued
+
+            if self.__scheduled:
+                return
+            self.__scheduled = True
+        finally:
+            self.__cond.release()
+
+        self.__dispatch_pool.schedule(self)
+
+    def deliver(self, max_count):
+        """\
+        Deliver up to `max_count` queued notifications.  Called by a
+        dispatch worker.  Returns True if notifications remain.
+
+        """
+        stats = self.__stats
+        for i in xrange(max_count):
+            self.__cond.acquire()
+            try:
+                if not len(self.__queue) or self.__closed:
+                    self.__scheduled = False
+                    return False
+                entry = self.__queue.popleft()
+                if self.overflow == OVERFLOW_COALESCE_LATEST:
+                    del self.__latest[entry[0]]
+                stats['queued'] = len(self.__queue)
+                self.__cond.notify()
+            finally:
+                self.__cond.release()
+
+            lag = time.time() - entry[2]
+            try:
+                self.callback(entry[1])
+            except Exception:
+                stats['errors'] += 1
+                raise
+            stats['delivered'] += 1
+            stats['lag'] = lag
+            if lag > stats['max_lag']:
+                stats['max_lag'] = lag
+
+        return self.resume()
+
+    def resume(self):
+        """\
+        Returns True if notifications remain to be delivered, otherwise
+        marks this subscriber as no longer scheduled for delivery.
+
+        """
+        self.__cond.acquire()
+        try:
+            if len(self.__queue) and not self.__closed:
+                return True
+            self.__scheduled = False
+            return False
+        finally:
+            self.__cond.release()
+
+    def close(self):
+        self.__cond.acquire()
+        try:
+            self.__closed = True
+            self.__queue.clear()
+            self.__latest.clear()
+            self.__stats['queued'] = 0
+            self.__cond.notifyAll()
+        finally:
+            self.__cond.release()
+
+    def stats(self):
+        return self.__stats.copy()
+
+    def __discard_oldest(self):
+        entry = self.__queue.popleft()
+        if self.overflow == OVERFLOW_COALESCE_LATEST:
+            del self.__latest[entry[0]]
+
+
+class DispatchPool:
+    """
+    A bounded pool of threads delivering the notifications of
+    :class:`AsyncSubscriber` queues.  Threads are started as they are
+    first needed.  A subscriber is served by at most one thread at a
+    time and is handed back to the pool after each batch so that one
+    busy subscriber does not starve the others.
+
+    """
+    def __init__(self, workers, tracer):
+        self.__max_workers = max(1, workers)
+        self.__workers = []
+        self.__idle = 0
+        self.__ready = deque()
+        self.__cond = threading.Condition(threading.Lock())
+        self.__tracer = tracer
+
+    def schedule(self, subscriber):
+        self.__cond.acquire()
+        try:
+            self.__ready.append(subscriber)
+            if (len(self.__ready) > self.__idle and
+                len(self.__workers) < self.__max_workers):
+                worker = threading.Thread(
+                    name="ChannelPublisherDispatch%d" % len(self.__workers),
+                    target=self.__run)
+                worker.setDaemon(True)
+                self.__workers.append(worker)
+                worker.start()
+            else:
+                self.__cond.notify()
+        finally:
+            self.__cond.release()
+
+    def __run(self):
+        while 1:
+            self.__cond.acquire()
+            try:
+                while not len(self.__ready):
+                    self.__idle += 1
+                    self.__cond.wait()
+                    self.__idle -= 1
+                subscriber = self.__ready.popleft()
+            finally:
+                self.__cond.release()
+
+            try:
+                pending = subscriber.deliver(DISPATCH_BATCH)
+            except Exception:
+                self.__tracer.error("exception during channel" +
+                                    " notification: %s",
+                                    traceback.format_exc())
+                pending = subscriber.resume()
+
+            if pending:
+                self.schedule(subscriber)
@@ -52,6 +52,10 @@ from channels.logging.file_logger.file_logger_storage_manager import \
 OP_Q_DEPTH = 512
 FILE_WRITE_Q_DEPTH = 512
 DEFAULT_SAMPLE_INDEX_FREQUENCY = 128
+DEFAULT_FLUSH_MAX_EVENTS = 100
+DEFAULT_FLUSH_MAX_BYTES = 8192
+DEFAULT_FLUSH_MAX_AGE = 60
+DEFAULT_FLUSH_FSYNC_EVERY = 0
 
 # interface
 
@@ -64,6 +68,19 @@ class FileLogger(LoggerBase):
     FileLoggerStorageManager in order to log events to a file on a
     file system accessible to the Python core.
 
+    Events are queued in memory and written to the file in batches.
+    A batch is written once any of the following flush policy settings
+    is reached:
+
+    * **flush_max_events:** number of queued events (default 100)
+    * **flush_max_bytes:** size of the queued events in bytes
+      (default 8192)
+    * **flush_max_age:** age of the oldest queued event in seconds
+      (default 60)
+
+    Setting **flush_fsync_every** to N also forces the file to stable
+    storage every N batches (default 0, never).
+
     """
     
     def __init__(self, name, core_services):
@@ -86,6 +103,22 @@ class FileLogger(LoggerBase):
             Setting(
                 name='sample_index_frequency', type=int, required=False,
                 default_value=DEFAULT_SAMPLE_INDEX_FREQUENCY),
+            Setting(
+                name='flush_max_events', type=int, required=False,
+                default_value=DEFAULT_FLUSH_MAX_EVENTS,
+                verify_function=lambda x: x > 0),
+            Setting(
+                name='flush_max_bytes', type=int, required=False,
+                default_value=DEFAULT_FLUSH_MAX_BYTES,
+                verify_function=lambda x: x > 0),
+            Setting(
+                name='flush_max_age', type=int, required=False,
+                default_value=DEFAULT_FLUSH_MAX_AGE,
+                verify_function=lambda x: x >= 0),
+            Setting(
+                name='flush_fsync_every', type=int, required=False,
+                default_value=DEFAULT_FLUSH_FSYNC_EVERY,
+                verify_function=lambda x: x >= 0),
         ]
 
         # State information:
@@ -121,6 +154,16 @@ class FileLogger(LoggerBase):
                     self.__class__.__name__, self.__name)
         self.__log_storage_mgr.queue_operation(op)
         
+    def flush_stats(self):
+        """\
+        Return a dictionary of statistics about the writes of queued
+        events to the log file: number of flushes, events and bytes
+        written, fsyncs, and the size and latency of the last flush.
+        """
+        if self.__log_storage_mgr is None:
+            return { }
+        return self.__log_storage_mgr.flush_stats()
+
     def channel_database_get(self):
         # TODO: return our instance of the correct DBI
         return self.__logger_dbi
@@ -26,7 +26,6 @@
 ############################################################################
 
 # imports 
-from copy import copy
 from threading import RLock, Event
 
 from channels.channel import Channel
@@ -35,7 +34,8 @@ from channels.logging.logging_events import \
     LoggingEventNewSample, LoggingEventChannelNew, LoggingEventChannelRemove, \
     LoggingEventMeta
 from channels.logging.file_logger.file_logger_storage_manager import \
-    RetrieveSeek, RetrieveNext, RetrievePrevious, \
+    RetrieveSeek, RetrieveNext, RetrievePrevious, RetrieveRange, \
+    RetrieveAggregates, \
     DBIEventBase, DBIEventChannelNew, DBIEventChannelRemove, \
     DBIEventNewSample, DBIEventChannelDump, \
     NoEvent, FlushOperation
@@ -44,6 +44,11 @@ from channels.channel_database_interface import \
     LOG_SEEK_SET, LOG_SEEK_CUR, LOG_SEEK_END, LOG_SEEK_REC, \
     ChannelDatabaseInterface, ChannelAlreadyExists, ChannelDoesNotExist
 
+# constants
+
+# Number of events retrieved per storage manager operation when
+# iterating forward through the log:
+LOG_EVENT_WINDOW = 64
 
 # classes
 
@@ -110,9 +115,23 @@ class FileLoggerChannelDBI(ChannelDatabaseInterface):
         self.__position = cdo.record_position
         self.__last_logging_event = LoggingEventMeta(record=self.__position,
                                         description="Channel dump")
+        return self.__last_logging_event
+
+    def __event_channel(self, channel_name):
+        # Return a channel for a logging event.  It is detached from the
+        # DBI context so that it keeps its sample when further events
+        # are applied, as happens when events are retrieved in ranges.
+        sample = self.__channels[channel_name].producer_get()
+        return Channel(name=channel_name,
+                       channel_source=ChannelSourceLogger(initial=sample))
+
+    def _last_logging_event(self):
+        # Return the logging event generated by the last applied event.
+        return self.__last_logging_event
     
     def _apply_event(self, event):
-        # Apply a log event to the DBI context.
+        # Apply a log event to the DBI context, returns the resulting
+        # logging event.
         if not isinstance(event, DBIEventBase):
             raise ValueError, "_apply_event: event must be of type EventBase"       
         if isinstance(event, DBIEventChannelDump):
@@ -124,16 +143,16 @@ class FileLoggerChannelDBI(ChannelDatabaseInterface):
                 name=event.channel_name,
                 channel_source=ChannelSourceLogger(initial=event.sample))
             logging_event = LoggingEventChannelNew(
-                        channel=copy(self.__channels[event.channel_name]),
+                        channel=self.__event_channel(event.channel_name),
                         record=event.record_position)
         elif isinstance(event, DBIEventNewSample):
             self.__channels[event.channel_name].producer_set(event.sample)
             logging_event = LoggingEventNewSample(
-                        channel=copy(self.__channels[event.channel_name]),
+                        channel=self.__event_channel(event.channel_name),
                         record=event.record_position)
         elif isinstance(event, DBIEventChannelRemove):
             logging_event = LoggingEventChannelRemove(
-                        channel=copy(self.__channels[event.channel_name]),
+                        channel=self.__event_channel(event.channel_name),
                         record=event.record_position)
             del(self.__channels[event.channel_name])
         else:
@@ -142,6 +161,7 @@ class FileLoggerChannelDBI(ChannelDatabaseInterface):
             
         self.__last_logging_event = logging_event
         self.__position = event.record_position
+        return logging_event
         
     def _apply_event_inverse(self, event):
         # Apply a log event inversely to the DBI context.
@@ -155,9 +175,9 @@ class FileLoggerChannelDBI(ChannelDatabaseInterface):
         logging_event = None
         if isinstance(event, DBIEventChannelNew):
             logging_event = LoggingEventChannelNew(
-                        channel=copy(self.__channels[event.channel_name]),
+                        channel=self.__event_channel(event.channel_name),
                         record=event.record_position)
-            logging_event.channel = copy(self.__channels[event.channel_name])
+            logging_event.channel = self.__event_channel(event.channel_name)
             try:
                 del(self.__channels[event.channel_name])
             except:
@@ -167,12 +187,12 @@ class FileLoggerChannelDBI(ChannelDatabaseInterface):
                 name=event.channel_name,
                 channel_source=ChannelSourceLogger(initial=event.sample))
             logging_event = LoggingEventChannelRemove(
-                        channel=copy(self.__channels[event.channel_name]),
+                        channel=self.__event_channel(event.channel_name),
                         record=event.record_position)
         elif isinstance(event, DBIEventNewSample):
             self.__channels[event.channel_name].producer_set(event.sample)
             logging_event = LoggingEventNewSample(
-                        channel=copy(self.__channels[event.channel_name]),
+                        channel=self.__event_channel(event.channel_name),
                         record=event.record_position)
         else:
             raise ValueError, "_apply_event_inverse: unknown event %s" % (
@@ -223,6 +243,48 @@ class FileLoggerChannelDBI(ChannelDatabaseInterface):
     def log_position(self):
         return self.__position
 
+    def log_event_range(self, from_record, to_record):
+        """\
+        Return a list of the logging events for the absolute records
+        `from_record` through `to_record` inclusively.
+
+        The whole range is retrieved with a single storage manager
+        operation.  As with :meth:`log_seek` the state of this database
+        is left at the last record retrieved.
+
+        """
+        if to_record < from_record:
+            raise ValueError, "to_record must not be less than from_record"
+
+        op = RetrieveRange(record_index=from_record,
+                           count=to_record - from_record + 1)
+        return self.__perform_operation(op)
+
+    def log_aggregate(self, bucket_size, start_time=None, end_time=None,
+                      channel_names=None):
+        """\
+        Compute aggregates of the numeric samples stored in the log.
+
+        Samples are grouped per channel into buckets of `bucket_size`
+        seconds, aligned to multiples of `bucket_size`.  Only samples
+        with timestamps within `start_time` and `end_time` (inclusive,
+        None for no bound) and of the channels named in the list
+        `channel_names` (None for all channels) are considered.
+
+        The aggregates are computed by the storage manager in a single
+        sequential pass over the log; the state of this database is not
+        changed.
+
+        Returns a dictionary mapping channel names to lists of
+        [bucket start, count, min, max, mean] lists, ordered by
+        bucket start.
+
+        """
+        op = RetrieveAggregates(bucket_size, start_time=start_time,
+                                end_time=end_time,
+                                channel_names=channel_names)
+        return self.__perform_operation(op)
+
     def log_event_iterator(self, from_record, to_record=None):
         # If you wish to terminate iteration of the log early the user MUST
         # call the close() method of the iterator in order to release
@@ -264,6 +326,12 @@ class FileLoggerChannelDBI(ChannelDatabaseInterface):
                 self.__islocked = True
 
                 try:
+                    if self.__step > 0:
+                        for logging_event in self.__log_event_windows():
+                            yield logging_event
+                        self.close()
+                        return
+
                     # set initial seek position:
                     op = RetrieveSeek(offset=0, whence=LOG_SEEK_REC,
                                       record_index=self.__from_record)
@@ -308,8 +376,43 @@ class FileLoggerChannelDBI(ChannelDatabaseInterface):
                     raise
                 self.close()
                 
+            def __log_event_windows(self):
+                # Iterate forward retrieving LOG_EVENT_WINDOW events
+                # per storage manager operation:
+                record = self.__from_record
+                while 1:
+                    count = LOG_EVENT_WINDOW
+                    if self.__to_record is not None:
+                        count = min(count, self.__to_record - record + 1)
+                        if count <= 0:
+                            break
+
+                    op = RetrieveRange(record_index=record, count=count)
+                    try:
+                        logging_events = self.__perform_op(op)
+                    except NoEvent:
+                        if (self.__to_record is not None or
+                            record == self.__from_record):
+                            # unexpected error, or the first record
+                            # is not in the log:
+                            raise
+                        # the log ended on a window boundary:
+                        break
+                    for logging_event in logging_events:
+                        if logging_event is not None:
+                            yield logging_event
+
+                    if len(logging_events) < count:
+                        if self.__to_record is not None:
+                            # unexpected error:
+                            raise NoEvent, "end of log at record %d" % (
+                                record + len(logging_events) - 1)
+                        break
+                    record = logging_events[-1].record + 1
+
             def close(self):
                 if self.__islocked:
+                    self.__islocked = False
                     self.__lock.release()
                 
         
@@ -0,0 +1,220 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, Digi International (Digi). All Rights Reserved.       #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice, and the following   #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+"""\
+Compact typed encoding of sample values for the FileLogger.
+
+Each value is stored as a single tag byte followed by a payload whose
+layout depends on the tag:
+
+=============  =================================================
+Tag            Payload
+=============  =================================================
+TAG_NONE       (none)
+TAG_FALSE      (none)
+TAG_TRUE       (none)
+TAG_INT        zig-zag encoded varint
+TAG_FLOAT      IEEE 754 double, big endian
+TAG_STR        varint length, bytes
+TAG_UNICODE    varint length, UTF-8 encoded bytes
+TAG_BOOLEAN    one byte: value in bit 0, coercion style above it
+TAG_PICKLE     varint length, pickle protocol 1 (any other type)
+=============  =================================================
+
+Varints are stored least significant group first, seven bits per byte
+with the high bit set on all but the last byte.
+"""
+
+# imports
+import struct
+import pickle
+
+from common.types.boolean import Boolean, STYLE_TF
+
+# constants
+TAG_NONE = '\x00'
+TAG_FALSE = '\x01'
+TAG_TRUE = '\x02'
+TAG_INT = '\x03'
+TAG_FLOAT = '\x04'
+TAG_STR = '\x05'
+TAG_UNICODE = '\x06'
+TAG_BOOLEAN = '\x07'
+TAG_PICKLE = '\x08'
+
+FLOAT_FMT = ">d"
+FLOAT_SIZE = struct.calcsize(FLOAT_FMT)
+
+# exception classes
+class SampleCodecError(ValueError):
+    pass
+
+# interface functions
+
+def encode_uvarint(n):
+    """Encode the non-negative integer 'n' as a varint string."""
+    if n < 0x80:
+        if n < 0:
+            raise SampleCodecError, "can't encode negative varint %d" % n
+        return chr(n)
+    out = []
+    while n > 0x7f:
+        out.append(chr((n & 0x7f) | 0x80))
+        n >>= 7
+    out.append(chr(n))
+    return ''.join(out)
+
+def decode_uvarint(data, pos):
+    """\
+Decode a varint from string 'data' at index 'pos'.
+
+Returns a tuple of the value and the index following the varint.
+    """
+    b = ord(data[pos])
+    if b < 0x80:
+        return b, pos + 1
+    result = b & 0x7f
+    shift = 7
+    while 1:
+        pos += 1
+        b = ord(data[pos])
+        result |= (b & 0x7f) << shift
+        if b < 0x80:
+            return result, pos + 1
+        shift += 7
+
+def encode_value(value):
+    """Return the tagged encoding of the sample value 'value'."""
+    try:
+        return _ENCODERS[type(value)](value)
+    except KeyError:
+        return _encode_pickle(value)
+
+def decode_value(data, pos):
+    """\
+Decode a tagged sample value from string 'data' at index 'pos'.
+
+Returns a tuple of the value and the index following the encoding.
+    """
+    try:
+        decoder = _DECODERS[data[pos]]
+    except KeyError:
+        raise SampleCodecError, "unknown value tag 0x%02x" % ord(data[pos])
+    return decoder(data, pos + 1)
+
+# internal functions & classes
+
+def _encode_none(value):
+    return TAG_NONE
+
+def _encode_bool(value):
+    if value:
+        return TAG_TRUE
+    return TAG_FALSE
+
+def _encode_int(value):
+    # zig-zag maps small magnitudes of either sign to small varints:
+    if value >= 0:
+        return TAG_INT + encode_uvarint(value << 1)
+    return TAG_INT + encode_uvarint(((-value) << 1) - 1)
+
+def _encode_float(value):
+    return TAG_FLOAT + struct.pack(FLOAT_FMT, value)
+
+def _encode_str(value):
+    return TAG_STR + encode_uvarint(len(value)) + value
+
+def _encode_unicode(value):
+    value = value.encode('utf-8')
+    return TAG_UNICODE + encode_uvarint(len(value)) + value
+
+def _encode_boolean(value):
+    style = getattr(value, '_Boolean__style', STYLE_TF)
+    return TAG_BOOLEAN + chr((style << 1) | (bool(value) and 1 or 0))
+
+def _encode_pickle(value):
+    value = pickle.dumps(value, protocol=1)
+    return TAG_PICKLE + encode_uvarint(len(value)) + value
+
+def _decode_none(data, pos):
+    return None, pos
+
+def _decode_false(data, pos):
+    return False, pos
+
+def _decode_true(data, pos):
+    return True, pos
+
+def _decode_int(data, pos):
+    n, pos = decode_uvarint(data, pos)
+    if n & 1:
+        return -((n + 1) >> 1), pos
+    return n >> 1, pos
+
+def _decode_float(data, pos):
+    end = pos + FLOAT_SIZE
+    return struct.unpack(FLOAT_FMT, data[pos:end])[0], end
+
+def _decode_str(data, pos):
+    length, pos = decode_uvarint(data, pos)
+    end = pos + length
+    return data[pos:end], end
+
+def _decode_unicode(data, pos):
+    value, pos = _decode_str(data, pos)
+    return value.decode('utf-8'), pos
+
+def _decode_boolean(data, pos):
+    b = ord(data[pos])
+    return Boolean(b & 1, style=b >> 1), pos + 1
+
+def _decode_pickle(data, pos):
+    value, pos = _decode_str(data, pos)
+    return pickle.loads(value), pos
+
+_ENCODERS = {
+    type(None): _encode_none,
+    bool: _encode_bool,
+    int: _encode_int,
+    long: _encode_int,
+    float: _encode_float,
+    str: _encode_str,
+    unicode: _encode_unicode,
+    Boolean: _encode_boolean,
+}
+
+_DECODERS = {
+    TAG_NONE: _decode_none,
+    TAG_FALSE: _decode_false,
+    TAG_TRUE: _decode_true,
+    TAG_INT: _decode_int,
+    TAG_FLOAT: _decode_float,
+    TAG_STR: _decode_str,
+    TAG_UNICODE: _decode_unicode,
+    TAG_BOOLEAN: _decode_boolean,
+    TAG_PICKLE: _decode_pickle,
+}
@@ -35,8 +35,8 @@ import Queue
 import struct
 import os
 import pickle
-import operator
 import StringIO
+import cStringIO
 import bisect
 
 import time
@@ -44,9 +44,12 @@ import time
 from collections import deque
 
 from channels.channel import PERM_GET
+from core.tracing import INFO
 from channels.channel_database_interface import \
     LOG_SEEK_SET, LOG_SEEK_CUR, LOG_SEEK_END, LOG_SEEK_REC
 from samples.sample import Sample
+from channels.logging.file_logger.file_logger_sample_codec import \
+    encode_uvarint, decode_uvarint, encode_value, decode_value
 
 # constants
 
@@ -62,21 +65,34 @@ from samples.sample import Sample
 # Ring Buffer) which would contain information used for the efficient
 # retrieval of log data by providing sorted, convenient access to
 # record numbering data.  This is a data structure that is maintained
-# in memory from an initial startup scan of the ERB presently.
+# in memory from an initial startup scan of the ERB presently, see the
+# ChannelDumpIndex class below.
 
 # Header
 
 # The header contains the following elements
 # Offset     Item
-#      0     Magic 'FL'
-#      2     ERB offset
-#      6     nameDB offset
-#      10     Instance name length
-#      11     File_Logger name when log file was created
-
-LOG_HDR_FMT = ">2sIIH"
+#      0     Magic 'FV'
+#      2     Format version
+#      3     ERB offset
+#      7     nameDB offset
+#     11     Instance name length
+#     13     File_Logger name when log file was created
+
+LOG_MAGIC = "FV"
+LOG_FORMAT_VERSION = 1
+LOG_HDR_FMT = ">2sBIIH"
 LOG_HDR_SIZE = struct.calcsize(LOG_HDR_FMT)
 
+# Logs written before the format version was introduced identify
+# themselves with the magic 'FL' and have no version field.  They are
+# treated as format version 0, and continue to be written in that
+# format until they are re-created.
+
+LEGACY_LOG_MAGIC = "FL"
+LEGACY_LOG_HDR_FMT = ">2sIIH"
+LEGACY_LOG_HDR_SIZE = struct.calcsize(LEGACY_LOG_HDR_FMT)
+
 # The CDORB.  The CDORB is a list that contains at a minimum ordered
 # offsets to channel dump events in the ERB.  It can be used to
 # efficiently locate a channel dump to provide a starting location
@@ -90,6 +106,13 @@ LOG_HDR_SIZE = struct.calcsize(LOG_HDR_FMT)
 # be either zero (can't point to the beginning of the file and
 # convenient with POSIX file seek behavior), or 0xffffffff (Erase
 # state of flash). Choice of either/both deferred until implementation.
+#
+# Because channel dumps are written every 'sample_index_frequency'
+# operations the CDORB doubles as a sparse record index: it maps every
+# Nth record number to an ERB offset from which the DBI state can be
+# rebuilt.  Entries are kept in write order, which is also ascending
+# record order, so that a record lookup is a binary search followed by
+# a scan of at most N events.
 
 # ERB elements
 
@@ -171,13 +194,20 @@ EVENT_NAMES = ["NONE", "CHANNEL_NEW", "CHANNEL_REMOVE", "NEW_SAMPLE",
 
 # Sample serializing
 # Samples as currently existing in the system contain three members
-# (unit, value, timestamp).  When an event writes sample(s) to disk it
-# uses a combination of the 'struct' (for unit and timestamp), and
-# 'pickle' (for value) modules to do so.
+# (unit, value, timestamp).  The serialization depends on the format
+# version of the log.
 
-# We will always pickle with protocol=1 currently because that
-# provides the best overhead for the simple data that is intended to
-# be primarily stored in Sample objects.
+# Format version 1 stores each item as a varint or tagged value as
+# implemented by the file_logger_sample_codec module:
+
+# Item
+#   Unit offset (offset of unit string in nameDB, varint)
+#   Timestamp (varint)
+#   Value (tagged value)
+
+# Format version 0 uses a combination of the 'struct' (for unit and
+# timestamp), and 'pickle' (for value) modules to do so.  It always
+# pickles with protocol=1.
 
 # Offset    Item
 #      0    Unit offset (offset of unit string in nameDB)
@@ -187,6 +217,17 @@ EVENT_NAMES = ["NONE", "CHANNEL_NEW", "CHANNEL_REMOVE", "NEW_SAMPLE",
 SAMPLE_FMT = ">II"
 SAMPLE_SIZE = struct.calcsize(SAMPLE_FMT)
 
+CHANNEL_OFF_FMT = ">I"
+CHANNEL_OFF_SIZE = struct.calcsize(CHANNEL_OFF_FMT)
+
+# Size of the sequential ERB reads performed when retrieving a range of
+# events.
+RANGE_READ_SIZE = 8192
+
+# Seconds after which a flush check which found no space in the
+# operation queue is tried again:
+FLUSH_CHECK_RETRY = 1.0
+
 # nameDB elements
 # Offset    Item
 #      0    Length
@@ -197,6 +238,50 @@ SAMPLE_SIZE = struct.calcsize(SAMPLE_FMT)
 ########
 # interface
 
+def format_sample_v0(unit_off, timestamp, value):
+    """Serialize a sample in format version 0."""
+    return struct.pack(SAMPLE_FMT, unit_off, timestamp) + \
+           pickle.dumps(value, protocol=1)
+
+def parse_sample_v0(data, pos):
+    """\
+Parse a sample serialized in format version 0 from string 'data' at
+index 'pos'.
+
+Returns a tuple of unit offset, timestamp, value and the index
+following the sample.
+    """
+    end = pos + SAMPLE_SIZE
+    unit_off, timestamp = struct.unpack(SAMPLE_FMT, data[pos:end])
+    sio = StringIO.StringIO(data)
+    sio.seek(end)
+    value = pickle.load(sio)
+    return unit_off, timestamp, value, sio.tell()
+
+def format_sample_v1(unit_off, timestamp, value):
+    """Serialize a sample in format version 1."""
+    return encode_uvarint(unit_off) + encode_uvarint(timestamp) + \
+           encode_value(value)
+
+def parse_sample_v1(data, pos):
+    """\
+Parse a sample serialized in format version 1 from string 'data' at
+index 'pos'.
+
+Returns a tuple of unit offset, timestamp, value and the index
+following the sample.
+    """
+    unit_off, pos = decode_uvarint(data, pos)
+    timestamp, pos = decode_uvarint(data, pos)
+    value, pos = decode_value(data, pos)
+    return unit_off, timestamp, value, pos
+
+# Sample serialization routines by log format version:
+SAMPLE_FORMATTERS = {
+    0: (format_sample_v0, parse_sample_v0),
+    1: (format_sample_v1, parse_sample_v1),
+}
+
 # classes
 
 class FileLoggerStorageManagerOperation(object):
@@ -297,6 +382,47 @@ Calls the given callback upon completion.
     pass
 
 
+class RetrieveRange(RetrievalOperationBase):
+    """\
+Instructs the FileLoggerStoreManager to retrieve the event with absolute
+record number 'record_index' and up to 'count' - 1 events following it.
+
+The events are decoded with sequential reads of the ERB and applied to
+the DBI in a single pass of the storage thread.  The given callback is
+called upon completion with a list of the resulting logging events.
+    """
+    def __init__(self, record_index, count, completion_cb=None):
+        self.record_index = record_index
+        self.count = count
+        RetrievalOperationBase.__init__(self,
+            completion_cb=completion_cb)
+
+class RetrieveAggregates(RetrievalOperationBase):
+    """\
+Instructs the FileLoggerStoreManager to compute aggregates of the
+numeric samples in the log.
+
+Samples are grouped per channel into time buckets 'bucket_size'
+seconds wide.  Only samples with timestamps between 'start_time' and
+'end_time' (inclusive, either may be None) and, if given, of the
+channels in the list 'channel_names' are considered.  The log is
+scanned once, sequentially, without altering the state of the DBI.
+
+Calls the given callback upon completion with a dictionary mapping
+channel names to lists of [bucket start, count, min, max, mean] lists
+ordered by bucket start.
+    """
+    def __init__(self, bucket_size, start_time=None, end_time=None,
+                 channel_names=None, completion_cb=None):
+        if bucket_size <= 0:
+            raise ValueError, "bucket_size must be positive"
+        self.bucket_size = bucket_size
+        self.start_time = start_time
+        self.end_time = end_time
+        self.channel_names = channel_names
+        RetrievalOperationBase.__init__(self,
+            completion_cb=completion_cb)
+
 class RetrievePrevious(RetrievalOperationBase):
     """\
 Instructs the FileLoggerStoreManager to retrieve the previous sample from the
@@ -315,6 +441,18 @@ Calls the given callback upon completion.
     """    
     pass
 
+class FlushCheck(FileLoggerStorageManagerOperation):
+    """\
+Instructs the FileLoggerStoreManager to check whether the file write
+queue is due to be written to disk.
+
+This event is scheduled automatically when events are queued in order
+to enforce the 'flush_max_age' setting of the FileLogger.
+    """
+    def __init__(self):
+        FileLoggerStorageManagerOperation.__init__(self,
+            priority=FileLoggerStorageManagerOperation.PRI_HIGH)
+
 class StopOperation(FileLoggerStorageManagerOperation):
     """\
 Instructs the FileLoggerStoreManager to terminate its thread.
@@ -409,6 +547,121 @@ class DBIEventChannelDump(StoreChannelDump, DBIEventBase):
         return "<%s: num_channels %d>" % (
             self.__class__.__name__, len(self.channel_dict))  
 
+class ChannelDumpIndex(object):
+    """\
+Sparse index of channel dump events in the ERB.
+
+Holds (offset, record) tuples in the order they were written to the
+ERB.  Record numbers are handed out monotonically by the storage
+manager, so write order is also ascending record order and lookups by
+record number are binary searches.  Entries are invalidated from the
+oldest end as the ERB write cursor wraps over them.
+    """
+    # Number of invalidated entries tolerated before the lists are
+    # compacted:
+    COMPACT_THRESHOLD = 64
+
+    def __init__(self):
+        self.__entries = [] # (offset, record) tuples in write order
+        self.__records = [] # record numbers only, parallel to __entries
+        self.__head = 0     # position of the oldest valid entry
+
+    def __len__(self):
+        return len(self.__entries) - self.__head
+
+    def __nonzero__(self):
+        return len(self.__entries) > self.__head
+
+    def __repr__(self):
+        return '<%s: %s>' % (self.__class__.__name__, repr(self.entries()))
+
+    def entries(self):
+        """Return a list of the valid (offset, record) tuples."""
+        return self.__entries[self.__head:]
+
+    def first(self):
+        """Return the (offset, record) tuple of the oldest channel dump."""
+        if not self:
+            raise IndexError, "channel dump index is empty"
+        return self.__entries[self.__head]
+
+    def last(self):
+        """Return the (offset, record) tuple of the newest channel dump."""
+        if not self:
+            raise IndexError, "channel dump index is empty"
+        return self.__entries[-1]
+
+    def append(self, offset, record):
+        """Add a newly written channel dump at ERB 'offset'."""
+        self.__entries.append((offset, record))
+        self.__records.append(record)
+
+    def clear(self):
+        self.__entries = []
+        self.__records = []
+        self.__head = 0
+
+    def clear_range(self, before, after):
+        """\
+Invalidate the oldest entries whose offsets fall within the ERB region
+[before, after) that is about to be overwritten.
+        """
+        entries = self.__entries
+        end = len(entries)
+        head = self.__head
+        while (head < end and
+               entries[head][0] >= before and
+               entries[head][0] < after):
+            head += 1
+        self.__head = head
+
+        if head >= self.COMPACT_THRESHOLD and head * 2 >= end:
+            del self.__entries[:head]
+            del self.__records[:head]
+            self.__head = 0
+
+    def rebuild(self, entries, cursor):
+        """\
+Rebuild the index from 'entries', a list of (offset, record) tuples in
+ERB offset order as found by a scan of the ERB.
+
+The entries are rotated so that the oldest entry, the first one at or
+beyond the write 'cursor', is at the head of the index.
+        """
+        split = 0
+        if entries and cursor < entries[-1][0]:
+            while entries[split][0] < cursor:
+                split += 1
+        entries = entries[split:] + entries[:split]
+        self.__entries = entries
+        self.__records = [ entry[1] for entry in entries ]
+        self.__head = 0
+
+    def closest(self, record_number, forward_retry=False):
+        """\
+Return the (offset, record) tuple of the channel dump closest to, and
+preferably not after, 'record_number'.
+
+If 'forward_retry' is set, the entry before the closest one is
+preferred.
+        """
+        if not self:
+            raise IndexError, "channel dump index is empty"
+        head = self.__head
+        records = self.__records
+        pos = bisect.bisect_left(records, record_number, head)
+        if forward_retry:
+            pos = max(head, pos - 1)
+        if pos >= len(records):
+            # All channel dumps are /less/ than the desired record, return
+            # the last entry:
+            return self.__entries[-1]
+        if pos > head and records[pos] > record_number:
+            # favor entries with lower record numbers than our needle:
+            return self.__entries[pos - 1]
+        return self.__entries[pos]
+
+
 class FileLoggerStorageManager(threading.Thread):
     def __init__(self, name, core_services, file_logger,
                     op_q_depths, file_write_q_depth):
@@ -430,12 +683,27 @@ class FileLoggerStorageManager(threading.Thread):
         
         ## File Write Queue initialization and state information:
         self.__file_write_q_depth = file_write_q_depth
-        self.__file_write_q = deque()
-        self.__last_write = time.time()
+        self.__file_write_q = deque() # (record, op, event type, body)
+        self.__file_write_q_bytes = 0 # serialized size of queued events
+        self.__file_write_q_since = None # time first event was queued
+        self.__write_buf = cStringIO.StringIO()
+        self.__flush_check_pending = False
+        self.__flushes_since_fsync = 0
+        self.__flush_stats = {
+            'flushes': 0,        # number of write queue flushes
+            'events': 0,         # events written
+            'bytes': 0,          # bytes written, including pad events
+            'fsyncs': 0,         # fsync calls made
+            'last_events': 0,    # events written by the last flush
+            'last_bytes': 0,     # bytes written by the last flush
+            'last_latency': 0.0, # duration of the last flush, seconds
+            'max_latency': 0.0,  # longest flush duration, seconds
+            'total_latency': 0.0,# sum of all flush durations, seconds
+        }
 
         ## Scanned state from log file
         self._logfile = None
-        self.__cdorb = deque() # List of ChannelDump offsets in ERB
+        self.__cdorb = ChannelDumpIndex() # ChannelDump offsets in ERB
         self.__names = {} # Maps channel names to offsets
         self.__offset_to_name_cache = {} # maps offsets to names on retrieval
 
@@ -445,6 +713,8 @@ class FileLoggerStorageManager(threading.Thread):
         
         self.__erb_off = None
         self.__nameDB_off = None
+        self.__format_sample_fn, self.__parse_sample_fn = \
+            SAMPLE_FORMATTERS[LOG_FORMAT_VERSION]
 
         self.__wraps = 0
         
@@ -495,13 +765,59 @@ class FileLoggerStorageManager(threading.Thread):
         except Queue.Full:
             self.__tracer.warning("no space in q, tossing '%s'", 
                                   operation.__class__.__name__)
-            return
+            return False
 
 
         # Notify thread of new operation:
         # NOTE: This is not being used to protect a critical section,
         # and does not need to match an acquire in this method
         self.__op_q_semaphore.release() 
+        return True
+
+    def flush_stats(self):
+        """\
+        Return a dictionary of statistics about the flushes of the file
+        write queue to disk.
+        """
+        return self.__flush_stats.copy()
+
+    def __flush_due(self):
+        # Returns the number of seconds until the file write queue must
+        # be written according to the flush policy of the file logger,
+        # zero if it is due now, or None if the queue is empty.
+        if not self.__file_write_q:
+            return None
+
+        get_setting = self.__file_logger.get_setting
+        if (len(self.__file_write_q) >= get_setting("flush_max_events") or
+            self.__file_write_q_bytes >= get_setting("flush_max_bytes")):
+            return 0
+
+        age = time.time() - self.__file_write_q_since
+        return max(0, get_setting("flush_max_age") - age)
+
+    def __schedule_flush_check(self, delay):
+        # Arrange for a FlushCheck operation to wake us up once the
+        # oldest queued event reaches 'flush_max_age'.  At most one
+        # check is outstanding at a time.
+        if self.__flush_check_pending or self.__core_services is None:
+            return
+        self.__flush_check_pending = True
+        try:
+            sched = self.__core_services.get_service("scheduler")
+            sched.schedule_after(delay, self.__queue_flush_check)
+        except Exception, e:
+            self.__flush_check_pending = False
+            self.__tracer.warning("unable to schedule flush check: %s",
+                                  str(e))
+
+    def __queue_flush_check(self):
+        # Scheduler callback.  If the operation queue is full the check
+        # is tossed, so it must be scheduled again or the buffered events
+        # of a quiet logger would never be flushed on age:
+        if not self.queue_operation(FlushCheck()):
+            self.__flush_check_pending = False
+            self.__schedule_flush_check(FLUSH_CHECK_RETRY)
     
     def run(self):
         """FileLoggerStorageManager thread execution beings here."""
@@ -513,20 +829,17 @@ class FileLoggerStorageManager(threading.Thread):
                 #       time.
                 break
             
-            # Case 2: if there are no pending operations and there
-            #         are items in our file write queue, go and service
-            #         the file write queue.  We must have more than 100
-            #         entries in the queue, or not have written for at
-            #         least a minute.  This helps us to use the flash
-            #         file system effectively.:
-            if (self.__op_q_pri_high.empty() \
-                and self.__op_q_pri_low.empty() \
-                and len(self.__file_write_q) \
-                and (len(self.__file_write_q) > 100
-                     or time.time() - self.__last_write > 60)):
-
-                self.__tracer.info("Writing %d items at time %.2f", 
-                                   len(self.__file_write_q), time.time())
+            # Case 2: if the flush policy says so, go and service the
+            #         file write queue.  The queue is written once it
+            #         holds 'flush_max_events' events or
+            #         'flush_max_bytes' bytes, or its oldest event is
+            #         'flush_max_age' seconds old.  Batching writes
+            #         helps us to use the flash file system effectively.
+            if self.__flush_due() == 0:
+
+                if self.__tracer.is_enabled_for(INFO):
+                    self.__tracer.info("Writing %d items at time %.2f",
+                                       len(self.__file_write_q), time.time())
 
                 if self.__debug_scan:
                     pre_state = self._extract_state()
@@ -551,7 +864,6 @@ class FileLoggerStorageManager(threading.Thread):
                                 pformat(scan_state))
                         sys.exit()
                 
-                self.__last_write = time.time()
                 continue
             
             # Case 3: wait for an operation to show up in one of our queues:
@@ -602,9 +914,25 @@ class FileLoggerStorageManager(threading.Thread):
 #                self.__tracer.info("RetrievePrevious")
                 self.do_retrieve_prev(op)
 
+            elif isinstance(op, RetrieveRange):
+#                self.__tracer.info("RetrieveRange")
+                self.do_retrieve_range(op)
+
+            elif isinstance(op, RetrieveAggregates):
+#                self.__tracer.info("RetrieveAggregates")
+                self.do_retrieve_aggregates(op)
+
             elif isinstance(op, FlushOperation):
 #                self.__tracer.info("FlushOperation")
                 self.do_flush_operation(op)
+
+            elif isinstance(op, FlushCheck):
+                # a due write queue is serviced at the top of this loop,
+                # otherwise check again when the next one will be due:
+                self.__flush_check_pending = False
+                flush_due = self.__flush_due()
+                if flush_due:
+                    self.__schedule_flush_check(flush_due)
                 
             elif isinstance(op, StopOperation):
 #                self.__tracer.info("StopOperation")                
@@ -616,12 +944,24 @@ class FileLoggerStorageManager(threading.Thread):
         if len(self.__file_write_q) >= self.__file_write_q_depth:
             self.__tracer.warning("Dropped log event, write queue full")
             return
-        
-        self.__file_write_q.append( (self.__record, op) )
+
+        # Serialize the event body now so that the size of the queue is
+        # known, the header is completed when the event is placed:
+        etype, body = self._generate_event_body(op)
+        if not self.__file_write_q:
+            self.__file_write_q_since = time.time()
+            self.__schedule_flush_check(
+                self.__file_logger.get_setting("flush_max_age"))
+        self.__file_write_q.append( (self.__record, op, etype, body) )
+        self.__file_write_q_bytes += EVENT_HEADER_SIZE + len(body)
         self.__record += 1
 
     def empty_write_q(self):
         dq = self.__file_write_q
+        buf = self.__write_buf
+        begin = time.time()
+        events = len(dq)
+        written = 0
 
         while dq:
             #self.__tracer.info("dq: %s", dq)
@@ -629,61 +969,46 @@ class FileLoggerStorageManager(threading.Thread):
             tmplast = self.__lastrecord
             wrap = False
 
-            writebuf = ""
+            # Re-use the write buffer's storage for each write:
+            buf.seek(0)
+            buf.truncate()
             totallength = 0
-            eventspan = 0
 
             while dq: # Can't decide we need to stop until we've serialized
-                #self.__tracer.info("writebuf: %s", repr(writebuf))
-                # pop an op
-                record, op = dq.popleft()
+                # pop an event
+                record, op, etype, body = dq.popleft()
                 #self.__tracer.info("record: %s op: %s", record, op)
-                
-                # serialize event
-                event, length = self._generate_event(op, record, tmplast)
-                #self.__tracer.info("event: %s", repr(event))
-                #self.__tracer.info("length: %s", length)
+                length = EVENT_HEADER_SIZE + len(body)
 
                 # if it will fit place in write stream, else push back op
                 newcursor = tmpcursor + length
                 if self.__nameDB_off - newcursor >= EVENT_HEADER_SIZE:
                     # Keep CDORB up to date
-                    
-#                     self.__tracer.info("Clearing for %s: %d - %d",
-#                         op.__class__.__name__,
-#                         tmpcursor,
-#                       newcursor)
                     self._clear_cdorb(tmpcursor,
                                       newcursor)
                     #self.__tracer.info("CDORB: %s", self.__cdorb)
 
-                    if isinstance(op, StoreChannelDump):
-                        #self.__tracer.info("Append: ", (tmpcursor, record))
-                        self.__cdorb.append((tmpcursor, record))
-                        
-                    writebuf = writebuf + event
+                    if etype == CHANNEL_DUMP:
+                        self.__cdorb.append(tmpcursor, record)
+
+                    buf.write(format_event_hdr(
+                        EventHeader((etype, record, length, tmplast))))
+                    buf.write(body)
                     tmplast = tmpcursor
                     tmpcursor = newcursor
                     totallength += length
-                    eventspan += length
                 else:
                     #self.__tracer.warning("Can't fit another, break")
                     # Process later
-                    dq.appendleft( (record, op) )
+                    dq.appendleft( (record, op, etype, body) )
                     break # Time to write
-                
-#                self.__tracer.info("totallength: %s tmpcursor: %s tmplast: %s", 
-#                                   totallength, hex(tmpcursor), hex(tmplast))
-
-#            self.__tracer.info("totallength: %s tmpcursor: %s tmplast: %s", 
-#                               totallength, hex(tmpcursor), hex(tmplast))
 
+            pad = ""
             endpad = False
             if len(dq) == 0:
                 # Pad until next event
                 try:
-                    pad = self._pad_write(writebuf, totallength, tmplast)
-                    writebuf = writebuf + pad
+                    pad = self._pad_write(buf, totallength, tmplast)
                 except self.PlaceError:
                     endpad = True
             else:
@@ -699,29 +1024,24 @@ class FileLoggerStorageManager(threading.Thread):
                                    tmplast))
                 
                 pad = format_event_hdr(pad)
-                writebuf = writebuf + pad
                 wrap = True
 
-            #self.__tracer.info("writebuf: %s", repr(writebuf))
-
-            padhdr = struct.unpack(EVENT_HEADER_FMT, pad)
-            padhdr = EventHeader(padhdr)
-            eventspan += padhdr.length
+            if pad:
+                buf.write(pad)
+                padhdr = EventHeader(struct.unpack(EVENT_HEADER_FMT, pad))
 
-            # Keep CDORB up to date
-            
-            self.__tracer.info("Clearing pad: %d - %d", 
-                               tmpcursor, tmpcursor + padhdr.length)
-            self._clear_cdorb(tmpcursor,
-                              tmpcursor + padhdr.length)
-            #self.__tracer.info("CDORB: %s", self.__cdorb)
-            #self.__tracer.info("padhdr: %s", padhdr)
-            #self.__tracer.info("eventspan: %s", eventspan)
+                # Keep CDORB up to date
+                self.__tracer.info("Clearing pad: %d - %d", 
+                                   tmpcursor, tmpcursor + padhdr.length)
+                self._clear_cdorb(tmpcursor,
+                                  tmpcursor + padhdr.length)
 
             # Write out padded event stream
+            writebuf = buf.getvalue()
             self._erb_seek(self.__recordcursor)
             self._logfile.write(writebuf)
             self._logfile.flush()
+            written += len(writebuf)
 
             if wrap:
                 #self.__tracer.info("Wrapping")
@@ -736,24 +1056,53 @@ class FileLoggerStorageManager(threading.Thread):
             
         # End top 'while'
 
-    def _clear_cdorb(self, before, after):
-        while (self.__cdorb and
-                  self.__cdorb[0][0] >= before and
-                  self.__cdorb[0][0] < after):
-            self.__cdorb.popleft()
-
-    def _generate_event(self, op, record, lastrecord):
-        if isinstance(op, StoreChannelNew) or \
-           isinstance(op, StoreNewSample) or \
-           isinstance(op, StoreChannelRemove):
+        self.__file_write_q_bytes = 0
+        self.__file_write_q_since = None
+        if not events:
+            return
 
-            return self._generate_single_event(op, record, lastrecord)
+        fsync_every = self.__file_logger.get_setting("flush_fsync_every")
+        self.__flushes_since_fsync += 1
+        if fsync_every > 0 and self.__flushes_since_fsync >= fsync_every:
+            self.__flushes_since_fsync = 0
+            self._fsync()
+
+        latency = time.time() - begin
+        stats = self.__flush_stats
+        stats['flushes'] += 1
+        stats['events'] += events
+        stats['bytes'] += written
+        stats['last_events'] = events
+        stats['last_bytes'] = written
+        stats['last_latency'] = latency
+        stats['max_latency'] = max(stats['max_latency'], latency)
+        stats['total_latency'] += latency
+
+    def _fsync(self):
+        # Not all platforms provide fsync():
+        fsync = getattr(os, "fsync", None)
+        if fsync is None:
+            return
+        try:
+            fsync(self._logfile.fileno())
+            self.__flush_stats['fsyncs'] += 1
+        except OSError, e:
+            self.__tracer.warning("fsync failed: %s", str(e))
 
-        elif isinstance(op, StoreChannelDump):
-            return self._generate_dump_event(op, record, lastrecord)
-                                        
+    def _clear_cdorb(self, before, after):
+        self.__cdorb.clear_range(before, after)
+
+    def _generate_event_body(self, op):
+        # Serialize the body of the event for 'op', returns a tuple of
+        # the event type and body.
+        if isinstance(op, StoreChannelDump):
+            body = [ ]
+            for name in op.channel_dict:
+                body.append(struct.pack(CHANNEL_OFF_FMT,
+                                        self._get_name_offset(name)))
+                body.append(self._format_sample(op.channel_dict[name]))
+            return CHANNEL_DUMP, "".join(body)
 
-    def _generate_single_event(self, op, record, lastrecord):
         if isinstance(op, StoreChannelNew):
             etype = CHANNEL_NEW
         elif isinstance(op, StoreNewSample):
@@ -761,37 +1110,9 @@ class FileLoggerStorageManager(threading.Thread):
         elif isinstance(op, StoreChannelRemove):
             etype = CHANNEL_REMOVE
 
-        channel_off = self._get_name_offset(op.channel_name)
-        channel_off = struct.pack('>I', channel_off)
-
-        sample = self._format_sample(op.sample)
-
-        size = EVENT_HEADER_SIZE + len(channel_off) + len(sample)
-        header = EventHeader((etype, record, size, lastrecord))
-        header = format_event_hdr(header)
-
-        event = header + channel_off + sample
-        return event, size
-
-    def _generate_dump_event(self, op, record, lastrecord):
-        body = ""
-
-        for name in op.channel_dict:
-            channel_off = self._get_name_offset(name)
-            channel_off = struct.pack('>I', channel_off)
-
-            sample = self._format_sample(op.channel_dict[name])
-
-            body += channel_off + sample
-
-        size = EVENT_HEADER_SIZE + len(body)
-        header = EventHeader((CHANNEL_DUMP,
-                              record, size,
-                              lastrecord))
-        header = format_event_hdr(header)
-
-        event = header + body
-        return event, size
+        channel_off = struct.pack(CHANNEL_OFF_FMT,
+                                  self._get_name_offset(op.channel_name))
+        return etype, channel_off + self._format_sample(op.sample)
 
     class PlaceError(Exception):
         pass
@@ -842,8 +1163,14 @@ class FileLoggerStorageManager(threading.Thread):
 
     def _format_sample(self, sample):
         unit_off = self._get_name_offset(sample.unit)
-        hdr = struct.pack(SAMPLE_FMT, unit_off, int(sample.timestamp))
-        return hdr + pickle.dumps(sample.value, protocol=1)
+        return self.__format_sample_fn(unit_off, int(sample.timestamp),
+                                       sample.value)
+
+    def _parse_sample(self, data, pos):
+        unit_off, timestamp, value, pos = self.__parse_sample_fn(data, pos)
+        sample = Sample(timestamp=timestamp, value=value,
+                        unit=self._get_name_by_offset(unit_off))
+        return sample, pos
 
     def _get_name_offset(self, name):
         # Keep names less than 256 bytes
@@ -928,15 +1255,28 @@ class FileLoggerStorageManager(threading.Thread):
 
         self._logfile.seek(0)
         # Verify we're looking at a good logfile
-        hdr = self._logfile.read(LOG_HDR_SIZE)
-        magic, self.__erb_off, self.__nameDB_off, name_length = struct.unpack(
-            LOG_HDR_FMT,
-            hdr)
-        
-        if magic != "FL":
+        magic = self._logfile.read(len(LOG_MAGIC))
+        self._logfile.seek(0)
+        if magic == LOG_MAGIC:
+            hdr = self._logfile.read(LOG_HDR_SIZE)
+            (magic, version, self.__erb_off,
+             self.__nameDB_off, name_length) = struct.unpack(LOG_HDR_FMT, hdr)
+        elif magic == LEGACY_LOG_MAGIC:
+            hdr = self._logfile.read(LEGACY_LOG_HDR_SIZE)
+            magic, self.__erb_off, self.__nameDB_off, name_length = \
+                struct.unpack(LEGACY_LOG_HDR_FMT, hdr)
+            version = 0
+        else:
             raise IOError, "%s(%s): : Bad log file" % (
                 self.__class__.__name__, self.__name)
 
+        if version not in SAMPLE_FORMATTERS:
+            raise IOError, "%s(%s): : Unsupported log format version %d" % (
+                self.__class__.__name__, self.__name, version)
+        self.__format_sample_fn, self.__parse_sample_fn = \
+            SAMPLE_FORMATTERS[version]
+        self.__tracer.info("Log format version %d", version)
+
         self.__tracer.info("Log self identifies as instance: ")
         self.__tracer.info(self._logfile.read(name_length))
 
@@ -955,7 +1295,7 @@ class FileLoggerStorageManager(threading.Thread):
         erb_off = struct.calcsize(creation_fmt)
         nameDB_off = erb_off + op.event_volume_size
         
-        hdr = struct.pack(creation_fmt, "FL",
+        hdr = struct.pack(creation_fmt, LOG_MAGIC, LOG_FORMAT_VERSION,
                           erb_off, nameDB_off,
                           length, self.__name)
         self._logfile.write(hdr)
@@ -990,6 +1330,7 @@ class FileLoggerStorageManager(threading.Thread):
         offset = self.__erb_off
         records = 0
         dumps = 0
+        cdorb_entries = []
 
         while offset < self.__nameDB_off:
             # Read in an event header
@@ -1007,7 +1348,7 @@ class FileLoggerStorageManager(threading.Thread):
 
             if hdr.type == CHANNEL_DUMP:
                 # Add this offset to cdorb
-                self.__cdorb.append((offset, hdr.record))
+                cdorb_entries.append((offset, hdr.record))
                 dumps += 1
 
             if hdr.record >= self.__record:
@@ -1034,11 +1375,7 @@ class FileLoggerStorageManager(threading.Thread):
         # the advancing record cursor for us to maintain it as we
         # write out.
 
-        # If record cursor is greater than any record offset in the
-        # cdorb, we're already in the correct state
-        if self.__cdorb and self.__recordcursor < self.__cdorb[-1][0]:
-            while self.__cdorb[0][0] < self.__recordcursor:
-                self.__cdorb.rotate(-1)
+        self.__cdorb.rebuild(cdorb_entries, self.__recordcursor)
 
     def _scan_names(self):
         # Build name database in memory
@@ -1086,12 +1423,26 @@ class FileLoggerStorageManager(threading.Thread):
             ret = e
         op.do_completion_callback(ret)
 
+    def do_retrieve_range(self, op):
+        try:
+            ret = self._retrieve_range(op.record_index, op.count)
+        except Exception, e:
+            ret = e
+        op.do_completion_callback(ret)
+
+    def do_retrieve_aggregates(self, op):
+        try:
+            ret = self._aggregate(op.bucket_size, op.start_time, op.end_time,
+                                  op.channel_names)
+        except Exception, e:
+            ret = e
+        op.do_completion_callback(ret)
+
     def do_flush_operation(self, op):
         try:
             self.__tracer.warning("Writing %d items at time %.2f",                
                 len(self.__file_write_q), time.time())
             self.empty_write_q()
-            self.__last_write = time.time()
             ret = True
         except Exception, e:
             ret = e
@@ -1115,21 +1466,27 @@ class FileLoggerStorageManager(threading.Thread):
         This method is most useful when used after a call to the helper
         method read_event_hdr()
         """
+        if event_header.type == PAD_EVENT:
+            raise NoEvent, "pad event"
+        return self._decode_erb_event(event_header,
+                    self._logfile.read(event_header.length))
+
+    def _decode_erb_event(self, event_header, body):
+        """\
+        Decodes the event described by 'event_header' from the string
+        'body', the event data following the header in the ERB.
+        """
         if event_header.type == PAD_EVENT:
             raise NoEvent, "pad event"
         ret_event = None
-        sio = StringIO.StringIO(self._logfile.read(event_header.length))
+        body_len = event_header.length - EVENT_HEADER_SIZE
         if (event_header.type == CHANNEL_NEW or
             event_header.type == CHANNEL_REMOVE or
             event_header.type == NEW_SAMPLE):
-            fmt_size = struct.calcsize(">I")
-            channel_off = struct.unpack(">I", sio.read(fmt_size))[0]
-            fmt_size = struct.calcsize(SAMPLE_FMT)
-            unit_off, timestamp = struct.unpack(SAMPLE_FMT, sio.read(fmt_size))
-            value = pickle.load(sio)
+            channel_off = struct.unpack(CHANNEL_OFF_FMT,
+                                        body[:CHANNEL_OFF_SIZE])[0]
+            sample, pos = self._parse_sample(body, CHANNEL_OFF_SIZE)
             channel_name = self._get_name_by_offset(channel_off)
-            unit_name = self._get_name_by_offset(unit_off)
-            sample = Sample(timestamp=timestamp, value=value, unit=unit_name)
             
             if event_header.type == CHANNEL_NEW:
                 ret_event = DBIEventChannelNew(channel_name=channel_name,
@@ -1146,42 +1503,22 @@ class FileLoggerStorageManager(threading.Thread):
                                                  
         elif event_header.type == CHANNEL_DUMP:
             channel_dict = {}
-            while sio.tell() < (event_header.length - EVENT_HEADER_SIZE - 1):
-                fmt_size = struct.calcsize(">I")
-                channel_off = struct.unpack(">I", sio.read(fmt_size))[0]
-                fmt_size = struct.calcsize(SAMPLE_FMT)
-                unit_off, timestamp = struct.unpack(SAMPLE_FMT, sio.read(fmt_size))
-                value = pickle.load(sio)
-                channel_name = self._get_name_by_offset(channel_off)
-                unit_name = self._get_name_by_offset(unit_off)
-                channel_dict[channel_name] = Sample(
-                                                timestamp=timestamp,
-                                                value=value,
-                                                unit=unit_name)
+            body = body[:body_len]
+            pos = 0
+            while pos < body_len:
+                end = pos + CHANNEL_OFF_SIZE
+                channel_off = struct.unpack(CHANNEL_OFF_FMT, body[pos:end])[0]
+                sample, pos = self._parse_sample(body, end)
+                channel_dict[self._get_name_by_offset(channel_off)] = sample
             ret_event = DBIEventChannelDump(channel_dump_dict=channel_dict,
                                         record_position=event_header.record)
         else:
             raise ValueError, "unknown event type: 0x02x" % event_header.type
 
-        sio.close()
         return ret_event
 
     def __closest_cdo_to(self, record_number, forward_retry):
-        sorted_cdorb = sorted(self.__cdorb, key=operator.itemgetter(1))
-        sorted_records = [ cdo[1] for cdo in sorted_cdorb ]
-        bisect_result = bisect.bisect_left(sorted_records, record_number)
-        if forward_retry:
-            bisect_result = max(0, bisect_result-1)
-        try:
-            cdo = sorted_cdorb[bisect_result]
-            if bisect_result > 0 and cdo[1] > record_number:
-                # favor CDORB entries with lower record numbers than our needle:
-                return sorted_cdorb[bisect_result-1]
-            return cdo
-        except IndexError:
-            # All channel dumps are /less/ than the desired record, return
-            # the last CDORB entry:
-            return sorted_cdorb[-1]
+        return self.__cdorb.closest(record_number, forward_retry)
 
     def __create_event_from_q_op(self, record, op):
         if isinstance(op, StoreChannelNew):
@@ -1212,7 +1549,7 @@ class FileLoggerStorageManager(threading.Thread):
         # scan-forward replaying events up until event record is replayed:
         i = 0
         while 1:
-            record, op = self.__file_write_q[i]
+            record, op = self.__file_write_q[i][:2]
             event = self.__create_event_from_q_op(record, op)
             self.__logger_dbi._apply_event(event)
             self.__ret_record = record
@@ -1242,7 +1579,7 @@ class FileLoggerStorageManager(threading.Thread):
 
     def __seek_earliest_rec(self):
         """Find the eariest record number in the logging storage system."""
-        cur_off, record_index = self.__cdorb[0]
+        cur_off, record_index = self.__cdorb.first()
         prev_hdr = None
         while 1:
             self._erb_seek(cur_off)
@@ -1269,16 +1606,26 @@ class FileLoggerStorageManager(threading.Thread):
             return self.__file_write_q[-1][0]
         
         # Otherwise, we must find the record number on disk:
-        cur_off, record_index = self.__cdorb[-1]
+        cur_off, record_index = self.__cdorb.last()
+        start_off = cur_off
         prev_hdr = None
         while 1:
             self._erb_seek(cur_off)
-            hdr = read_event_hdr(self._logfile)
+            try:
+                hdr = read_event_hdr(self._logfile)
+            except (NoEvent, BadEvent):
+                # Ran off the end of the events written so far
+                break
             if self.__finished_chk_forward(prev_hdr, hdr, cur_off):
                 break
-            record_index = hdr.record
-            prev_hdr = hdr
+            if hdr.type != PAD_EVENT:
+                # Pad events do not carry a record number
+                record_index = hdr.record
+                prev_hdr = hdr
             cur_off = self.__next_offset(cur_off, hdr)
+            if cur_off == start_off:
+                # Traversed the whole ERB
+                break
         
         return record_index
 
@@ -1362,9 +1709,12 @@ class FileLoggerStorageManager(threading.Thread):
 
         # Step 2: attempt to locate a cdorb entry if:
         #           a) We do not have a current disk offset because the
-        #              previous operation was in memory.
+        #              previous operation was in memory, or a flush of
+        #              the file write queue has since overwritten it.
         #           b) The requested record_index is more than halfway to
         #              the next index marker.
+        if self.__ret_off is not None and not self.__ret_off_valid():
+            self.__ret_off = None
         idx_frequency = self.__file_logger.get_setting("sample_index_frequency")
         if (self.__ret_off is None or self.__ret_record is None or
              (abs(record_index - self.__ret_record) > (idx_frequency // 2)) or
@@ -1416,6 +1766,205 @@ class FileLoggerStorageManager(threading.Thread):
 
         self.__ret_last_prev = (offset < 0)
 
+    def __ret_off_valid(self):
+        # True if the event at the retrieval offset is still the
+        # current record, i.e. the ERB has not wrapped over it:
+        try:
+            self._erb_seek(self.__ret_off)
+            hdr = read_event_hdr(self._logfile)
+        except (NoEvent, BadEvent):
+            return False
+        return hdr.type != PAD_EVENT and hdr.record == self.__ret_record
+
+    def __erb_read(self, offset, minimum):
+        # Read at least 'minimum' bytes from 'offset' without crossing
+        # the end of the ERB:
+        size = min(max(RANGE_READ_SIZE, minimum), self.__nameDB_off - offset)
+        self._erb_seek(offset)
+        return self._logfile.read(size)
+
+    def __apply_range_event(self, event):
+        try:
+            return self.__logger_dbi._apply_event(event)
+        except:
+            # The DBI no longer reflects the retrieval position, force
+            # the next seek to start over from a channel dump:
+            self.__ret_off = None
+            raise EventApplicationException
+
+    def _retrieve_range(self, record_index, count):
+        """\
+        Seek to absolute record 'record_index' and apply it and up to
+        'count' - 1 following events to the DBI.
+
+        Events following the seek position are read from disk using
+        buffered sequential reads of the ERB rather than a seek and
+        read per event.  Events not yet written to disk are taken from
+        the file write queue.
+
+        Returns a list of the logging events generated by the DBI.
+        """
+        self._seek(offset=0, whence=LOG_SEEK_REC, record_index=record_index)
+        logging_events = [ self.__logger_dbi._last_logging_event() ]
+
+        # Read forward from disk:
+        start_off = cur_off = self.__ret_off
+        prev_hdr = None
+        buf = ""
+        buf_off = cur_off
+        while cur_off is not None and len(logging_events) < count:
+            pos = cur_off - buf_off
+            if pos < 0 or pos + EVENT_HEADER_SIZE > len(buf):
+                buf = self.__erb_read(cur_off, EVENT_HEADER_SIZE)
+                buf_off, pos = cur_off, 0
+            hdr = EventHeader(struct.unpack(EVENT_HEADER_FMT,
+                                    buf[pos:pos + EVENT_HEADER_SIZE]))
+            if (hdr.type == 0x0 or hdr.type == 0xffff or
+                hdr.type >= MAX_TYPE or hdr.length < EVENT_HEADER_SIZE):
+                # end of log on disk
+                break
+            if self.__finished_chk_forward(prev_hdr, hdr, cur_off):
+                break
+
+            if hdr.type != PAD_EVENT:
+                if prev_hdr is None and hdr.record != self.__ret_record:
+                    # The seek position does not hold the record seeked
+                    # to; following events would not continue it:
+                    self.__ret_off = None
+                    raise NoEvent, "record %d not found on disk" % (
+                        self.__ret_record)
+                if prev_hdr is not None:
+                    # The first event is the one we seeked to and has
+                    # already been applied.
+                    if pos + hdr.length > len(buf):
+                        buf = self.__erb_read(cur_off, hdr.length)
+                        buf_off, pos = cur_off, 0
+                    event = self._decode_erb_event(hdr,
+                                buf[pos + EVENT_HEADER_SIZE:pos + hdr.length])
+                    logging_events.append(self.__apply_range_event(event))
+                    self.__ret_off, self.__ret_record = cur_off, hdr.record
+                prev_hdr = hdr
+
+            cur_off = self.__next_offset(cur_off, hdr)
+            if cur_off == start_off:
+                # Traversed the whole ERB
+                break
+
+        # Continue from the file write queue:
+        for record, op, etype, body in self.__file_write_q:
+            if len(logging_events) >= count:
+                break
+            if record <= self.__ret_record:
+                continue
+            if record != self.__ret_record + 1:
+                break
+            event = self.__create_event_from_q_op(record, op)
+            logging_events.append(self.__apply_range_event(event))
+            self.__ret_off, self.__ret_record = None, record
+
+        self.__ret_last_prev = False
+
+        return logging_events
+
+    def _aggregate(self, bucket_size, start_time, end_time, channel_names):
+        """\
+        Compute count, min, max and mean of the numeric NEW_SAMPLE
+        values per channel and time bucket.
+
+        The ERB is read once from beginning to end with buffered reads,
+        followed by the events still in the file write queue.  Samples
+        are decoded to raw values only; neither Sample objects nor DBI
+        events are created.
+
+        Returns a dictionary mapping channel names to lists of
+        [bucket start, count, min, max, mean] lists.
+        """
+        # Channels on disk are matched by their name offsets.  Samples
+        # are accumulated by channel name so that those still in the
+        # write queue fall in the same buckets:
+        channel_offs = { }
+        if channel_names is not None:
+            for name in channel_names:
+                if name in self.__names:
+                    channel_offs[self.__names[name]] = name
+
+        numeric = (int, long, float)
+        accumulators = { } # (channel name, bucket) -> [n, min, max, sum]
+
+        def accumulate(name, timestamp, value):
+            if not isinstance(value, numeric):
+                return
+            if start_time is not None and timestamp < start_time:
+                return
+            if end_time is not None and timestamp > end_time:
+                return
+            key = (name, timestamp - (timestamp % bucket_size))
+            acc = accumulators.get(key)
+            if acc is None:
+                accumulators[key] = [1, value, value, value]
+                return
+            acc[0] += 1
+            if value < acc[1]:
+                acc[1] = value
+            if value > acc[2]:
+                acc[2] = value
+            acc[3] += value
+
+        # Sequential scan of the ERB:
+        parse_sample = self.__parse_sample_fn
+        cur_off = self.__erb_off
+        buf = ""
+        buf_off = cur_off
+        while cur_off < self.__nameDB_off:
+            pos = cur_off - buf_off
+            if pos + EVENT_HEADER_SIZE > len(buf):
+                buf = self.__erb_read(cur_off, EVENT_HEADER_SIZE)
+                buf_off, pos = cur_off, 0
+            etype, record, length, previous = struct.unpack(EVENT_HEADER_FMT,
+                                            buf[pos:pos + EVENT_HEADER_SIZE])
+            if (etype == 0x0 or etype == 0xffff or
+                etype >= MAX_TYPE or length < EVENT_HEADER_SIZE):
+                # Hit the end of events in the ERB
+                break
+
+            if etype == NEW_SAMPLE:
+                if pos + length > len(buf):
+                    buf = self.__erb_read(cur_off, length)
+                    buf_off, pos = cur_off, 0
+                body_off = pos + EVENT_HEADER_SIZE
+                channel_off = struct.unpack(CHANNEL_OFF_FMT,
+                            buf[body_off:body_off + CHANNEL_OFF_SIZE])[0]
+                name = channel_offs.get(channel_off)
+                if name is None and channel_names is None:
+                    name = self._get_name_by_offset(channel_off)
+                    channel_offs[channel_off] = name
+                if name is not None:
+                    unit_off, timestamp, value, end = parse_sample(
+                        buf[body_off:pos + length], CHANNEL_OFF_SIZE)
+                    accumulate(name, timestamp, value)
+
+            cur_off += length
+
+        # Events not yet written to disk:
+        for record, op, etype, body in self.__file_write_q:
+            if etype != NEW_SAMPLE:
+                continue
+            name = op.channel_name
+            if channel_names is not None and name not in channel_names:
+                continue
+            accumulate(name, int(op.sample.timestamp), op.sample.value)
+
+        # Gather results by channel name:
+        results = { }
+        for (name, bucket), (n, vmin, vmax, vsum) in \
+                accumulators.iteritems():
+            results.setdefault(name, []).append(
+                [ bucket, n, vmin, vmax, float(vsum) / n ])
+        for buckets in results.itervalues():
+            buckets.sort()
+
+        return results
+
     def _dbi_initialize(self):
         """Initialize the DBI to the earliest state in the event ring buffer."""
       
@@ -1429,7 +1978,7 @@ class FileLoggerStorageManager(threading.Thread):
         return deepcopy((self.__record,
                          self.__lastrecord,
                          self.__recordcursor,
-                         self.__cdorb))
+                         self.__cdorb.entries()))
 
     def _clear_state(self):
         self.__record = -1
@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+
+from samples.sample import Sample
+from channels.channel_database_interface import LOG_SEEK_SET
+from channels.logging.file_logger.file_logger_channel_dbi import \
+    FileLoggerChannelDBI
+from channels.logging.file_logger.file_logger_storage_manager import \
+    FileLoggerStorageManager, VolumeInit, StoreChannelNew, StoreNewSample, \
+    StoreChannelDump, RetrieveSeek, RetrieveRange, FlushOperation, NoEvent
+
+class FakeFileLogger:
+    """ Stands in for the FileLogger; runs operations synchronously """
+    settings = { 'sample_index_frequency': 10,
+                 'flush_max_events': 16,
+                 'flush_max_bytes': 1 << 20,
+                 'flush_max_age': 3600,
+                 'flush_fsync_every': 0 }
+
+    def __init__(self, filename, size):
+        self.dbi = FileLoggerChannelDBI(op_req_method=self.perform)
+        self.mgr = FileLoggerStorageManager('file_logger_test', None, self,
+                                            64, 1024)
+        self.mgr.do_volume_init(VolumeInit(filename, size))
+        self.record = 0
+
+    def get_setting(self, name):
+        return self.settings[name]
+
+    def channel_database_get(self):
+        return self.dbi
+
+    def perform(self, op):
+        if isinstance(op, RetrieveSeek):
+            self.mgr.do_retrieve_seek(op)
+        elif isinstance(op, RetrieveRange):
+            self.mgr.do_retrieve_range(op)
+        elif isinstance(op, FlushOperation):
+            self.mgr.do_flush_operation(op)
+        else:
+            raise ValueError, op
+
+    def write(self, count, flush_every):
+        """ Log 'count' samples, writing every 'flush_every' events """
+        mgr = self.mgr
+        if not self.record:
+            mgr.queue_write_event(StoreChannelNew('dev.chan', Sample(0, 0)))
+        for i in range(count):
+            self.record += 1
+            if self.record % 10 == 0:
+                mgr.queue_write_event(StoreChannelDump(
+                    { 'dev.chan': Sample(self.record, self.record) }))
+            else:
+                mgr.queue_write_event(StoreNewSample('dev.chan',
+                                        Sample(self.record, self.record)))
+            if self.record % flush_every == 0:
+                mgr.empty_write_q()
+
+class RangeAfterWrap(unittest.TestCase):
+    """ Range reads of records the ERB wrapped over since the seek """
+    def setUp(self):
+        self.filename = tempfile.mktemp()
+        self.logger = FakeFileLogger(self.filename, 4096)
+
+    def tearDown(self):
+        self.logger.mgr._logfile.close()
+        os.remove(self.filename)
+
+    def assertContiguous(self, events, first):
+        records = [ event.record for event in events ]
+        self.assertEqual(records, range(first, first + len(records)))
+
+    def testRange(self):
+        """ Records following the seek position are contiguous """
+        dbi = self.logger.dbi
+        self.logger.write(350, 16)
+        dbi.log_seek(0, LOG_SEEK_SET)
+        first = dbi.log_position()
+        self.assertContiguous(dbi.log_event_range(first, first + 63), first)
+
+    def testRangeAfterWrap(self):
+        """ A record overwritten since the seek raises NoEvent """
+        dbi = self.logger.dbi
+        self.logger.write(350, 16)
+        dbi.log_seek(0, LOG_SEEK_SET)
+        first = dbi.log_position()
+        # Wrap the ERB over the record seeked to:
+        self.logger.perform(FlushOperation())
+        self.assertRaises(NoEvent, dbi.log_event_range, first, first + 63)
+        dbi.log_seek(0, LOG_SEEK_SET)
+        first = dbi.log_position()
+        self.assertContiguous(dbi.log_event_range(first, first + 63), first)
+
+    def testIteratorAfterWrap(self):
+        """ Iterating from an overwritten record raises NoEvent """
+        dbi = self.logger.dbi
+        self.logger.write(350, 16)
+        dbi.log_seek(0, LOG_SEEK_SET)
+        first = dbi.log_position()
+        # The iterator flushes the write queue, wrapping the ERB:
+        iterator = iter(dbi.log_event_iterator(first))
+        self.assertRaises(NoEvent, iterator.next)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -152,6 +152,14 @@ def dump_channel_db_as_text(cdb, startswith=""):
     Returns the channel database as a formatted string.
 
     """
+    if hasattr(cdb, 'snapshot'):
+        # the core channel database, read all channels at once:
+        return format_channel_table_generic(cdb.snapshot(prefix=startswith),
+                                lambda snapshot: snapshot.channel_list(),
+                                lambda snapshot, cn: snapshot.get(cn).dumpable(),
+                                lambda snapshot, cn: snapshot.get(cn).sample,
+                                startswith)
+
     # method which retrieves the channel list from the provided database
     channel_list_method = lambda cdb: cdb.channel_list()
 
@@ -51,13 +51,24 @@ service in a manner similar to the below example::
     sched_handle = self.__core.get_service("scheduler")
     sched_handle.schedule_after(5.0, function_to_call, 'function', 'arguments')
 
+Periodic events are scheduled with :meth:`SchedAsync.schedule_periodic`.
+Actions which may block should be scheduled with
+:meth:`SchedAsync.schedule_blocking_after`, which runs them on a small
+pool of worker threads rather than on the scheduler thread.
+
 """
 
 import digi_sched as sched
 import threading
-from copy import copy
+import Queue
 from core.tracing import get_tracer
 
+# constants
+
+# number of threads running the actions scheduled as blocking, started
+# on first use:
+BLOCKING_WORKERS = 2
+
 # exception classes
 class SchedulerBadCallback(Exception):
     """Exception raised when a bad callback is passed to schedule_after"""
@@ -85,14 +96,22 @@ class SchedAsync(threading.Thread):
 
         self.__sched = sched.scheduler()
 
+        self.__blocking_lock = threading.Lock()
+        self.__blocking_queue = Queue.Queue()
+        self.__blocking_workers = []
+
         threading.Thread.__init__(self)
         threading.Thread.setDaemon(self, True)
 
-    def __new_event(self, delay, priority, action, args):
+    def __new_event(self, delay, priority, action, args, interval=None):
         if self.__stop_flag:
             return None
 
-        event = self.__sched.enter(delay, priority, action, args)
+        if interval is None:
+            event = self.__sched.enter(delay, priority, action, args)
+        else:
+            event = self.__sched.enterperiodic(interval, priority,
+                                               action, args, delay)
         self.__semaphore.release()
 
         return event
@@ -100,14 +119,42 @@ class SchedAsync(threading.Thread):
     def __do_stop(self):
         self.__stop_flag = True
 
-        for event in copy(self.__sched.queue):
+        self.__sched.clear()
+
+        self.__blocking_lock.acquire()
+        try:
+            for worker in self.__blocking_workers:
+                self.__blocking_queue.put(None)
+        finally:
+            self.__blocking_lock.release()
+
+    def __run_blocking(self, action, args):
+        self.__blocking_lock.acquire()
+        try:
+            if not self.__blocking_workers:
+                for i in xrange(BLOCKING_WORKERS):
+                    worker = threading.Thread(
+                        name="%s_worker%d" % (self.__name, i),
+                        target=self.__blocking_worker)
+                    worker.setDaemon(True)
+                    worker.start()
+                    self.__blocking_workers.append(worker)
+        finally:
+            self.__blocking_lock.release()
+
+        self.__blocking_queue.put((action, args))
+
+    def __blocking_worker(self):
+        while True:
+            work = self.__blocking_queue.get()
+            if work is None:
+                break
+            action, args = work
             try:
-                self.__sched.cancel(event)
-            except ValueError:
-                # ValueError is raised by self.queue.remove(event)
-                # in digi_sched.py when the event cannot be located.
-                self.__tracer.warning(('unable to cancel nonexistent ' +
-                                       'event %s') % (event))
+                action(*args)
+            except Exception, e:
+                self.__tracer.error('Exception calling %s with args: %s: %s',
+                                    action, args, str(e))
 
     def start(self):
         """Called to start the scheduler thread."""
@@ -126,9 +173,11 @@ class SchedAsync(threading.Thread):
         """Cancel a given event given by `event_handle`.
 
         `event_handle` is the return value of an event scheduled by calling
-        :meth:`schedule_after`.
+        :meth:`schedule_after` or one of its variants.
 
-        If the event cannot be found :exc:`ValueError` will be raised.
+        If the event cannot be found :exc:`ValueError` will be raised,
+        e.g. if it has already occurred or been canceled.  Canceling an
+        event takes constant time.
         """
         self.__sched.cancel(event_handle)
 
@@ -150,6 +199,52 @@ class SchedAsync(threading.Thread):
         else:
             raise SchedulerBadCallback, "Scheduled action is not callable"
 
+    def schedule_periodic(self, interval, action, *args):
+        """Schedule an event which occurs every `interval` seconds.
+
+        Returns an event handle, which stays valid until it is passed
+        to :meth:`cancel`.
+
+        The first occurrence is `interval` seconds from now.  Later ones
+        are at whole multiples of `interval` after it, however long
+        `action` takes; occurrences missed when the scheduler was behind
+        are skipped.
+        """
+
+        if not callable(action):
+            raise SchedulerBadCallback, "Scheduled action is not callable"
+        if interval <= 0:
+            raise ValueError, "interval must be positive"
+        return self.__new_event(interval, self.PRIORITY_NORMAL,
+                                action, args, interval)
+
+    def schedule_blocking_after(self, delay, action, *args):
+        """Schedule an event whose action may block.
+
+        Returns an event handle, as :meth:`schedule_after`.
+
+        When the event becomes active `action` is run on a pool of
+        worker threads rather than the scheduler thread, so that it
+        does not delay other events.
+        """
+
+        if callable(action):
+            return self.__new_event(delay, self.PRIORITY_NORMAL,
+                                    self.__run_blocking, (action, args))
+        else:
+            raise SchedulerBadCallback, "Scheduled action is not callable"
+
+    def stats(self):
+        """Return a dictionary of statistics of the scheduler.
+
+        See :meth:`digi_sched.scheduler.stats`; `blocking_depth` is
+        added, the number of blocking actions waiting for a worker.
+        """
+
+        stats = self.__sched.stats()
+        stats['blocking_depth'] = self.__blocking_queue.qsize()
+        return stats
+
         
     def run(self):
         """An internal method used by the :class:`SchedAsync` thread.
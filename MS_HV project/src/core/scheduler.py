@@ -34,7 +34,8 @@
     will not perform blocking operations.  This is not enforced in the
     code.  Any blocking operations will degrade the performance of the
     entire system and cause delays in the execution of scheduled tasks
-    throughout. 
+    throughout.  Operations which may block should be scheduled with
+    ``schedule_blocking_after``, which runs them on worker threads.
 """
 
 # imports
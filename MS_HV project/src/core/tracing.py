@@ -43,6 +43,23 @@ under the framework can simply do this::
     tracer.error('A error message!')
     tracer.critical('A critical message!')
 
+Suppressed messages are cheap: a Tracer knows which levels can produce
+output and returns before doing any other work.  Where building the
+arguments of a message is itself costly, guard it::
+
+    if tracer.is_enabled_for(DEBUG):
+        tracer.debug('state: %s', pformat(state))
+
+Handlers are named by strings in the 'tracing:' section of dia.yml, for
+instance::
+
+    tracing:
+        default_level: 'info'
+        default_handlers:
+          - 'async:rotating=dia.log,max_bytes=65536,backups=2'
+          - 'memory,size=200'
+
+See _parse_handler_string() for the available handlers.
 '''
 
 # imports
@@ -50,6 +67,9 @@ import sys
 import threading
 import os
 import traceback
+import linecache
+import time
+from collections import deque
 
 from common.utils import wild_match
 
@@ -66,9 +86,26 @@ LEVELS = {'CRITICAL': 50,
 # reverse lookups
 LEVELS_REV = dict(zip(LEVELS.values(), LEVELS.keys()))
 
+CRITICAL = LEVELS['CRITICAL']
+ERROR = LEVELS['ERROR']
+WARNING = LEVELS['WARNING']
+INFO = LEVELS['INFO']
+DEBUG = LEVELS['DEBUG']
+NOTSET = LEVELS['NOTSET']
+
 # internal tracing manager instance
 _TM = None
 
+# handler defaults
+ROTATING_MAX_BYTES = 64 * 1024
+ROTATING_BACKUPS = 1
+ROTATING_BUFFER = 4096
+MEMORY_NAME = 'memory'
+MEMORY_SIZE = 100
+ASYNC_QUEUE_SIZE = 1000
+ASYNC_BATCH = 50
+ASYNC_INTERVAL = 1.0
+
 # internal functions
 
 
@@ -175,16 +212,19 @@ def _generate_filter(level_str, msg_str):
 
     # just a msg string
     elif not level_str:
-        return lambda x: _parse_msg_string(msg_str)(x.msg)
+        msg_func = _parse_msg_string(msg_str)
+        return lambda x: msg_func(x.msg)
 
     # just a level
     elif not msg_str:
-        return lambda x: _parse_lvl_string(level_str)(x.level)
+        level_func = _parse_lvl_string(level_str)
+        return lambda x: level_func(x.level)
 
     # both
     else:
-        return lambda x: _parse_lvl_string(level_str)(x.level) and \
-               _parse_msg_string(msg_str)(x.msg)
+        level_func = _parse_lvl_string(level_str)
+        msg_func = _parse_msg_string(msg_str)
+        return lambda x: level_func(x.level) and msg_func(x.msg)
 
 
 def _parse_lvl_string(level_str):
@@ -224,12 +264,12 @@ def _parse_slevel(slevel):
         slevel = slevel[1:]
         # make sure this level exists
         if not slevel.upper() in LEVELS:
-            __bad_parse_slevel(slevel)
+            return __bad_parse_slevel(slevel)
         else:
             lvl = LEVELS[slevel.upper()]
             return lambda x: x == lvl
     else:
-        __bad_parse_slevel(slevel)
+        return __bad_parse_slevel(slevel)
 
 
 def _parse_msg_string(msg_str):
@@ -425,14 +465,32 @@ def _get_handler(name):
 
     if not _TM:
         # if there is no manager, create a standalone item
-        return Handler(key)
+        return _make_handler(key)
 
     if not key in _TM.handler_registry:
-        _TM.handler_registry[key] = Handler(key)
+        _TM.handler_registry[key] = _make_handler(key)
 
     return _TM.handler_registry[key]
 
 
+def get_memory_handler(name=MEMORY_NAME):
+    '''
+    Return the memory handler configured as 'memory=<name>', or None if
+    there is none.  Its dump() method writes out the buffered messages.
+    '''
+    if not _TM:
+        return None
+
+    prefix = 'memory=%s,' % (name)
+    for key, handler in _TM.handler_registry.items():
+        if key.startswith('async:' + prefix):
+            return handler._target
+        elif key.startswith(prefix):
+            return handler
+
+    return None
+
+
 # classes
 
 class TracingManager(object):
@@ -696,7 +754,7 @@ def __get_handler(handler_string):
     #TODO: use key_type as a hook for new handler types
 
     if not key in _TM.handler_registry:
-        val = Handler(key)
+        val = _make_handler(key)
         _TM.handler_registry[key] = val
 
     return _TM.handler_registry[key]
@@ -707,13 +765,61 @@ class Tracer(object):
     An object which exposes five functions to the world for logging.
 
     Instances should be grabbed by calling tracing.get_tracer(name).
+
+    Whether a message of a given level can produce any output is worked
+    out in advance whenever the level or filters of the Tracer change,
+    so that suppressed messages cost a single lookup.
     '''
 
     def __init__(self, name, level, handlers, filters):
         self.name = name
-        self.level = level
         self.handlers = handlers
-        self.filters = filters
+        self._level = level
+        self._filters = filters
+        self._update_enabled()
+
+    def _get_level(self):
+        return self._level
+
+    def _set_level(self, level):
+        self._level = level
+        self._update_enabled()
+
+    level = property(_get_level, _set_level)
+
+    def _get_filters(self):
+        return self._filters
+
+    def _set_filters(self, filters):
+        self._filters = filters
+        self._update_enabled()
+
+    filters = property(_get_filters, _set_filters)
+
+    def _update_enabled(self):
+        # Cache is_enabled_for() of the standard levels:
+        enabled = {}
+        for level in LEVELS.itervalues():
+            enabled[level] = self._check_enabled(level)
+        self._enabled = enabled
+
+    def _check_enabled(self, level):
+        # basic cut-off
+        if self._level > level:
+            return False
+        # with filters, output only happens when one of them can match
+        if self._filters:
+            return _ormap(lambda x: x.accepts_level(level), self._filters)
+        return True
+
+    def is_enabled_for(self, level):
+        '''
+        Returns True if a message at level could produce any output.
+        '''
+        try:
+            return self._enabled[level]
+        except KeyError:
+            return self._check_enabled(level)
 
     def __repr__(self):
         ''' simple repr '''
@@ -734,11 +840,13 @@ class Tracer(object):
         respective numerical values as the level argument.
 
         '''
-        trace_event = TraceEvent(self.name, level, msg, args)
+        if self.is_enabled_for(level):
+            self._log(level, msg, args)
 
-        # basic cut-off
-        if self.level > level:
-            return
+    def _log(self, level, msg, args):
+        # Must be called directly by the public method the caller used.
+        trace_event = TraceEvent(self.name, level, msg, args,
+                                 _caller(2))
 
         default_write = not bool(self.filters)
 
@@ -766,35 +874,52 @@ class Tracer(object):
         '''
         Send a message at the critical level.
         '''
-        self.log(LEVELS['CRITICAL'], msg, *args)
+        if self._enabled[CRITICAL]:
+            self._log(CRITICAL, msg, args)
 
     def error(self, msg, *args):
         '''
         Send a message at the error level.
         '''
-        self.log(LEVELS['ERROR'], msg, *args)
+        if self._enabled[ERROR]:
+            self._log(ERROR, msg, args)
 
     def warning(self, msg, *args):
         '''
         Send a message at the warning level.
         '''
-        self.log(LEVELS['WARNING'], msg, *args)
+        if self._enabled[WARNING]:
+            self._log(WARNING, msg, args)
 
     def info(self, msg, *args):
         '''
         Send a message at the info level.
         '''
-        self.log(LEVELS['INFO'], msg, *args)
+        if self._enabled[INFO]:
+            self._log(INFO, msg, args)
 
     def debug(self, msg, *args):
         '''
         Send a message at the debug level.
         '''
-        self.log(LEVELS['DEBUG'], msg, *args)
+        if self._enabled[DEBUG]:
+            self._log(DEBUG, msg, args)
 
 # internal functions & classes
 
 
+def _caller(depth):
+    '''
+    Return (filename, line number) of the code depth frames above the
+    caller of this function.
+    '''
+    try:
+        frame = sys._getframe(depth + 1)
+        return frame.f_code.co_filename, frame.f_lineno
+    except Exception:
+        return '??', -1
+
+
 def _parse_handler_string(_str):
     '''
     Parse a handler string (from a yaml) and returns a unique string
@@ -806,10 +931,28 @@ def _parse_handler_string(_str):
          - stdout
          - stderr
          - file=hey_i_have_no_quotes
+         - rotating=dia.log,max_bytes=65536,backups=2,buffer=4096
+         - memory=recent,size=100
+         - async:file=dia.log
+
+    'file=' truncates the file and writes every message through.
 
-    TODO: this should be extended for more output types
+    'rotating=' appends to the file, buffering up to 'buffer' bytes of
+    messages (messages at ERROR and above are written at once).  When
+    the file would exceed 'max_bytes' it is renamed to <file>.1, older
+    copies are shifted up to <file>.<backups>, and a new file started.
+
+    'memory' keeps the last 'size' messages in a ring buffer that can be
+    dumped on demand, see get_memory_handler().  The name defaults to
+    'memory'.
+
+    'async:' followed by any other handler string queues messages and
+    writes them to that handler in batches from a background thread.
     '''
 
+    if _str.startswith('async:'):
+        return 'async:%s' % (_parse_handler_string(_str[6:]))
+
     if _str.lower() == 'stdout':
         return 'sys.stdout'
     elif _str.lower() == 'stderr':
@@ -817,10 +960,65 @@ def _parse_handler_string(_str):
     elif _str.startswith('file='):
         fname = os.path.abspath(_remove_quotes(_str[5:]))
         return 'file=%s' % (fname)
+    elif _str.startswith('rotating='):
+        fname, opts = _parse_handler_options(_str[9:],
+                                  {'max_bytes': ROTATING_MAX_BYTES,
+                                   'backups': ROTATING_BACKUPS,
+                                   'buffer': ROTATING_BUFFER})
+        return 'rotating=%s,max_bytes=%d,backups=%d,buffer=%d' % (
+            os.path.abspath(fname), opts['max_bytes'], opts['backups'],
+            opts['buffer'])
+    elif _str == 'memory' or _str.startswith('memory=') or \
+             _str.startswith('memory,'):
+        rest = _str[6:]
+        if rest.startswith('='):
+            rest = rest[1:]
+        name, opts = _parse_handler_options(rest, {'size': MEMORY_SIZE})
+        return 'memory=%s,size=%d' % (name or MEMORY_NAME, opts['size'])
     else:
         raise NotImplementedError
 
 
+def _parse_handler_options(_str, defaults):
+    '''
+    Parse '<value>,<option>=<int>,...' into the value and a dictionary
+    of the options, which must be among those in defaults.
+    '''
+    fields = _str.split(',')
+    opts = defaults.copy()
+    for field in fields[1:]:
+        try:
+            name, value = field.split('=', 1)
+            name = name.strip()
+            if name not in defaults:
+                raise ValueError
+            opts[name] = int(_remove_quotes(value.strip()))
+        except ValueError:
+            raise BadParseException('bad handler option "%s"' % (field))
+    value = fields[0].strip()
+    if value:
+        value = _remove_quotes(value)
+    return value, opts
+
+
+def _make_handler(key):
+    '''
+    Create the Handler for a key returned by _parse_handler_string().
+    '''
+    if key.startswith('async:'):
+        return AsyncHandler(key, _make_handler(key[6:]))
+    elif key.startswith('rotating='):
+        fname, opts = _parse_handler_options(key[9:],
+                                  {'max_bytes': 0, 'backups': 0, 'buffer': 0})
+        return RotatingFileHandler(key, fname, opts['max_bytes'],
+                                   opts['backups'], opts['buffer'])
+    elif key.startswith('memory='):
+        name, opts = _parse_handler_options(key[7:], {'size': 0})
+        return MemoryHandler(key, opts['size'])
+    else:
+        return Handler(key)
+
+
 class Handler(object):
     '''
     Manages access to a single flo.
@@ -857,7 +1055,19 @@ class Handler(object):
 
     def __repr__(self):
         ''' simple representation '''
-        return '<Handler ' + str({'key': self._key}) + '>'
+        return '<%s %s>' % (self.__class__.__name__, str({'key': self._key}))
+
+    def write_many(self, trace_events):
+        '''
+        Write a batch of TraceEvents, flushing once.
+        '''
+        self._lock.acquire()
+        try:
+            for trace_event in trace_events:
+                self._flo.write(str(trace_event))
+            self._flo.flush()
+        finally:
+            self._lock.release()
 
     def write(self, trace_event):
         '''
@@ -917,6 +1127,267 @@ class Handler(object):
                    'TracingManager killed early?)\n\tTrace event ' +
                    'was: (%s)') % (self.__key, str(trace_event))
 
+        def flush(self):
+            '''
+            Stub flush method used by Handler after calling close.
+            '''
+            pass
+
+
+class RotatingFileHandler(Handler):
+    '''
+    Appends to a file which is rotated when it would grow beyond
+    max_bytes, keeping up to backups older copies.
+
+    Messages are collected in memory and written out once buffer_size
+    bytes are pending, or at once for messages at ERROR and above, to
+    spare flash file systems from a write per message.
+    '''
+
+    def __init__(self, key, filename, max_bytes, backups, buffer_size):
+        self._lock = threading.RLock()
+        self._key = key
+        self._needs_close = True
+        self._closed = False
+
+        self._filename = filename
+        self._max_bytes = max_bytes
+        self._backups = backups
+        self._buffer_size = buffer_size
+        self._buffer = []
+        self._buffered = 0
+
+        self._flo = open(filename, 'a')
+        self._flo.seek(0, 2)
+        self._size = self._flo.tell()
+
+    def write(self, trace_event):
+        '''
+        Buffer output, writing it out when due.
+        '''
+        text = str(trace_event)
+        self._lock.acquire()
+        try:
+            self._buffer.append(text)
+            self._buffered += len(text)
+            if self._buffered >= self._buffer_size or \
+                   trace_event.level >= ERROR:
+                self.flush()
+        finally:
+            self._lock.release()
+
+    def write_many(self, trace_events):
+        '''
+        Write a batch of TraceEvents.
+        '''
+        self._lock.acquire()
+        try:
+            for trace_event in trace_events:
+                text = str(trace_event)
+                self._buffer.append(text)
+                self._buffered += len(text)
+            self.flush()
+        finally:
+            self._lock.release()
+
+    def flush(self):
+        '''
+        Write out all buffered output, rotating the file if needed.
+        '''
+        self._lock.acquire()
+        try:
+            if not self._buffer or self._closed:
+                return
+            chunk = []
+            for text in self._buffer:
+                if self._size and \
+                       self._size + len(text) > self._max_bytes:
+                    self._flo.write(''.join(chunk))
+                    self._rotate()
+                    chunk = []
+                chunk.append(text)
+                self._size += len(text)
+            self._flo.write(''.join(chunk))
+            self._flo.flush()
+            self._buffer = []
+            self._buffered = 0
+        finally:
+            self._lock.release()
+
+    def close(self):
+        '''
+        Write out buffered output and close the file.
+        '''
+        self.flush()
+        Handler.close(self)
+
+    def _rotate(self):
+        self._flo.close()
+        for i in range(self._backups, 0, -1):
+            if i == 1:
+                src = self._filename
+            else:
+                src = '%s.%d' % (self._filename, i - 1)
+            dst = '%s.%d' % (self._filename, i)
+            if os.path.exists(src):
+                if os.path.exists(dst):
+                    os.remove(dst)
+                os.rename(src, dst)
+        self._flo = open(self._filename, 'w')
+        self._size = 0
+
+
+class MemoryHandler(Handler):
+    '''
+    Keeps the most recent messages in memory, to be written out on
+    demand with dump().
+    '''
+
+    def __init__(self, key, size):
+        self._lock = threading.RLock()
+        self._key = key
+        self._needs_close = False
+        self._closed = False
+        self._size = size
+        self._events = deque()
+
+    def write(self, trace_event):
+        '''
+        Remember a TraceEvent, forgetting the oldest if full.
+        '''
+        self._lock.acquire()
+        try:
+            self._events.append(trace_event)
+            if len(self._events) > self._size:
+                self._events.popleft()
+        finally:
+            self._lock.release()
+
+    def write_many(self, trace_events):
+        '''
+        Remember a batch of TraceEvents.
+        '''
+        for trace_event in trace_events:
+            self.write(trace_event)
+
+    def dump(self, flo=None, clear=False):
+        '''
+        Write the remembered messages, oldest first, to flo (default
+        sys.stdout) and optionally forget them.
+        '''
+        if flo is None:
+            flo = sys.stdout
+        self._lock.acquire()
+        try:
+            events = list(self._events)
+            if clear:
+                self._events.clear()
+        finally:
+            self._lock.release()
+
+        for trace_event in events:
+            flo.write(str(trace_event))
+        return len(events)
+
+    def close(self):
+        '''
+        Nothing to close.
+        '''
+        pass
+
+
+class AsyncHandler(Handler):
+    '''
+    Hands messages to a background thread which writes them to another
+    Handler in batches, so that tracing never waits for output.
+
+    If more than ASYNC_QUEUE_SIZE messages are waiting the oldest are
+    dropped; the number dropped is reported once output resumes.
+    '''
+
+    def __init__(self, key, target):
+        self._key = key
+        self._target = target
+        self._queue = deque()
+        self._dropped = 0
+        self._closed = False
+        self._cond = threading.Condition(threading.Lock())
+
+        self._thread = threading.Thread(name='TraceHandler %s' % (key),
+                                        target=self._run)
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+    def write(self, trace_event):
+        '''
+        Queue a TraceEvent for writing.
+        '''
+        self._cond.acquire()
+        try:
+            if self._closed:
+                return
+            self._queue.append(trace_event)
+            if len(self._queue) > ASYNC_QUEUE_SIZE:
+                self._queue.popleft()
+                self._dropped += 1
+            # wake the thread for a first message or a full batch
+            if len(self._queue) == 1 or len(self._queue) == ASYNC_BATCH:
+                self._cond.notify()
+        finally:
+            self._cond.release()
+
+    def write_many(self, trace_events):
+        '''
+        Queue a batch of TraceEvents for writing.
+        '''
+        for trace_event in trace_events:
+            self.write(trace_event)
+
+    def close(self):
+        '''
+        Write out all queued messages and close the target Handler.
+        '''
+        self._cond.acquire()
+        try:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        finally:
+            self._cond.release()
+        self._thread.join()
+        self._target.close()
+
+    def _run(self):
+        while True:
+            self._cond.acquire()
+            try:
+                # Sleep until there is output, then give it up to
+                # ASYNC_INTERVAL seconds to make up a batch:
+                while not len(self._queue) and not self._closed:
+                    self._cond.wait()
+                if len(self._queue) < ASYNC_BATCH and not self._closed:
+                    self._cond.wait(ASYNC_INTERVAL)
+                events = list(self._queue)
+                self._queue.clear()
+                dropped = self._dropped
+                self._dropped = 0
+                closed = self._closed
+            finally:
+                self._cond.release()
+
+            if dropped:
+                events.insert(0, TraceEvent('tracing', WARNING,
+                    'trace handler %s dropped %d messages',
+                    (self._key, dropped)))
+            if events:
+                try:
+                    self._target.write_many(events)
+                except Exception:
+                    pass
+            if closed:
+                break
+
 
 class TraceEvent(object):
     '''
@@ -924,28 +1395,27 @@ class TraceEvent(object):
     This is what is generated and passed through the system when
     someone calls (log()|debug()|...) on a Tracer object.
 
-
+    `caller` is the (filename, line number) the message originated
+    from; the source text of that line is only read when asked for.
     '''
-    def __init__(self, tracer_name, level, msg, args):
+    def __init__(self, tracer_name, level, msg, args, caller=('??', -1)):
         self.tracer = tracer_name
         self.level = level
         self.msg = msg
         self.args = args
 
-        # grab information for debug
-        entries = traceback.extract_stack()
-        try:
-            entry = entries[len(entries) - 4]
-        except Exception, e:
-            entry = ('??', -1, '??', '??')
-
         # DEBUG
-        self.filename = entry[0]
-        self.lineno = entry[1]
-        self.debugtext = entry[3]
+        self.filename, self.lineno = caller
 
         # TODO: expand this to include time, etc...
 
+    def _get_debugtext(self):
+        if self.lineno < 0:
+            return '??'
+        return linecache.getline(self.filename, self.lineno).strip()
+
+    debugtext = property(_get_debugtext)
+
     def __str__(self):
         expanded_msg = ''
         if len(self.args) == 0:
@@ -1042,6 +1512,10 @@ class Filter(object):
                 1) 'stdout'
                 2) 'stderr'
                 3) 'file=<some filename>'
+                4) 'rotating=<some filename>[,<option>=<int>...]'
+                5) 'memory[=<name>][,size=<int>]'
+                6) 'async:<any of the above>'
+              (see _parse_handler_string)
 
         :param stop: boolean specifying whether or not processing should
                      continue after a match
@@ -1055,6 +1529,10 @@ class Filter(object):
         parsed_handlers = _parse_handlers(handlers)
 
         self.__filter_func = _generate_filter(level, msg)
+        if level:
+            self.__level_func = _parse_lvl_string(level)
+        else:
+            self.__level_func = lambda x: True
         self.__handlers = parsed_handlers
         self.__stop = stop
 
@@ -1069,6 +1547,13 @@ class Filter(object):
         return self._config
 
 
+    def accepts_level(self, level):
+        '''
+        Returns True if this Filter may match a TraceEvent at level.
+        '''
+        return bool(self.__level_func(level))
+
+
     def examine(self, trace_event):
         '''
         Process a trace event (and possibly writing to Handlers).
@@ -29,9 +29,9 @@
 # imports
 from devices.device_base import DeviceBase
 from settings.settings_base import SettingsBase, Setting
+from devices.polled_device_base import PolledDeviceBase
 from channels.channel_source_device_property import *
 
-import threading
 import sys
 import time
 
@@ -63,7 +63,7 @@ channel_map = { PROP_15SEC: 15,
 
 # classes
 
-class AlarmClockDevice(DeviceBase, threading.Thread):
+class AlarmClockDevice(DeviceBase, PolledDeviceBase):
     """
     This class extends one of our base classes and is intended as an
     example of a concrete, example implementation, but it is not itself
@@ -127,10 +127,8 @@ class AlarmClockDevice(DeviceBase, threading.Thread):
         DeviceBase.__init__(self, self.__name, self.__core,
                                 settings_list, property_list)
 
-        ## Thread initialization:
-        self.__stopevent = threading.Event()
-        threading.Thread.__init__(self, name=name)
-        threading.Thread.setDaemon(self, True)
+        ## Polling initialization:
+        PolledDeviceBase.__init__(self, self.__core)
 
     ## Functions which must be implemented to conform to the DeviceBase
     ## interface:
@@ -156,12 +154,15 @@ class AlarmClockDevice(DeviceBase, threading.Thread):
         return (accepted, rejected, not_found)
 
     def start(self):
-        threading.Thread.start(self)
+
+        # Baseline relative time targets
+        self._set_targets()
+        self.poll_start()
 
         return True
 
     def stop(self):
-        self.__stopevent.set()
+        self.poll_stop()
         return True
 
     ## Locally defined functions:
@@ -210,23 +211,12 @@ class AlarmClockDevice(DeviceBase, threading.Thread):
                 self.targets[tgt] = self.time_now + channel_map[tgt]
         
 
-    # Threading related functions:
-    def run(self):
-
-        # Baseline relative time targets
-        self._set_targets()
-
-        while 1:
-            if self.__stopevent.isSet():
-                self.__stopevent.clear()
-                break
-
-            rate = SettingsBase.get_setting(self, PROP_TICK_RATE)
-            self._trigger(rate)
+    # Polling related functions:
+    def poll_interval(self):
+        return SettingsBase.get_setting(self, PROP_TICK_RATE)
 
-            time.sleep(rate)
-
-        return
+    def poll(self):
+        self._trigger(self.poll_interval())
 
 # internal functions & classes
 
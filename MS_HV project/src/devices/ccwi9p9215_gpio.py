@@ -30,13 +30,13 @@ import digihw
 from devices.device_base import DeviceBase
 from settings.settings_base import SettingsBase, Setting
 from channels.channel_source_device_property import *
+from devices.polled_device_base import PolledDeviceBase
 from samples.sample import Sample
-from common.shutdown import SHUTDOWN_WAIT
 import threading
 import time
 
 #Main class
-class ModuleGPIOs(DeviceBase, threading.Thread):
+class ModuleGPIOs(DeviceBase, PolledDeviceBase):
     """
     This class extends one of our base classes and is intended as an
     example of a concrete, example implementation, but it is not itself
@@ -49,7 +49,6 @@ class ModuleGPIOs(DeviceBase, threading.Thread):
     #Class vars
     gpios = {}
     gpios_ind = {}
-    setting_gpio=False
     for i in xrange (0,32):
         gpios["GPIO_"+str(i)]=0        
     for i in xrange (0,32):
@@ -58,7 +57,8 @@ class ModuleGPIOs(DeviceBase, threading.Thread):
     def __init__(self, name, core_services):
         self.__name = name
         self.__core = core_services
-        self.setting_gpio = False
+        #Serializes reading the inputs with setting an output
+        self.__gpio_lock = threading.Lock()
         
         from core.tracing import get_tracer
         self.__tracer = get_tracer(name)
@@ -268,10 +268,8 @@ class ModuleGPIOs(DeviceBase, threading.Thread):
         DeviceBase.__init__(self, self.__name, self.__core,
                                 settings_list, property_list)
 
-        ## Thread initialization:
-        self.__stopevent = threading.Event()
-        threading.Thread.__init__(self, name=name)
-        threading.Thread.setDaemon(self, True)
+        ## Polling initialization:
+        PolledDeviceBase.__init__(self, self.__core)
 
 
     ## Functions which must be implemented to conform to the DeviceBase
@@ -284,76 +282,64 @@ class ModuleGPIOs(DeviceBase, threading.Thread):
             self.__tracer.error("Settings rejected/not found: %s %s", 
                                 rejected, not_found)
 
-        if (('update_rate' in accepted) and 
-            (accepted['update_rate'] > SHUTDOWN_WAIT)):
-            self.__tracer.warning("Long update_rate setting may " + 
-                                  "interfere with shutdown of Dia")
-            
         SettingsBase.commit_settings(self, accepted)
 
         return (accepted, rejected, not_found)
 
     def start(self):
-        threading.Thread.start(self)
-        return True
-
-    def stop(self):
-        self.__stopevent.set()
-        return True        
 
-    # Threading related functions:
-    def run(self):
-        
         #Get the device properties
-        time_sleep = SettingsBase.get_setting(self,"update_rate")
-
         self.input_gpios = SettingsBase.get_setting(self,"input_gpios")
         self.output_gpios = SettingsBase.get_setting(self,"output_gpios")
         
         #Call the GPIOs initializer method
         self.initialize_gpios()
-        
-        #Start the refresh thread
-        while 1:
-            if self.__stopevent.isSet():
-                self.__stopevent.clear()
-                break
 
-            try:
-                while self.setting_gpio:
-                    pass
-                self.get_GPIOs()
-            except Exception, e:
-                self.__tracer.error("Unable to update values: %s", str(e))
-            
-            #Sleep the time configured in settings (in seconds)
-            time.sleep(time_sleep)
+        #Start refreshing the inputs every update_rate seconds
+        self.poll_start()
+        return True
+
+    def stop(self):
+        self.poll_stop()
+        return True        
+
+    # Polling related functions:
+    def poll(self):
+        
+        try:
+            self.get_GPIOs()
+        except Exception, e:
+            self.__tracer.error("Unable to update values: %s", str(e))
 
     def set_gpio(self,gpio,sample):
         
-        self.setting_gpio = True
-        #Update the channel and the module GPIO
-        if sample.value==True:            
-            self.property_set(gpio,Sample(time.time(), True))
-            digihw.gpio_set_value(self.gpios_ind[gpio], 1)
-        else:
-            self.property_set(gpio,Sample(time.time(), False))
-            digihw.gpio_set_value(self.gpios_ind[gpio], 0)
-        self.setting_gpio = False
+        # The lock is released before the channel is updated: a
+        # subscriber may set a GPIO again from within property_set().
+        value = sample.value==True
+        self.__gpio_lock.acquire()
+        try:
+            digihw.gpio_set_value(self.gpios_ind[gpio], int(value))
+        finally:
+            self.__gpio_lock.release()
+        #Update the channel
+        self.property_set(gpio,Sample(time.time(), value))
 
     def get_GPIOs(self):
         
-        for gpio in self.input_gpios:
-            val = digihw.gpio_get_value(gpio)
-            #If the GPIO value has changed, update its channel
-            if self.gpios["GPIO_"+str(gpio)]!=val:
-                self.gpios["GPIO_"+str(gpio)]=val            
-                if val==0 :
-                    self.property_set("GPIO_"+str(gpio),
-                        Sample(time.time(), False))
-                else:
-                    self.property_set("GPIO_"+str(gpio),
-                        Sample(time.time(), True))
+        changed = []
+        self.__gpio_lock.acquire()
+        try:
+            for gpio in self.input_gpios:
+                val = digihw.gpio_get_value(gpio)
+                #If the GPIO value has changed, update its channel
+                if self.gpios["GPIO_"+str(gpio)]!=val:
+                    self.gpios["GPIO_"+str(gpio)]=val
+                    changed.append(("GPIO_"+str(gpio), val!=0))
+        finally:
+            self.__gpio_lock.release()
+
+        for name, value in changed:
+            self.property_set(name, Sample(time.time(), value))
     
     def initialize_gpios(self):
         
@@ -28,11 +28,8 @@
 # imports
 from devices.device_base import DeviceBase
 from settings.settings_base import SettingsBase, Setting
+from devices.polled_device_base import PolledDeviceBase
 from channels.channel_source_device_property import *
-from common.shutdown import SHUTDOWN_WAIT
-
-import threading
-import time
 
 # constants
 
@@ -42,7 +39,7 @@ import time
 
 # classes
 
-class HelloWorldDevice(DeviceBase, threading.Thread):
+class HelloWorldDevice(DeviceBase, PolledDeviceBase):
     """
     This class extends one of our base classes and is intended as an
     example of a concrete, example implementation, but it is not itself
@@ -101,10 +98,8 @@ class HelloWorldDevice(DeviceBase, threading.Thread):
         DeviceBase.__init__(self, self.__name, self.__core,
                                 settings_list, property_list)
 
-        ## Thread initialization:
-        self.__stopevent = threading.Event()
-        threading.Thread.__init__(self, name=name)
-        threading.Thread.setDaemon(self, True)
+        ## Polling initialization:
+        PolledDeviceBase.__init__(self, self.__core)
 
 
     ## Functions which must be implemented to conform to the DeviceBase
@@ -118,22 +113,28 @@ class HelloWorldDevice(DeviceBase, threading.Thread):
             self.__tracer.error("Settings rejected/not found: %s %s", 
                                 rejected, not_found)
 
-        if (('update_rate' in accepted) and 
-            (accepted['update_rate'] > SHUTDOWN_WAIT)):
-            self.__tracer.warning("Long update_rate setting may " + 
-                                  "interfere with shutdown of Dia")
-            
         SettingsBase.commit_settings(self, accepted)
 
         return (accepted, rejected, not_found)
 
     def start(self):
-        threading.Thread.start(self)
+
+        # Set the value of the channels with the configured settings
+        full_string = (SettingsBase.get_setting(self, "prefix_init") + 
+                       SettingsBase.get_setting(self, "suffix_init"))
+
+        self.property_set("prefix_string", Sample(0, SettingsBase.get_setting
+                                                  (self,"prefix_init")))
+        self.property_set("suffix_string", Sample(0, SettingsBase.get_setting
+                                                  (self,"suffix_init")))
+        self.property_set("xtended_string", Sample(0, full_string))
+
+        self.poll_start()
 
         return True
 
     def stop(self):
-        self.__stopevent.set()
+        self.poll_stop()
         return True
 
 
@@ -142,30 +143,12 @@ class HelloWorldDevice(DeviceBase, threading.Thread):
     def prop_set_suffix(self, string_sample):
         self.property_set("suffix_string", Sample(0, string_sample.value))
 
-    # Threading related functions:
-    def run(self):
-
-        # Set the value of the channels with the configured settings
-        full_string = (SettingsBase.get_setting(self, "prefix_init") + 
-                       SettingsBase.get_setting(self, "suffix_init"))
+    # Polling related functions:
+    def poll(self):
 
-        self.property_set("prefix_string", Sample(0, SettingsBase.get_setting
-                                                  (self,"prefix_init")))
-        self.property_set("suffix_string", Sample(0, SettingsBase.get_setting
-                                                  (self,"suffix_init")))
+        full_string = (self.property_get("prefix_string").value + 
+                       self.property_get("suffix_string").value)
         self.property_set("xtended_string", Sample(0, full_string))
 
-        while 1:
-            if self.__stopevent.isSet():
-                self.__stopevent.clear()
-                break
-
-            # increment counter property:
-            full_string = (self.property_get("prefix_string").value + 
-                           self.property_get("suffix_string").value)
-            self.property_set("xtended_string", Sample(0, full_string))
-            
-            time.sleep(SettingsBase.get_setting(self,"update_rate"))
-
 # internal functions & classes
 
@@ -0,0 +1,232 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, 2009, Digi International (Digi). All Rights Reserved. #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice,  and the following  #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+
+"""
+A mixin for device drivers which do periodic work.
+
+Rather than owning a thread which loops on :func:`time.sleep`, a
+driver deriving from :class:`PolledDeviceBase` has its :meth:`poll`
+method called by the core :class:`~core.scheduler.Scheduler`::
+
+    class MyDevice(DeviceBase, PolledDeviceBase):
+        def __init__(self, name, core_services):
+            ...
+            DeviceBase.__init__(self, name, core_services,
+                                settings_list, property_list)
+            PolledDeviceBase.__init__(self, core_services)
+
+        def start(self):
+            self.poll_start()
+            return True
+
+        def stop(self):
+            self.poll_stop()
+            return True
+
+        def poll(self):
+            ...
+
+The interval is read from the 'update_rate' setting unless
+:meth:`poll_interval` is overridden.
+
+"""
+
+# imports
+import math
+import random
+import threading
+import time
+
+# constants
+
+# Poll deadlines are rounded up to a multiple of this fraction of the
+# interval, at most POLL_SLACK_MAX seconds, so that the polls of drivers
+# with close deadlines share one wakeup of the scheduler:
+POLL_SLACK_FRACTION = 0.1
+POLL_SLACK_MAX = 1.0
+
+# exception classes
+
+# interface functions
+
+# classes
+
+class PolledDeviceBase:
+    """
+    Calls :meth:`poll` every :meth:`poll_interval` seconds from the
+    core scheduler.
+
+    Polls are due at fixed multiples of the interval after the first
+    one, so the time spent polling does not make the interval drift;
+    polls missed while the scheduler was busy are skipped.  The first
+    poll is delayed by a random part of the interval so that drivers
+    started together do not all poll at the same time.
+
+    Parameters:
+
+    * *core_services*: The system
+      :class:`~core.core_services.CoreServices` object.
+
+    """
+    def __init__(self, core_services):
+        self.__poll_core = core_services
+        self.__poll_lock = threading.Lock()
+        self.__poll_handle = None
+        self.__poll_deadline = 0.0
+        self.__poll_running = False
+        self.__poll_generation = 0
+        self.__poll_stats = { 'polls': 0, 'errors': 0, 'late': 0.0,
+                              'max_late': 0.0 }
+
+        from core.tracing import get_tracer
+        self.__poll_tracer = get_tracer(self.get_name())
+
+    def poll(self):
+        """
+        Performs the periodic work of the driver; must be overridden.
+
+        May return a number of seconds to wait before the next poll
+        instead of the interval, e.g. to back off after an error.
+
+        """
+        raise NotImplementedError, "virtual function"
+
+    def poll_interval(self):
+        """
+        Returns the number of seconds between polls; by default the
+        'update_rate' setting.
+
+        """
+        from settings.settings_base import SettingsBase
+        return SettingsBase.get_setting(self, "update_rate")
+
+    def poll_start(self, delay=None):
+        """
+        Starts polling.  The first poll happens after `delay` seconds,
+        or after a random part of the interval if `delay` is None.
+
+        """
+        if delay is None:
+            delay = random.random() * self.poll_interval()
+
+        self.__poll_lock.acquire()
+        try:
+            if self.__poll_running:
+                return
+            self.__poll_running = True
+            self.__poll_generation += 1
+            self.__poll_deadline = time.time() + delay
+            self.__schedule()
+        finally:
+            self.__poll_lock.release()
+
+    def poll_stop(self):
+        """Stops polling.  A poll in progress is completed."""
+        self.__poll_lock.acquire()
+        try:
+            self.__poll_running = False
+            if self.__poll_handle is not None:
+                try:
+                    self.__poll_core.get_service("scheduler").cancel(
+                        self.__poll_handle)
+                except ValueError:
+                    # the poll is in progress
+                    pass
+                self.__poll_handle = None
+        finally:
+            self.__poll_lock.release()
+
+    def poll_stats(self):
+        """
+        Returns a dictionary of polling statistics:
+
+        * `polls`: number of polls
+        * `errors`: polls which raised an exception
+        * `late`: seconds the last poll started after it was due
+        * `max_late`: the latest a poll started
+
+        """
+        return self.__poll_stats.copy()
+
+    def __schedule(self):
+        # Called with the lock held.
+        interval = self.poll_interval()
+        slack = min(interval * POLL_SLACK_FRACTION, POLL_SLACK_MAX)
+        due = self.__poll_deadline
+        if slack > 0:
+            due = math.ceil(due / slack) * slack
+        self.__poll_handle = self.__poll_core.get_service(
+            "scheduler").schedule_after(max(0.0, due - time.time()),
+                                        self.__poll_tick, due,
+                                        self.__poll_generation)
+
+    def __poll_tick(self, due, generation):
+        self.__poll_lock.acquire()
+        try:
+            if not self.__poll_running or \
+                   generation != self.__poll_generation:
+                return
+            self.__poll_handle = None
+        finally:
+            self.__poll_lock.release()
+
+        stats = self.__poll_stats
+        stats['polls'] += 1
+        stats['late'] = max(0.0, time.time() - due)
+        stats['max_late'] = max(stats['max_late'], stats['late'])
+
+        delay = None
+        try:
+            delay = self.poll()
+        except Exception, e:
+            stats['errors'] += 1
+            self.__poll_tracer.error("poll failed: %s", str(e))
+
+        self.__poll_lock.acquire()
+        try:
+            # polling may have been stopped, or stopped and started
+            # again, from poll():
+            if not self.__poll_running or \
+                   generation != self.__poll_generation:
+                return
+            now = time.time()
+            if delay is not None:
+                self.__poll_deadline = now + delay
+            else:
+                interval = self.poll_interval()
+                self.__poll_deadline += interval
+                if self.__poll_deadline <= now:
+                    # skip the polls missed, keeping the phase:
+                    missed = int((now - self.__poll_deadline) / interval) + 1
+                    self.__poll_deadline += missed * interval
+            self.__schedule()
+        finally:
+            self.__poll_lock.release()
+
+
+# internal functions & classes
@@ -30,12 +30,10 @@ from devices.device_base import DeviceBase
 from settings.settings_base import SettingsBase, Setting
 from channels.channel_source_device_property import *
 from common.digi_device_info import query_state
+from devices.polled_device_base import PolledDeviceBase
 from samples.sample import Sample
-from common.shutdown import SHUTDOWN_WAIT
-import threading
-import time
 
-class SystemDevice(DeviceBase, threading.Thread):
+class SystemDevice(DeviceBase, PolledDeviceBase):
     """
     This class extends one of our base classes and is intended as an
     example of a concrete, example implementation, but it is not itself
@@ -82,10 +80,8 @@ class SystemDevice(DeviceBase, threading.Thread):
         DeviceBase.__init__(self, self.__name, self.__core,
                                 settings_list, property_list)
 
-        ## Thread initialization:
-        self.__stopevent = threading.Event()
-        threading.Thread.__init__(self, name=name)
-        threading.Thread.setDaemon(self, True)
+        ## Polling initialization:
+        PolledDeviceBase.__init__(self, self.__core)
 
 
     ## Functions which must be implemented to conform to the DeviceBase
@@ -99,66 +95,54 @@ class SystemDevice(DeviceBase, threading.Thread):
             self.__tracer.error("Settings rejected/not found: %s %s",
                                 rejected, not_found)
 
-        if (('update_rate' in accepted) and
-            (accepted['update_rate'] > SHUTDOWN_WAIT)):
-            self.__tracer.warning("Long update_rate setting may " +
-                                  "interfere with shutdown of Dia")
-
         SettingsBase.commit_settings(self, accepted)
 
         return (accepted, rejected, not_found)
 
     def start(self):
 
-        threading.Thread.start(self)
+        self.poll_start()
         return True
 
     def stop(self):
 
-        self.__stopevent.set()
+        self.poll_stop()
         return True
 
 
-    # Threading related functions:
-    def run(self):
-
-        while 1:
-            if self.__stopevent.isSet():
-                self.__stopevent.clear()
-                break
-
-            try:
-                device_stats = query_state("device_stats")
-
-                for stat in ['uptime', 'cpu', 'freemem', 'usedmem', 'totalmem']:
-                    for item in device_stats:
-                        data = item.find(stat)
-                        if data != None:
-                            data = data.text
-                            break
-                    else:
-                        continue
-
-                    if stat == 'uptime':
-                        self.property_set("uptime",
-                            Sample(0, int(data), unit="sec"))
-                    elif stat == 'cpu':
-                        self.property_set("cpu_utilization",
-                            Sample(0, int(data), unit="%"))
-                    elif stat == 'freemem':
-                        self.property_set("free_memory",
-                            Sample(0, int(data), unit="bytes"))
-                    elif stat == 'usedmem':
-                        self.property_set("used_memory",
-                            Sample(0, int(data), unit="bytes"))
-                    elif stat == 'totalmem':
-                        self.property_set("total_memory",
-                            Sample(0, int(data), unit="bytes"))
-
-            except Exception, e:
-                self.__tracer.error("Unable to update stat: %s", str(e))
-
-            time.sleep(SettingsBase.get_setting(self,"update_rate"))
+    # Polling related functions:
+    def poll(self):
+
+        try:
+            device_stats = query_state("device_stats")
+
+            for stat in ['uptime', 'cpu', 'freemem', 'usedmem', 'totalmem']:
+                for item in device_stats:
+                    data = item.find(stat)
+                    if data != None:
+                        data = data.text
+                        break
+                else:
+                    continue
+
+                if stat == 'uptime':
+                    self.property_set("uptime",
+                        Sample(0, int(data), unit="sec"))
+                elif stat == 'cpu':
+                    self.property_set("cpu_utilization",
+                        Sample(0, int(data), unit="%"))
+                elif stat == 'freemem':
+                    self.property_set("free_memory",
+                        Sample(0, int(data), unit="bytes"))
+                elif stat == 'usedmem':
+                    self.property_set("used_memory",
+                        Sample(0, int(data), unit="bytes"))
+                elif stat == 'totalmem':
+                    self.property_set("total_memory",
+                        Sample(0, int(data), unit="bytes"))
+
+        except Exception, e:
+            self.__tracer.error("Unable to update stat: %s", str(e))
 
 
 
@@ -28,11 +28,9 @@
 # imports
 from devices.device_base import DeviceBase
 from settings.settings_base import SettingsBase, Setting
+from devices.polled_device_base import PolledDeviceBase
 from channels.channel_source_device_property import *
 
-import threading
-import time
-
 # constants
 
 # exception classes
@@ -41,7 +39,7 @@ import time
 
 # classes
 
-class TemplateDevice(DeviceBase, threading.Thread):
+class TemplateDevice(DeviceBase, PolledDeviceBase):
     """
     This class extends one of our base classes and is intended as an
     example of a concrete, example implementation, but it is not itself
@@ -107,10 +105,8 @@ class TemplateDevice(DeviceBase, threading.Thread):
         DeviceBase.__init__(self, self.__name, self.__core,
                                 settings_list, property_list)
 
-        ## Thread initialization:
-        self.__stopevent = threading.Event()
-        threading.Thread.__init__(self, name=name)
-        threading.Thread.setDaemon(self, True)
+        ## Polling initialization:
+        PolledDeviceBase.__init__(self, self.__core)
 
 
     ## Functions which must be implemented to conform to the DeviceBase
@@ -118,12 +114,13 @@ class TemplateDevice(DeviceBase, threading.Thread):
 
     def start(self):
 
-        threading.Thread.start(self)
+        self.prop_set_global_reset(0)
+        self.poll_start()
 
         return True
 
     def stop(self):
-        self.__stopevent.set()
+        self.poll_stop()
         return True
         
     def refresh_counter(self):
@@ -151,21 +148,12 @@ class TemplateDevice(DeviceBase, threading.Thread):
         adder_reg2 = self.property_get("adder_reg2").value
         self.property_set("adder_total", Sample(0, adder_reg1 + adder_reg2))
 
-    # Threading related functions:
-    def run(self):
-
-        self.prop_set_global_reset(0)
-
-        while 1:
-            if self.__stopevent.isSet():
-                self.__stopevent.clear()
-                break
-
-            # increment counter property:
-            counter_value = self.property_get("counter").value
-            self.property_set("counter",
-                Sample(0, counter_value + 1))
-            time.sleep(SettingsBase.get_setting(self,"update_rate"))
+    # Polling related functions:
+    def poll(self):
+        # increment counter property:
+        counter_value = self.property_get("counter").value
+        self.property_set("counter",
+            Sample(0, counter_value + 1))
 
 
 # internal functions & classes
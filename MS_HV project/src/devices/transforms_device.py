@@ -31,11 +31,15 @@ from settings.settings_base import SettingsBase, Setting
 from channels.channel_source_device_property import *
 from channels.channel_manager import ChannelManager
 import sys
+import threading
 import traceback
 from pprint import pformat
 
 # constants
 
+# Marks an input whose value has not been read yet:
+_UNSET = object()
+
 # exception classes
 class TransformInitError(Exception):
     pass
@@ -45,6 +49,56 @@ class TransformInitError(Exception):
 
 # classes
 
+class RingBuffer:
+    """
+    Holds the last `size` values appended to it, for the windowed
+    functions of a :class:`Transform`.
+
+    """
+    def __init__(self, size):
+        if size < 1:
+            raise ValueError, "window size must be at least 1"
+        self.__values = [ None ] * size
+        self.__next = 0
+        self.__count = 0
+        self.__sum = 0
+
+    def append(self, value):
+        size = len(self.__values)
+        if self.__count == size:
+            old = self.__values[self.__next]
+            try:
+                self.__sum -= old
+            except TypeError:
+                pass
+        else:
+            self.__count += 1
+        self.__values[self.__next] = value
+        self.__next = (self.__next + 1) % size
+        try:
+            self.__sum += value
+        except TypeError:
+            pass
+
+    def __len__(self):
+        return self.__count
+
+    def values(self):
+        """Returns the values held, oldest first."""
+        if self.__count < len(self.__values):
+            return self.__values[:self.__count]
+        return self.__values[self.__next:] + self.__values[:self.__next]
+
+    def average(self):
+        return self.__sum / float(self.__count)
+
+    def minimum(self):
+        return min(self.values())
+
+    def maximum(self):
+        return max(self.values())
+
+
 class Transform:
     """
     Allows a set of input channels to be transformed using simple expressions.
@@ -55,6 +109,15 @@ class Transform:
     **TransformsDevice**, and the list of channels and the expression supplied
     from an iDigi Dia configuration file.
 
+    The expression sees the input values as the list `c` and may use
+    these functions of the last `n` samples of input `i`:
+
+    * ``moving_avg(i, n)``: their average
+    * ``window_min(i, n)``: the smallest of them
+    * ``window_max(i, n)``: the largest of them
+
+    A window starts to fill when the expression first uses it.
+
     """
 
     #TODO: A transform should probably bind to the settings tree so
@@ -80,23 +143,45 @@ class Transform:
         from core.tracing import get_tracer
         self.__tracer = get_tracer("Transform." + self.__name)
 
+        # Compile the expression once, into a function of the input list:
+        try:
+            compile(self.expr, "<transform %s>" % self.__name, 'eval')
+            namespace = { }
+            namespace.update(globals())
+            namespace['moving_avg'] = self.__moving_avg
+            namespace['window_min'] = self.__window_min
+            namespace['window_max'] = self.__window_max
+            self.__function = eval("lambda c: (%s)" % self.expr, namespace)
+        except SyntaxError, e:
+            raise TransformInitError("Transform(%s): failed to compile " \
+                                     "expression: %s" % (self.__name, e))
+
+        # Position in the evaluation order, see TransformsDevice:
+        self.rank = 0
+
         cm = self.__core.get_service("channel_manager")
         cdb = cm.channel_database_get()
 
+        self.__lock = threading.Lock()
         self.__channel_names = []
+        self.__indexes = { }        # channel name -> input indexes
+        self.__handles = [ ]        # input index -> channel or None
+        self.__values = [ ]         # input index -> latest value
+        self.__windows = { }        # input index -> { size: RingBuffer }
         for chan in channels:
             try:
-                parent.cdb.channel_get(chan)
+                handle = parent.cdb.channel_get(chan)
             except:
                 self.__tracer.warning("channel '%s' does not exist yet.", chan)
+                handle = None
+            self.__indexes.setdefault(chan, []).append(len(self.__handles))
+            self.__handles.append(handle)
+            self.__values.append(_UNSET)
             self.__channel_names.append(chan)
 
         # subscribe to all the channels that drive our logic
         cp = cm.channel_publisher_get()
-        for channel_name in self.__channel_names:
-            #TODO: Might it be a good idea to have a worker thread to
-            #queue transform updates to rather than directly in the
-            #callback from each channels update function?
+        for channel_name in self.__indexes:
             cp.subscribe(channel_name, self.update)
 
         # try to create the device property with the proper type
@@ -110,6 +195,13 @@ class Transform:
                 "".join(traceback.format_exception_only(exc[0], exc[1])))
 
 
+    def name(self):
+        return self.__name
+
+    def channel_names(self):
+        """Returns the names of the input channels."""
+        return self.__channel_names
+
     def __create_property(self):
         val = self.eval()
 
@@ -128,36 +220,54 @@ class Transform:
 
         """
 
-        # Compute initial value of channel, also gives us the type
-        cdb = self.__parent.cdb
-        c = []
+        self.__lock.acquire()
         try:
-            for channel_name in self.__channel_names:
-                chan = cdb.channel_get(channel_name)
-                val = chan.get().value
-                c.append(val)
-        except:
-            raise ValueError, \
-                "Transform(%s): WARNING: failed to perform get on all channels" \
-                % self.__name
-
+            # Read the inputs which have not sent a sample yet:
+            try:
+                for i in xrange(len(self.__values)):
+                    if self.__values[i] is _UNSET:
+                        self.__values[i] = self.__input_handle(i).get().value
+            except:
+                raise ValueError, \
+                    "Transform(%s): WARNING: failed to perform get on all channels" \
+                    % self.__name
 
-        eval_ns = { }
-        eval_ns.update(globals())
-        eval_ns["c"] = c
-        try:
-            value = eval(self.expr, eval_ns)
-        except:
-            exc = sys.exc_info()
-            raise ValueError, \
-                "Transform(%s): ERROR: failed to evaluate expression:\n%s" \
-                % (self.__name,
-                    "".join(traceback.format_exception_only(exc[0], exc[1])))
+            try:
+                value = self.__function(list(self.__values))
+            except:
+                exc = sys.exc_info()
+                raise ValueError, \
+                    "Transform(%s): ERROR: failed to evaluate expression:\n%s" \
+                    % (self.__name,
+                        "".join(traceback.format_exception_only(exc[0], exc[1])))
+        finally:
+            self.__lock.release()
 
         return value
 
     def update(self, channel):
         """
+        Called by the channel publisher with a new sample of an input.
+        Records the value and asks the device to evaluate the transform.
+
+        """
+
+        value = channel.get().value
+        self.__lock.acquire()
+        try:
+            for i in self.__indexes[channel.name()]:
+                self.__handles[i] = channel
+                self.__values[i] = value
+                for window in self.__windows.get(i, {}).itervalues():
+                    window.append(value)
+        finally:
+            self.__lock.release()
+
+        self.__parent.transform_changed(self)
+
+    def refresh(self):
+        """
+        Evaluates the transform and sets its channel.
 
         """
 
@@ -172,6 +282,32 @@ class Transform:
         val = self.eval()
         self.__parent.property_set(self.__name, Sample(value=val, unit=self.__unit))
 
+    def __input_handle(self, i):
+        # Called with the lock held.
+        if self.__handles[i] is None:
+            self.__handles[i] = \
+                self.__parent.cdb.channel_get(self.__channel_names[i])
+        return self.__handles[i]
+
+    def __window(self, i, n):
+        # Called from the expression, with the lock held.
+        windows = self.__windows.setdefault(i, {})
+        window = windows.get(n)
+        if window is None:
+            window = windows[n] = RingBuffer(n)
+            window.append(self.__values[i])
+        return window
+
+    def __moving_avg(self, i, n):
+        return self.__window(i, n).average()
+
+    def __window_min(self, i, n):
+        return self.__window(i, n).minimum()
+
+    def __window_max(self, i, n):
+        return self.__window(i, n).maximum()
+
+
 class TransformsDevice(DeviceBase):
     """
     This class extends one of our base classes and is intended as an
@@ -180,6 +316,11 @@ class TransformsDevice(DeviceBase):
     base class documentation for the API and the source code for this file
     for an example implementation.
 
+    Input updates only mark a transform as changed.  The changed
+    transforms are evaluated together `coalesce_delay` seconds later
+    on the scheduler, each once, with a transform evaluated after the
+    transforms it uses.
+
     """
 
     def __init__(self, name, core_services):
@@ -193,9 +334,18 @@ class TransformsDevice(DeviceBase):
         from core.tracing import get_tracer
         self.__tracer = get_tracer(name)
 
+        # Transforms waiting to be evaluated:
+        self.__lock = threading.Lock()
+        self.__pending = { }
+        self.__scheduled = False
+        self.__flushing = False
+
         ## Settings Table Definition:
         settings_list = [
             Setting(name='instance_list', type=list, required=True),
+            Setting(name='coalesce_delay', type=float, required=False,
+                    default_value=0.0,
+                    verify_function=lambda x: x >= 0.0),
         ]
 
         ## Channel Properties Definition:
@@ -232,6 +382,8 @@ class TransformsDevice(DeviceBase):
                 self.__tracer.error("%s", sys.exc_info()[1])
                 self.__tracer.error("Transform was %s", pformat(t))
 
+        self.__order_transforms()
+
         return True
 
     def stop(self):
@@ -241,6 +393,97 @@ class TransformsDevice(DeviceBase):
 
     ## Locally defined functions:
 
+    def transform_changed(self, transform):
+        """
+        Called by a :class:`Transform` when one of its inputs changed.
+
+        """
+        self.__lock.acquire()
+        try:
+            self.__pending[transform] = None
+            if self.__scheduled or self.__flushing:
+                return
+            self.__scheduled = True
+        finally:
+            self.__lock.release()
+
+        self.__schedule_flush()
+
+    def __schedule_flush(self):
+        sched = self.__core.get_service("scheduler")
+        sched.schedule_after(SettingsBase.get_setting(self, "coalesce_delay"),
+                             self.__flush)
+
+    def __flush(self):
+        # Evaluate the pending transforms in order.  Transforms using
+        # the ones evaluated here are marked pending again as their
+        # inputs change, and are evaluated by this same pass.  A
+        # transform marked again after its evaluation (a cycle) waits
+        # for the next pass.
+        self.__lock.acquire()
+        self.__scheduled = False
+        self.__flushing = True
+        self.__lock.release()
+
+        done = { }
+        while True:
+            self.__lock.acquire()
+            try:
+                waiting = [ t for t in self.__pending if t not in done ]
+                if not waiting:
+                    self.__flushing = False
+                    if not self.__pending or self.__scheduled:
+                        return
+                    self.__scheduled = True
+                    break
+                transform = min([ (t.rank, t) for t in waiting ])[1]
+                del self.__pending[transform]
+                done[transform] = None
+            finally:
+                self.__lock.release()
+
+            try:
+                transform.refresh()
+            except:
+                self.__tracer.error("%s", sys.exc_info()[1])
+
+        self.__schedule_flush()
+
+    def __order_transforms(self):
+        # Rank the transforms so that each comes after the transforms
+        # whose channels it uses.
+        by_channel = { }
+        for transform in self.tlist:
+            by_channel["%s.%s" % (self.__name, transform.name())] = transform
+
+        users = { }
+        needs = { }
+        for transform in self.tlist:
+            needs[transform] = 0
+        for transform in self.tlist:
+            for channel_name in dict.fromkeys(transform.channel_names()):
+                source = by_channel.get(channel_name)
+                if source is not None and source is not transform:
+                    users.setdefault(source, []).append(transform)
+                    needs[transform] += 1
+
+        ready = [ t for t in self.tlist if needs[t] == 0 ]
+        rank = 0
+        while ready:
+            transform = ready.pop(0)
+            transform.rank = rank
+            rank += 1
+            for user in users.get(transform, []):
+                needs[user] -= 1
+                if needs[user] == 0:
+                    ready.append(user)
+
+        for transform in self.tlist:
+            if needs[transform] > 0:
+                self.__tracer.warning("Transform %s is part of a cycle",
+                                      transform.name())
+                transform.rank = rank
+                rank += 1
 
 
 # internal functions & classes
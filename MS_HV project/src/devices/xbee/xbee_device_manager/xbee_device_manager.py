@@ -63,7 +63,7 @@ except:
 
 from devices.device_base import DeviceBase
 from settings.settings_base import SettingsBase, Setting
-from core.tracing import get_tracer
+from core.tracing import get_tracer, DEBUG
 from channels.channel_source_device_property import *
 
 from common.digi_device_info import device_firmware_gte_to, get_platform_name
@@ -311,7 +311,9 @@ class XBeeDeviceManager(DeviceBase, threading.Thread):
 
 
     def __select_rx_cbs_for(self, buf, addr):
-#        self.__tracer.debug("__select_rx_cbs_for(): enter")        
+        debug = self.__tracer.is_enabled_for(DEBUG)
+        if debug:
+            self.__tracer.debug("__select_rx_cbs_for(): enter")
 
         self.__lock.acquire()
         
@@ -331,22 +333,22 @@ class XBeeDeviceManager(DeviceBase, threading.Thread):
             # Update the time we last heard from the node:            
             state.last_heard_from_set(time.time())
             if not state.is_running():
-#                self.__tracer.debug("__select_rx_cbs_for(): cb not made, " +
-#                                    "device %s not running.",
-#                                    (str(rx_event.match_spec_get()[0])))
-#                
-#                self.__tracer.debug("__select_rx_cbs_for(): device is in " + 
-#                                    "state: %d", state._get_state())
+                if debug:
+                    self.__tracer.debug("__select_rx_cbs_for(): cb not made, " +
+                                        "device %s not running.",
+                                        (str(rx_event.match_spec_get()[0])))
+                    self.__tracer.debug("__select_rx_cbs_for(): device is in " +
+                                        "state: %d", state._get_state())
                 continue
             
             if isinstance(rx_event, XBeeDeviceManagerRxConfigEventSpec):
                 if not state.is_config_active():
-                   
-#                    self.__tracer.debug("__select_rx_cbs_for(): cb not made," +
-#                                        " device %s not configuring.",
-#                                        (str(rx_event.match_spec_get()[0])))
-#                    self.__tracer.debug("__select_rx_cbs_for(): device is in "+ 
-#                                        "state: %d", (state._get_state()))
+                    if debug:
+                        self.__tracer.debug("__select_rx_cbs_for(): cb not made," +
+                                            " device %s not configuring.",
+                                            (str(rx_event.match_spec_get()[0])))
+                        self.__tracer.debug("__select_rx_cbs_for(): device is in "+
+                                            "state: %d", (state._get_state()))
                     continue
             
             #Contains check to see if remaining elements match the event spec
@@ -50,6 +50,7 @@ from channels.channel import \
     OPT_AUTOTIMESTAMP, OPT_DONOTLOG, OPT_DONOTDUMPDATA
 from core.core_services import CoreSettingsInvalidSerializer
 from common.dia_proc import get_drivers
+from core.tracing import get_memory_handler, MEMORY_NAME
 
 
 # constants
@@ -258,6 +259,22 @@ Syntax::
         logger_iterate start [end]
 """,
 #---
+"logger_aggregate":
+"""
+    Report the count, minimum, maximum and mean of the numeric samples
+    in the active logger per channel and per 'bucket_size' seconds.
+    Only samples with timestamps from 'start_time' to 'end_time'
+    inclusively are considered, a negative time leaves that end
+    unbounded.  If channel names are given only those channels are
+    reported.
+
+    The current position of the active logger is not modified.
+
+    Syntax::
+
+        logger_aggregate bucket_size [start_time [end_time [channel ...]]]
+""",
+#---
 "device_dump":
 """
     Report the name and driver of all current running devices,
@@ -268,6 +285,18 @@ Syntax::
         device_dump
 """,
 #---
+"trace_dump":
+"""
+    Print the recent trace messages kept by a 'memory' trace handler,
+    oldest first.  If 'name' is omitted the handler configured as
+    plain 'memory' is used.  Give 'clear' to forget the messages
+    after printing them.
+
+    Syntax::
+
+        trace_dump [name] [clear]
+""",
+#---
 "quit":
 """
 Disconnect from the CLI.
@@ -898,12 +927,105 @@ Syntax::
         except Exception,e:
             self.write("\r\n\tException during log iteration: %s\r\n" % str(e))
 
+    def do_logger_aggregate(self, arg):
+
+        try:
+            args = parse_line(arg)
+        except Exception, e:
+            self.write("invalid syntax: %s\r\n" % str(e))
+            return 0
+
+        if self.__logger is None:
+            self.write("\tNo logger currently selected\r\n")
+            return 0
+
+        if not len(args):
+            self.write("logger_aggregate requires at least one argument.\r\n")
+            return 0
+        try:
+            bucket_size = int(args[0])
+            if bucket_size <= 0:
+                raise ValueError
+        except:
+            self.write("invalid bucket size: %s\r\n" % repr(args[0]))
+            return 0
+
+        times = [None, None]
+        for i in range(min(len(args) - 1, 2)):
+            try:
+                times[i] = int(args[i + 1])
+                if times[i] < 0:
+                    times[i] = None
+            except:
+                self.write("invalid time: %s\r\n" % repr(args[i + 1]))
+                return 0
+
+        channel_names = None
+        if len(args) > 3:
+            channel_names = args[3:]
+
+        if not hasattr(self.__logger_cdb, 'log_aggregate'):
+            self.write("\tLogger '%s' does not support aggregation\r\n" %
+                        self.__logger.get_name())
+            return 0
+
+        try:
+            aggregates = self.__logger_cdb.log_aggregate(bucket_size,
+                                times[0], times[1], channel_names)
+        except Exception, e:
+            self.write("\r\n\tException during log aggregation: %s\r\n" %
+                        str(e))
+            return 0
+
+        channels = aggregates.keys()
+        channels.sort()
+        for channel_name in channels:
+            self.write("\r\n%s:\r\n" % channel_name)
+            self.write("\t%-12s %8s %14s %14s %14s\r\n" %
+                        ("start", "count", "min", "max", "mean"))
+            for start, count, vmin, vmax, mean in aggregates[channel_name]:
+                self.write("\t%-12d %8d %14s %14s %14s\r\n" %
+                            (start, count, vmin, vmax, "%.4g" % mean))
+        self.write("\r\n")
+        return 0
+
     def do_device_dump(self, arg):
         name_device_pairs = get_drivers(self.__core)
 
         for _ in name_device_pairs:
             self.write(_[0] + ": " + _[1] + '\r\n')
     
+    def do_trace_dump(self, arg):
+        try:
+            args = parse_line(arg)
+        except Exception, e:
+            self.write("invalid syntax: %s\r\n" % str(e))
+            return 0
+
+        clear = False
+        if len(args) and args[-1] == "clear":
+            clear = True
+            args = args[:-1]
+        if len(args) > 1:
+            self.write("invalid syntax.\r\n")
+            return 0
+
+        name = MEMORY_NAME
+        if len(args):
+            name = args[0]
+
+        handler = get_memory_handler(name)
+        if handler is None:
+            self.write("\tNo memory trace handler '%s' configured\r\n" % name)
+            return 0
+
+        out = StringIO()
+        count = handler.dump(out, clear)
+        for line in out.getvalue().splitlines():
+            self.write(line + "\r\n")
+        self.write("\r\n%d trace messages.\r\n" % count)
+        return 0
+
     def do_quit(self, arg):
         return -1
 
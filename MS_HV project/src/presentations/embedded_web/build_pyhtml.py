@@ -349,6 +349,29 @@ def compile_pyhtmls( inp ="src/presentations/embedded_web", outp="src/presentati
 			data = p.pythonCode()
 			out.write(data)
 			out.write("    return py_code\n\n")
+def compress_static( inp="src/presentations/embedded_web/index_page.py", outp="src/presentations/embedded_web/index_page_gz.py" ):
+  """
+  gzip-compresses the raw_html page defined in the "inp" file and writes it,
+  together with its ETag, to the module given by the "outp" kwarg so that
+  the gateway does not have to compress it at run time.
+  """
+  sys.path.insert(0, os.path.dirname(inp))
+  from static_asset import compress, make_etag
+  del sys.path[0]
+  page = {}
+  execfile(inp, page)
+  raw_html = page["raw_html"]
+  data = compress(raw_html)
+  out = open(outp,"w")
+  out.write("# auto-generated from %s by build_pyhtml.py\n\n" % os.path.basename(inp))
+  out.write("raw_html_etag = %r\n\n" % make_etag(raw_html))
+  out.write("raw_html_gz = (\n")
+  for i in range(0, len(data), 48):
+	out.write("    %r\n" % data[i:i+48])
+  out.write(")\n")
+  out.close()
+
 if __name__=="__main__":
     compile_pyhtmls()
+    compress_static()
 
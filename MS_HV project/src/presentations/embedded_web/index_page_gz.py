@@ -0,0 +1,615 @@
+# auto-generated from index_page.py by build_pyhtml.py
+
+raw_html_etag = '"77c3259940230a46f1d236f1a9c61300"'
+
+raw_html_gz = (
+    '\x1f\x8b\x08\x00\x9c\xa8\xd2j\x02\xff\xdc}m{\xdb8\xae\xe8\xe7\x9b_\xa1xzGR\xe2\xd8Igv\xcf\x1e\xa7iN\xda\xa63=\xd3\xb7\xd3fvf\xae\xe3'
+    '\xf6Ql%Qk[>\x92\x9c\x97m\xb3\xbf\xfd\x12\x00_@\x8a\xb2\x9d\xb4\x9d=\xf7\xce\xf3\xec6\xa6H\x10\x04A\x10\x04A`\xed\xc1\xfa\x93W\x8f\x8f\xfex'
+    '}\x18\xfc|\xf4\xe2y\xf0\xfa\xd7G\xcf\x9f=\x0eZ[\xdd\xeeo?<\xeev\x9f\x1c=\xa1\x0f?v\xb6w\x82\xa3"\x99\x96Y\x95\xe5\xd3d\xdc\xed\x1e\xbel'
+    '\x05\xad\xf3\xaa\x9a\xf5\xba\xdd\xcb\xcb\xcb\xce\xe5\x0f\x9d\xbc8\xeb\x1e\xbd\xe9\x9eW\x93\xf1\x8f\xddq\x9e\x97igT\x8dZ\x0f\xd7\x1e@\xd1\xc3\x07\xe7i2\x12?&'
+    'i\x95\x04\xd0r+\xfd\xefyv\xb1\xd7z\x9cO\xabtZm\x1d]\xcf\xd2V0\xa4_{\xad*\xbd\xaa\x10\xd8n0<O\x8a2\xad\xf6\xb22\xdf\xfa\xdb\xdf'
+    '\xfe\xf2\xef[;\x00\xb5\xca\xaaq\xfap-{\x92\x9de\xc1\x93\xf4"\x1b\xa6\xc13\xd1\xf8\xacH\x00\xcb\xe0`6\x1bgC\xfc{\xedAW\xd6~0\xce\xa6\x1f'
+    '\x83Jt%{\x18\x96e+(\xd2\xf1^\xab\xac\xae\xc7iy\x9e\xa6U+8/\xd2\xd3\xbdV\x17\x8b\xba\xe6C\x07j\x0b X\xf2p\xadS\xa4\xb3q2L'
+    '\xb7$\xd2\xc1\xa7\xcblT\x9d\xf7v\xb6\xb7\xff\xf7np\x9efg\xe7U\xef\xc7\xbfl\xcf\xaev\xf3\x8b\xb48\x1d\xe7\x97\xbdd^\xe57k\x9dY\x91Of\xa2'
+    '\xc10\x1f\xe7E\xef\xacH\xd3\xa9.}\x9fMG\x02Z:R\x9f\xbfK\x92D|M\x8bB\x95\x14\xe9\xe8F\x0cJ\xe2\xb1\xf6`}k+\xf8\xee_\xf5\xdf\xda'
+    '\xb3\xd3`\x94\x95\x1f\x83r&\x88\x11de\x90\\$\xd989\x19\xa7\x81\x98\x87\x11M\xcdl\x9c&e\x1a\x8c\xf2\xcb\xe98OFA2\x1d\x05\xb3d\x0c_\x8a'
+    '\xbc\xcaaJ:\x1f\xca\xe02\xab\xce\xb3iP\x9d\xa7\xb2a\x19\x9cf\x82\xfc\xd7e\x95N\xb0\x91\xe0\x86\xe9Y*j\x88\x8e\xc4l\xa6k\xff\xb2\x81\x07\x82\x13\x86'
+    "E&\xe6\xb1,\x86{j9$\x1f\x92\xab\xceY\x9e\x9f\x89\x01\xcf\xb2\xb23\xcc'X\xd6\x1dg'eW\x0f\xb6\xbb\xd3\xf9kg\xbbs\xbf\xcb\x87\xdf\n\xc6b"
+    'p\xf3\xe4L\xb0\xe7\x07AE\x02\xdf\xe2\x0c\xcb\x8a\x1f\xaemm\xc1\xec\xd3\xcf\x87k\xdd\x8d x\xad\xa0\x05\xff)*\xbe%\xf4N\x8bd\x92^\xe6\xc5\xc7v '
+    '\xf8\xb0\x84\xd5A\xbd\xef\xac\x05\xa2M4\x8c\x83\xfb\xdb\xdb\x7f\xd9\x12\xff\xf7o\xc1\xdbd\x12\xbc\xad\xd2\xd9y:-\xc5\xd2\t6\xb0\x8e\x81+\xc8~*\xf8u|'
+    '\r\x93^\x15\xd9\xc9\xbc\xc2\xa9\x9e\x0b\xae-p\xe2\xaa\xb4\x98\x94A~*\xa6+x\xf1\xech\x0b\xd9T\xcc\xd5P@L;\x08\xeei^\x88\xf9\xad\x04\x9b\x94\xed'
+    "\xa0LSlg\xfa\xb8LO\x02!l\xd2^\xc0d\x8c&\xd4\x87\x12\x85\r\xa1\xb6\xf5\xd5\xfe\xdb\xe8\xae\xad]$\x05Cc/\xf8\xb4\x16\x04\x7f'\x92\xf5\x82P"
+    '\x12-l\xaf\x89\xe2GE~Y\xa6E\x0f\xeb\x04\xc1\xb3\xc3\x1e\xfc\x13\xac\xafG\x97b\x01\xe7\x97\x9d\xa4\xaa\x92\xe1\xf9\xe1\x05H\x86\xef\xbf\x0f\xd6eq>K\x8b'
+    '$nc\xa3W\xf0w\x0f\x1a\xf1\x8f\xf4\xed\xb7\xf4\xe4\x97\xac\xea\x05\xd3\xe4";K\xaa\xbc\xe8\xccEw\x07g\x02\\\x07$\xc4\xd5\xab\xd3(\x04!\x97R\xcdn'
+    '\x18\x07\x0f\x83\xad\x1dj\xfdS:\xfc\x98\x0b\xc8\x0b[c%\xd9\x0cP\\X\xf9\x17\xd8\x0bD\xe5\xbd=\xdd\xc9\x8b\xfcD\xac\xcd\xb7\xc9iRd=1\x08_\xfb'
+    'IR\r\xcf\xa3."\xda\xd9\xa0\x16\x9d\rj\xd3\x8d\x05\x98\x1bN\xcd\xa7iR\xcd\x8b\xb4TT\xfd\xfdu"\x04\xaa\x00=\xca\x87\xf3\t\xc0K/\x92\xf1<\xa9'
+    'R\xc2\xe0p\x9cB\xe9\xe1\x95\x90\xbf0Ie\xcf\xd0\x12\xf0\x95\xdf\xa9\xf2\xdbY:\xccN\xb3a\xbd\x11~\x0e\x02\xdd\xc9\xb0\x10x\xa4\xb2^\x14\x8e\xb2\x8b0\xee'
+    '\xbc\x7f\x8f\x1c\xf8\xfe\xbd \xd5-\x1b\xac\xef\xed\xc9\x16\xcdmN\xf3b\xc2\x1bi\xd2\xd0"~Z$gPQ\xb0\xa1\\\xf0\xfdw\x0f\x07\x1b\x0f\xa3\xfe\xf1\xf1\xdb'
+    '\xe3\xe3r\xb0\xb1\x1f?8\xeeJY\x10\xc2\x88\xff\xf3\xed\xab\x97O\xb3q\x05L\xda}w\xdc=\xde\xd8*\xd3\xa1 \xef\x96hT\x1e\xbf\x1dl\xc4\xc7\x1b\xa2\xb8'
+    '\xdc\xb8\xd7\xc5\x9eR\xb1\xfb\\?\x9dO\x87\x15\xf2\xfb\xa9\xfc+\x8a\x83O\x80K\x10\xfc\xc2\n\xaf\xa0\xb4H\xc5tM\x83\xab\xe0f\xedfwm-;\r"\xbd'
+    '|:rN;\x9cM`\xc6k5\xd4\xacw\x1agH,\xc5\xd3d\\\xa6\xa2\x0f\x10s\x8f\xc4V2\x82\xcd\xe5`\x9c^\x05\x07\xc54\x1d\x8f\xc32\xc8\xa6\xe7'
+    'i\x91U\xc9\x14\xb6\xa1\xc9\x8c\x80\xa0\x06\xd0\t\xc4\xea\x86\xc5\xfdx\x9c\x94\xa5\\\xd84\x01\xf68q\x9a\xa0\xe2,)`\xe1\xee\x05\xd3\xf9x\xdc\x86MJ,\xcd'
+    '*K\xa1\xf1\xbd\x83()\xcep\x16\xcbx\x17\x9b\xc0\xc8_\x9d|H\x87b\xc5\x94\x8a\x84\x91i\xd5\xdf\x1e\xc4\xb1\xe4\x01\r\xda|\xee\x94\xe7\xd9i\x15\t`X'
+    'Ga\x14|\x04t5^\x01\xeezbI\n=,\x19g\xffH;\x89XV\xd7\x11\x94\xb6\x03\x17\xa5\x1b\x82%\xb1J\x81\x96\xa3\x08\x01\xb6\x89\x0c\x9d\x17iu'
+    '\x9e\x8fT}\xfc\xd4)\xe7\x02\xa5\xa1\xa4\x12aj\x7f>\xc1\x8fH\x87\xfe@\xe2\x0b\xa3\xa7\xba\x06U \xa2\xaa\r\xd3g1\xd3\xae\xac\xa4*\x18\xe1\xae{5E'
+    '\xaa\xf2\xc7Z\xcdiz\xa9A\xecZ\xd4e\x88vf\xf3\xf2\x9c\x06nSF\xac\xb8 \x0243\x01j{W\xfc\xf3\x80O\xc98\x9d\x9eU\xe7\xa2xs3\xb6'
+    '0HF#I9>\xc1\xd9 f\xd4Xw\x90e\x93\x16\xfb\x87\xc3j\x08t\xcc\x1a\xb1\x16\xa5\xec\xc1m*\x14P\xb1\x15\xcf\x87B\xf4\x8a\xb6\x1f\x89\x1cXS'
+    '.\xd0\x8f\x8aB\xb4N\xad\xe9\x97\xab\xc1\x8c\x8a\xad\x882\x9f\x17\xc3\x94\xaf\x0bX\\%\xf4\x13\x88v\xc8\x8e\x8cc\xc4\x1e\xe2\x14\xb9\xb3\x88K\x8b\xaf%\xc9\x9e\x1f'
+    '\xd3\xebR\xf5\xc6\xc9\xc8?\x7f\n\xaa\xfc\xad\xd08\xa6g\xbd@\x8c6\rnb9Ize\x99\xd9\xc3Io\xa9\x06\xadv\xd0\x82\x8d#}u\xda\xd2\x8b\xcc\x9a'
+    '\xfev@\xa0\xece\xa9y@\xb0\x06\xe7\x07\x8b\xcbe\xfdk\xab\xa9\xe0\x07\xa1mA\x97\xa2\x98\x06\xd6W\x15\x07\x8aWa\x88\x9a\xa0\x82xu\t\x82\x10b\xb3\xe3'
+    "P\x9f\xa2\xac\xa3\x96\xfbK\xa1\xdb\t\x11\xd19\xcd\x8aRH\x10\xd8\x9f[\xf7p\x02Z\x06MBt\x82\xf3+\xf0A\x08\x06=[DDz\xf6'\x1c\x80\xe6%"
+    'k%\xcb25\x88\xfed\xd0 \x93\xcc\x9a\x17L\x18\xab\x85s\x1dw.\x8bd\x16\x11fq\xdb\xeaONX/\xf0v)\x07s\xd3f-\x0c\x7f4\xb7\xe8\xa8'
+    "J\xe2\xd3\rCI\xa1w\xc3E\xad\xe6^3w\x8a|\x96(\x91=@\x1b\xb3\xca\x80\xe4\x07'ba&C\x90\xf6(\xf6\xd6,Zs\xb98\x12\x04\xcc\xa6\xb8"
+    "[\xb5\x03\xbe\xee4\x9fj>\x13\x07$Y\x01;g--4}\\'\x11eMv\xd7jh\xc9\x9d\x8cf#\x9b\x96bW\xae\x18Is\xfc\xaax\xa3*\xae"
+    '\xf5\xacY\xbb\xe0\xafBs<\x15\x07\xb4\x91j\x10\xab\xde\xc3\xb9\xfa\x14\xf2\x95@\xd5\x04\x03\xd3\xa6k\xaa\xc3/]S\x16\xe6\xb2\x1b\xc2.\xd8w\n\xc4\xe4\xf6T'
+    '\x91\x99p9g\xc1\x10\x94\xd2 Jc\x0b\xf3\x14\xc6\x8a\xda\x838\xbb\xbc\x81S\xe6aQ\xe4\x85\xc1\xa3\xd3\xe9h4\xaas\xa1\xbb\x04\x9a\x0b\x94\xb2V\xe5\xa0u'
+    '5\x12\x0b\xa6Q\xee]\xf0\x8f\xe8\x87\xbe\x13\x98R\x9c~\x01/\xf8dP\x1b\xc2\xb9\x99\x91\xacg\x95\xab\x8e\x9c\xe2\xf9\xf4\xe3T\x1c\xb5\xc3\x9eD~\xd7\xfaz\x92'
+    '\xe7\xe2tj\xbe6R\xcaH\xe2U&\xc7\xd4\xeb\x10\x1d\xe2\x1a|(\x8d|:\x93\xd2\x83\x1d^\x91\xb2\x1a\xe8&\x14\xc4\xf9\xb8Rz\x87%\xc1\xf9\xca\xb0\tN'
+    "M\x1dA'\xd1\xa0\x9af}\xc4\x9c\x19\xd7=|L\xc28^3\x02\x111\xa2\xbdF\x81\xd1\x83\x0c6\x03A\xe0P\xfcC\xed|\x02#\xfc\x04\xdf\x15\x9c\x0fy"
+    '6\x8d\xc2v\x10b\xdb\x1b\xa4\xaab\xab\xff\x9a\xa7\xc5uM\xba\xd9\x83\x95@\xef\xfd\xac\xca;V;\xa2\xbb\x02\x08\xc7\xa3e\x90\xe4\xa4\x8b\x9dIO Z\x04\xf7'
+    '\xed\xdf\xb8\xd8\xa8\x0f\xb1\xfe\xc4yc&\xda+\x88\xa6O\xd8\xc4\x17\xae\x0c\xa8\xb0\xe2\xf4*\x1dJ\xb4\xb0\xc9/\xc9\xac\xf4\x1e\xf1\xdd \x80\xf3\xb0\x18\x05\xaar;'
+    "$\xa8\r\xa1\xd1\xc0S\x12\x1d\xaai\x10\x1a\x8e\xf3i\xbal\x12l\xd1\x0c'\xb1\xa0FZ\xbd~n=\xa3\xd3|\x94\x1e\xa1D\xda\x0bv8\xc0\x83\xa2H\xaeo"
+    '\r\xce\xd2D\x05H\x84\xc2\xc1\xfe\x9c\x94\xe7+Be\xd2\x18Zq(\x9eC\xaa\x17\x92%dQ5R\xf5[\x1c\xdcj\xeb\xaa\x0e\xac$\xe5\x92\x83z9\x9f\x9c'
+    '\xc0\x81\xfb\xb6\xa0\xa6\xd8\xce\x02\xa5\x05\xcf\xed\xa1\xe9\xdd\xa2%\xd5\x91\xb8\xb6\xc7+\x12\x1a\x1d\x87\xf6{K\xafl8\x1cO\xe1\x9b\xd2\xff\xcd\xa6\xa1\x8c=\xef\xc0\xbc'
+    '\x10\r6T\xdb\xfe;\xf1\xe38\x8a:\x1b\xfb\xf1q\xdc\x8d\xfb;\x83N9\x1bgU\xd4j\xb7b!2.\xf2\x8fi\x84\xd4\x9c\xb5\xec\x15\x83=u\x94j.'
+    'X\x14MiX*\x8e\xd4B\x10\xf5\x07A\x8fj\x19\xd2\x9dd\xd3\x91\x07s\xd4\xb6\x95B\xaa`>\x08\xee[\x9a\xb7\x91\xf6\xba*\x9e\xdd]\x15\x8f\x08\xf1\xfe\xbd'
+    '\xd6\xa9\xb5\xc2[\xb3\x10\xb4\xf5\xcc\xe0gs\xd6oP\xaamEGu!\xf5\xea\\\xaaf\x08I\xac6\xa1\xcaDVoq\xec\xea$@\x8e\x83\x12\r\x91\xcf\xb3'
+    'RL\xbe\xc5\x9f|^\xbf\xfep\xd2\x0b\xcb(\xb0xL}\xac\x1d|\xfe\x1cH\x13\x1e\xfe\x1e\xa8aBo\xf5\xd1\r\xe7Eq\xdd0\xdb\xeb\xeet\x7f\xc94\xde'
+    'm\xbe\x0c\xbc\x15gk\x94\x8e\x93\xeb/\x9b\x9f*\x9b\xa4\xf9\xdc\x9d\xa0`#\xd8\xd9\xde\xde\xb6\x86!\xe9\\\xa6\xd5\x11\xb5\x89V\x1e\x98\xfaIH\xa8a\xe8\xce\xd9'
+    "\xe6\x04'<6 \xf8)6\xc7\x05\xe3Z\x91\xd2\x12\x90E\xe8\xbe\xc6\x12\xb8\x1e\x0b\xe3\xc1\x8a\x94\xa7\x86\xd9?\xd2\x06nBi\xf7^\xd7\x1aY\xcc\xc4?\xec\xae"
+    '40\xb7\x95c$[H|2J\xf6\x01\xc4\x92\xd11\xf9_\x97\xf8\x1d!\xebR0\x19y?\t>\xec\xe0\xea\x8a\xb6;\xdb;\x00\xe1IR\xa5\xac\ni\xba'
+    'u\xbc\x95r\xdb\x02\xe5\x16\x87y\x96V\xbf\x1e=~*\xb0\xfe#M\n\xd2\x8d\xb7\xc4W\xc41bU^\xe4\xd3\xea\x1c\xbf\xef\x80\xf6\xfa:\x19\x8d\xd2\x91\xdc_'
+    '\xee\xdb\xcdX+\xc0+j\xa8\x7f\xe4\xa9\xff\xb38\x19\x97M\rz\x9e\x06/\xb2\xe9\xbcJo\xd5\xe4m*\xe6e\xd4\xd8\xe4\xff\xb4\xc2]m%8*\xae\xa5\x15'
+    '\xae:O\xcb&\x934\x91\xf5\xefd|Xl\xc2r\xe5\xde\x12\x0b\xd68\x99\x9c\x8c\x12\xde\xae\x9fi#\x15?\xe0\x07\x1c\tQ\x9f\x1aF\xb1\xb1\xed\x9c\x14i\xf2'
+    'Q\xdbR\xf8I[ZV\xec\x03\x905&e8y\x93\x9e\x1d^\xcd\x18\xa3\xa1^!\xba\xab}\x10sR\x99\x06i9L\xf0lm\xec\x97Ua\xb1\xa4\x9c\x02'
+    '(V\xb7\xf7Q7\xeaw66\xf7\xdf\xed\xad\xf7\xee}\xba\x89\xe2\xcf\xfd\xe3\xc1q\xf7\xf8x\x10w\xcf\xc4Y\xec\xf8\xf8\xdeN\x18\xd3\\u\xbf\xc5ucZd'
+    'B\x00\x0c\x93\xf1\xe1U:\x14\\\x06\xeb\x91\x0c\xb4tA\x11\x91\x15F\x19\x87\x19s\x886\xe3\x93d\xf8\xb1\r7\xb2\xff=O\xa7\xc3km\x95\x01FT\xdf\x05'
+    '@\xf5\xe7\xae\xf9\xaa\xdb\x00\xc1\xd4\xdf\xec;,}\xc1\n\xe3k\xc2K\xd0\x8d\xdd\xc2\xe8ZEz\x06:E\xf1Xv\xc0\x0f\x99\xee7\x0f_\x93\x06)\xb6\x0c\x18'
+    '\xb5\xd8\x86\xc0\x83\xa3\x10\xc7$\x92\t\xf9\x14\xb6\xa5\x02U\x17&\xd0\xdb\xee\x00hgc=\xa7D\xca\xa6\x0e\x155\x08\x9ciVV\xf9\xacI\x950\x98\xc6\x96M'
+    'e8\x16\x12\xcdF\x9bj\xed\xd6\x07\x08b\xdb\xf4\xc6G\xb7\xb0\xd7\xfaL\xb0\x1b!ku6O\x1c\x18\xccw\xedz\x92Hf\xf5\xde\x04B\xf3\x15\xa4Y\r\xa2'
+    "d\x05n5\xbd\xd1\x9b\x8d}\xd6\xa0e\xa7\xec\x89\xd2@\xc0\x86,\xad\xdc\x9fjg\xe5@\x9a\x9b\x84\xa2\x1f\x86\xda\xc8\x10\x19\x83\n\x9a\x7f\xc1\xe2'\x16\xc7\xe3\xf3"
+    "D_\xc7\x87\xc7'`|9\x16\xff\xb4eAE\x05\x95.\x98R\xc1T\x17\x9cR\xc1\xa9.(\xa8\xa0\xd0\x05\xc7T \xfem:VI3\x88s\xa8:+\xe7"
+    "'l\xbc\xb3\xa4\x12D\x98\xb6\x03)\x83&LI6\xa6.A\xe30T\xb6`\xad\xf2\xa1,T\x8a\x84nm\xc9|`\xef\x146\xea\x14.\xc3\xde\x98Z\x11\xef"
+    "O\xae\xe2\xcb\xf3l\x9c\x06\xf2\xeeE\x9d\x8a\x1e\x06\xdb\xb6mTI`Y\x8d\x0ezr\x18ql\xed\x0f\x88\xfa\xa6\xaeZ\x82\xe3G\xb4-\x11'\x7f\x02\xb6_\x98"
+    '\xfa5\x03\x12C\x96\xfa\x8fY;I\x95\xc0\xe9\x87u"vY\xfc%\x8eoJ\xfb7\x8c\x9e\n\xde]\x805\xa3z\x18\xd6y\x9cm_\xd0\x8e\t\x90\xa5\xd3\xdc'
+    '\x0e\x86\xf9|\xcaN\xf0|\nI}\x10@\x96\xcf\x1d\x8a\x1e\x80d\xcc\x9a\xfc\xf0*;\xd9\x17\x07\xe6\x1e\xd5\xdb\xad\xddT`O\x06Is\xed\x83\xb4\xb6\xa6\x7fk'
+    '\x8b\xfaz\x00|\xa1\xaeS$q\x1d\xc3|}\xd6\xa4&\xca\xe5\xec0\x99\xfa\xe8\x94\x89\x7f\xc0\x7f\xc4\x12\xd66\x96\xba\x8a\xa5KK\xb9\xe0\x88s!\xf3@3\xe6'
+    '\xdb\x001B[}\x12E\xaa/\xad;\xc9?\xc4)\xf4\x07yX2\x95\xfd\xc4\xe6\xc0\xf6\xe9\x9a \xe8\xb1Vu\xb5_/3\xf9\xc7>\xbft\xd2+F~\xdc'
+    'b\xa0\xf49v\x93c\xd5k \x00ZT<[\x0bGE\xabA\xef\x8e\xcb\xcd\xaePxB\xa6\x1a\x89\xa2{T\xe6\x00=J\xce\xcaU\x01?8\xee\xee\x83\xb3'
+    '\xca\xe6\xc3\xeeY\xe6\x03F\x1e.\xab\xc2\x83K\x7fR\xf8\x98\xaf\x89\xed$#:\xc9&ga\xect&D4\xdc\xc55w\x87\x97\xa4\xc0\xb3\x07b\xcb!\xf7\x82'
+    '\x15{\xda\xb5\xdb\xbf\x9a\xa6\xb7h\x1f\xda\xccLJ\x04\x89X\x85M\x0c\xfc\xd8\x1f\x80\x89mf\xce\xe8\xe4\xed#\xe6\xa2v^4\x9f8 \x81\x16\x01\x82}%\x0c'
+    '\x07`\x89\xab\xafNp\xb1ZmJl\x82F^\xec\xd8\x05,\x00\xd6\xa5V\x8f\xa8\xb8;7\x12|R\xcat|\xea\xd9\xe2\xe4\xb5\x99\xf8\xd8\x01\xe7\xc8\xce(\xa9'
+    '\x12\xdfQ\x1bk\x8c\xb2\x0b\xb11L\xd3\x02\xfa1}\xcf\xa7K{\x17-\xe5l\xda\x1e^\xd4\x87\x05W;E\xa8E\xe2\x18\xc6\xa0\xf2P\xec\xb8\xa3\x97\xf9H\x99'
+    "0#\xbb\xd0\x08\x87\x1d-\x17\xc4\xd9\xde\xae\x04VS\x90C\x11\xcc\xa4\x91\xdc\xe9$o\x07`\xd2\xb7\xae\xbd'\xf9&\x94\xa1\xad\x9fNn7q\xa0\x9d\xde\\\x8c"
+    'L5\xb8\xd6\t\xeb\xb7P\xaf\x93"\x99X^"\xb0Wq\xb9\xad\xd7\x81E\x0ec \x8e\xfa\xef\xf6\xbf\x1bl\xc4\xd1w\x9d\x8dx\xff^\x97]\x08\xae\xcb\xddG'
+    '"O\x97\xe6\x8c\x80\xb4\xebh\x03\xb2\xee\x1a\xd8:\xfc>\xd4t\xc1{\x12\x8d\xe1yR\n\xa1?K\xb2\xc2\xde\xd7"(B\x97\xa3\xac\x90\x10\xc3\xbd0\x8e\xc1\xe4'
+    '\xeb8O|L\xe1\xa04\x12\xa7\xfaQ\xfa\xeb\x9bg\x8f\xf3\xc9,\x9f\x02/P[\xb2\xb11\x05\x85\xdf;b\x15>\xadTB\xf7}\xa2?Ag(`\x9b)'
+    "\xa1G\xed\xd7\xf7\x02m\xcf\x8f5L\x0f&J-\xb6`\x00\xde\xd94\x00\n\xd8\xee\x1c\xf6-'^\xd4 \x9d\xfa\xa2\x05\x18\xbc\xf5\xdfp\x1b\xa6\x7f0\x0c\x03S"
+    "\x85.\xbf\xf8='w\xa5\x08H\xdd\xe2\x00\x99\x0b\x85\xa9'\xa7\xf8\\^\xf6\xd8R\xa9\xca\xdd\x1b)\x9fD\x92shm1\xf3\xe1pY+\xb5\xe3\xf2\xcdy+"
+    "\xd8\x89\xa5Y'P\xca\xe9i\x91O\xe0\x98\xf1X\x90\x9e\xc4\xf4P\xfe:\xa8\xa2z\xe3`\x87\x0f \xb3/T\x1c=\x10\xb1QZ\xd6\x8e:\xf0\x80\xd0\xa1\xa9\xa1"
+    'Oh\x17C\xbeq\xb6\xfaa2I\xc7~\xdb\xa5tg\xac\xf4\x8d\x8d$\xd2\x16l\x90\x02_r\xb93\xb6"\xbd\x16\xf1\xdb\x1e\x8cD\xa2\x87\xd5\x90K5`\xd5'
+    '\xaf2q"A\x041\xb6\xd1\x13I\xf4!\t\xb8\xaf\x1b\x9b\x1a\x9d*\xff\x15,\xb8\x8f\x932E\x9b\x9f\xae"T>\xba[\x8bv\xd4-k\xcf\xed\xdd2~\xed'
+    'h\x0b\x97\xe5\xb0g\xb0\xdb\x94\x83\xecg\xcb\x11\xc8l\x04l\x01\xa4Ar\xda\xcf\xb2*i\xa0>\xe7\xb3\xe6\x8e\xa5\xdb\x9c\xe9T\xd4x\x9e_\xaa\x1a|\xbb\x1a\xa5'
+    'E9\xcc\x8be}\xa1\xda\xdc\xed\xf5@}\xeb\n\xb9H\xbf\xa3\xfe\xc1\xd6\xff\x19l\xc6\xf4o?\xd9\xfa\xc7 \xee\xb6\xc3\xef>\xed\xdc\xbc\xff\xee\xd3\xfd\x1bVQ'
+    "|;\x1e\rdM\x7f\xa5-Q\xfa>l\xc4u$\x16rZ,'\x0b\x01{/\x80m\xf1\x85[\xf7<\x9a\x97\xe9\x93|~2N\xffk\x9eWb\x13d\x0c"
+    'N\x9b\xb8\xb4\xb1\xf2\xa3T\xd4\xed\x1f_moo\x1d_\xed\x9c\x1e\x1f\x0f\xba\xcd\x07\x1ddg1CB\xa3Ak\x8d\\\xf3\xcc\xba\xd0Wg\x1e\xf7\xd0c\x9a\xed'
+    '\xb3\xbf\xd1V0\xdf\xde\x0e\xf9Q\x94\t\x8c\xbai\xb8\x1d\xec\xfc\xd5:/\xd1B\xac\x8d\xdb\xb2\xb0[C7jwK\x9a/[\xe4N\xd2\n-E\xa4\x15\xb6\x9a'
+    "\x9b\x86\xb2\xe9q\x88mE\xdd\xddf\x0f'\xdf\x8c*/,\xb0:Y\xcc{\x8a\xfe\xe8\x0e\x04*\xf4\nf1\x7f\xf4\x15\xf6w\xa3D\x1b\xd7v\x81'\xf0\xa5\xc5"
+    '7e\x03\x86\xa8IV\x85\xa5!\x02yEY\xe7d\x9cL?F\xe6\x9e\x97Y\xb7L\x13v0:\xee \x8d\xfe\x83\x9f\x96Z\xfdw-A\xb4\xe9q1\xd8 '
+    '\xea\xbb\x9a}\xf7]\xbf\xdd\xfbts\xdc?\x1elo\xfd{\xe7xk\xf30IO\xc7\xd3bk\x1e@\xbb\xe3j\xb0!\xd4!\xb4k\xa3\x95\xda\xd6\xca\x9dq\x95'
+    '\tX\x85\xffa\xf9\xe7~(\xf1\x94\x8a\xd8rr+=\xd4u\xd7[W@\x80\xc0\xd0\xb8C\xe4c\xa4@\xb5=\x8c\x80\xd5\x10\xba`\xa68\xf4\xf9\xd2\xc9\x8d\x9c'
+    '\\\xe3`\xe7z{=\xad\x92+\xf4\xa2\x8b\xc2G\xc9h|\rR{"\xc41^\x1c\x95\xd2\xedB_\x13i\xe7=K\n\x0c\xc7\xf3QZ7\x17\xf8\xf9\x8e^'
+    '\xab\xe8*\xf0\xb4\x85\x9f6A\xbe\xff\x96U\xe7w\x04\x07.-\xdblN\xa6\xa3%\xd0\xf0\xf8\xa0\xe6C\xeb\x06\xb2\x92\xb5\xe1\xaa\x03B\xf0Pt\xa1=\xa9\xc7I'
+    'Y=\xf3a\xc1\xb6\x1f\xf4\x10_\xbc q/f\x9a<r{s\x13\xb0\x05\x08>$6t\x14\r\xb2\xcf\xe5c\xdb\xae\xa2\xae\xf0\xfd\xc4\x04^8\x12hB#'
+    'yQ\xab*\xea\x07=\x96\xbf\x18YV\xfd\xcfI\xe8\xb9\x93-\x0f\xd4\xb7g\x87q\xb0\x8a=v\xe1\x91\xcfk\xc4\xf8^\xac\xe7\xf0\xfbd2\xdb\xe5+\xfe\x01\x96'
+    '\x8e+\xab\xf0!\x16\x9eA\xa16Q/9e\xfa\xbb\x84\xde\x10\x16\x87\x0e\xbdA\xe1\x03\xab\xf0\x8c\n\x1f\x86\x9c~\xee\xd8\x9bL\x8b\xfc\xc6\xacf\x91\xf6\xbfl\xe1'
+    "\xd5b\x8f\xe9owM:\xbb\xcaY\x97\xe7g\xcd\x04\xae1\xd3\xbd\xecW[\xb3\xa6\x8clh\xd8E\xd6\xb8\xa1\x9b\xb9\xdaPg\xf0f\x18\x8f\xabf'\xe77\xd7"
+    '\xec$\xbb\xd4\x86\xdf1sG\xec#\xce\xcc\xbd%\xaf\xbf`\xd2\xc1&\xd1s\xab\x1d\x89B8j\xc3!\x85\xa6\t\xde\xbc\x06\x8b:\x8d\xf1\x90\x0e\xce\x0e\xd3\xd1c'
+    '8\xaaG\x009V\x97\xc7\x86\xc4\xab]\x1b*Z\xd6V+\xddU\x19p\x9a\xe8\xae_0\xf9\xc6Sc<=\xd0_bI*d:\xaf\xa9\xcc\xde\xbf\xe6>\xa1'
+    '\xc1\xef\xbb\xea\x8c\xa6\x1dM\x15d\xc6\xb7\xa5\xf6\xc5\xd5\x1eI\x0b\xabG\xb1\xc7\x08\xae\x07\x89\xca"\x1f\xd9b\x93\xb8\xf1\xb6\xb3\xfd\xa1C}\xfe\x86\xc99I\xc5\x86'
+    '\x07\xb4Tv\x0b\xb4SXn\xef\xaa\xca\x1e\xde/9\xe6\xf5\xfb\x03\x0b\xdc\xb0\xba\xd2\x83l\x07\xe9\xd5\xac\xd0\xa0\x7f\xd0:)\x9d\xf7\xd4\xe4t\xdfE\xfdw\x9d\xfe'
+    '`\xf3\xf3q?\x8a\xf6{\x9d\x8d\xfd\xfe;\xb8\xdd\xde\x8f\xc5\xffE\xc7\x1dQ\xfe\xf9^\xdcU\xad\x95\xddF\xedQpK\x18AO\x96{\xb4\xac\xe5\x0c\x9e\x86\xa2'
+    '1\x96WKTw]\xd5\xb5\xcd*\xc3|2c\xe4\xe9\x98-:\n\xfb!\xd8\xd3\x15!h\x82\xf0\xf6m\x00\xe6\xcb\x01\xdaMTCcu \x1a\x89\xff\xef\x03'
+    'l\xc7\xa2\x82\x97\x89{\xf8\x99f\x02~(\x02\xc6\xb6\xf7B\xa0\x08\x0c\xff\xb0\xc3\x99\xc0\x8b\xb7\xd2(\xee\xa8{&\x8dV\xfd\xe6i\x15\xfa\xde\xac\xd9\x87\x0b\xc9 '
+    '\x9b\xf5\x1b21\n\xa5\x87\xb1\xebq\xb6\x05\xb8\xcb\x11\xf8!z\xf7Y\xccy\xf1\xf9x\x1aG\xdf\x1d\x7f"\xaf\xcc\x1b`\x00\x14\'\xf7\x90\x06\xfa\xbd\n\x14\x1dN'
+    '\x85\x00+\xf0\x957y\xa9\xa4\xc9\x90\xeb<\xeaN\xa6M\xe1\x1b\xae\xac\xbbL\xba\x8b\x93jS\xa0\xefoD\x89\xfa\x93PWM\xebj*9JA\x9f\x91\xff\xc6'
+    '\x98\xc3\x8d\xe4\xdb&\xecvs\xd3\x10u\xe9\xe3\x0f\xc1\xa04\xf6\xb8\xfe\xb8\xa3\xfe\xc2\x87d\x9a\xc0\xe9-\xd8\x8e\x181\xc8\x91\xd7\\T\xd5\x88\xe2\xa1\x80`!?'
+    '1\x04\'\x19%\xe7\x97\xdd\x1aQ\xb7Toh\xc1"\xbfup\xc8+\x92k\xe3\x9eK\xf6#9~\xb9&#yE\n\x8b\x12 \xc4\xc1\x03j\xe6\xbc\xa8#\xb8'
+    'd\xde\xa3\xefd+\xc3\xe6\x8a\xca\x12\x84}\xd6\x91-\x87\xf9x\x0c*}\x9d\x1c\x86\x8c\xc9x\xbc\n7}\r\xc2\xe9\x9bu\xe3\x0fA7\x19u\xee\x92\xa3\xe3W'
+    '+\xb2\xad\xfc\x03<\x91\xd7\xbd|g\xbf$\xa1\xea\x8a\xab\xee1\x19sc\x93\xcc\xbdMN\xa6\xd7\x7f:]\xd8\xb9we\xc2\xc0(5\x80&\x92\xc4\xcc\xa5\xe4\x96'
+    't\x90<\xf4\xe7\xd2\x82?\x02\xb9%\x8b\xc8\xf5\xd2@\x87\x05Cf\xa2e\x94Vw\x1f\xb2O\xa2\x9a\x91\xddav\x1b\x86R\xf7\xa0p,\xfb\xbe\xc9\xd6\x8e\x14\x8b'
+    "'\xfd\x14\xbc\xd6\xef,\x18\x16S\xe0Ns\xbb\x80\x0e\xfe\x17a\xd6\xb3\xaf%\xd3}&\x0eD5\x8b\xd87\xdeDlZ\xd4up\xa9\xf3K\xeb\x9c\x1a\xa44\xc7"
+    'Y\xb7\xdb\xb2\n\xf7\x0b\\\x95\xa2\xd4T^\x0c.|`\xf7E\xcb\xa9nEZ\xe5\xf0\xc1\x8d@\x1a-\xed\n\xae\xacC\n\xd2:DF1N\xe1\x85v\xd3\x05'
+    'b\x9f\xe6sz\xef\xbb\\\xbe\xda\x04\xd2~p\xee\xc3\xc6@\xc3t}\xfbV\\q\xd8\x9c\x93\xe8\xa7"\x9f\xcfJxq]\xd3f\xc44\x8dA)W\xdd\xab\xdf'
+    '~\x87\x18S{\x9f\xdc\xf7z\xbaA\xdd\x17F+Q\xa63m\xe0\x84b3b\xd4]\xa8\xd0<\xdfQ\xfa\x0b\x15#\xa7\xe8\xee\x1d+=V\xa9\xdf,\xd2\x8dq'
+    '\xcf\xbdF\xffRq\xb3\xf22\x80\xee\x18,\xd9\xbdG\x9fp\xe6\x0f\xea\xf1Q\xc0+*k\x14\xf8\xa6\x9e\xc7n\xf0\xbc\x16\x91\xfa\xdcN\\\x9f\x18\xcb\x99\xc3\xe1L'
+    '\xee\xa4\xd9\xa7\x9e\xd4\xcb\x7f\x898\x7f\x15\xc2\x88=I\xae\xfe\xdc}\xfc\x96\x93\xa1\xae\xd7\x97\xebuj\xc7\x93\x1e\xaa\xe24Im\x1f*\x051^\xb89.\xd9\xfe'
+    '&\xd9\xf4\xffs:=\xf8\x1ad\x82\x0b\xdb\xccy\t\xfaM\x89\x05\xb2V\x9d\xb3P\x96\xdfI\x97h\xd8\xcc\xb4\xbfO \xfb\xe9\xc9>\xe2\xa5\x1aE\x1f\x1b(\x9c'
+    '\x06\x8cB\xe3\xb9\xe5y\xaf\x1fJ\xd7\xfc\x8dW\x19I\x83\xaaKr\xc0}\xf5\xbclS.\xd2\x0f\xdfJ\xc7\xbd\xb3\x86\xb7\xfe\xcdT\xbc2/\xaaG\xd7_q\xb4'
+    '\x8be\xb5\xe7lB\x1eU\xf8\xb5\xa7\xf6\x97a\x01]dI\xafa%\xdf\xa8\xc1u\x00\xff\x889\xd2\x9eV\xed\xa0\x80\x18\x97\xf6\rz\x82.\xb4\xa7`\xee&\xc8'
+    '\xed\xe0\x04\xce\xccPS\x979\x1bs"\x84\xc1\x89X\x8a[\xe0\xad\x9c\x04\x0f\xf1\x07\xfc\xbd\xad{G6\x8eB\xc4-\xbc\xb5[\x10\x90\x875\xfa\x87\xd7+\x16\r'
+    '+\x86\xf4l\xf9/z\x10\xea\xd7\x1c\xf1\xe1%\\\xdeE\xb1Q\x1c\rl\xfc<\xcbg\xda"M\xa6P<\xe6\xcaxg\xf6\xe3>\xdcMq\x18\xf7\x0e\xbeh\xfa'
+    '\xf5,\xb3\xde$q=\n\xb5\xe4\xdc\xe5.\x1c\xda\xca\xc4\xee4\x9b\xbc8\x9c\xf6\xe1w\x0f\x8c\x81\xb1\xa7\xef\x82\rD\x13\xd2e3\x08\x1f\x86\xe6\x9d\x98}kc'
+    '\x80\xd0%\xcd\x04^\x9db\x90@\xfdAY\xa3\xda\xf2|\xd9s>\xd3\xa1\x1b\x9f\x94\xa4dq\xe0_\xe5\x89\x94\x1aSX\xbd\x86\xcfB3;q?\xcb\x13H\x1b'
+    "\xaf\x8d\xc5\xc9\n|\xc1\xd8g9\\\xfc|\x91\xc2\x8bf\xabuB\x80\xcb|\x92\xbaH'\xd3k\xb4\xf5\xea\xa0q\x82Iq\x96\xc5Gs\x85\xb7n\x8a\xd4\x8e\x81"
+    '\xe2Q\x9fj\x19\x12\xb1\xc5,\xec\x03\xad!|1\xa8\xbc\xe5u\x15\xe36\xbf\xddfB\xd88\xb01K\xb84BR\xc9\xd6V\xac\xea\xf7\xa9d\xc0\xe0\xaa"v'
+    'I\xa8%\xeb\xcd\xe2+b\x19>\xa9\x91,\x8b\t#\xbfz\xd6\xb6i\xf0\xfd\xf7\x1aO\xbc\xbf\xe9\xcbK!\xb8\xdf\x83\xa7\xf6pE\xc1Bw\xdd\x92\xce_\x83\xd2'
+    'w\xa6\xb5w\x1f\x03\x8ac\x17\xe8\x08\x89\xf2\xb0\xb6\x0c\xe9;\xbbo7\xac\xaa\xee\xf4\xd7\x9d:\x9d\xf7\x05\xf0|)(\xda\xf4%\xd8\xab}\x92_\x96#\x00s\xfd'
+    '\xbe\xe1\xcaB\x9fg\x9b^\xd22\xc7\x8d\xfa#ZG\xb0\xa3Y\x80\x02\x01\x9a\x08/iR4=C\xd4\x9dl\xef6\xdf1`\\\xb7\xc5\xd2W\xfa\rS}\xd8'
+    't\x96Tw\x1cU\x07\xdc\xd2:\x99%\xc3j\x99\xbb,\n\xc7\x95\xce\x86\xea\xda\xaf\xbe\xa9\x9c\x8e\xe1Jj\xba\xd4\x91\x0c\xbd\xb9Q\xdb6{+\x08\xca\xc0\xdf+'
+    ']R\xc8]\xd3\xf1n\x96-\xf6\xd7\xecHz\x12\x13\x8cb\xd4\xc7\xa2\x81g\x13\x84[\xfa|^5\xe8\r:nPs\xc8\x88[\x90n]\x86\x14\x92{\x86G'
+    '\xcdT\n4.\x01\xce\xd7S\x88\x89\xedPR\x96B\x18Z:\x1f\x08\xed\n\xbd\x82z\xceV\x1b\xeb\xf5f?\xe3\x1d\xcd\x87\xcb\x14\x00\xcb\xbb\x9d\x01\xb7xs>'
+    '\xcd\xfe\xdb\x8a.YT\xe9\xe8.\xd3\xeeU\xdd\xb7A\x06\xd3\xbd\x96\x90\x8d\x12\xba\xc0F\xdek\xa12\x06\xfcH\x8c\xd9\x0b\xd6\xe9\x83Md\xa6\xe9\xd3g\x8fg;'
+    'g5\x9f9\xa9\x02\nZ\xab(!q_\x1f(P\x04\x837\xa2\xee\x10q\xf94i\xe0mRR\xea,\xc46\x93\t\xba\x88]\xc8\xa7\x1eu\x14\xdd\xb8S\x0e'
+    'f}\xadv\xba\xef\xc9\x96+\x82\xb7W\xff\xfaZ\xe5\x03-\xf6\x95\x15\xc6/vb\xa2\r\xc2\x15\x1cQW>\x05\xde6T\xdc\xaa\x01\xe2V>#\xd2\xd8\xfd\xe1'
+    '\xdf\x06!\xf3\xe4\xeav\x83\xb9X\xb6\x10\xb1\xf1"\rNH\xcd\t\xfe\xf3-\xc4qwB\x1d\x03r:\x00\xff\x9a\xfft\xe2n\xa5b\xf7;L\xe0}\xad\xe8\xb1'
+    '\xb6\x03\x03\xcd<\xdb\xafl\xd3\xb4\xa5+\xaby\xd0\xf0\x81\xfb\x9c\x01\xc7\x8a\x15-\x95U\\\xbc\xb8\r\xd7\xb5M\x87\xc5Py\xa5G\xa9\x99y\xb9\xb9\x19d\xbb*'
+    'nf\xc3\x9e\xadl\xf8b\xb3\xc6\xa5B\xcbM- \xa6k\x82\xf7\xe8M\xd3\x18\x99sf}\x9c\xec\xe3\x82\xb1\xeeA\xc8\xb0\xe4e\x94\xc5Rl\x1a\x17\x12\x1a\x99'
+    'S,\xc6&>e\xf8\xb6DQG\xfb\xfb\xeag,Y\xdc\xd1r\\_S\xe0\x18\xd9\xd0\xa2)Qn?\x80\x07\xa4\x99\xd0\x04\xa6\xa0\r\xd0x\xdd\xd1\xc8-\xc2'
+    '\xc3\x07(KD\x0b\xa3g_F\xe4(\xc3\x0e\x1f\xee\x9d\x92\xac\xe0\xa8\xdc\xa5r\xde/\xa5\xe7=\xbd\x1ac8\xcb\x1a\xfb\xba\x06\xbed\x81g\xaa]\xdc\xbd\x07\x0b'
+    '\x0e\x05\x18l?\xfe\xe4aq\x12v\xbe\xf8;d5\xa7\x81\xd7"\x02\xdeJU\xe4\xbb\tW\x13\xbfN\x10\x17k\x99\xd3f\xceC\xb9\xc4\xf6\xad\x91\xec\xef\x03\xf5'
+    '\x87\x88=\xafu\n\xaf`T_\x1f\x94w\xc8sU`\x94_g\xa7\xe4\xed\xfb\x1f\x06\xcdO\xee\x1b\xda\xc4\x0b^\xdb\xeb\r\x17\x9c>\x1d\xad\x9f\xe2\xee\xb9j\x7f'
+    '\x95?\x86\x84)\xaf\x93\xa2Zj\xc0hx\x89\xb1\xea#2\xb5"\xfd\x8f\xbd\xdc\xf3\xc6\xbd7\xea\xb9\x19\xbeEOc\xda\x9a\xfc\xaf\xdb\xed\x03\x81\x8d\xa9\xe7m{'
+    '\x91\x8c\xb2+\xe7\xcd\x03{\x14\xa3\x9d9\xb1\x1eH\xdb\x9dmg[\xda\x0e1dI\x19\xe9C\x82\\o\xe6\xf59\x15\xac\xfe,D\xec>\xe0\x8cJ\xee\xdfZ\xd8'
+    '\xb1X\xcc=\x16JV\xeezB\x92\x84\xc9I\x19\x14x\xcf9L\xb3\xb185\xe4y\x11\xc6\xceF.\xaf\xba\xa0C\x97\x0f\xd4\xe5\x94\x18\xfd\x8b\xa4:\xd7wU'
+    ':\xee\x16\xc8\x17\xdb|\xf2\xb3\xa5\x180\x17v\x88BiT\x01\xe5\x1d\x07\xa5\xae\xef-\xb7E\xd9!\xd5\xb8EB{!g\x05<\xd3t\x8e4\r\xc1\x94\x8d\x8e'
+    '\xa1"\x9c\xba\x11OA{\xd8\xc3\x87A\xd3\xda\x13\xd1\x9a\x0b\xa1\x04GT7\xc3\x95(\xf8\xdc\x87]\xad\x89\xdc\xf3\xb4\x07\xaeF\x99S\x8bG\x8c\xa5\n8\xe3\xb2'
+    '.n!\xb6\x8eEL\xb5\xfc\xdc\xce\xc4\x99|\xe8\xca\xd1q\x9dM\x95r\xc7\xeb\xe0\x8bTz\x1b\x0cB\xde\xcc\x03\xf3\x1c\xc5\xd7\xba\xf4\x00X\xd3[\x97+\xa0\x8e'
+    '\xe3\x8b6\n\xe0\xabcG\xaa\xc9\xd1\x95V\x14\x9c:\x0b8\xb1\xe2\x18\xc2\xce%\x99\x84w\xe6\xc2[\x0e\xc8\x060\x9f\x96\xcd \x16RP\rp$\x0e\xb8U\xda'
+    '\xfc\x9d\x1b\x07\xec\xbe\x15g\xf4\x16\x84\xc1\xb3\x18\xc6\x9ai\x1b\x96\x13j\xd8O\x06y\xa5 \xea\x86N\xf3Z\xa0\xe0\x85\x00\xd8\x9d\x84\x01\x81ZWS\x88#\xcf\x0b'
+    'y\xf7Tg\xbfU\x0f\xcc\x0b\\\xc3q{\xee3j\xf7\x80J\x1d|\xff\xbd\x0c\xbd\xa3YW\xe1(D\xd4\xd9\xa2\x95m=]E\x92\xc7\x9d\xf9l\xe4<\xd6a'
+    '\xdc\x83\xdf\x96\x03te\xa9:\xee\xd3v\xc8\x9e\xa2\xc0\xb9\xc8}\xb6\xafn\xe0 he\xa4\x16f\x9b\x11\xc6\n.\xe4\\\x1a[\x9e\xc0\x9a\xef\xfc\xb1\xb5\xfdt\xb0'
+    'nZ\\\xccL\x9c\x00\x8f\xe8U\xb8\xc6mc-2X;\xaf\xf6e\rx\x06F\xc1}U\x93\xbd $\xaa\x85\xf5\xd7\xfc>sW\x19sE\xcd\x89D\x8d\xa3'
+    'a\xbb\x90\x0c\xf7\x08H\xaa\x93\xf7\xf7\xa1\xf7A\xbf"\x89w\x07+\x99\xd7\xb5\x0b\xc6\xac\x8f&\xbb\x00\xbf\x18\xc2h\xd1\x9f,\x03\xc1J+\xa4\xd9\x92 \xd4\x8c:'
+    'v:\xe4\xfa\xc3\xd0\xe5\x8d\x06\xad\xc6\x95H\xd2N \x95\x1a\xb5\xc59cn2\xbb\xd4\x17\x86\xb6\xbb\x98\x98j\x08m\r\xbeZ\xc72\xdf;\x17\xc1X\xb5z\xaf'
+    'd\x9e\x01\xfc\xa0\xac\xf7?\xef\xa2\x06C\xdf0\xe3\xc1"E\xa6\xf1A\x11\xbe\xd9h\xc3kHx\x932\x1c\xcf\xcb\xec"\xb5,\xddX\x03\x0fv\xe2_n\x8fA'
+    '\xff\xb5t:\xe2e\n\x02\xbe\xbc\x90\x7f\x1bEs\x99FP\xdb\xa5X\x9f\xf2.D\x9a\x18-\xb3\x9f9JY\xd7\xe0\xf1\xae\xe3\xefB&c8\x0eD\xb5\x00\xb2'
+    "u'\xc3\x9aB\xa7\\_\x0cf\xb1\xcd\x02\xcc?P;\x1a\x1a\x9a\xfa,\xec\x0f4)\xeb\xb1\xe6\x83\x07{\xd6W\xa9X\xe3;\x8f7v\xa0\xcc\xc6)d\xbc\xc9"
+    '\x18\xa5\xa1\x85Q\x8b\x0f>$W\xf2\xb9\x88PK0}\xe8,_t\x0c;*\xae;\x18\xfe4R\x9a\x1d\xab\xc8\x90\xf8\xfd\xc5\xf3\x9f\xabj\xf6\x06\x82?\x82I'
+    'Wg\x80i\xa8\x7f0\x04\xa3\xd9\xefrM\x86/\xca\xab\xc9\xf8~\x07\xa0\x1c\x1d\xbd\x0eo\xdd<\x1b\x16y\x99\x9fV\x0c\x02\x02\xc0\xc0Jz\xf6\xa4\x03?\xb6\x95'
+    '\x98>\x86\x00\x1e\xbd`\x9b\xec+\x90%\xf2M*H\x82\xf1\x1c$\xa1\n]\x00\xb6\x8c\x95\xd8]>\x19U\xed\xe4;\x19\xeb\x1ci\x07\xe3\xecY\x1b,5\xab\x87'
+    '\x9cT\xab\xc3T\x89\xb9\xba\xcf:\xc4\x13\xbc\xa9\xc6\x8d\xfd\xabt\xe9\x803\x0f\xedu\x07\xf2\xe2\xc5\xdb\xc7(+g\xa0\xdbx\x83\xa2\x16Dw8`K\xe6k\xe3'
+    "\x03v\xabk\xfb YC\xaf\xf9\xfd\xab\xac\xd8W\xfd\xd9F\x16;,'\x9bYS_\xbaK\xea/\xed\xa0\xdf\x84\xf1\x80\xef\xc1\x9e\x17\xf7\xb6\x83\xaf\xcf9\xc2\xe1"
+    '7\xf7V\xd6\xf9\xac\xa3\xba\xe2#\xd2|\xfaXf\xcas21a\xab:\x8fon\xd2\x9bg\xd1.\x07\xd3\xb4\x1b\x87\xb5\xa9\xdd\xd6\x96\x92OX\x01\x92\xfc\xad\xfc'
+    "\xa65\x9f\xa1'\x8b5\xb5\xb2L\xae-Rx\xe1\xd0\xdf\x93\x94\x0cgy\xa9\xa2\x81\x8a\xb5Z^O\x87\xe7E>\xcd\xe7%\xe5\x17S_dz_\xc8\x92!\x9a"
+    '\x86\x89I,\xdc\xbd\xda\xba\xbc\xbc\xdc\x82\x98\x06[\xf3bLJ\xdfH\x83\xc4\xdf\xa8Tbw\xbf\x1e=\xdd\xfa\x9b\xfe\x08q\xab\x04>\xb8\xd6\x03\x08\xf4\xa9\x1a\xe9'
+    '8\x0f\xca\r\xd0\xfe\xd2c\x0e\x82&\xc4\xb7\x9b\xe7\x8f\x13\xa0\x1d(J\x08\t\xf5\t\x99\xa4F\xa4\x8e\x15\xa7\xdc)u\xe3\xbb4>\x15\xb0\xda\x9a\x01\xda\xb2\xa3\xfe'
+    '\xdd\xed\xd5|\xb1\x1fj\xab\x1d\x17-\x89V\xffZi\xfa\xda\xbd+M\x8em\x9er\xad \xdf\xba\xfc\xa9\x19Wz\x1d\x0c\xcd\x02\x80\x9dAj\t\x1e\xfe\xa5\x8cm'
+    '\xed@p\x91\x9e.m+\xc4o\x9a\xc5y\\a%&\xc0.\x8fy\x87\xd9Nk=\xd6\x96\x92%\x12\xf0\xad=\x01Ky\x84\x9dbl\xad!\xf1[\xc0\x16\xff'
+    '\xcf`-b\x95]\x1eqJL\x991\x08\xb13\xbbg\x8ex\xce\xbf~(\x86\x01:9\xae\xcf\x81\xde\x8bX\xe7L\xd6v\xbbA\x99M\xe6\xf8d=\x17\xfaC'
+    '\x019\x8eO\xca\x00Rn\x07\x00\x81\xaf\xb7\xb2\x1f\xca@\xfa\xe1@\r\x80#\xee\x8e\x90P\xb027\xc9\x17\xe2\x8c{f*\x8a\x00K\x85i\r\xdd\xce\xc2D_'
+    "\xed\x11\\\x9e\xa7\xd3\xe0\xa7\xc3\xa3v@\xaf\xfc\x99t\x10g\x90\xe0\xd77\xcf\xdd\xc7'\nE\x81#P+\xb6\x036\xc3\xb4m\xee\xc9\xaa\xe2\x87\xa6a\xb8\x8fo"
+    '\xaa\xc5y\x0c\x0c\xae\xfb\xa1\x0cz\x85\xf8\xb3Pm\xd0M\xf7\x97|*\xd8\xa3\xc8\x8b\xcf\x94\xbb\xf53\xa6\x00\x96QA<\xb9~\xd9ISR@\xa0\x10~\xff~'
+    '\xcf! \xdb\x1a\xe5U\xad\xd8vJ\x15"\x82mEe\xca\x0fBl\xf0\x8a\x81\xd4\xce\x14\x07\xde\xe2H\x81\xd6\x10\xdc}N\xe9\x0fQ\xa8\xda\x84\xca*\xcf\xdar'
+    '\xd6\xd0K\x0er5O\xf9\\\xd81\xbd\xdaz"\xda\xf6\xd4($\xf9~c\xfa\xa8\r\xd1\xaaf\xe9FG\xf9\x9b4\x19\t\xae\x82\xf7\xdd\xe6\xf57\xe5t0a'
+    '\xcb\xeax\x0b\xbdL\xb4+\xa1\x9dL\xa6\xae\x96\xf2\x14\x81=\xc6B\x06\xd2Z\x1beZI\xe1\xf7\xb3\x00\x93\x16&\xaa\x82\xacp\x92\x8f\xae\xed\xb5\x85\\\x8a+\t'
+    '\xa2]\xda"@\x94>\x82\x06bk\x92\x0b\x03\xa2\xdei\x8f\xa1\x1a\xf6\xa5\xde\xdd\xa0\x1f\xd3uw\x03\x92\x8a\x0f\xd3\xe0iV\xa4\xa7\xf9\x15,\x1b1\x8e\x918\xef'
+    '\xe1p\x03\x1co\xf0#\xda\x8b\x19M\x95\x0c,!C0\xbb\xddo\x9c\x04\x1d\x9a\x87QT\x88\x9a"\x1b\xa5/\xb2\t\xe6\xd2r\x16\xa3EVM-\xd2\xd8\xea\x8f'
+    '\xd1\xc9\x1a(\xf9\xf2\xf0j\x98\xce(\x91N\xed\xb4i\x81mt\x83P\x1c\xa2o\x7f4\xd6\xe6\x9b9n\xb2\xfa\x0fe\xae\xa5\x88\x17\x8a\x89\xfc1\xd6\x14\xd0\xdb\x9b'
+    '\xf7p\xc0\xf93j\xec\x9b\xdf\xb1\xb9\x9c\xd50\xa8s\xfa\xca\xf4\xba\xf0\xf7-\xd92\x1dm\xc1\xcb/0\xf3\xd8\xe7D\xad_\x89\xba\xfanxK\xe6v\x0f\xf9c'
+    '\x0fY\xa6\xeb\x1f\x0ca\x0e\x00"\xf8\xdew?$\x17\t\xc5\xb0mc\x80\x97\xeey5\x19\xa3\xdc6Z!\x14\xe07\xfck\xa3\xbb\x11*Mm\xadI\x88\xe3\xf2'
+    '0\\ \xc7\xd8\x0f\x1f\x93\xf2\xb9\x05\xa8\x99=K1&SMu\xa8\xca\xc0YbJ\x0b\x05\xb1\xbf\x8b\xd1\xe9\x04\xa1\xf7\xb4M\xadV\xadGa\xcb\xdcu\xd5\x12'
+    '\x98LS\x99uMl\xe6e\xda\xc2\xb5\x94\x8f\x05\xa2\xc1\x8b\xfc\x1f\xd9x\x9c(\xd7\x14\xdc\xb5.\xf3\xe2\xa3\xc2i#H\xe8\x16OT\x99\x9f\xc1~W\xa4\xceI'
+    '>\x80\xa5]\x06\xc9\x14\xec(yQ\x88\xbeLkE\x06y!I\xe4\xe9\x04o\xd3Tw\xfdh~F\x7f|w\xff\xc7\xbf\xfe\xf5/;\x1d\xdd\xba\xeb\n\xd7\xe6'
+    '\xa5kg\xda\x8d\x16d\xb4\xff)\x1d~\xcc\x8f\xbb\xd1\xf1\xe8\xd3\x8f7q\x97\xe2*o\xb7\xefoo\xff\x05\xe3*Cf1\xf1\xb7m}\xe5\xd3*\x89\x89\x93\x1a'
+    '"A\xed}\x92|~\x8a-y\xf1\xa7\xda\x1a\x0e"\xc3\xb05\x89\x85\xb5~\xfc\xd6b\x8c\x96\x08\x81\x9bk\x9a\xaf\xdd\xda\xda\x93\xea\'`\x02\x81\xc7\x7f\xb6\xf17'
+    ':3\xc8\xea^O\x06\xd0\x13\xeesB)2Q\xa3~6\x18h\x08\xfdl\xd3\x04{\x01]E7\xbb\xf7\xb3\xc4\xc9\xbd\x1d\x96\x86b\rU\x19\xe2\x07\x96\x01\xde'
+    '\xdc\x0b8\xe1E!\xb9\x1cF\xd0\xa5\xe6q\xd3\xbed\x0b\xaf\x08\x9a\xb5u\x9f\xf0k\xe0\xf8\x13\xa4e\xd9\x18\xa40\xa9\xe6zz\x84~\xf7\x16\x0b\x9cX\xd2\xeb\xb2'
+    "\x1a:;\xd2\x9f\x0f\xf7\x80\xe9@@\xcb\x82\x07\xc1\x0fVb\x14\r\xcb\xe7\x93\xcc\x143\xcb5\xc2\x0cRw\xb8\xed\x0b\xff'\x1bm\xb3M\xca\xb3\x17X\xd6 \xbd"
+    '\r8\xa3O\xd5\x89F\x12\xb5\x83YR\xca\xbei1h\xaf\xa49\xb2 \x8fr\x03\x0b\x95U"\\\x98EEon\xb5\x07\xd6\x96x\xed\x0b\xcdQ:\xf1a\xbf'
+    '\x92F\x03\xc3\xcd\x82Z\xbe\x06\x91\x0cp\x89|\x10\xa1R\xfe\x96~\xa0j\xfe4\xc9\xc6\xf3B\xe0hCj\xc8\x0b\x1fkU\xd7P\xa5C\xbc\x87yx\xbd\t\x99'
+    '\xec\xf16\xab\x1c,"\x11=S2{\xce\x9e\xe9Mp\x96\xe4|{\xcfj\xd6\xde\xc9\x9e\x81Sr\n[L\xc8$\x00\xf0\xb4\xaf\xb2\xe0l\xd6?k`\x7f\xd0'
+    '\x99(\x8f\xcb\r\x0c\x96\xf6\x99\xed\xcf\xb1\x90\xdaW[\xf1~\x04[\xf9\xe7t8Ib\xda\xd0\xa3]\x08G\x8e\xa1\x0f\xb38v\xb48@@3W\xdcx\xa2\xf1'
+    '2\x07\xf2\xde\xe0+\xcc\xdf\xa2\xf3\x8b\xee\xc8=\xc1,\x02ys\x17\rt\xb55%\xf6\xaf\xe4"\xcfF\xf8N]Ph\x0ca\xa5\x84\x1c}\xf1\xf6\xd9a\x0f\x1f'
+    'FL\x83\xf9\xec\x16g\x94\x06\xda\xb9z\xb1fD\x1e\xc6@\x88\xdf\xd5\xc5\xdc\x19\xc8r\xa2\x18\x13\xe6\xb8\xc3\xb3\xb7\x0c>\xd1\x87/\x9co\xac\x98w\n\xd2j\x02'
+    '\x17c\xad\xd6\xb5e\x02\x01\xa1\x03)jY\xec\xc4v\xfd\x92\xd9tm\xe9\xba\x0e\xc38Ue\n\xae{\x0e\xd7\x8d\x1629\xf1\xa5\x01F(,bj\rW\x9f'
+    '\xcb\xed\xd6\x1e\x9b\x9c\xdc*\x82=\xf1\xb9\x1f\xfe:5\xf6\xb6\x11\x18\x95\x9e\xe7\t\xa8\xb9\xeaO*\xc4\xfc]d\x91\x86\x9f\x9a\x9b\x07\xb6m\xfc\x16\x06i\xa9K\xc5'
+    "\x9fj68\x14\x9a\xf8\x17\x7fU\xae\x0cy\xb5sZ`\xea\x9b\xc26\xbb\xf5vOxv\x89\xf7\xb8'\x17pd\x9f\xf70\x11\xee\xba?\xa8\xaa\x98\xd5\xda1\xd0"
+    '\xe20\xa9\x1a\xd0\x7fM\x8a\x8bU\x17\xb9\xb9^\x17\x8a\x9d\xfa\x16\xff{\x12E\xf9W\x8a\r\xc3H>\xd3\xe7{-*x\x84d-\xdf\xa2\xc6\x11\xc3\x94\x89\xa3\x9d'
+    'C_\xea\xfawJ.RC^\x94\x07\xfeh)\x02\x12\x0b\x94"~y\xdb\xcbT\x9b\x1a\xf17\xac\xbc~\x15]J%\x0f\xff\xdbn\xeb\x92#\x0cI\n\xb7\r'
+    '\xb62h- \x160V\xd5\xb0\xeb\x13\x94;+\x90F\x8e-\x10\xa5a\xe8\x97\xe9\xcd\x98R\rU\xff`<n6#4aJ\xedl\xe1\xaf\xb9w\x15\x89_'
+    '\xdb:\x1a6\xa1[m<\x96\xfa^\xc7o\x99g3\x07\xdf4:\xe9[a-\x88\x86\xc3\t\x8f0\xce\x94\xbe\xdf\xb7\xa0M\xc8S\xb9\xd0e+#\x14}\x93\x00'
+    '<\tL(\xe4m\x84\xed<\x81 %$\x8cR\xae\xae\xc9".Z\xf5\x86\xa4\x82\x9a\xaf\xa2\xe9\xa8\xb6\xab\xec\x91\xee\xc2k \x91\xb9y\xf4a\xc7(dk\xb7'
+    'b\x81\x83\xde[+\\\xd7\x1a\xb21O\xacG\xee\x04\xd8Z\xb7\xd2\x13\xb4\xe1\x9f\x1b\xa8\x80\x82a\x0cul\x1d\x97\x8bO\x1d\x11\x7f\xad\xe6<f\xa6\xb2i\x1dY'
+    "\x80\xf4T}\xc3\xd9aj\xc0\xaf\xe8\x85Xx\xaf\xe6\xde\xa8\x0b\xf6O\xcb.\xe2\xe00\x91\x08\xf1\xdcp'G>\x91\xaa\x0e3E\xea\x83}\xa4\xbf\xaaC\x1eL"
+    '\x89.\x8c\xb5\xdb\t\x1d\xf4\xac\x06\xb2\x0c\xb9\xa1\x0eFo\x15\x06Xl\xd9\x17\r\xfb\xd9\x0e\xd6\xd6\x05"\xf2\xa9\xbe\xa1\x87\xa8\xc2\xe6\xf6D\x16\xeerh\x1d\xab\xb2'
+    '\xeb2\x01\xa7\x0c\xee[\xa1\xee\xa1p.$g\xea\xaa\xfem\xba!\xfe\xb3\xeeU\xf0\xab\xf9\xe1v\xab\xe3\x84\xf0[\x0b~{jM"sR\xe1\x08\xd6\xfcT$'
+    '\x86\x96A}\x98f\x17\xa9N\x08\xa1\xa7\xa0_?\xce\x97\xec8/g4\x1c\x18\xcd\xcd\x11\x12Z8\xf8\xa5\x83\xcc\xb1\x16\x07\x8e2d\xad4\x9eM\xcf\xba\xa8g'
+    "h\xdf\xd3?b'\xa0\xb5\xec-\x13\xd0\n\xae\xeb7\xdd\xf6\xd7\x1b\xd8.\xa9\x14\xa8V~\x93\x01\x85MA\xbf\xd6|\xe0\x0cg\xd7\x92<\x84\xb3\xac\x1d\x99>\x1b"
+    '\xd3M\xd5\xe0\xeb\x81\xb7\x03/\x03\xde\xf0\x1bP\xdd\xa1tx\xf6\xb4p\x05\x8f\xc9\xe4\xbcH\x04\x19\xef\x80/\x91?\xcd>\x01\xd62u\xafE\xf5\xc2\xf6\xa7\x81\xb6'
+    'Ou\xe6\x8b\x90C\xf7y\x1fb\xebN\xea\xf5\xa9\x14\xde\x13Y\x1e&sM\x8cO\xcaW\xa5&=\xf5\xdf\xbb^\xd7\x03\xc7\x914\x8a\x9d\x94\x1eM\x01\x16\xbc\xa2'
+    '\xcb\x12LTZ\xbb\xeb\xace\x9f\x8e\x96g\x89\xe6\x83\xf5\xf7\xac\xb3\xb8\xb1\xcc\xd1\xd0\x05x\xb7\xd5\x12GG\xeel.8XKW2: \xdb\xe1\x07l1W'
+    's\xc7\xd2\xb7\xdc\xcc\x03\xb0>\xa9\xae5AM\xbfW\xa0\xc3YI\xe7.\xc1\x82}\xc7\xd2\x88\xcd7\x02\x0f\xf3\xf4\x02\xf7\xdeZ\x03a\xa6\xc6\xba\x90\xb8\xa9\xe7\xda'
+    '^\x94@\\\xf46N\x88^66&\x8f\xfa\xcai\xba\x1d\x1e\xd7\x86h)\x03"\x9b\xd7\x99[\x805~f\xcc0\x0f\xd1\xa2t\xec$\xe2p\x9f\x84\xc2-m'
+    'S\x08\x13\xd9X\x05\xab\xbb\xc5\xb3R-\x07\t\x00\xb9x\xdes^\x94ZW\x11\xaa*\x8d\xc2\xbf]\xa8\xc1\xc4k\x0c8\x9c\x03T~\x0c\xa1\xcb\xca\x1c\x1a\x8f\xae'
+    '\x9f\x8dt}\xf6\xfcW~VNn\xa6F\xd3\xa3\xdf\xa7B\xee\x8am\xb7\xec\xfc\xfe:Q\xc1Ku\x7f\xefM\x87\xe5\xa3k\xac\xc1]\xa2!&\xbf\xd8\xbe\xe1*'
+    '\x18\\\x13D\xad\xc3qC\xa6n\x1eg\x00J\xff[\xe6\x1d\xd1]\xe9\xac%\x1c\xe8\xbd\xc8\x01+V\xb8j\xa1\xd4\x04\xd0\xf4\xda\x01\xe2\xf6\x86\x9e\xbd\xbcz\xf3\xe4'
+    '\xf0\xcd\xe1\x93\xf7/_=9|\xff\xf6\xe5\xc1\xeb\xb7?\xbf:z\x7f\xf4\xc7\xeb\xc36%XX\xf2\xaa\x18q\xeb\x94\xd3dV\x9e\xe7\xd5\xf3\xc5,`\x052p'
+    '\xa8o\x03zV\xa5\x93\x08\xac\xe6\x8d\xc1\x83p\x96\xba\x1b[_\xed\xbf\x8d\xae|\x97\x7f)\x16v~\xd9y\x89yOa\xcc\xf0\x97\xce`\x80U\xa0\xa4s\xf8\xfc'
+    '\xf0\xc5\xe1\xcb#$\x1dMb\xb7\x1b<y\xf5B\x8c\xfc"\x1d\x07\xf7\x83\xc3\xc7/\x0eH}\n\x9e\'\xd3\xb3yr\x96\x06\x8f\x04p\xc1\xbek\xae\x87%@l'
+    'KN\xe0\x80\x85\x08\xa3\xc9;8:z\xf3\xec\xd1\xafG\x87\xb2\xf8>\x15\x1f\x1d\xfe\xae*\xfe@%\x8f\x9f\x1c\x1c\x1d\xbc\x7f{\xf8\xf8\xe8\xd9\xab\x97\xf2\xd3\x8f\xf4'
+    'I\x00}v\xf4\xc7\xfb7\x87O\xc5\x9c\xbf|\xac@\xfd\xc5\xfaJe\x7f\xa5\xb2\xd7o^=>|\xfb\xf6\xd9\xcb\x9f\xde?{\xf9\xf6\xe8\xcd\xaf\x1c\xea\xbf\xc9\x0e'
+    '_\xbd`\xe8\xfe\x8d\n\x9f\xbcz\xfc++\xfdw\xa7\x14\x18L\x8do\xdb\xf9\xf6\xf4\xcd\xc1O|\xfc\x92\x00/_\x1d\x1d\xb0\xcew\xee\xaf\x91\x87\xb2`\x83\xc8\x11'
+    "\xa3x'=\xb6\xd2\xa0Kn\x03\xd6\xe1\xbf\xf9\n\xad\x92\xb3\x97x\xcb\x9aTB\xc4\x9c\xccYJ@S\x02\x12\xcf\xfc \x0fX\xb9\xc9Ss\xe8\x90\xfe\xaa\xe71"
+    'T9.\x87\xe7PM-\x00\xfcmN\xf1>\x8b)\x98RM\xb7\x1dn\xfa\xe1\x1d\x87\x0f\xd0\x0fC\xfe\xde\x0cB\xbcm\xde\xc3\xb4~Ns\xcc\xe1\xf70t\xde'
+    'Y:\x95\x9c\x07\x80\n\xe1K\x08\xbbx\xa0\xaaF\r\x89\x8b$\x1a\xb1EO\xbe\xbf\xe2J\xc2\xc1\xf7e\xddA\x1c\xd8\xbf\x19\x95\xe4:Y\xd2\x99-/\x1a\x10\xb6'
+    '\xfb\xa0\xe3,\xe6PB\xaf\xda:\xc28\xc1\x1e\x87h\t^\xef\x8d\xc6!Z\x9c\x1c\xc11?"Q\x02:\x885\xd9Z\x98\xa8\xd2\x17\xe8\xb9\xa3|\x90.\xb22'
+    '\x83\xe0\x85l\xf3\xb0\xb7\n9<\xb3\xa3\x0bE\xf6\x1a\x02\x0ef\xe5Lh"h\xe1\x99\x8aAY\xe1m\xce\xce\x16\x814\xcb\xe5\x9e\xb5U\x06\x8a\x88}\x85\xab\xc4'
+    "\xce\x00\x10g\xd3\xf3l\x94\xe2\xc1T\xc8\xee\xcbp\xe0@\xb0wu\x83\x13\xb4j\xc6\xa8qt|p\xcd\xc0\x01\x93\xbb\x01_\x02\xb8H'\xf9\xc5\x9d()\x7fu"
+    "h\x9f\xc6=\x84\x80Q\x16\xae\xd5\x88V{\x15\x9b*.\x94\x17\xd6\xcb\xf1\x80\x85'+\xb3\x8bn!\xae\xb4\xea\xa0\xbe\xee\xd5?F\xbe@\xa5\xea\x9bB!v\xd0"
+    'W\xc7\xdeX\x1d\xb8UEyt\xd1\xddi\x17g\xf0\rvj)X<;\xbaB\xcf5U0\xa8\xdc\xde\xc1\xe2\xde\xc2\xd4\x93ok\xbcl\xbe\xf1)\xe4\xbf\x9e'
+    '\xe2\xda\x95z}\x01\xdd?\xd9\xafL\x96\x90Tj\x9d\xf2F\\\x118\xbf\x14\x04~b\x0b\xda7\xca\xdbT\xee\x08\xe8\xd3K\xe1\xe7Pt\xda\xe3\xbd5\xf19\xc2'
+    '\x04\x9b\xba}L!\x8a\xe7\xc9\xf8i\x91\x9c\xf1\xb1:Sn\xed,\xde\x85\x86\xb3H+M\x82\xd0\x82{\t\x07\x10\xcf\xfa\x18@\x1b\x83\xca\xc5<\xd0\xf8\xc4\x85\x03'
+    "\x10\xbb\x87\xfeLqG\x9c\xcf\xfa\xdc[\x9b\x7f\x07\x0c\xfb\r\xec\xc6~\x1a\xae\x82zV9\xa6\x06\xb4\xec\xf3\x0c\x8a\xd8\x98N\xf2\xaa\xca'=Sxc\x05\x1b\x96"
+    '\x14\xa5\xcf\xed@+SC\xa08LA\xc9\x13m\xcf\xf22\xa3\xf0bS\x0f\x11\r7@D+\xfd\xb9\xafZi\x8f=\rfO\xff\xe9\xd3\xba\xd4P\x98:\xf1'
+    '^\x83\xc5\x17.\xe3\xa4\xd6\x03\xb3e~\xf1\xd2]*.\x99i\x94\x04dM\xc6\xb0\x8ct\xa2$\x9b\xf2|\xf7+\xaf\xf9\x9a\xc6\x18\x99\x99\x00\xbf\x1b\xca\r\x17\xa2'
+    "\xfb</ON\xab\xb4`\xafB\xf6=KLl\xffzO5\x1a0{\xc3\xa0\xbb7,\xc1'D\x1c\x9f\xa5\xe1\xfci\x91O\x0e\xc4\x16\x7f=\xc9\xe7\xa5\xa3\xe1"
+    '\xb5\x83\xc6\xf5\xcf(m!_\xe5\xb3\xc6\x111\\:V\xacJ\x1bO\x19N\t\xa7FF5\xd0\xf6\x87\xdd\xb5\xbb\x89\xbc\x9b\xb5\x85B\xe7\xb2Hf>\x91\x03\xe5'
+    "h\xd2\xad\x9fR\x16\xef?5\xee\x93\x90\xf4\x92\xbf\xa7K\\\x85\xb9v\xe2i|9'\xc5\x9a\x06\xad\xd0\x95\xa6,\xa7k\xcf\xd1\x00A\xfa\x1ba&TM\x006"
+    '\xb2:/:6\xa7\xc6\x8d@\xe3a\x93K\x16[9R\xbd[\x85\xac\xb8(>\xe5\xca\xda\xa1\x957\x8dNr\n\xfd\x05\x07\xca{?G\x9f\xc2l\x04\xef\t2'
+    '\xf4=\x1a\xc2\x15\x01\xd4\x86"\xfc\x11\xde4\xb80\xf3\x04\x9f2\xd7\x82\xf2a\xc60\xc1\x11?\n\xa9/\x14\xf8t\xd7\x13\xc4G\x8d\xc7$nP\xb7\xc6n\xc2W'
+    '\x16\xbc@E\xb7\xc4\xc7]\x81uP\xd5\x81\xa7(HB-\t|C\x8e\x04\x16\xd6]\xeaob\xc1B4\x81\xf1\xf5\xe3Z\xe67\xbd\xac\xdc<\x16\x8b\xe7\xc92'
+    "\x86Z\xc1 L\xbb\x1a5x\xc6'5\xb3S\xc1\x92\xe4\xfa\xba\x17\xec\xc4\xec\xc6\x89\xdbJ\x1b\xec\x94\x0bl\xa62\xdf\xdf0-\xab\xdc\xf2\xe8Xz\x90\xacS+"
+    '\n\xcd\xea\xe1\xa9\x12\x84X\x1c\nt\x12\xd1\xe7m:\xb0\xac\xa4oQ\x81\xcc\x8b\xa8\xb5\xd1\x8a\x9d \xd5O4\xfc\xdb\xad&\xe2]\\\xb4\xde\x99\x11\x9bx\x8d\xfa'
+    '\xeb@\xfd\xa06w\x9d\xa9 \xf9[q\xda\x95\xb1\xe9<\xe3aK\x7f2IG\x99\xd0Y\x9f\xacB\x18\x8a\x06\xbf\x04\xff\xb8\x16D\xfek\x8e\x85\xf1\xa1\xe9G\x16'
+    '\xe8\x90\xbd\x0c/\x06\xc0(\xdc\x16~2E\x8c\xd8H3\xb1s\xab\xba_\xcc~6<\xce\x83\x1c\xa5/\xed\x86\xc1\n\xad \xc5\xcb\xc07\x8b\n\xe7\x10\xec\x12&'
+    '\xe2qU%\xbd=\xb3\xa5\x88\xad2^\xd9\x01*\xb4\x04+\xe5Z\xf2\x06\xfcS\x81RU\x1d\x9d\x90U\x16\xc8\xadV\xafG]\xd1N\xc2*K\xa5?\xfc=['
+    '\x14)\xfb\x84\x0f9~Qa\xc5\xda^\xac\xb3\xd4.\xa8PL\xd6&\x94\xef\xfcFHk\xf9\xc7\x16\x81.sN\xfd\xee\xc1\xcb\xe0\x0b\xf6-\xdd\xaao\xca\x07A'
+    'O\xd2P\x11\r\xc3n+eE7\xf1\x8d\x9d\tQq\xd6\xfe\xd3\xe8\xa5\x88\xe0\x88\xd7[\x91B\xc1`\xd2?\x8a\xbddQ5e\x8cz\x06\xa6\xaf\xa3\xaao{'
+    '\xc4\xc6\x9f\xc8>z\xe6\xe8i/\x84\x9f\x91H\xc8i\x94+\xd0\xddrIc\xb2\x173c\xb2\xfa:\xbf\x05\x81\xdd\xc6\xab\xb3\x9c\xdbr1\xe7Mm\xa7\xdb?\x9f'
+    '\xd4\x80\xc0r2s9\xe8\xdf\xccnG^\xdepu\xd2\xf2V\x8b\xc9\xaa2\xfd4\xc4~\xae\xa7}j[\x84\xc5LN\xe5yvZ\xb9;\xac\x85\x17j\x07J'
+    '\x8d2s\xa7\x93$J\x05p\xf4A\x9ct\xa6\xff\x1al\x98L\x96\x88\xe9\xd0K\x1e\xddi$~g\xa7\xd7w=7e#\xc6\x1b\xe0go\xce\xaep,\x8aq'
+    'w<\xb5\xbc\x15\xe0~&e\xd7n\xd9\xc8Dl\x97\x8a\xe3(\x17g]\x04\x1d&\xca\x1c\xf1^\xf6\xf2\x1e\xdfG\t\xa0b\xe3\x9e\xc3\xd3\x01\x08S\xa4\xd4\xb3{'
+    '\x00\xcd\xb1Z;Gj:\xad\x89j\x16Y\xb3\x11?\xb7\xb0a\xf8V*\xbf\x05\\\xbc8\xfd\x8f0\xf8\xf9\xcf2\x8d\xe9\x13\x187\x8d!Y\xad\xc7w\xf4\xd0U'
+    '=F\xd5\x0e\xbbV\xb1\x83\xad\xdd\x1e\x8at\xf3\xa9\xbc;\xe5\xa5\xbc:\x14\x18\xf7\xe3^\x18{\x825F\xebz\x9f\xb7,\x16\x9eb\xd5\xad\xf2~5f\xcf\xa6\xba'
+    '\x1d;:j=\x9e\xb8j\x08~\xf1z\x9e\x1d\x8f{\x9b\x0b\x9af\xd5\x89\xdb\xbb\x98\xf7\xad\xbb\xe9O\xa2\x9fU&\x13\xf1\xe0\xf1\x03\xe8\xf57M\x02\x7f\xe6mA'
+    '7w\xc2h\xa6q)\xe4\x7f\x8f\xa2\xd2\xe4\xe0\xb3\xd7\xa0\x17\xf0\xf8\xa4\xda\xad\x04@\x81-\xb8n\xd4\n\\\xce\x80*hY\x80?\xdcx\x8a\x0c%\xac\xe7eX'
+    "\xfc\xc28\x8e\x17\x9b\x89\xb0\x036\xf2\xdc\xc9*\xed\x8d\xce=\xba'\xb3\x91\xd6\x0e\xf0\xf2~\xcf\xc3\x0e\x96\xf9\xcc@A\xe3F\rJ\xe9r\x94\xb3\x9c\x10\xd0\x82\xca"
+    'V\xce\x90\x85VG|\x00\x00\xb9\x15oy\xa4\x7f\x92\x89?aG\x84C\xcd9B\xb0\x80\xfe\x96\x8d\xaa\xf3/\x81y\t\x00x\xca\x19i\xe5Z~\xecc&\xc4'
+    "\xcec\xdd\xcc\xb3\t\x9d'\xa5\xfe\xee\xbd\xedS\x1f\x97\x9f\xe1\xf5\xc1\xbdf2\xd2=\xb0\rK\x03\xb6\xf6\x82\xc8ma\x9c\xf4\xf0I~T\x87\xb8gp4\xd7E"
+    ',\xb1z+z\xf7\xf9\xf8\xb8\x8c[b\xef257\x83V$J?\xdf\x8b[1Ecr!\xc7\xb1\xa5U\x8c\xbe\x11\x99\xb0\xa2"\n\x9f\x8d\xc8\xc0t-\xbb'
+    "l\x18\xc6\x02\xc9J\xf7\xd1\xaa\x88AH\xf8\xa0W\xb9\xe2\xffF\xa3\xac\xe3\xe8\xe1\x04e\xa6\x8e\x1a'q\xd3?\x8b\x9b8\x8dm\x18u\xcc3\x9e4\x0f\x96<C"
+    '\xbe\xd1`\xedN\xfbK&W\xbb\xf6\x86\xce\x0c\xe0\x0cr\xc6\x0b\x07\xac\x99\x19K\xb7+\xe7\xae\x04UL\xf0\xf2L\xd0p+\x9f\x8e\xaf1\x80N\x00F2\xba\xd6'
+    '\x11\xba\xa9\xcc\xa77\xfdM\xd7\xbc\xab\xfa9%\x07A\xeb|]7@N\xd1\xa1\x90k]p\xac\x90\xce\x85\xf0\xb1n\xa2\x93\xaa\x0f~c\x96\xe2\x1f\xf0im\xf7'
+    '\xf8\xad\x8a\x9e\xa6*\xfc\x9d\xa2\x0f7lCt\x9115V\x92@a\xae\x10Ye\x8b@_\xf1\xdb\x88r\xed\xaf\xa1\xde\x80\xf9l\xc8\xafN}\x8c\xa7\xac(\x8b'
+    '\xa6\xc1\xd4\xa23\x8bj\xc2\xde%\x15\xd9Y6M\xc6\x07\xa6\x9e\xaa\xc5T \xbd\x06!ia\x91*\xff\x87\xd7\xf2\xd6\xd0\t\x96\xbc\xac\xba\xc1#\xf8>\xf8[\x8c'
+    '\x9b\xfb\xdf<\xbd\x95\xf9\xbc\x18\xa6\x98\xd9\xa9\xe1\xbd4%\x1a\xb2\xe3\xed0fc\x00\xda\x98-Yul}Q\x1c\x01\x13\xed!C\x13\xe7\xad\xf3\xfa\\\xe1\xc6\xa3'
+    'Q\xe2\x01dN}\xbb\xec\x05\x8d\\\x01\xeb\xd1\n\xfdc@0\x0f\xbc\xda\xc3\x1a\\\x1a\x16~zn\xc4\x1e\x99\xa0q<x`\r\x99\xd3\xc4\xbe\x86m\xba\xbe\xf1'
+    '\\*\xb2\xe9\x83\xc5\xe8r\x979\t\xe90/n0ni*\x18\x16\xf9x|\x94\xdfU\xea\xccrn\x11\x11\xec\x07Q+\xb3\x8b\xf4\xd5\xe9)$3Pw\x99'
+    '\xe4\xcd\xac:\x83\xab\xf1\xfe6d(\x11\xff\xee\x0c\x96\xec\r\xf8D\xfbz\xec\xdd\x14\xd0on9\xa6X\rc\xb5_\xcb\xb4\xb6\xa7\xe3<\xc1\xd8}\xe1\xb0,\x9f'
+    '\xd2\x8f\x1e}\x17\xa7\xf2I:\x96it\xdc\xfbE\xcd\xf1P\xb3\x8f\xff\xcfS\xebzRb\x08\xf8\xdcm^\x9cH\x92\xf9\xb8\xfa{\x96^v\xd0\xdb`2\x13:'
+    '\xf2\x08G\xc8\x0e`\xc6\xeb\xdd\x9c+\x86\xf8PR\xfc\xbf\xec\xd7\x8a*x\xc3"\x98\xa8A\xe6b?\xc9\xaa\xeb0\xb6\x03\xa8\xef\x83\xef\x7f\x99\xe2\xa8\xd5\xc9\xa8\x17'
+    '\xect\xb6=\xc1\xd6\xd1Ma^\xe5\xa1y\xa2\xa9\x8f\xa0zz^Q?\xb7T\xadi\xc8\x06I+j\xde\xe2\x19/ouC\xfaV\xce\xbe5wm\xba\xc4\xd8'
+    'm\xbe\xa6\xa0\x8e\xccdZ\xcd;b\x1a\xf0\r\x0f\\\x19\xefR\x9c\x1a\xa8\xefx+S\xa11\x19\x98\x19\xd9\xf7\x1d\xb0$!e\xdf*\xe2\x8fl\xd4\x83\xc0?\xc7'
+    '\xa3\xfd\xe3\xce\xfe\xf1h#\xeeBD\xb6\xd88\xbcp6\xd0GZ}\xa5\x9e)\\\xb8\x001\x17\xee\x16\xb34"\xc4\xae\x91\xbd\xe1\xca8\xbd\xfb6t\xb9\xde\xc0'
+    '\x03\x86\x17\xeb\xc5\xc7\t\x12x\x93Dq\xe04\x07\xd82v\xd7ph\xbe\t\xa8=+V\x9dq\n\x90\xb2\x80\riw\xb1+L\xb9\x80\xcdW6\x95\xd8,$'
+    ')\x0e^\x0bz\xb1\xed\xd8\x07\xfa\x90B\xdb\x86z\x1c:\xdb\xc2vg[\xfc\xb7\x03\x9f\xb7\xf9\xa2\\(G\xcdi\xf6\xae\xf2\xde\xb8({\x17\xb3\xfc\xccC&\xd4'
+    '\xfc\xc1aOd\x85(\xea@i\xa6\x88\xbc\x10K\xd1^C\x9f.\xe9\xdc\xae=Cqk\xc1\xc3<\x04\xa3#C\x81\xfd\x91\xcc\x07\xca7P\xc0>\x10\x92k\x03'
+    "\x9b\x88]}\x14lP\x05\xc5\x0f\x99P\xd5\xcf ;\xc7v\x90\x1b'\x06L\x8f\xac1\x05\xd4\xdb\n\\\x99\x07\xe9\x14S\xa4W\xe7\xda\xe8!\xb4\xfb\xc9,/\xc4"
+    '\x18\xc6\xd7L\x04\x95\xae\xe4\xa9\xeb\x84\x7f\x07o\xf6lL\xbc Z\x90{;\x16\xd4+\xbf6\xee\x86PU9\x94\xd5+>\xd1S\x05\xf5\xe48\xb4\xe5\x8c\xf5\x01'
+    '\xb6\xe5\xf3l4J\xa7\xa1\xf9\xcc\xbc\x1a!a]>\x16\xbb\x14\xfb\xcc\\\xd5O\xc6\xf9\xf0cX\xef\x9f\xc8\xcd\xcf\x95\x99\xf8\xe77eC\xb1+\xcb\tqk\xff'
+    '\xac\xad8n\xb7\xce(\xbd\x88\xbb$k\x18|}\x1a\xac\x85\xa4\xf8\xcf\x1a\x97\xe1<{\x047\xfc\x92\xfcc\xaazNG_\xa6`\x1d\x1a\xb3\xae\xa3)\x84j\xbc'
+    '|\xcda\xa3=\x10\x85B\x19\x1b\xa2\xd8]\x17e\xf5\xbd\xec\xfd$\x191$\x9d\xb8\x80\xb6\xb8\xe2\x1cQ\xa4\xa4\xe6\xe9\xb7;bQ\xe0\x19A\x12\xad\xc4\x85A\x8b'
+    '1P\x95!\x80*\x14+@\x10\x99uH\xbe\xd5m\n\x17\x9eL\r8E\x96\xac4N\x93\x1a\xd2\xc9\\,\xb7|\x86\x8by\x9c\x9eV\xc1y"J\xa7y\x15'
+    "\x9c\xa4\x02\x8e\xdc3\xd8V'5\xd0\xdc>\xc7\xb8C\x04\x90:u}\xfd3\xf6\xc4\xbe\xdf\xacpR\x9d\x8b~\xbf\x8c\x0b\xf8I\xcd\x99\xafU&\xd4y\xa1\xdd<"
+    '\xab\x8bh\xb2\x90 \r\x1f\xc9W\xbb\xf1s!\x17\xbc\x8e\x98\xb4\x90\x8c\xb0\x98\x1e\x8f\xb3\xd9\xccNhv7"B\x84\\\xa1\x90\\\xc6\x9e\xee\x18)U\xb5\xc5\xeb'
+    "O\xd5\x92\xf1iPY^\xd0'f\xacW\xe26\xf6N\t\xeb\xd7\x96\xcb\x8bx\xecK\x89\xb3~K\xea\xd4P\xf5\x90\x8d\x9d\x1d@\x85\xa9Wi&\xb89\xd84"
+    '\r\xda=k6\x0f\\\x9f\xdf\x8e\xe8\xdd0\xfe\xfd\xdc,d\xb0#\xf0\xa3\xd6\x11(\xf5\xb6Bq$\x16\x01\x8b\x11\x1b(\x18\xb5\x8a\xcfaE\xf0\x8a\xf5\xc3<U'
+    '|\x8dGz\x15)\xc8>\xf9\xfb\x1f\x10\xbe\xa7\xdf\xf2dM\x08\xc8\xc1\x1c\xb1\xc3\xd3L/\xfe\xff\xe7\xe9\xe2\xb8\x07\xda\xa1[\x1c\xbfd\xe4\xb6G\xaf\x9e\xfc!\xd6'
+    '\xe1I\x91&\x1fw\xad\x14\x86\xb3\xdbm\xa2z#E\xb0z\xb7\xc3\xf3\x0b\xf1\xb5R\x89\x9c\xden\xbe\xfe\x84\xca\xae\xec\x98*w\x12|FO7\xe3uG\xc3\r'
+    '\xe7b\x17V[\t\xf8\x13\x81\x15*\x8aw\xa1\xf8(\x17\x1b\xad`\x90i*$\xf3t\x9e\x8c\xc7\xd7\xc1\xc9u@/\x0e\xaei3\xcf\xaa`\x9a\xa6\xa3R\xfc\xd1'
+    '1\x8fth\x96-O%\x87a\xb9\xd9\x056\x1f\x8a\xbe(\xdb\xf5wXL\x02\xdc~\xac\xaf\xdb\xec+\xaam\xf8u\xa1\x06Jz\\\xd0\xa8z:"Jj{'
+    '\xcf\xa9\xeb=\xc2a\x8b[T<[$r~\xbc\xeb\x07uDc\xdc\xa3\xc1.\x00\x05\xdf\x17\x01"\x85\xdb=n\x98[KO\x93\x9a\xdaMM\xce}c\xafk'
+    '\x81\xb5s\x81\x8b\xad\x1e\xd6\xa6XbW\xdejc\x8b\x90\xcd\xf5.\xd5\xe0\xe8\x8f\xe6\x8a\xe7jH\xf2\x0f^\xb3\xf9\xae\r\x17\xf8\xb7\\bZ\x86|\xdb%\xb6\xb2'
+    '\xca\xaeW\xd7\xdeb\x86#\x8e\x13l\x19y\x19\x97\xf1\xa3^\x91{KVC3D\xbdK\xc4^\xde\xfb\xca,u\xee2\xbf\xb3,\x16\xb2\xa1\x7f\xf5\xad\xaa\xb2\xbc'
+    'EK\xf87\xdd\xa0\x95\xb1}\xe9\x06M\x15W\xd8\xa0\xd9\xb5\xca\xd7\xdf\xe5\xc0\x8c\xcc\x14\x80\xc5\x8f\x16|*\x83\xc7#\xdb\xfa\\[\xab\xb0,\xb5Y\x1e3\xef\xf8'
+    '^V\xf0\x8b\x99\xc573\xec!\x04\xd8\xb5l\xd0L\x9fYI\rAs\x99<\xbe\xc7\xae\x8bY\r?]nwj\xa8{\x91\xa5\x97\x10/\xb5\xc6q\xa7yq'
+    '\xb8:\xd3\xb9\x96u\x88\\\xa2\x01|S\xa5\xd1\xd8\x05\xa4\x99\xf04\xbb\xf2<e\xe23^\x9b_\x9e\x08e\xb5I\xf0kz^\xe6oPd\x1dA\xb6\x98`x'
+    '\x0ek\xb8|\x05:,Pyy\xc2n\xa4\xfa\xd6RI\xa0\xe9\xbe\xb5T\x16\xdc,\x1b\xb2uC\xfa\x05R\x00\xc3\xa0\xa8\r\xd1{\xfd\x83w\xa7\xfe\xc0\xb4vt'
+    '\x14\x1d\xbd\x94\xf8\xa8\xe7\xa6\x9e$F\xac\xa7\xa4,\xb5\xa3X\xad\\y\xa5Y\xe5\x9a\xa7{2*\xb5)\xa4~\xb7e\xc2l\xe3\xf7\xdb\xbf?p\xf2V\n\xbe\x06'
+    '\'f\xb1q\x9e\x19\xfb\x98\x80"\xc7K\x97\x98\xf8\'\xea\x1f\x92\n\xccJ\x08\x17\x1aX\xd8\xb1\x97z\xe4\xf60\xcc\xf3b$\xf6\xab*\r\xca\xeb\xb2J\'`\x95'
+    '\x9b\xcbK\x9c%\xb6\xfft\\\xc1\xe5~_H\x05\xaeh\xcf\xe4rc\x87v\xd1\x1b\xd5\x16u\xb7\x07Bg\x1b\x8f\x81\xd1\xc1\x0eEf\xf5\x99\x99\xe3\xec*\x1di'
+    '\xa3\xbb6\xb1\xeb\nj\xfdIM\xc7Z\xe1\xd8\x87I\x1ft\xa7E\xfd\xc9$S\xb4y\xda\xd9\x91\xcc\xbbQE\x07j\xe1!\xb8\x9d\xf1H&~\x02\xe5\r\xa5\x90'
+    ':\x01E0\xf2R\xca\xb3\x98gZ\xf4oN\x9fx\xf7\xe2\xa4\x03\xeb\xd6\xaa\xc2\xa4\xa6\x85*dnj\xa8+\xd8\xd6E\x17,\xb6\x8aZkn U\t>n'
+    '\xd0\xb9\xf6\x04\xfa\x88\x99Ar\xd3\x04\xdb\xd5\xd8\xc5\x96R\xe6\xc0\x17(\xc5M\xaa\x1f\xc2\xdf1\xf0w\xea\xf0\xb1\xf9\x02\xf0\xb8\xb6c\xbfZ\xa7\xd7\x10\xbbbZ\x04'
+    '\x8b\xe4A\xdc\xa4VZ\xc0~^\xe94\xb2\xe6\t\xc8\xd4Q\x0f\x13\x94\x97\xbf\x00\xbdS\xcb\x86\xec4j\xab,\xe5\xf5w\xae\xbd\xc0\xed\x80\xde\x8b\xc0\xd2\x1b\xf2W'
+    '\x14\xf5\x8a\xbe\xe7\xa5\x14-v\xb1\xab\xb7\x8c)\x85\x0e\xdf=\xc9\xc8Sr\x9c\xd5\xc16\x8c\xef\x9f|1\xaed)$\xa3{\nh\x07\x182\\\xe6\x9dk\xaf\xe9'
+    '\x1d\x0c\xa0\xa8\xc8\xb5\xbb\rQ\x13\xb9\x07\x93;*%.\x98\x89\xc8\xfd\xd4\x81G\xf6\xe4\x07i\x1e\xb0\x17\xf9P\x88$\xfdZ\xc5\xf1F\x11\x02[H:\x88\xff\xed'
+    '\x14C\x86\xc42\rBX2aO\xfe\x80\xf8\x10\xeao\xb4\x8c\xeb_dF\x0f\xf9E\xb6\xbc\xbb\x87\xde\x9bD\x1c\xd3\x1e\xeb!\xce\r\x0e\xc4\xab\xba/\\\x06V'
+    'W\xe8\xccH7:\xe1\xb6\xe0\\t- \xa3\xb4y\xed\x1d\\\n\xa9\x9e\xc0]\r\xdc\xca\xf0\xfe\x1c\xa4\xd7\x9b\xe2w9H\xfa\x11\x80\xbb\xa3\x13\xb1{\xa5\xc5\xd6'
+    'I~\x15\x8c\xf4evP$\x98%\xb7:O\xa6XK\x06\xbb\x80j6(\xd3\x06T\t\xc0\xbb\x9c\x9fT\x90&EH\xf3\x11\xe6\n\x84+%\xea\xa5\x0cN\x8b'
+    '|\x82\x00\x91\xcf\x9c8\xd0\x02\x96:\xea>\xc3\x97o\xce\x84\xd0\xb4\xb7\x83\x9d\xed\xd8\x1a\x11]\x8aO\xf0"@\xf9\xa4\x86$$\xb4\x1fIg\x98\xcc\xb2*!/'
+    '\xa4\x81\x9dpOR\n@(i\xe2`f\xae\xb5w\x9d~\x95o\xd0\x9e\x9ez;\xbeu\xc0\xaf\xc4\xc5N\x1fJz\x0b\xf6\xdc"\xe6\x00F#JAa\xd8\xb6'
+    '\x1a\x9bo\x92k\xdbA\xa8g\x0c\n$\x90\x01\xc7\xeb\x86\xfd\x8d\x8f\x08VA\x08\x16O\x1d#\\RM(\xd1\xb22\x18\xe1\xefe\x08Ib\x1b$:\xd9\x14\xd3'
+    'g\x0b\xf2\xb7\x8d,\x80|P\xf5\xf8\r|N\x04\x07\x01\xb7\xb8L\xa2\x9b\xec\xfa\xe6\x18\x1b\xc9w\x1d\xc1>f\x9d\nz\xf4\xcf\x96\xe1<QKr\x19\x1b\x83\xbd'
+    '\t\x92.\x80\x9eg=6&\x1f\xc3\xd6/7\x89}]\xd1h=\r\xf3\x88N\xeb\xfbj\xf2S\xef\x1dv\x14w\x16\xfe\x03C\xe9d\xd5\xd8\x98\xd1\xcc\xa1\x08\x8a'
+    '\x1d\xf7\xab\xda\x10M\x0f\xbb|xB\xfb\xd1\xef`\x9a\xdf\xa9\xdd\xbb4V=e\xacv\xed\x16\xceI;t\xa3\x9e\xc8\\\xdf*\xc8\xaaM\xb3>}\x1d\xd4\xa9\xa9'
+    '\xbe0:.\xa0\xa4\xe7\x82\xdb\xa3\xd23\x0f\x03\xe3P\xd2l\xc5t.FT\xa3u\xcfN\xe3\x90=\xde\xf5\xf9\xbaQ\x07\x9f\xd8I\x80\xdd\xb3\xdc88*\x17\xc8'
+    ';B\xd6\xd8r\xb8\xdc\xcf\xd1fz:\x90\xfa\xd9\x9e)\x0b_\xec\x8e\x1a\xd5\xfcQ\xc5\xa9\xd0\x94q\xe78\xcb\xad\xed\xaby\xaa\xf2\xd8\x1d\x10QJ\xf9\xd7\xc55'
+    '(\xfc\xab\x06\xb6\xd0\xe5\xf4S\xfd\xd1\x9a\xcfLN)\xdfLr\x17\xe9\xf3\x98\x8cg\xe7\xc9q$\xc1\xedE\x9d\x8d\xf88\xee\xb2W\x05\x1a,zA*\xc6s\xfc'
+    'Z\xf1[W\xc8\xc6mG0hgW\x96\xf9\xcfqx\xb5G\xc0\x86H;\x86=Uz3eo\xa2|nq\xc6\x0b.\xaeY\xf5V\xd3\x05\x1c\xb1^\xd3\xed'
+    'n\xd6|\xbc}\xe3\xe5e\xe3\xd3\xe8\xe5f\xcb\xa9Q\x87p\xc7\xf7<\x070=\x11\xcd]\xecd\xcb\xa1R\xfdxHMe\xff\xddq<\xd8\x10\x93x\x96\xb5\xc3'
+    '\xd0\x17*\xb1\xc1\xec\xc0Y\xaf\x81#\r_GVmx\xcc\xc0\x0b\xe0\xcd\xcf\xf3\xe4:\x9fW,\x94a\xb4\xee\xb6\xb1\xcfs\xff\xc8\xc1\x8b\x05\xe7\xad\x98$\xe3\xd0'
+    '\xf3\xb4\x85W\xc4\xb3\x99\xc2\x9dh\xe1\x95\xac\x8a\xf1\xdbZ\x1cx\xbc\x04-\xbe\xf4\xf8\x86\xea\x14\x9d\xba\xa3\xfa\xf4p\xd7ZBTW\x96\x7f(q\xe2>\x14\xd58'
+    ':\xdcf{\x1c\xbbOH\x99o\xaaZ\xf7\xdbL\xeeu\x16\xa0\xaa\x13~\x87\xc84z\xf9crY\x02\xb6\x01\xab\x19\x95\x9b\xb8\xf9\x18mq\xfb\xc2#)=q'
+    '\xefY\xef|\xd9\xa94P\x87\xd1\x1e\x0fjf4L<\x90\xe2\xc9T\x9eRU\xc2\xd7\x9b6\xb7m[\x10\xdf\xcb\xb7\xd9\xde\xb7Fu\rh\xd9\xe3n\xdd\xa4\xad'
+    '\x13\x9aX\x08\x98\x0e\xc1<{\x8bN=\x8f\xcax\xc7\x18q\xd5\xd5\xa7l\xa1\x04\x8d\xf7\xe9U\x19M^/h\xb5\x1aQ<\xbc\xb8\x05r<$\xdcb\xb2\xf80'
+    '3\xad\xf7\xcd\xdf,B\\\xa7\x1cgBt\xdd\xff\xa1\x1dl\xdd\x8f\xadw\x16.\xe2\xa7\xe3\xe4\xec\xf63\xc9\x9c\xa7\x85H\xf2a\xcd1[\x84@\xe9\x7f(\xb1\x90'
+    '\x7f\xac\x17\x0c\xfeX\xa5V\x1f\xa8Z\xdf\xb2\x0fK\x1d7g*s\xaaXe\x91R\x88\x00\xbdT\xe5\xe2\xb42\x80\xad\x100\x82\xde\xec\xc7\x8e\xc5H\xc7\xd7L\x87'
+    "\x1f}\x8e\x99\xce\xfeg\xbd\x9a\xa56\x02\xaf\xf5u[}l\xab\xa3x\xd9\xf4~\xa5\x11\xa8\xfd\xacdO\xbf\xd5Q+'\x0cw\xefFC\xc1`@A\xaa\x0bg"
+    '\x98a>~;K\xa6\x818\xde\xe0\xbf\x17\x07\xe3\xecl\x1a@plH\x0b\x13$\x98\xe3\xeb\x97\xf4:\xa8\x92\x13z\x15\x18\x1a\xc9\x9cN\x87\xf8\x04t\x92\\Q'
+    '\xa6\r\x94\xa0\xaf\xe0y\xab\x98\x903\xb0\x0c\xd6N=\x80\x98{\xe6Y4\xe3,\xca\x82\xcd\x9e\x03\x19^aw\x15Pb\xe0K@H\x1d\xdf z\xa1\xb0\xb4\x8d'
+    '\xab\x17m=a\xe7Ez\xda\xd3"\xb2\xa3d\xab\xbe%*\x86\xbd\xa0\xf93\x9c+\x17\xb4N\x86t^q>c\xfc\x1ae\xd1\xcfJxx0\xea\xc9* \x7f'
+    '\xda./{\xbe\xc1$\xc1\x1bd_\xbb\xc9|\\e\xb3q\xea\xfb&\xda\xe4\xc9\xc8B\xe9\xf0\xc2|\x9c\x9b\xcf\xf5\x8fC!E?\xf6\x1aZ\x8eN\xc6\xea{\xfd'
+    '#D\xb9I).Y\xc3\xc79^\xdd5|\x04G\xd2\xc6\x96\x149\xbf\xa9\xe5\xbc\xf2"t\x9a\x0fU\xee\xd9\xfa\xc7\x93\xf1\xbch\xa4\xd0\xc7\xf4\x1a#5\xf5\x1a'
+    '>\xd2(\x1b>\xcegM}\x96\xf3\x93IV5\x10^\xf4\x97V\x8d-et(\xff\x94afr\xeb#\x8brz\x13\xaf$oI\xc6.\xb5\xab\xfc$\xb85'
+    "\x07}\xbb[\\\xf4v\x8e;\x7f;\xeel\xab\xc7\xe4\xc9Ev\x96\xc0cY1'\xc5\xc1\x99\tP\xfd%g\x98/z\x98\x85/\xad:\xff\x8e\xff\xb9\xcf\xb1\xec"
+    "\xa7Zw|\xa4\xb5\x8c\\\xbf\xa5'\xbfd\xd5\xbf\x98\n_\xf6<\xcds\xa61\x9e1^\x8f\xdeg/~\n\xf9\x91\xec\x92\xae\xef\xea\xdb'~\xd8\xdc\xdc\xb5\x0b"
+    '\xb6\xb6\xf4\xa6I\xc7\x14\x9e\xddU\xaa\xb8\xfcu.\x05\xfc?\x92\x91\x08"\x08`Q71\xf1\x88\xccS\xcfw+\xd0\x81\xb1\xa7Z\xa9\x96\x9b\x03o\xef\xca\x18\x12'
+    '\xd2\xcfE]~L\x92\xe2,\x13\xff\x8a\x138\xde"_\x9eg\x02XV\x06\xd9T]0\x0b\xc2\xe2\xe5\x07t\x0c_\xd4%7>GcW\xea\xe9\xa8\x13\x04\xe2'
+    '\xac\x12\xcc\xd2\xe2\x14\xce\xb4\xd3!$\x87LJ\xbc\x16)Rz/\xa2x\xec;\xd7\xd1\x1e\xae\x80\x08\xe0/\x10P\xa1K|\t\x1b\xc5u\xc7\xc3\x9a\xb5\xe6{\xff'
+    "3\x1d\xd2Wv#\xb2mP_\xecHt\xe7'\x02ws\xb3iN,\x07)\x9e\xac\x84\x8c\x9e\xabS1\xe9\xa2\x16\\\x91\x91S\x92\xc00\x98de\t\x17g"
+    ",'J9\x9f\x81\r\x1c/\x0b\x8f\x0e\x1e=?\xdcB\xd3\xaeP\x99\xa1\xe9\xdb\xc3\xe7\x87\x8f\x8f\xf4\xf5\xa1\x87g(S\x8bW\x94\xad\x94\xee\xe4\x7f^\x86\x99["
+    '\xa4\x98A\xcf\\\x9d\x1c\xa1\x1e~\xbd\x9e\xcd\x00\x03\x8b\xc9\x16\xd9tIz\t\x80\xc4^\x02\xde;0QDt\xaa\x01W\x7f\x97Qc\x9aC\xb90\xc3\xfa\xd7\xca'
+    '\xa5\xa0W\xd9\x12\\,il\xe1r\xb3V\x8bK\xb6J\xda\x9e\xaf\x94\xb7G/\xb4\x86la\x98I \xee\x08\x85\x930\xf2o\xec\xd2\x8a\xfa\xff\xc0R\xf8\xb4b'
+    '\xba\x83\x86\xbc7\r\xc6\xc5\xdb.\x9c\x9a\x17\x17\x8f\x00jV\x95t\xddZ\xb6\xa8VXI,m\x9c\x1bUI\xc6\x92q"\xc6\xday\x0bNeF\xa1\xaf\x9b\x85'
+    '\x84{\xb4-H\xefe\xc2\xd7\xa8\xb07z\xd1i\xbc\x1aV\x9f\x84Mty\x84\x19[\xf0[;\xb0\xa2\xe8\xdc\xf8\x03E\xac\x08\xfdVK[/\xa4?ii{'
+    '\xb7\\\xbeN!\x1d\xaeI\x05\xa9\xb3j\xf4\xa1|@\x19`1\xfb\xa9|31fE\xf4\x0e\xb9bib\xe9\xc3\xae\xe5\x1f\xb6\x84O\xbci%\xc1Lm\x90\x12'
+    '"\xc8\x97\xdf$v\xc2w\xae\xc0\xfd\xbb2C\xae\x96F\x02\x8e%m+r\x06\x84\xfe!=\xa4~\xc7U\xf5\xef\x0f0\xc1qi%\xd0\x94\xa8\x01\x14\x13\xc9L'
+    '\x9dBi\xe2\xdd\x1e\x004\xa3\x98\xd8\xd8\xa0\x06\xdb\xd4\x1c\xeayG%m\x8d\x94\x83\xc8\x1b\x1a\x95\x05P\xf3\x88:\xcf\x82p\x82<B\xb0\xbb\xd9\xaa\x90\x9b\xc1\xf1'
+    '\x0c\r\x1a\xb2L\x8f\xb5"\xf0\xda\xf2\xd2p01\xd1W\x1d\xbd\x15\\\xcbP"9\xd3\xa6X\xd4\x13{A\xd0\x0f\x1fT`\xe1z\x18\xb6\x03\xe7\xbf\xf0A\xb7\xe9'
+    '\x93\xf8og \xb3\xd1\x82K<\x07\xf4\xa0\x02\xb5\x9d7\x02@X\xe6\x05x_\x01zC&\x14\x17\xd0\x83\xaaP\r\x00P\xf1\xb0\t\xda\x0f\n\xd0\x93f@\x0f'
+    "\xaa\x11\xd4\x07@\xa3\x87M\xd0~\x94\x80Hs\xee\x01 \xb2\xe2\xd4)!\x005}B\x1ai7I7_\xad'\xb7(L\x8f\xb2|\x1e\xfd|x \x86\xa1\xcb"
+    ";Hf9\xbe\xa7\xaf^\x1d5}\xfb\xb9g\xf2\x98\xe3\xb7'*g\xae\xccO\xbaxA\xc6\x1e\x87\xd8\xb7\x19\x1e)\xd1\x02\xff\x89\x82\xa6.\x0cg\\\xbb\x8bI"
+    '<~KK\x8c\xc8\xf8E\x87\xfc\xc5_\xb5\xd8\x8bvH\x9c\xc57e\xfc\x8eL\xa8dxI\x06\xb9\x85\xb2\xd3\x8cB5\xf8}\x81\x1f]\x1f%g:u\xab\xd7'
+    '\x05\xb8\xed*\x91\xb1\xca\x18\xdd\x9cK\\\xb68\x04@\xa5L\xd9\'\x8f\xdc\x8b\x94\xd7\xf7\xefg\x00\xf2\xfd{"\xac\x0c\xb2\x01\xf2\xd8\xecA27q\xfd[g\xa6'
+    '\xd0\xa9[`\x9a\xfa\x01H\xb7\x19\x85\x8ag\xc2\xf6k"\x16X\xb5\x9c\x05\xb08\xdb\xfa[\x9a\x9ba\xad\x8f\x98O\xa7i\xff\x0bj\x1b\xc0\x1c,\xaf.\xbc\x02Q'
+    "3\xe8\x9dY\xddHciO\xf1\xc2L>,\x03\xb0~\x9dH\xed\xd2\xd1\xa3k\x8d\x1aO\xe2\xe8M\xdc\xc3\x00\x80\xe1B\xe6\x0f\xae)B\x9a\xfb'z\x80\xd6\xcd"
+    "\x9c\xe2\xbev-\xe1\x9fs\xa65^\x90m\xcbP\x08A`\x88\x0c\xaa\x07\xb0'\xc8E2\xc4\xcdC\x0f\x1e\xa9\xc7tq\x9bl\x13\xe5\x14\xefT\xb3\xb2A\xb2P"
+    "i\xb2~l\x9b\x9b\x04\xe6\xf2\x03\x8f\x1a\xe6I\xad\xf8T_'\x91\xdd\x15\xdcP,\xf8\xda\xed\xd9\x9d\x88>\x8fPF)\xc7\xa8K\xe6\xe4u\xe3<I\xf7M\xf1"
+    '\x1e\xe3D\x8c\x95\xaaP\xf2\xeb\xb4\xb8\x1fk\x7f\x88S\xc1\xef\xe7\x9e|\rM3"\x848NF\x10I\x9b\xe5(O\xcbiHo\x93Q\xf2\xc7\x0b\x1f\xb85\xaf'
+    '_n\xe8\xb5gT?s\xa8\xcb\xba\xdb50\x9b\x89\xc7\xf3U\xde\x0f\x12\x88\x8e\xa4\x0c\xcd\x83"!~\x82\xcd,\xe2;\x15\xdf\x91\xbcgwgK\xe2\xc6G\xde'
+    '\xb6faj\xf0\x16`\x185\x8e\xcfn\xebu\x89\xe5;N2\x1a\x19\xc9\xe5\xf8\xaf\x96\xe6\x08\xf1\xd4\xe25gF\xdb\xc1\xd1BI\x87\xfc\xe0,6{\xda\x9e\xe6'
+    '\xc5\xa4\r\xc6\xea\x893\xc3\xf5j&\x15:\xff\xb5\xb0\x99\x173s\xd7\xdbz\xfa\xea\xcd\x8bV\x8fs\x13\x896\x0b\x1f%\xdfZ\xcf^\xbe\xfe\xf5\x88\xaa\xd7k\xbb'
+    '\xe8\xe8V\xa4\xd3a\xb3[\xb4::\xfc\xfd\xe8\xe0\xcd\xe1A\xab\xb7B+~\x83\xa7\xc8\xee\xcb\x95s\x9f\x1b\xe2\x8d\xb8\x96\x13D\x044\xc2\xde<g\xa4\xb3\x9c\x06'
+    '\xbd.\x9b\xc6\xc1\x92\'J\n\x16\xcb\xe7\xc9\x1e\x00X"\xf5\xa0(\x92ku\x8c\x8dc\x85\x1d\xd9\x0f\x08>O\xde\xa9\xb4XY_\xa3\xa7\xbd\x18\x9d\n\xb2K3'
+    '\xe6\x06\xcbP\xed!\x8b\xc59fcql\xa1\xfeZF9Z\x89/u;M8\xcf\xb8\x86\xf9\xec\xdalw\xe2\xd4[\xc1[O\xcc\x12\x04\x174\xcfN\x0fN'
+    'J\xa67\xf02\x08\xa3\xc2\x7f\x8aY\xd1\xc1\x82\x1bB\x8az\xf6\xc9b\xb5\xbdr\xbdi\xb3\x8ck\xa9\x85\xb1\xba\x8b\x99\xbd\x9f\xb2q\xb2=\x95\x95\xae\xb6\xaf\xba\xc4'
+    '\x84\x07\xb3O^\xbd\xc0\x80\xef.\xab\xc0H?\xc2\x07f\xb4\x87s\x83vV\x12\x8b\xf4\xd5\xeb\xa3\x9f\xde\xbc\xfa\xf5\xb5X\xa4\xadW\xb3\xea\xa7"\x9f\xcfZmk'
+    "\xf1\xb6\xe0\xae\xf1@\xe8\xbcP\x8e\x15_'ErV$\xb3\xf3\x96^\xecO\x9f\x1d>\x7f\xf2\xf6\x10\x84D\xebi\x96\x8eGo\xd3\n\xea\xff\xfa\x1cJ~}\x9e"
+    '\x95\xf8\xf3\x15\xfe|\xa5~>\xc1\x9fO\xe8\xa7\x02\xf5\xe4\xd9\x1b,\xcd\n|\x0bx\r\x15\x7f\xde\x81\xa2\x9f\xd3\x04\x9e\xc9`\xc1}\xb7\xe0\x07\xab@\x01\xfb\xf9G'
+    '\xb7\xde_\xdc\x82\xbf:\x05\xff\x05\xbf\xffk\x9eWi\x8b\xc9\xcd\xb7P\xfa"\x1f!\xda\x87\xcf\xd9/\xa4\xd1\xc1tx\x9e\x17\xf0\xf3\xd9\x8b\x9f\xa0\xe0\xd9$9K'
+    '\xe1\xf7\xe3\x83\xd7G\xcf^\xbdl\xf5\xb4\\\x84#\xf3\xe3\x04\xdfhb\x05"\n\x15\xe7cY\xa4g\x85\x97\xe3\t\xd7\x81\xf46\x1d*Hx\xc8\xd5m\xf8\x078'
+    "\xecz?\xbcq\xa0\xbd\xc9/\xa9#\xd3u:\xa6\xbe\x9f\xd4\x8a\x9e\xbe9xq\x88\x93\xae\xd9\xa0\x10\xfc'\xa7\xfe\x19~FZ`q\x8bX\xd8H(dF\xa6"
+    '\x10#\xafB\x1c\x188\x81\x81?\xad]\x01\x1cj\xa5\xd4ao]I\xf5\xefc[\xe3eo\x95R\xe5:t)I\xbf\rX\xcb%\xfe\x0b\xfa`\xc1\xc9e\x19'
+    '\x97\xc9\xd6\x87UN\xabJD\xd8\xe7\xd5\xa0q\x80z\xc7|\xda\xac\xfa\xa2@\xaf\xed\x9c\xdec\xb4\x94c\xbe\x16F\x0blh\xdb\x0etJc\x86U\xf3\xa1W\xbd'
+    '\nP\xbb\x82\x18:\xbfz\xb46.{{Ps\xea\nW\x7f\x96z\x13\xff\x19\xdby\xb6\x07\x1c\xee\x110\xb2\xd8\x18\xb1R\x8d"Z\xb2\xafl/\xc1\x97\xf3i'
+    '\xa5\x9d \x1c\x9d\xd5\xb6%\xa8\x83A\x1c\xf8\xcbi\x83Q\xdf\x86BcI\x15\x9b\x81\xc2\xad\x99I=\x1d\x93[HS\xbcf\xbe\x03\xb17\xb0\x8cq\xe1\xcb#\x9f'
+    '^.\xd3u_F\xf4\x88%P\xcfV\x9ck\x98\x91=cO\x80\xe3\xad%\xa7\xc3\x0b\xe8\xee\xfb\xf8j-z$\xbd\x94\xf0\xc8\xab\x07\x067-\xf3\x84\x9c\x9a!'
+    "]]?D\xbb=,\xe8'\x03\x16\xa2[4\x97\xbe\x06\xfb\xb6\xcbE?\xa4\x98l\xaa\x05\x0b\xa7/\xff8T\x8fgxEo\x82n\x83\xf3\xc2\xe4PN\xe8z"
+    '\xb4_.\xc9\x07\xe5\xcb[\xb5\n\x18O\xaa*\x1e\x1f\xaal\x06\xe7w\xfb\x90\xf4\x94\x167\x08)\xf2\xbb\xbc\x9d\x12\x8aS\x13\xe5\x9c\xd0/v\xb0\x08\xf3\xad]\x07'
+    '\xfe\xc7\xca\xc0e\xc00\x1fl\x08\xdb\xa0\xad\x9e\xdd\x8d\xe0u^\xd0}LNNM*x\x01\xc5\t@\xbf\x93QZd\x17\xe9\x88\x1ei\xffg2\xfc\x18\xbc\r'
+    '\x9e\xe4\x93\xff\x9a\xa7\xc5\xb5@s\x03n\x11+h\xff\xc7\xaf\xcf\xb6\x84\xe8\n \xcb1\xa8u\xdb\x9d\x1f\xb7\xdb\xe0H+\x0f\xbe#\x8c\x91[`?UZL\xb0'
+    '\xd3d\x1a\xbcxv\xb4\x85\xaep\x00\x0c\x1e\x04L\xcb\xb4\x13\x04\xaf\xc7)<\x96/\xd348\xaf\xaaY\xaf\xdb\xbd\xbc\xbc\xec\\\xcf\xb3-\xf0\xa6\x1f\xe6\x93.\x8a'
+    '\xc5I^\x807\x06:Xax\xb7`\xa3\xbb\xb6\x06\xeb\xe9\xad\xc9w\x8c\xd2O\xee"\x18\xb1&\x9bfU\x86\xab\x8c\x1b\xb2Y\xf6PyP\x01>2\xc5`S'
+    '\xd3?\xec\x8cKX\x13\xf2\xc3d\xe3\xf4\x058\xa0\xa9\x9bM\x19\xd6\xfe<\x9f\x8fG\xbf\x96\xe9\xef\xaf\x13/\xff/1\xd9`\xb3\xd8I.\xb2\xc6s\xc48\xa8\x1a'
+    '\xdb\x9e4\x16\xfd\x10\x08\xe5\xeec\x8a\x9em\xbd\x8d\xad\xfct\x0b7Yp\x14\xea\xa1\xe9jA\x06I-l\x88+#\x93\x9c\xb1\xa5\x00\xb5\xf0e!\xfb@@['
+    "q\xec$\xd3\xe1\xb8\x0b\xecp`\xc10\x01;\xd6(\xa7\xa7\x07\x90\x9ei\xc4\xd2\xfb\xc1}X\x01u \xf0\x01x\xbe\xaa\xc6\xc0I-\xe9\x8d\xdd2'&\xe4T"
+    '\xb1\xe7\xa1\xb5\xdf\xd8.\xa3nt\xdc\xef\x1f_n\r6\xf6{\x9f{\xb2]\xdc\x95\x89\xd0\x1c\x02.\xc2\xdbI\xfa"c*Y\x93\xdf0\xc5\xd8\x89\xcd\x0c\x91\xdb'
+    '\x13g%\xac\xc1\xf8i\xd1\x94\xb7\x83\x19lO:]\xebLP0-\xc0\xd7\xf0\x9c\x17\xab\xa4\xbc\xe6\xdd\xc9\x90\x7f\x1e\xc2\xc3\x80"K\xda\x01$\xef\x98\x89C0'
+    's\xd4\xd0\xb5\xde\xe3\xf6\xda\xe7\xee\x18\x88\xcd\x84P\xe5\x00uU\xdb\x01\xc52\xb2:m\xfb-\xa7@\xd3\xb2\xc8s8T\xb7\x9c\xe0\x03\xf2\xbf\x16z\x00\x88\xfaP'
+    '\xadi\xd88\\\x9cM\xc1W\xbb\xad\x81\x1d{\x0eo\x89\xc6h\xa0\xc7?#\xc8\xbc\xa5R\xe51\xf7\x1bzI\xa8\x86\xa4\xf5\xb3\x0c\xb4\xb3\x99eP\x05\x17\x83Y'
+    '\xd9\xcf\x06\xf6\xcbnx\xc2\x98\xcag\xb8\xb3\xd8~\xe3\xc3G\xdf\x99\xcd\x85jS?\xc6\x0f\x05D\xd8\xc0\xe1\xdfh\xa22p\xfc/\x93B\xeeH,@PE\xa9'
+    '\xa6V\x0eD]\xeb\xa9\x16\x8eC\xbf"\x9d`\xbe\xa00\xb4\xaa8q~\xdd7Fk~\x94[\x92\x9d\xcf;\xf3i\xf6\xdf\xf3\x14|t\x8f\xa77-e?\x12'
+    '\xf8DV\xab\x0fy6\x8d\xc2\xe3i\xa8\x10tY\xc8\xe1\xf7\x81Z\x02\x12@m)\xf2\xc5\xd3\xa0\xd8\xddf\x19i\x02\\\xf1\xcfW\xe2\xfb9-\x96[\xad\x14l'
+    "\xe7_'\xab\xac\x90\xb0\xd3\xedn\xa8x\x1a\xdf\x8cwk\x8c\n||\x07f\xbd\x92\xccze1k\x10x\xb8\xf5\xeaO\xe3V5\x03\x1e&\x0co\xc9\x81\x08\xca"
+    '\xf0\x1fK\'\xce\xb5J)\xbch\x0b\x11\x7fKA\xc5u\xb5]{\xa7@\xb8z\xdb\xd7\n\xdd{+\xe0\x14\xed"\xa6~\x1b\xa1\xda\xda8\x1fc\xa4?\xab\x98\xff'
+    '\xa2\xb8\xf9\xd9!\xb9\x14\x08\xd5\x01\x0f?\xfd\xc1]7\xa1\xc4*\x17\xfa\x189!\x94<\xaa\xad\xb5\xe1\xd4\xb8\xfa_)\x92\x85\xb61/SKGfc\xd0&\xf6'
+    "\xf9t,\xe8\x80\xd5JY\xcd\x06\x92\x89\x8fy\x8e\x12j\x9c^u\x9c\xb8A\t\xae/'\xac\r\x9b\x00Z_\xfd\xacm\xdfFL\xe2\x81\x13\xd8f\x85ur\xe3"
+    '\x8b\x02\x84a\xa0\xc6\xf3a\x95L\xab\xf15hd\x89f;\x88\xe1\x03\xc3J\x8a\xe1\xb9\xdb\x08\x13\x84\xe4\xf9G\xba\xa8$\x96\x02\xba\x03!\x12\xb8S\xf0\x85\xdd\xc1'
+    '\x81\xf1\xb5\xa2}xc\xadG\xd6#\x90\xf0\xc0A\xde\xc5\x8dw\xe5\x88\x00\xb9%\xa8<\xdb\xc4\xfe\xa5cg\xcf\xe8\r\x04\xd2w\x97\xfeQ\\M4\x076\t\xb2'
+    '\xcd\xcdz\x92j\xf8\x8c\x94\x95\x90u\xd9\x8em\x83\xf70\x8c\x9b1]B\xb0\x98N\x8d\x814Oo\xfc{K\x1d\xd5\x89\xd6T\xaeWzf\xbd\xe4\x94\xcc\x8f\x0c'
+    '\xaai6\x85\xdb\xff\x05\xe7\xeb\xd6w\x0ft\x98;HM\xeb@\xeaH\x00h4l=l\xc9\x13g\\s\xa5Q@\xe8.\x90\x84,F\x99C4P\x9a)\xbf'
+    '5\x93>\x14\xae\xf0Zb\xf7\x93J z\x1e\xea\xc7\x9e-]\x9e\x8c>\x08\xde\x9f\xca\xf7y\xad\xee\xa98\xfe\xe6\x97\x10\xa1\xaa$\xff\xb8^oC\xcc\x94\xac\r'
+    '{O!\x1d\xe7zA\xe8\xad-\x03\x12H\xf3c\xcf\x89\x0e4\xb1#\x99L j"\xbcG\xd90\x01{B7\x9eH\xab?\xce\x87\xc9x\x0b\xb8!\x8a\xf7B'
+    '\xa0%4\xb4\x9f\xd2\xeaG\xc1j\x8ca \xb8\xb7\xb1%\xbbI\x03\xf2\x87\x03\x19\x0b@\xbe4g\x11\x00\x01V\x1f\x0c}\x89\x980\xf0\xcb\x1d&\x15<\xc6j\x07'
+    '\xff\x81\xb5(\xb50\xfc\xffw\x9fvn\xc4\x9f\x8aZ\x99!8\xc2\xf8\x8fl\xb4\x17B\x9dP\xd5\x80\xd3\xdbkx\x1f9\xb5R\xed2"\x11\x81<\xc3uc\xae'
+    'p\xed@t\x05\xdd\x0cZ\x96\x8a`\x8d/\xb1c>\xdc\xa6\xc7I\xff\x07\xaa\xf0\x17\xf4@\x9b\xf4\xff:X\x84\x8c\xad\x03R\xd2#\xf1\xb3\xecO\xfa\xf7\x07\x83f'
+    '\x0cge:\x1f\xe5~\x1c1UBM\xbf\xecP\x13\x80\xbc3\xb0\x85\xcb\xb9\x87\xbb\xfc^2\xe7\xe6!\xcd\xb9Fi\xa5\x91Y\xbd7\x8fK\x13\xc0<\xfb\x0f\xf7'
+    ' l\x87\x9c5`\x91\x1f\x0c\x8b\x88\xaf\xeb\xf0Y~]\xaf\x7f~G\x9f\xcb*)\xaar\x0b\x02\xdaFXUp$V\x8dY\xdd{\xb2\xee\xfc\xa4\xa4\xe8\x12\xb2'
+    'fD?\xb7\xe8\xfa\x9dJ!*\xbe],\xe1\x89\xf5\xb2\x13\xc7uD6\x08\xb8^*\x8dX\xfc\xd3\xa9h\xad)\xd9H/\xa9\x1f\xf8\x92\x12\x8d?74\xdeb'
+    '\x8d\xb7\xb0\xf1\x164\xde\x82\xc6u\xbe\xe2\xd4G\xe7\xe5-\x94\x90\x10Z\xa5?\xcd!\x80b:LG\xb6d\x8b\x07:\xd8J(\x16\xbei"\xdb\xf8\xa4!o\x03'
+    '\xd7\xc6n\x1b_? \xb7\x96\xc1B\xbbQ\xd8\xd3\xb2\x05\xa3\xb1F\x1b1\xec\xd3\xa8gDTR\xe1#\x0f*\xce\xe5\xad02/}\x00\x12\x1fW\xc7\x858O'
+    "\xa2\xea\x83)\xb08\xb5\xa5\xfdG\xf6$\x98P\x16\xb0**\x08@(E\xe5\x7f\xa8\x02V\x87\x12\x14\x1a00t]\x8f\xf7'>\x84\xfe5o\x94i\x908m"
+    'TO\x17\x1c?\x17\x1dA/X\x90J\xf2o\x14j\x944]\xf6\x99\xba{\xcb\x13c]\xbd\xf6\xa8\xd8\xae\xdeZS\xa9\xebgGD\xd384.:1.9'
+    '%\xee:P\xf5\xc0\xa51"\x82\r\xf2\xa2c\xc4\xc3\x8e \x96\xf2\xc9\xd9\x82g\xe7b\xab\x8c[u8\xcb\x15i\xcf\xa1\xd3\roY\xd7X\x99\n\x00\x1c\x03\xd8'
+    '\x19\x94\xf1\x10\xdaBfo\x11b\x83\xd6\xae\x1b\xf1(\x9cV\xe7f\xcd5\xa9"\xba\x1f\xbfH\xef\x08 \x828\xb4\xa2:]\xafl@\xa1\x18\xb4\x84\x92\x1a\xfb\x91'
+    '\xb0$\xc6\x97#\xe1\x15\x10K\x91\x90vh\xa2\xc5\x9d\x91Po\x89\xa3\xe5\x036\x1d\xde}\xc8\x00\x08\xb5\xb4\x1d\x084\xaa\xfbn\xec\x9c\xe49\x1b\xaa\xbfk\x10#'
+    '\x82o[;\xad\xdd\xc5h\xf4-\xd2\r"_\x9f\xce`\xbfR\x9f\x16T\x7f\xc7\xb8\xa9,\xefX\xc5\xe5\xf7\xf7\xa6\x91\x99\xf5\x1d\xea\xa1X\xd9\x84\xf2\xe5\xb8L\xad'
+    ';\x1b\xf5\xac\x0e\xe6\xc8Ad\x02\xd1j\xf3\x02\x9c\x00\x8c8/\xc4\x92\x12\x1byj[\x1bt5\xb11\xa5\x17\x90\xa5\x90\xb5\x0c\xefO7\xb7\xc3\xe6\x06\xf9h$'
+    '\xea;\rv\x9c\x06\x93\t\xe5\xc1\x80**\xe0\xe3\xbb\xe8x\xb4\x19\xdf\xeb\xc61\xc5i>\x93!\x05\xea\x11\xa6\xc2>\xdc\xee\xaa\xb1\x82\x14\x12\xb3\x0b\xa7\x8c\t\xc5'
+    '\x83\x0f\x07+u\xb7\x85Y\xb4\xf7\xa7Q\xd4\xdf\xdc\x1a\xc4\xd8}\xbc\x0f\xfd\x7f"\xc3\xc1\xe6\x89c\x04\x99\xa8\xa3SkKH?\xf9+\xd8\xda\xd9u\x82\xa6!\x85'
+    "\xf1\xeb~\xf0r>9I\x0bj\x8aY\xd6\xdd\xca'T\xf9\xbe]\xf9>V\xde\xe6\x95\xf5l\x013\xf7\xa3\xe8\xbbO\x8a\x047b\x8d~\xf7\xe9Dh\x8f\x93|"
+    "$\xfeJn@\xf7\x88IL[g\xb4\x96\xbf\x19\xbc\xb5\xc3f\x0f\xa1\xdd\xa0\xe5\x8b\xe5\xc679\x8d\n\xdb\xe9\xec\xddS\xf5\xd1\x0b\x0cO&\xbd i\x07'="
+    '1d\x1e\x86\xd5\x13\x19\x8cl\xe5\xf2\xbe\xa7g\xfbf\xf6\x94\xb8\x83\x17\x7f\xea\x05A4m\x07\xe2\xac\xde\x02]TH\xa8a\xbc+o\x8f\xc8D\x11\xfa\x0e\x98\x12'
+    '\x82.\xf4\xc0\xa8A\xb0\x8f\x97\x12B6\xf2v\xafo\xb0,\x08\xf6\xf1SB\xe0\x85\x16,\x1f\x0e\x8b\x8e\x91xJ\x8c\xf81q\xe1i\x8au\xef\x0c\xa1\x05z<'
+    '\xfd{\xdfE\xe3n\xe7G2=\x08\x84\x94@\x86\x7fL\x90\xd0V\xf7L\xe8/\xc7\xc7\xadp\x15\x8c\xa9#\xc0\x99!\xfcW\xf8\xb7\xa8\xcd\\3\xba\xb6\xe5&\x84'
+    "6-S\xd6\xd2lc\xd9q\xa8\x1a\x96\xe9\x1a\xb6E\x87j\xa82]\xc91\xe4`%^&*\x9a\x1c\x9eR\xb7V\xbc\x8fYD&'\xe0\xcc*N\xb1\xc1d"
+    '^B\xa2\xe3`\x9c\x95\xe0\xbd\x80\xdb\x87\xaa\x17\xc1\xaa7\xa3\x90YS*L&\x07\xfb\t\x03\x14{\xf0\xea\xbe;.7\xfe)\xfe\xd7\xf5\r\x1e\xbf>4_\xed'
+    '\x81\xe3\xd7\xe3M\xf3\xd9&0|\xee\xb6Y\x9e\x11\xda\x16Ky\xf0\xf2,r\x04\x18\x1do|\xee\x1f_\x1eo\r6\x85\x90>\xf9|O\x08i\xdfj\xec\xbe\xfb'
+    '.\xc2z\xc7\x1b\xbaf\xd7\xb7\xf0\x05\xd4NSM\xc9\xc1k\xddw\xbd(B\xba~\x06\xa2}\x16\xfb\xecg\xa5\x1d|\x86m)\x8eH\xb1\xfc\xac\xf6\xe7\xf83\x9e'
+    '\x0f?\xcb\xc3\xda\xe7(\x9d~\x16\xa7\xad\x18\x8f[\x9f\x85*-:\x8a\xa2\xce\xc6~|,\xb6\x19\xec\xf4s\xb4\xbfw\\~\xee\xf76\xff\xf9P\x1c@\xba>\t'
+    '!\x90\xed\x03\xb2\x02\xd1\xe3A\x97K\x00=nQ!\xda\xef\x91\xff@/\xde\xc7?DmA\xb9\xfd^\xd4_\x7fwo\xe3\x9f\x9f\x07\xfb{X\x12\xf5\xc3\x96\xd8'
+    '\xeb\xfa\xef\x8e\x7f\x1c\x00*?~\x16\x7f\x8b"Q0\x80\x02\x81\x9a\xe8F\xf3a\x97\\Y\xb4\x06C\x96_\xe00\x15\x1c\x08K\xe0\xc5\xb0\xb6 \xd7\xe4u\xfd\xf1'
+    '\x8b2*\x07N\xe4`Y^\xb7\x16\xee-\x8d\x83\xc2\xa3/\xb2\xe9^\xbdo\xf6r\xe7\xb1\xde\x12\xdcV\xb0\x89\xdb}e\xa3\xdbt\xa2\x9fu\x8f0|\x96\x81j'
+    '\x03m\xb0Q\xdef\x0c\x9e\x87>\x8dcH\x1a\x82\xd1\xd6\xbaQO]\xff.=\xfc\x0fu8\x18\x16\xea\x7fA\x87\xf5\xb3\x073M\xca\xca\xf7\x07\x83H\xf7a`'
+    '\xfc0\xe0\xbe\x9c\x88\xb8r\x9c`B\xf2\xd7\xa3g\xcf\x9f\x1d\xfd\x11<\xfd\xf5\xe5c\xf0\x0b\x7f\xab>\xc0\xc1UH\xc1K\xb8\xe0\x1a\x8f\xc9E\xbbT\xd1 \x84&'
+    "\xc3\x86\x0f:\x8a\x19\xb2{\x1d\x03\xa8\xed\xaa\xf7\xbe'\xfa\nFk3\t\x1d\xeb\xf5sz\x1et\xd6\xa6\xba\xc0j\x92\x14\x1fK\xf04\xc3\x9b(\xf0:C\xc7 "
+    '\xec\x14\x0f\x9dB$\xd3\xa3\x1bQ\x91\xa1\x88\xb5V\xc4\x11\xeb\xd6\xf1\xc4\xf7\xc6\xef)\xa1\xd0H?\x93\xad\x85\xef-m\x9c\xe7\xd3o\x8fI-_}3:\x92\x84'
+    '\x01x\xaf\xca\xb0g\xd8\x17f\x18\xcb\xaa\xd2\xc4\xfd\x873\n\x1c\x96\x02xq.\x1fD\x89\xd6\xad\xfc\x14^\xbd\xb6\x02\x88x\x19dS\xd2jKH\xae\x8a\te'
+    '.\xd3\x10\x9d\xf8F\xe9\x15\x04r\x91@\x94\xc8WPx\xf6\x19m\xfb \xe9\x00-\x19\xb9x0\x9a"\x05\x7fD\xf1\x07\xe1\xe0&"{\xb9`\x82@\x97\x92\xcd'
+    '\xf99OS\x9f\xb8h\x8fC2a0\xda89X\x85\x99\x99\xda\xc1\x07\x0c].>\xc2!@\xfc\xbb\xb5\xd5\x18\x0eZ\xcf\xa4s@\xc2\xa9\xd4O\x891\\ '
+    '\xd8\xee\xd6i\x84\xa0\x92Z\x93-\x8eZ\xba\x05\x85\x99\xdd\x0b>lnz\x8e\x06\xee\x8d\xb0\xcbg\x88{{\xf1\xb8\x97\xf1\xe1\xb7\x18\xc2\x8d\xcb\xae\x14\xe7\xbc\x0c\xf2'
+    'y\x15\x8c\xe6\xb3\xb1\xe47\xd8Q\xe9\xe6\xb1\xc4\xd7\xb4\xc6?\x90\\\x94\x9aW\x9c\xc2\x99?\xe3\xdb\x8e=k\x86G\xa1!\x7f\t\xf02kX\xb7c\x87C\x80-'
+    '\x1e\x04c\x87bx\xcd\x13M\x19IcC\x18\x8bw\xa6M\x9cL\xeb\x1bq"\xc1i{\xd0G\xd3\xd8sRt7\x11\xb5\x11tH<E\x12`\\\x13\x16\x8f'
+    "_\xbdx\xf4\xec\xe5\xc1\xd1\xab7\xce\x0e\xc1\x15\xd5&J\xd7.\xc0T\xb7MDth\xbd\x82(\x14\xa7Q\xbaY\x91M\xa9U\xc7r\xaa9\x92'^\xb8\xbeu"
+    'w\x18\xd9\xcc\xd1\x86H\x83\xff\xf3\x87\xe5[\xaf\x1f\x08\x06\xe2\xb4+E6\xb5c+\xb5\xffA@\xf8P_\x9bX\xa3\xbe8\xa9X=8\x82\x04\x1b\xebx\xb3\xcd'
+    "\xb8j\xa8\xc3\xe4x\xf8\xc8K5s\xb2Yu\xaf\xbb\x0b]T\xa40\xe5\xd8\x01\x7f\xcb\xa9\x96'2[\x930\x01\xbb\x9c\x01b\xd1m\xc6g\x9f\xfa\xfeG\xf1\xfc"
+    "a=bPIdX\x89\xdf\xeb4t\xc6g\x86'/\x9b\x18\x82V\x98\xa2\xb5\xff\xb5h_\xb0\x84ls:\x16\x89\xd5L\xec\xd7\x99\x89\xcdu\x07\xcc\x14\x84Z"
+    '\xa8\xb6\xaf\x81\x1e\xe4\x9b\x7f\xf5\xcb\xe1KG.\xd6\xcfpSR!\xc8\x8f\x99\x05\xa2\xd36\x05\x8bw\xe6G\xab<\xa8\xf6mM\x0b\xb9Noz\xaeK\xa8\x0f\x0f'
+    '\xb5\xf3\x8a\x93\xfb8\x99\xa6\xc8\xb2\x94\x02\xb7\xb8\xe6\x86\x12f`q\xe5\x8e\xfe\x82\xc6_f"r/\r\xef\xa2\xff\xde^\xf4\xebW\xf0\xde\x9cq\xd6\xa2\xb0\xf4\''
+    '\xa5\x1e\x81\xa8\xe9\x9bA\r$-]m\x8e\x85anm\xb4\xfc:\x05\xbf7\xbc\xdb\xe05\xf7z\x19\x04\x8f\xc9\x8a\x8b\\\x99gKF\xff\xf0\xe5\xd0\xd5G\xc1\xb6'
+    '\x8bi\xba\xe0to\xb1~6j\xe6\xfa*)D\x1f/UL\xa8l\x14\xaf\xc0\xcf\xeb\xa6\x95&u\xdf\xf6\xa8\xa1\xf9\x13;\x1e\xf9\xe8\x9ag\xa8\xa6\x81\x012\xb8'
+    '\xf3b\xa9\xb3|Hw\xa8_\x8f\xdb\x89\xbd\x14\xaa,\x82\x1c\xf46\xb5H\xe0\x19\x91\x93u\xc8\xc1\xd5,\xcf\xaf\x8c\xb0\xda\x97L\x07\xafN\xd9(dp\xbc/\xc0'
+    '\\\xe9\x1c_\x19\xef\xba\x9e\xec\xdf\x8c"\xce\x81j\x1ej\xcfYV\x1b\x9d\x125\xe7\x0b\xe5\xcc\xd7\x92\x1d\x80\xado\xf9xq\xac\xad-G]bd\x80\xb5\xb6t'
+    '\xd6\xd1i\x1d<BxwAOw\xb0\xc8*i\x89\x14]\xc1/Y\xf4:\xa6\x08\xbe\xa6\xc2\x8ab\xbd\xf1\xd4trm\x0c\x9e~\x84\x1c\xa9\xc8\x1a,\x1d\x8b\x8d'
+    "\xff\xba\x14D\n\xe5:2\x86\xccQ\x1f@\r,\x1d\x01.3\xd0\xdd'\x84\x8c4\xa6\x17\xb8\xf5\r\xc2\xd5\x95R\xfa\x7f=\x8a\xe5\x8a\xbaU]\x9fXt\xfb\x9a"
+    ".\xa6\xeb\xda\xc7r\xf7\xed\xba\xa7\x01\xd44\xe3\xfa\xfc9\x88h\xacv%\x1c\xafqF'\xba\xc4q\xd3\xa9\xda\xda*W:\xfe\xf8-\xd0\xd6\x1c\xf3\xa4>\xfe\xe9"
+    'm\xdenA\xa1hR\xfev\xbf\xc0\x98\xc8\xe5\xb4e\x05\xa7YG\x94\x17\xa9\x11\xcbh\xb2\x88\x162x][\xbb\x9b~-\xe2\xc8\xc5\xc1\xd7\x8b\xb1\x9b\xab\xbf\x06'
+    '\xed/%\xa2{.]j\xe8g4\xad3\xf4\xdfu\x92\x108m4\xb1\xbe\x1c\x1a\xb7\xf8\xab0@_\xc6\xc0\xb5\xabh9]\xf4\xe2BN\x94\x94U\xdf@\xd8'
+    '\xde}\xc2]1\xad\x9c\x93\xe8]\x86\x1c\x05\xc3\xbfv-\xe28\xdb:\xae\xb6.=8\xa4\xafj\xda\xb8\x95\xe6!5\xa7:\x8f|\x81\x1c\xab\xfb\x0c\xff\x8b\xc7\xde'
+    'd\xdc\xf9\x16\xe3\xb6\xfc\x9eW\x1a\xf7\x9f`\xea\xa1g\x01\x0by\x00\xe3\x86\x9c7\x93j%\x02-"L\xcd75\xa8\x91Gz\x8a\xb9\x04jX\x98\xe80\xe9m'
+    "Y\xef\xd8\xf6`\xffV\x1d\xb3P>v\xf7\x96'\xea7\xec^\xbeao\xc0\xa2\xc9G\xf5[\x10\xc1\x8bD\xcdW\xf5k\x92\xa2\xb5\xd3ZN\x86\x9a\xe7\xea7\xc2"
+    '\xa0\x91\x045\x0f\xd6\x95\x11\xa89\xb5*wV\x1b\xc1\xba\xf3\xaa\xc7\xcd\xd5\xdbS\xe3*RvJ\x92K\xf4\x94\x15\x9c4\x83q~\x96\r\xf1\xab\xd8\\\x9f\xc1\x1d'
+    "nZ:\xf7\xf9\xf0\x8c\xb2J\xc6\xf6\xfe\x9e\xd8we'\xc1\xc3`\x1b\x8eq'\xfc\xf4f\xd2\t\xbc\x01\xcf|\x02#\xf4nx\x16\x10\x81\xe0c\x91Q'y;"
+    '\xc8\xdc}`\x1bz\x89\xb2`\x0b\xbc\n\xfew\x90\xe0u\xa2\xfc\xd9\x15?\xd1\xe52\x80\xc6$\xc9\xb2\xbaI\x0b>j\xe1\xdfL\x10\xe0\x01\\]1\xc9\x986/'
+    '\x91To\xd3C\x15\xe3\xd9\x14[\x97\xd9\xb6;\xb1\x7f]5\xde[/\xbe\x8a\xb4mY\xb7\xf01\xbe\xa5\x87q\xe3>\xe6\xeeXx7\x8f\x17\x92\xf0k\xa2\xda\x9f'
+    "w\xf0\x0e\xd1V\xe7\xee\xa6Ek%\xb0\xe3\xb9\xd2\xb7m<\xe7\x1dD'rj\xd7\xa9m\x19ii\x04f\x07d-\x1b\x1dl-\x82jo\xe8\xe3\xd1\xe6=\xed"
+    '\xfa\xfc\x01\xdc\x0b\x13\xa1\xb7\x83727\xd1H\x82K7eY\xc0z\xfaB\x0b0\xbbD\xd7\xfe\xda\x0b\xcf\x01\xc6\x92\xf6\xc5\x1e\xde\xfce,\xb9w\xd7\xbd\xbb\xb5'
+    'o\xb7\xed\xda]\xf7\xec\xd6~\xdd\xb6[w\xdd\xab\x1biE\x12\xcb#S;F\x9eI)\xc6\x97\xd7\x12\xba\xd3%\xbe\x04\xae\xaf\xf1\x97\xb1\xac{U\xbb+\xfe\xc1'
+    '\x8b\xff\x0f\xaem\xd1?k\xb2\xbf\xfe\x87\xc1bc\xbd\xcb\x93\xe7\xea\xee\xde^w\xbaX\xb2\xfaJ\xe7t\xfdP\xefO\xd3\xf7)+^\x05Q\xbcJ8-RB'
+    '\xa7\xa4\xd4Q\xf4\x8d?\x87\xef\xca\x03\xc5\xdaz\x88\xc6\x1e,g\x19o@\x1f\x9eRj\x15\x99\xe9\xc6\xac\xd9r\x03\xd6\xac\xef\xf8\xf0egg\xf7E\xa0$_\xa9'
+    '\xdf\xc4\xafxr0M\x8ep\xeb\x99p\x19\xad\x1f\x95\x952\x03\x91j\x1e\xa9F\xb1\x1d\x82\x81i\x03ZJ\x1b \xf1W>\xa6\xd8^>\x0b\x08\xaaY\xd4\x83\xcb'
+    'b.\xd5\xef3\xbf-\x9fz\xc6\xa5_\x81\xde\xd1\x12\xc6\xdf\x9f\xfe\x89\xc8\x7f\x1d\xdc\xcd\xf3\xda?\x1bu\x15\xd8\xed\xb6\x98k\xd3N\xed\x1d;\xbdb7\xe3\xb8\x10'
+    '\x83\x80\xddM]\xd5^\x80h\xb9\xd8\xd5z?>k_T}\xdd\xaa\xfenI\xf5\x0e=\x80\xff\r\xde\xbf_\xc4\xa6\xdd\xbde\xed\xc0\xd1\xad\xd6jcY+e'
+    '\xed\xe6\x8d\xfe\xb9\xb0\x91\xb2\x9d_\xb8\x06s*W\xc5\x06\xdc\xe7%\xe0\xb6\x08\\-\x98\x05<\x7f7\xc0\xb1\x96\xbf\xd2.\x9bN\x14\xe4\x9epL*1j;\xa8'
+    '\x07~\xd41d\xd2\x9a\xdcd\x95m\xc9\xb9\xf8\xfaY\x8aR\xe5\xec\xed\x8fBcs\xbd\xca\x1bR\xcf\\[c\x7f\x9e\xd8\xa2A\x9c\xda\x91t\xb4<\xb5\x11\xaa/'
+    "\x8cZD\xab%\x14\x94\x1a\x7f\xec\xcb. 54\x1ed\xd1\x1ck\xa4['\x8bG\x13X\x917Y\x90\xfc\x9b5\xdf!\xdd\x9ag/n\xb0\xf5\x83C_\x9f:"
+    '\x83\xb4\xc4\x03{\x8c\xa8\r4\xf3\n\x07VZq\xe4Dqia_\xcaPbm\xf5\xd2\x8a}bW\x07\xd8\xb0S\x0e\x93i\xd4\x8d\xe0\x05\xcaw\xbd\xce?\x1f'
+    'nF\xf1q\xb95\xd8\xfc|\xbc\xf1\xf9\xb8\xdf\xd9\xd8?\x1e\xc4\xf4\xd6\xa4\x8d\x8fh\xbcO\xbfx\xdf8\xe3\x18\xe8DF)\x8d\xed \xbd\xb7\xf2\x04\xf2\xb9\xad\xf2'
+    '\xceH\xeb5j\x88\xe5\xc6\xaa\xd1+M8\xd6\x86\xf5\x04\\\xed\xe0\xeb\xf3\xd8Q\x80\xec\xd5\xa7s\xfdxX$\x1a\x07\x0f)\xb3\xbc\x0eF\xa8\x9cW\xc5A\x813'
+    ';\x05)j\xca\xdb\xcc\x933\xab\x84\xe1R\x0f\x95\xd7\x0f\x82\xc7\x1a\xaf\x1e:\xd4\xf6)\xfa&\x83]e\x02\xfe\xc9PZ7b\xd3\x98y\xe4K\xfe^\xe2v\xaf'
+    '%jz0DRk\xad\x8b\xc3W\xfd\x15\x05\x7fCA\xf97u\x96\x86{\xf7d\x14(w\xdd\xd5\xd6\x8d\x0e\xe3\xd5\x86\xec\x90:\x7f\tL\xcd\rF\xe6\x85\xec'
+    ')2\xfa6\\~r\x91\x02\xa7K5\xcc{\xf4\xab\x83u\x9c<\xa1\xf0\x85\x85\xd7\x85\x17\xac\x10\xcdw\xa1\x98\xcfg\x15_\xb7\xe8\x1d#&8?U_\xd0\xab'
+    '5Gi\x15\xc6\xba\x10"~\x9f\'\x90\xaai}]\x95\xdd\xb0$(\r\x81\xd4eU\xb8\x1f\x85\xc8;\xfc\xa7\xe5\x9d\x8d\xc1\xda\xd3k\xad\x17\x95\xf3\x93IV\x91'
+    '\x0f\xb7\xb4mR\x11$\x0e\x91@\xa8\x80E\xe2\x1b%U\xc2\xb6\x07e9\xc3Lh&\xfe 2\xba\xc9\x94i\xdf\x9b\xaa\xedCi~p&\xd2y\xcb,\x17\x83'
+    '\x00\xf0\xe5\xe9v\xf1n_\xe5#\xb1\xb3\xf3\xe1mc\xe4\\\\R\xd5u\xba\xb3DK\x9d~v&\x93\xa3\x854B:\xac\xad\x1b\x92\xa8\x10\xc4\xf2?I\x18`'
+    'h$\x15="\x90\xa5\xa2)\xe2\xb9\'\xab\xe1\xadG\xc4\xc9\x8b&\xdb8\xae\xfbeA\xbbLm\x83q=F^\x82\x903xE\x00w\xb5\xd7\xe0wZ\xe2V'
+    '-\x16\xae\x90`\xf3ae\xbd7\xc2\x01\x97\xb5\x83\xfd\xba\x93w\x87\xfa\xeb\x0b\xd8\x03}3\x8b\xbf@F\xb3\x9f\x03\xd7#Q\x7f\xa1\x05Mw\xbb\xfe\x90y\x81\xf2'
+    '\xd4\xe3\xc0e:\xb8&\xb3\x81\x93\x1cWm$|=Z\xec\xbdO\xfc\xd83i\xa41Z8\xc5\xa3\x8b\xe0\x9b\tB\xbe\xc6\x93<I\xa1\xa0\x97\xb3#\x18jK'
+    'Xv\x8e j2\x80\x9241qL\xe2\xc4\x00\xb1B\xc1{$\x07\x97E&\xdb\xad\x92J\xcd\xcf\x05\x98\xddz\xcd\xb9\x032\xc2\x88|\xe5\x1d3\xa6\x95V\xea'
+    '\xad\x1aPQ\xf6-\xe7{;x\xd9 \xb6\xe6V\n\x00\xdf+\x0f\xea\xb2n\xf8V\x8dl\xe3\x85M\x9eg\xd3\xd9\xbcF\x9cv\x00\xeb\x95|\xa9\xb8\x888%\xf9'
+    ".)e\xc4\\\x86@\xa4\r\xb1\x81\x80X'\xe4\xd9\xc1\xd7U'd\xa5\x91\x1e\xaaj:\x08f,\xb4\xbf\x993^+\xed \xdb-QO\x14\x8c\xf8La\x03"
+    '\xea\x8f\xb2\xa5K\x1c\xed\x079\xeao\xae\xce\xe8\xf1\xe86\xec\xa5\x16\x86\x1b\xe7hc\r-\xdd\xd4\x97\x98lQV\x9d\xa9|]\x81\xe34S\xeb\x1a\x9f\xecAx'
+    '\xa7\x1b\xe1\xc5v6C\xfe\x02X\xb76\x13-e\x7f\xc3\x1a\xf0M\xab\x7f\x8d\x89\x15p\x91\x7fL#e\xc1\x08\x17m\xded\xa1\xf9z}\x12\xbc\x85]\x82\xca\xf2'
+    '\x14\xac\x7f\xf53\r\xef\x1c5{\xd9\x89A\xc2\xea\x9a\xce\x80\x07\xe3qc\xceP\x13P\xe5<\x1b\x8d\xd2i\x88\xd1\xb6\xf8~\x07l\xed\xee\xbeuu\x1d\xad\x95\x8f'
+    '\xae\xd5\xf37\xbd\xd2W\xee\xdf\x9b\xdb0\xac\x92\x13\x04\x19\xc6|\xc3W\xa5\xf4JQ\xe2\xd2)\xf3B`\xe0\xeb\xc9\xedC\xb7\xbf\x89\xc9\xcc\x1a9\xfb\x855\x9a}'
+    "\xfbg\xcf\x1e\xdc\xf2\x91\xf5\xa5\xd4h\x0b\xbd\x01\xb5R\xf8\x0b\xc2\xc0%bw\x0e\x07n0Y\xbf\x1c\xb5NH\x92M\x84\x1e[\xae\xc0'>&E\x11\xe7\xf2\x99"
+    '`\x97D4\xbf\x80(\x19\x8b\xf8\xb3H\xc5\x19\xa5\xac\x96m\x7fv\xbfm\xa6\xb1Z\xe1\x81U\xb1\xce\xff\xa7yj\x96\x14\xc9\xa4d\x8a%\x16\xa4\x15Z\x95\x13\xd2'
+    '\xfb\xa5\xb4\xb6}\xd2B\xfa\x18\xa2\x04\x0bY>(*\xef\x9c\x8c\x93\xe9G\x08d\xa5\x81\xc8L&\x10\xb5\x14k\x9c\x17\xe9\xe9\xae\x0c\x1b\xe9\xf6\xad\xfa\xd4[z$'
+    '/\xd7u7\x84\xb8\xad\xc1jeJ\xea\x19\xb2NlFI\x7f(u\xe45\xfe2\xba\xa9\x1d\x9a\xd6G\x11\t\xd1\x92\xa8\xea\x9a\xcfYV\x14\x10\x9a\x16\x95:5'
+    '\xc8\\xJ\xa8\xdb\xa5j\xcc\xf4\xcb^,p^>\xf8\x90\\u\xde\x10_H*;\x9a\x0cjS\xdd\x8d\xad\xaf\xf6\x1f$R\xe1\x1a\x89\xd4\xcepU4\xc7\x0b'
+    "g\xfa?\xd6t\x18]'\xc35g\xb7\xb1\x1dk\xb8\x19\x1eU]\x00\xd0(\x94N\xae\xa9\x05\x8a\xa5\xd3\x9d\xb1\xb5\xddsLf\xb7<%\xf1\x1c\x8d\xaaF\xfd@"
+    'd\x1d\x87\xf4\x9b\xfcZ|\xb3$+x\xe6)z\xbf\x9e\x15}\xde\xb5G\x91\x97$\xf2\xaa\xe1\xd0\xde\x93\x8b7\xb0\xc3\xc9j\x05\x10\xf1\xbe\x0b\xd9L\xea\xea\xc0\x17'
+    "^\xa4\x16\x86\x97\xeb\xf4>U\x98`\r\xac^\x14'5a\xa9\xdc]\xbf:\xb2\xabb\xa9\x10X\xbc\x14\x86\xe34)VZ\t\x8a\xb1\x94\xe8m\x82(\xcf\xa5\xcd"
+    '0\x95"\xed\x82^\xdf\xb3\x18@\xedZwa\x80\xaa\xb866JI*K2\xd8\xe6kZ\xe4\xb6U\xc07\x01\x88"\xed\xfb<\xd5z\x10\xac\xf7C!\x83\xab'
+    '\x1c\x03\xbf\xa2\xed\x08\x15\x032(x\x94\x01\xf0\xf7\xa8\xa7\x08w\x84\xcdM0\xc4\xa0<\x110\x91\xbdPjD\xafk\xd1+\xd3Ju~2\x9e\x17\x91S\xa6E'
+    '\x0e\xb7\x1e5\xe1PS\xaao\x8d\x02\xeb\x8e\x99\xde\x9b\x84\xee\xd7\xdew\xd0L\x089XE\xf7|\x91\xed\xe2\x97{O\x9db\x9d\tQI\xaao\xbc\x15\xf2\xb5.'
+    "\xf7\x16d\xc5\xa5\xa2\xa7\xbc\xcc\x88\x8d\x18\xf79z\xa8^,C\xc8\x7fF\x17\xa9'\xf9U\xd8\xb3\x8a\x8bd\x94\xe5a\xcf\x15\xf5MHv\x10=ct\xf7\x89%"
+    '\x08\xd0p\x9a\xcc\xc7\xd5\xeaP\x95\x92\xed\x07x\xc32\n\xb0\xde\x97\x12\xa9\xc1\xa2j\x9e,Xg\ry\xdf+N\x11\xaa\x84DX\x8f=\xc0\xa6l\xd5N\x83\xbd'
+    '`}]o\x982i\x82\x1c\xcfWF\x91m\xcb\x16&J\x8c;X4\xa9D\x8b\xee\xd6\x0c\x0eT\xc7\x93T\xaco\x9d:\xc1\x1b\x86:\xda\x12\x87\x840\xd8\xd7'
+    '\x93.\x8b_AiO\xfdz\x91L\xaf\xc3AMV\xb0x1\xb00\x85Bj\x0c\xd9B\xcb\xc0Wd\xae\x99\x93\x10l\x0c\x8a\xa2,1\n\xdb\xa5\xa6\x18T\xa5'
+    "Y\x03\xa9\x15[\x91s\x14\xa51\xfe\x03U ML\xfc\xedX\xa7\t\xef\xbaQX\x82\xd8\xb3'\x81\xa1 \xb7\x0co\xf4\x15;\xedYsTh\xa4\xa8\x03\x0b\xfb"
+    '3\xd7\xf2\xd6\x8au\xc3y\xea\xa9k\x16\xfd\xd2\x1b\x8e[\x11tox\x00\xb7$}\xa6\xcd\x00b\x81\xd5\xa8W#9\xd4F\xf7;\xb5\xf68Z\xc0C\x8b\xf1"'
+    'Cy3\x13\x18E\\z\xe7\xd9\xb1\x16\xbc\xf6>\x82Iw\xae\x8b\xedy\xcb\xd8\x08:\xe6s\x13K\xd8d~\xf3\xb2\x96\xef:\x92\x1a\xed2\x7f\x13\xdd\x86Q\x07'
+    'Z\x9b\x90kt*\xd5\xdb\xf6I:L \x1f\x11?t\x06\x93\xe4:\x98\xe6\x18\xb2\x12\xd2\xb1_\xa4\xbe\x1c\xa6\xe6x\x1b;GVD+\x84[R\x18\xa3\x92\xa1'
+    '\xf07H\xc5o\xb7\xd5\x1f@Hv\xa1`v\x8e\xb2I:zu"\x0ei\x17i-k\xe7k\xb1\xeb\xe4\x108l|x\x95\x0e\x05\xc22i\x8c7\x93\xe7\xbd'
+    'r>\x83\nZn\x9e\xa2Ee:\xbcnch\xb2\x93d\xf8Qk\xd5X7R\xc5\xac.O\xed\xa9\x08\x1f\xf8\x14\\\xa8\x00^\xde\x7f\xe7B\xc6>\xebI\xad'
+    '\x8cPoHFw\xd1\xdc\xdco\xe1\xb0;F[\x83[EnZF\xb8;\xc8\xae\xcb\xcdG\xcct\x03PQ\xc3\x82\xe5\xe4\xb1St\x8b8\x99\\\xbd\xa2F!'
+    '\xb6!\xde\x98{wK\xcdhb\x04?\xbb\xb4U.gw\x19\xf9\xae\x8a\x0e\xdd\xe38\xc7=\xdeu\x10\xfa\x86\x880\x03W\x03\x06\xdfl\xb1\x1d^\x88\x9e\x9a\x86'
+    '\xd6\x9c"W\xcd\xaf\xbb\x8a\xecE\xd2\xb0FT#\xf1]\xfd\xb9\xbb\xb6\xf2\x12by\xf1\x16\x1f\x0cA\xb3\x01[Z\x18s\xf6+\xd23\x88\xe3[\x00\xe1\x1f\xcb\xde'
+    '\xcb\x88)2\xbe\xca\x8f}\xdc\xcd\x16t>U9\xdb/\xecc\xf6\xad\xd6u\xc3\x9a\xfc&+M\xda\x97=\xb4\xf0`_\xbbi\xb1\xc8@\xe9\xcc\xbd\xf4j#"'
+    "\xf1n\xadGU\xa1Y\r\xe0\xb6\x80\xcaz\xf9r\x9b\xb3S\xe3\xe9\xa9\xe9\xfc\x14\x048\x85\x9d\x9c\x96\x84\xe1tHu>\xfc\x18\xb6\xa5\xf2cMx\xe7\x04\xee'"
+    'p\xa8\x8brP\xd6\x8eU\x0b:;O\xa6g\xe9\x17\xf4v\xb3P\xa8.\\\xf5~\xd9\xf0\r%\xeb\xb7\xc6f\xa9xEMR\xdeL`71.X\xfcS\xd9'
+    '[\x9d\x94u\xf8\x8d\xb0\xf8\xe5\xf0\x8f\xf7\x8f\x0e\x1e\xff\xf2\xf6\xf5\xc1\xe3\xc3^\xf0\xb7\xb6,;:x\xa4^\xbd\xfe\xbb*{sx\xf4\xeb\x9b\x97P\xbc\xf3\x83*'
+    ';|\xfbX\xd6\xbb\xffo\xaa\xec\xf9\xe1\xd3#*\xfc\x01\xcb\x86\n\xd2\x0f\x1a\xfc\x9bg?\xfdLu~\xd0\xe0\x9f\xbc\xfa\xed%\xd5\xfcq[\x97\x1d>?<:'
+    '\x84\xd2\x1f\xff\xaa\xca~~\xf5\xe2P\x82\xd7e\x87/\x9f\xc8N~\xf8\x8b*{}\xf0\xd3\xe1\xaf\xaf\xa1\xf8\x87\x1fx\x19\xf5\xf3\xc3\x8f\xaa\xec\xd9\xcb\xb7\x87o\x10'
+    '\x99\x1f\xffB&L;\x85_\x91B\x04\xbc\xd1\x11\x86l\xe1k\xfe\xc2Q\xfc\x99AI-t\xaa\xe4\xc8\x00Z\xbc\x93\\(\xbf\xb9`\x87\xb0\xc7\x9dc\xb1>d'
+    '\xffV\xc6"{i\xf0\xb6sxzQk[\xe5\xba\xa5\xb3\xac\xd4\x12\xf6\xc4v[\xa0e{\x18\x9fV\xb2\xb9\x96\x88\x1c\x0e\xc6\x83K\xf9\x08\r\x98\xb89.v'
+    'F\x94\xaf\xa0\xb0\xfa\x8bd\x86L\xbb\xdd\x83(\xad;\xbd\xe0\xc7vp\xbf\x17\xdcW\xb7\x06\n,w+L\x89\x9d\x87VX<e\xbd \xa1#\xdb\xec\x99^\xfa'
+    'C\x13\xeb\xe7\x06\x91do\xc4\x9a\xd2\xc7k\xf9\xbe*\x16J\xdc\xdb\xa5r\x1a\xb7{6\x96\x97\xe7\xd9\xf0\\\xc7\xaa\\\xa7\xc2IZ%\xbf\xa4\xd7\xbbv\xd3\x9d\x85'
+    'M\x1bZ\xba\xf3\xcfL\xa2Z\xe6rJ|\xfa\x02\x8a\x13B\xfbAd\xe3\xb7\x87m(\x11RO}\xd4\xb3C_c=)\xf2\x82R\x02V\xe8<OO\xab\xc7'
+    '\xb0\x9fY\x0f\xe3\xd5j\xd4g~\x89\xb6\xc2u;V\x9e\xfbY\xf9"\x1b\x8d\xc6\xa9\x84\xb12\x84\x1d\x06\xe1Mvv\xae\x91X\x19\xc2\xfdX\xbf-I\xeb\x8e\xe8'
+    '\x17\x96[\x00\x8b\xa1L\xcbM-G\xac\xd6\xa1\x00R\xbb\xfe\xa0\xee*"\xae\x1b\xe9\x11_\x95\x1e\x1d\xfe~\xf4\xfe\xe5\xab\'\x87bv\x9c\x97\xa0`\xf2`\x13 '
+    'Qm\xf0\x9b\xbfp|\xc9m\xd4\x8dT\x92\xd8K\xe7\x01B\xdf\x8a}\xc2A\xd4M\xf3\x1e\x1f\x16e\x03\x1c(\xb7j\xa5L%\xd3aZ\xc2\xa3\x97(n\x0c\x92'
+    "\xc2F\xd3\xe0\xfb\xbf\xed\x8c\x7f\x96g\xd3\xca\xca\xbe\xeeL\x95\xc5\x9f\x98\xd9\xae'W\xc1,9K\x7fG\x07)\xfa-\xd40\xf1\xcf\xefV\xa2\x1d\xedi\xdcQ\x7f"
+    '\xa8i,\x87E>\x1e\x03\xbb\xf3\xf4\xda\x9d\x93|t\xcd\xbe\xc5\xb1I\xabw\xcd;\xfe\xa3\xd6\xf1\x1f\xb7\xea\xf8(\x9f5\xf5+>i\xe3\xec\x8d\x97Z\xbf/X'
+    "X\xc4\x11\xb2\xa2b\xe8+\x9d\x19\x86\xca\xff\xb8-\x80k\x8d\x82`\x81Y\xf3lyV\x93\xe2\x15I\xbb\x02\xff}B\xd22r\xbe\x02p\xb1=\x08\x02'\xb4\xe3"
+    "\xd5?\xcf\x1c\xeb\xe9\x8dtD\x8f#\xb3yJ[\x98\x7f\xef\x9c\xe8\x9dU\xeam\x1f\xd3\xeb2\xb2v\xdd\xd8\xef\x1e=\xb1\x9d\x18'}u\xa9n5\xa6R\xe9\xa6"
+    '\x01\xaa\xa5}\xa7KN<\xf1J;\xb7\xadXJ\xc4\xdbf\xff\xb3\xa9e\xeb\xba\xeaH(V\xed\xf8\xd1\xfc\xe4\x04\r\xed@6\x93\xb4\xcc\x9e\x0b.ku{B'
+    'Z\x1d\x15\xc9\x85Z\xb7\xf7f\x816i\x0b\xc9O\x9e\x883h\xa9=\xd0u\xf3j`$\x12^\x17<\xa8\xa6\xb5\xa3\xe2!\x10\xc9\xfe\x9e\xc8\x93\x8e\x1e]kZ'
+    '\xc6\xd6~\xa9S^67\x10\x833\x13\x81\xef\x96U\xa2I.&\xe5\xa2\xd03n/\x12\xbf\x9bPj\x8e\x03\xf2\x00.U]\xc9\xd2\xc5P\n\x866\xbbS\xb3'
+    "tb\xea\xcb*\x94=\xb6\x99\xaf\x87\x90\x85=\xbd\xbe;W\xf6\xa7?\xd8\xa7k'\x82\x85\xeb\x04b\xe3-\x99.\xdem\xd2`$%\x18!\xdd\x12.\xe6\xe8\xe8"
+    '\x865\xa2\x16\xbc\xa2\xc6?\xcbV\xdcy\xff\x1e[\xbc\x7f\xbf\xeba}\x07\xa4\x8b\x96\x1c\x80\x99\xc1_\x94>\x1d\xc5M\xe73\x9fh\xc0\xb3\x89\x1e\x01\xfe\xc2\x01\xeb'
+    "'.`\xe9\x80o\xcf\x9e,2J\xbcO\xa9N\xed\x96O} \xac\xf5\xbb\x174\xdc\xa4)f\xa3\xf1\x96\n\n\xee\xf8n\xd75@\xd1ns\xd3\xd3Rky"
+    '|\x04O\xc4\x11\x0f\x9aQf\x1d\xf5\x975\x10U\xa8\xf5]4\xa2\xe9w\x95\xbd\xd0\xdc`\xb6\xc0[?\xb9H\xb218\x03\xb4l4US/\x1e\x8f\x81\xbe\xe2'
+    '\x18.\x88\x99\x8d\x9c\xd39\xd2\xbe\x9f\x8d\x06h\tT\x7f\x93\x7f\xa2\x17\xd8oE\x02o<K\x01\xcf\x0c\x0e\x82\x03\xd7\x06\x88\x13-\xc0\xd60\xb0P\x1f\xf6uC'
+    '\xc4\x81\xff\x14h\xd0\xeb<\x1b\x0b\xe2m\x89\x08{\x10\xa8\x1a\xb6U\x00A\xeb\x9emD\xa8\xb8l\xb5\xeb\xe2\xba\xc2\x00\x8d\xbdp\xd8\x99\x8d\xe7\xc3\x8fQK\xf6\xd8'
+    '2\x8fb\x15\x0e\xaeX\xd5\xfd]RG\xb5\x13\x89#\x9b\xc9\x04"H\xb1n\xed\xb9\xcc\xd1F\xca\xe7:3\xb1\xa2\xf5=\x86\x7f\\Ow\xc8\x91[\xa8]\xc8a'
+    '!\xeb;\xb4\xb7dW\xa0\xc6\xd71\xd1\x1c\xe5_TmHwu\xb2\x96\xcd\x14\xb2\xb0>\xf5\xa0\xf7\xaa\x89\xb7\xe6\xc4;\xe7\xb7\x9dQ\xc5\x92\x8e\xb3\xb3B\xd1\xec'
+    '\xb9\xb5\xa1\xe9\xb1)\xafe\x0b\xeb\x91\xd0\xe7\x8b\xfc\xfa\xd6\x88\xfb\x96\r\xf2\x04_%\xbem{\xc1\xa2\xea@\xae\xa0|^E+\x90\xb2y(\x88YT\x7f\x059'
+    '\x82\xc7Z(Gb\xd7\xa9\xc0\xf0b\xc6\xc4\x0e{W\xa1\x8al\xdc\xf5\xed\xb5\xd2\xe3\xa4\x910\xa9*\xd1\xe0\x90/\x98\xfa\x97\xa8\x95O\xe7\xd3q\x9e\x8cZm\x0b'
+    '\xf5\xd8\x7f,\x97V`\xefs\xe3\xc6\t[\xe4\xc2%O\xc0\x14C\xb7yK\xd0\x0b\xcf\x96\x0b\xab\x0b:\xeb(\xaa\xf9\xd5=\x87z|\xfc\x92\xd1\x08\x11z\x0ew'
+    "\x02\xd3\xd4\x8a\x8c\xdeT'\xa2\x98\xa2\xb2\x1b\x19\xf7\xcd\rR\xe4\x01c\xcf\x0bd\xb0\xb5\x001O\n\xefs\t\xfb\x84\x06:9\x99\xa2\xed\xb4\x12_e\xc2\x9a6"
+    '\x8b\xf6-\xa6\x92\x82?J\xa9\xc0\xb7wN\xe2\xd5\xa4\x13]\xefx\xe4Q\xfd\xbdY\xc7\xa2K\xc4\x88\xe0\xc8,\x1e\x9b\xa8\xf1!\x9a\x1e\x0c\xb3*\xae{\x07\xc2\x8f'
+    'x5\xc9\xe5\x0e\xc0\x0ba\xe9\x10V\xc4\xd8\xe1!g\xa7].\xf4\xee\xbc\x94\x8at\x92_\xa4KW\x93\xa7\xda\x1d\x17\xd4(\xbd\xed\x82Zm#\xda]e\xfd\x9d'
+    'f\xc529\ta\xfcV[s\x8c\x8c<\xcd\x03,\x1b\xdf\x89\xc6}\xa75\xc3x\x13\xb8\x15\xb8D\n\x0c4\xd7@d\t]y~5\xe8\xf8\xfa\xb5\xa6\xf3\xc2'
+    '\x81\xdex\xe2\xda\xb5\xdbt\xe0:_V\xb3UzO\xfcJ\xdf\xec/\xe8\x98VaT\xeb\x12\xff\x9f\xec\xa7\x81\xe0\x14\xdfI\x82q\x89\xab;\xee\xd9\xe7\x0bS\x05'
+    '&\x18\xa2\xbe\xc1?\xea\xc8p\x1b\x12\xfaf\xd0Q7\x1b\x99\x1f\xf8\x8f50C\xb4\x95\xd1\xfan\xd2\xa8\xdb2\x03W\xe3a\xd6\xb6^\x81\x1d\xcc\xec\x91\xb2\x14]'
+    '6hu8w\xccP\x08\xe6\x02\xadex.\xa0\xe1\xbb\xb3\xb5\x1d^\xd4\x84"]`\xd9\x18\x9aP\x0f>\x04\x1c\xe7l\xf8\xcc-g>\xb4\x9c&\xf2\xb3\xdb\xca'
+    'E\xd6ie}v\xdb\x82b\x96\x9a\x9c\xc6(\xf6hh\xae\xd1\xa0\xbb\x11\xbc\x9d\xcffyQ\xa1B\t\xa1P\xc5\xfe\xfb8\x9fV F\x11\x8c\\\x18Y\x19\x9c'
+    '$\xa5\xf8)\x94\xd5\xcb\xbc\xf8\x18\x9c\\\x07O\x92i\xf0[zr"m5/\x84&r\x9e%e\xf0"\x13\xc7w!o\x9f\xa4\xa2\xc2\xe1\xe82)F\x94\x9a'
+    '\xf0?\xf3\xf3i\xf0&-\xb3\xb3N\x00\xbe:2\xcdM6\x813\x89}\x1e)R\x0b\x0bbI~\xc6\xd7\xab\x80F\x1b[\xee\xa7\xe8s\x02`c\xa5\xbd\xe2\xcb'
+    '\x93g`@\xbaH\xc6\xf2\x1b\xd5\xd5\x80\xa0S!;\xf2I\x8f@\xb6\xdc\nT\xcc\xac\xb7Zy\xd6U\x9a\xf4\xbeU\xee\r\x03\xa2\x84yJX\xc2\xabt\x89q'
+    '\xcd\r@A\xed\x12V\x9f\x87\xf9d6N\xab\xb4\xdb\xa9\xe0\x01\x9d\xc6\x08\xc37\xbc\xad\x84\xa0\xb0\xce\xa7M\x14\xd6\xcb\x9b\xae:\xd6|\xce\x1c\x84^;h\xc9\x13'
+    '\x80\x1f\x96j\xed\x88\x9aFRE-\x97\xf5Z\xc6\x08\xe8\xef\xc2\xde\xd2oj\xb6=\xdd\xd7e\x91Ubn\x1f\x94\xc3"\x9b\tf\x1e\xed\xbd\x7f\x9fOk\xac>'
+    'JO\x05\xfd\xcbb\xb8\xd7\xed\xf6\x1e>8\xeeR\xfd\x87\x8a\x13\xeeE-_\xbbV\xdc\xc9\xa7H\xe7\x12\xe8L\x1e.\xdc\xfe`\x9b\x1e\xa4aZM\x0bF\nU'
+    "\xb3ge\x02\x93\x1e2\x1e\xc8\xe6r~\xa5\xb9\xe4W\xa6dS\\\xeau\x17<9|\xfd\xe6\xf0\xf1\xc1\xd1\xe1\x93`\x05\xaf\xbb\x9f\x93\xf2\xdc~~g\xee'\xac"
+    "\xe2]z\xf9r\x94\x9f\x91\xeb\xfc'xL4\x1b'\xd7F\xc6U\xf4\xed\x86m\x03J\xeca\x80\x87W\xa7,\x93\x84\xfa\xc2\xd3\xea\xc8>\x9eMe*q\xf9~"
+    '\xe5Q*d\x9c\xdf\xd7\x8f\x88\xe7\xd8\xf0T\x17\x19\xc21\xb5?\x9d\x10 \xd9\x8a\xbf\xa7>\xb2\xef\x96\xee\x08\x1fn\xa8<\xc0\x1f\xe5U%\x84\xd3W\xc0\x9f\x00y'
+    '\xba88u\xee2\xef\xd8C\x82p\xec\x0e\xd0\xb5\x1a\xdf6\xa9P\x0f2P\xd6aQ\xe4E\x14\xb6\xaas!\x16\xcd\xd7\x16\xec9\xa3tV\xa4\x90\xdbV\xa8\xd4'
+    "\xe0\x0e\xde\xa2\x9e[pwS\x89u\x81q4 \xe9\xa0X*Ay\x9e\xcf\xc7#\xf0\x0e\x87\xa3\xc0(\xa8\xf2\x80\x16p'\x19\xce\xc7yg\x8e\xb9{\xabl\x98"
+    '\xe2Ng`+s<@:\x9d\x17\x98\x85\xf9$\x1d\x83\x8c\xab\xce\x93*\x98$3\x00\x06\x8d\x04\xc2\xe2\xa3z/,\xdbup\\\xafU\x92\xe8=\x15EK\x08'
+    "pl\x07\xb7Vb\xe5Cv\x1d\x18\x88\xd8\x10\xa7t\xba\x16\x0b\xf74\xbf\n\xc4\xa1\x01\xdc9\xe1\xae+\x98\x15\xb9\xd0\x1e'%Ax\xf9\xea\x08\x9aA;\xdc\xa1"
+    '\xe12$\xa0kV\x01\xa1\x1d@\x00v\x00=*\x92\xb33P;q\xa6\x12x&#H$\xb1\xc0\xea\xf8Q\xddi\xa3\xf7+\xdaS\xdf\xe2\xc7W\xa7\xa7\x02W'
+    'p\x90\xc4xLk\xd4p\x02\xf1\x9b\x055\xd1\x1c\x0ft\x05\xb6\xc7_\xb0\xbe\xc1\xe0\x95M\x9f!\x18\xf1\x9b\x00\xe5\x08\x08u\xc5\xe2\x1a\xf73\xa0\x1a\x81C\xdca'
+    '\x9a\xb0f:\xa2\xd7\x9b\xe0`\xe0\xf1rC\xd97J\xc7U\xf2\xbb\xa0\xa7\xda\x11\xf1\x9a\x88\x90\xad%\x14\xe3\xd74\xcd\x97\xe5\x0b\x9b9\x97\xe7\xbe\xba\xdb\xbb\x0ez'
+    '\x7f8\xe8\xfdqg\xf4\x84\xf0X\x15\xbb\x86\xaa\xdbf%\x0bz\xa3\xe5\xaf\x0c\xae\xba\xd7\x82)(S\xa5\xd8m\xf0\xa5\xb5`JXM\x98\xdf\x1c\xbc\xcc\xc6\t\xc0'
+    '\xa3\x19\xf5-\xff\xabvpmE\x15\x83\xe1\xfb8\xc8\xf3(\xab\xb3\x80QJ\xa7\x0bF\xdc+\xd8\x12\x05m\xafX\xd9\xb5,\xbbfe\x04\x88\xed\x08\x82Z\xf31'
+    '\xbe\x0e!\x9c\xd8\xa9\xd8\n\x99w\ro~\x18\x08\x08\xc6\xedD\xdf\xba\x0e\x1e\x04n\x95M\xf3|\x06\xcb~N\xc1\xdb\xc7my\xe5\x02\xdf\x1e\xd4\xab8\xc0\xb7\xeb'
+    '\xc0\x7f\xcbF2@7\xcd\xea"R.\x9b7|\xff\x83U\xf55a\x8db|.]\xba\xd9\xb3"Pe\xc0\x00\xf7-\xbef}\x93\xe64\xd9\xb1\x9b\xfc\xf15'
+    '\xe6\x94u\xb8trY\xdd\xbb\xce2#\xc9\xd2\xe9fuo?\xefb5\xd3\xd4\xbb2y$v\x90a%\xf6\x00\x12\xcep\xdc\xa4\xe5\xcc\xb8a\x82Q\xdc=\xf7'
+    '\xbd\xeb\x13\x9e\xe5p\xdb\x1c\x9d&2\x17\xe2\xff\xad\xed\xea~\xdb\x04b\xf8s\xf3W T\t\xd8R\xd0"\xed%M\x93Um\xf7\xbaj\xed\xa4I[U1`'
+    '\r\x1a\x85*\xa4\xe9\xb4\xa9\xff\xfblsw\xf8>H\xf2\xb0\xbc\xb4\x04|>c\xee\xc3g\xfb~\x17l\xd0\x80\x82\xaa\x02\xa3_\x87\xe1^\xfa\x8a\xe4\x17&5G'
+    '^b\xb9\x1b8\xb5\xa3\xfee\xb3*\xff\xe0\x84\xb6C\x82A\x15J\x01~o\x17\x80\x885u_\n\xe3\x00\xe7s\xb0Na\xce\x07\x9b\x18\xc7L\xa7\x01\x00f\xc5'
+    '\x8b\x17\xbe\x8b\xdf\xc7\x93(\xa6,a\xa3\xc1\xda+x\x93\xa2C3\x10&D\x91\x0f\x153):\xf0\x82\x1fmS=\xaf\xb7\xc2~H\xeb$\x16s\xae\x91\xd6\xa3'
+    "\x1c.\x8a\x95\x03\x7f\x82r8\xca\xcd\xff\xa8\xa7g\xe5\xac'\xadv\xeb\x8d\x0fV\xdd^\x15\xba\xbc\xa6\x8cE\xbb\xe0C\xb1\xfe\xc4\x08:}\xc3\x84mSn\xca\xe2"
+    '\x05}"\x8c5\xe1\x0c\xb1\x97n\x9b\xe7U\x86>EJg\xb1p\x8bz\x9c"\x1d\x9a\xc8\xa9\n\xe2-\xd5\x16J\x8e\xb2\x86\xc3#\xe0\xd0P\xa0\xac\x0c\r\xb4\xee'
+    '\xa2?~s\x07\x01_\xee\xa2m\x8e\xb6\xac\xf4\xe7\xfd\xe5\xae\x9dr-\x1c\xf3\xc6Z\x02oIT%L>E\xe0\xcc\xa9\xe7\x7f\x13\xf6l\x1b\x8at\xce\xc0\x0b\xc6'
+    "\xde\x07:\xd9rL\xa0\xdb\xf8W\xfa\xe8\xe1\x9f\x0f\xb7\xee\xfc\xde;\xa3\xcb2,\xbd\xe5\x9d\xf9X\xa4 X\xd1\xc6_\xafS0\x93\x16#\xcf\xb5.2\xcf'\xcd"
+    '\x18Ku\rKZ\xb1\xc30\x92\xf0\xbf,?\xa2\xa1T\xbf\xe4{+\\7\x8c\xe7\xc2;~a\xbf\t\x03\x10\x15\x18\t\xec\xe5\x00\x13\xa5I\xa3\xe6\x19\xab2\xe6'
+    '\x8e\xcc\x17\xfd\xc7\xbb\xd7\xde\x9f\xde,\x0c\xe2$yC\xc7\xa0\x021\x9b(\xe4\xe1E\xaf\xde\xf40o\xce\xb3v\xef\x18G\xda5\xb0\x8f>\xc4.l-\x84\xdf3'
+    '\xc1h\x06\xa3\xb5\xb0 G<\x93\xba\xb5\x80]\xdd\xd8\x97\xa7\xd6\xbb\x0e\x1c!\xeb\xdc\xa9-\xceS\xca\xea\xd3\xeer\xf80\x10\xca\x82!L\xcc\x9e3"\xc6du'
+    '_\xa5\xf1\xb8\xc3\xa0\x17T*_\x86i@\x03\x91\tuM\xf5\xbf\xe2\x94c\xed\xd5V8Q\xb5-B\xaa\xe4\x1fX\xf6^dW\x1b\x10\xf9u/\xa1\x86\x10\x10'
+    "9\x90i\xf6\x00\xf7t\xe1\xd3\xb4\x02\xd3yd'g\xb2#\x91\xbb\x84\xf6\xab\x01\x90 \xed\xa9\xb5\xfa\x8a\x06\x86\x0f\xa3\xf7a\xb4#4&\x95Clu\x95U\\"
+    '\xf0\x8e\xa3m1\x83Zm"-\xd9q\xd7FX\xe7\xf6W3\xd6\xd8\xcd\xda\xf7\x18\x8df\x1cp\\\xe2\xa7\xa1j\x1b[\xfb\x11\xa2}\xaa\xca5v\xf7\xb7\x89\x02'
+    '@\x1bh~|\xaa\x10\x00\ns\x86\xdeH\x02\xf4\xd5j\xb8YSGc\xd8.\x18\x1f\xc6\x18NT\x9e\xbbX\xdd6\xe7y>\xb4B6\xc9\xf4X\x05Q\xe2\x9a'
+    '\xe6\xf8\xbc\xdb\xfa(7.\x18\xa5\xc4\x90\x0f\x1dH\xb3\x94\xd0\xd5\xe5\x96\xe83=\xd3\x0c\xfe!\xa9\x04\xe9.\xc1d\x8e\x93]\xd2)\x9c\x1c\x1a\x8671*\xce\xaa'
+    "xo\xe6\x18\x81\xc2-\xcdx\xec]\xd5\xd0IW\xe8\xe2:d?c\xc1H\xacf&\xc3\x03x\xb9,\xd2|>\xc3A\x02}rM\x9a\x9f\xf9\xbe'\xb3\xa4\xe0"
+    "\x1a\x89$\xb9\x85v\xe8'\xcb\x06\x9a\xf4r\xfd\xe8wa\xc6nY1\xf5\x82\x07\xc4\xf6\xa2m\xd87\xcfYV\xb4|\x95\xbf^\xa5u\x8bv**\xf5\xe88\x0c"
+    '\xaa\xa6\xf9u\xf2\xb3(*:CD\x1c\xf3D\xe1*A\x88@\xf3O`L\x16\xb7\x84w\x81e\xd0\x02>\x11\x8e\xda\x13\x14\x9f\x97\x05\xb9\xf7\xa1\x82\xd1 \x00c'
+    '\xbfJ3E\xc4\x9fw,\xb6\x10`\xf4\x1c+Rz\xf9\xf2\x94\xa7h\xd4\xf8\x82\xd8\x1f\xfb\x0b\xbc$\xbf\xe1\xeaL\xdd\x05\x93\xdaP\x95Wl\xd2\xea\x86\xf4\x0c\xaa'
+    '\xea\xb6\x0b \xd0\xf3\xd1\xe8\x15\xdd\xd0\xfc\x93\xe5\xe5\x06\x03A\xbe\xd2\x1a|\xa3Y\x02w\xf9CCj 9\xa2g\xd4\x03\xce|\xd2\x0b~zh\xe5\xfe|\xb6\x9c'
+    "\xcc\xcb\xcb\xf2\xa1\xf4.\xcb\x14\x9a\xc4d.\xf89\xca\xac\x1f\xab\x9e'\rn\xaaNy\x1f\xc6\xb6\x99(\xde\xb1Q\xd2%\xf8\t\x809r\x99\x8f\xfe\x01\xab\xcfW"
+    '\x99\xad\xea\x01\x00'
+)
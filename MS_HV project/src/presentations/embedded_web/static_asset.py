@@ -0,0 +1,133 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, 2009, Digi International (Digi). All Rights Reserved. #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice,  and the following  #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+
+"""
+Static content for the embedded web presentation, kept gzip-compressed
+and served with an ETag so that browsers can revalidate it cheaply.
+"""
+
+# imports
+import cStringIO
+import gzip
+try:
+    from hashlib import md5
+except ImportError:
+    from md5 import new as md5
+
+# constants
+
+# exception classes
+
+# interface functions
+def compress(data):
+    """\
+    Return data as a gzip file image.
+    """
+    out = cStringIO.StringIO()
+    gz = gzip.GzipFile(fileobj=out, mode='wb', compresslevel=9)
+    gz.write(data)
+    gz.close()
+    return out.getvalue()
+
+def make_etag(data):
+    """\
+    Return a strong entity tag for data.
+    """
+    return '"%s"' % md5(data).hexdigest()
+
+# classes
+class StaticAsset:
+    """\
+    One static document.  gzip_data and etag may be given precomputed (see
+    build_pyhtml.py), otherwise they are computed here.
+    """
+
+    def __init__(self, data, gzip_data=None, etag=None):
+        if gzip_data is None:
+            gzip_data = compress(data)
+        if etag is None:
+            etag = make_etag(data)
+        self.data = data
+        self.gzip_data = gzip_data
+        self.etag = etag
+
+    def respond(self, headers):
+        """\
+        Answer a GET with the request headers given.  Returns (status,
+        response headers, body); status is 304 and the body empty when
+        the client's copy is still current.
+        """
+        response_headers = { 'ETag': self.etag,
+                             'Cache-Control': 'no-cache',
+                             'Vary': 'Accept-Encoding' }
+        if _etag_matches(_get_header(headers, 'If-None-Match'), self.etag):
+            return (304, response_headers, '')
+
+        if _accepts_gzip(_get_header(headers, 'Accept-Encoding')):
+            response_headers['Content-Encoding'] = 'gzip'
+            return (200, response_headers, self.gzip_data)
+        return (200, response_headers, self.data)
+
+
+# internal functions & classes
+def _get_header(headers, name):
+    if not headers:
+        return None
+    name = name.lower()
+    for key in headers:
+        if key.lower() == name:
+            return headers[key]
+    return None
+
+def _etag_matches(if_none_match, etag):
+    if if_none_match is None:
+        return False
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag == '*' or tag == etag:
+            return True
+    return False
+
+def _accepts_gzip(accept_encoding):
+    if not accept_encoding:
+        return False
+    for coding in accept_encoding.split(','):
+        params = coding.split(';')
+        if params[0].strip().lower() not in ('gzip', 'x-gzip'):
+            continue
+        for param in params[1:]:
+            param = param.strip().replace(' ', '')
+            if param.startswith('q='):
+                try:
+                    return float(param[2:]) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
@@ -39,6 +39,13 @@ from string import Template
 import time
 import cgi 
 from presentations.embedded_web.index_page import raw_html
+from presentations.embedded_web.static_asset import StaticAsset
+try:
+    # generated by build_pyhtml.py:
+    from presentations.embedded_web.index_page_gz import \
+         raw_html_gz, raw_html_etag
+except ImportError:
+    raw_html_gz = raw_html_etag = None
 import presentations.embedded_web.pyhtml as pyhtml
 
 class Web(PresentationBase):
@@ -64,6 +71,10 @@ class Web(PresentationBase):
         # page: The path location to access this presentation.
         # exclude: List of strings. Channels matching the strings will not be
         #    displayed.  
+        # static_headers: Serve the index page gzip-compressed with an
+        #    ETag.  This requires a digiweb which takes response headers,
+        #    including a 'Status' header, as a third item of the response
+        #    tuple; others must keep the default of False.
         
         settings_list = [
             Setting(
@@ -71,6 +82,9 @@ class Web(PresentationBase):
                 default_value='/idigi_dia'),
             Setting(
                 name='exclude', type=list, required=False, default_value=[]),
+            Setting(
+                name='static_headers', type=bool, required=False,
+                default_value=False),
         ]
 
         ## Initialize settings:
@@ -94,6 +108,7 @@ class Web(PresentationBase):
         return (accepted, rejected, not_found)
 
     def start(self):
+        self.__index_page = StaticAsset(raw_html, raw_html_gz, raw_html_etag)
         self._cb_handle = digiweb.Callback(self.cb)
 
     def stop(self):
@@ -112,7 +127,7 @@ class Web(PresentationBase):
             return None
        try:
         if args==None or args["controller"]==None or args["controller"]=="index":
-            return (digiweb.TextHtml,raw_html)
+            return self.__static_response(self.__index_page, headers)
 
         cm = self.__core.get_service("channel_manager").channel_database_get()
         channel_list = cm.channel_list()
@@ -142,3 +157,12 @@ class Web(PresentationBase):
        except Exception,e:
          import traceback
          return (digiweb.TextHtml,traceback.format_exc())
+
+    def __static_response(self, asset, headers):
+        if not SettingsBase.get_setting(self, 'static_headers'):
+            return (digiweb.TextHtml, asset.data)
+
+        status, response_headers, body = asset.respond(headers)
+        if status == 304:
+            response_headers['Status'] = '304 Not Modified'
+        return (digiweb.TextHtml, body, response_headers)
@@ -39,6 +39,7 @@ from core.tracing import get_tracer
 import threading
 import time
 import cStringIO
+from collections import deque
 
 # Because the idigi_data module can be external to Dia, we should try/except
 # around it, just in case the user does not have the module for some reason.
@@ -57,6 +58,19 @@ ENTITY_MAP = {
     "&": "&amp;",
 }
 
+FORMAT_XML = "xml"
+FORMAT_CSV = "csv"
+
+CONTENT_TYPES = {
+    FORMAT_XML: "text/xml",
+    FORMAT_CSV: "text/csv",
+}
+
+SAMPLE_XML = "<sample><name>%s</name><value>%s</value><unit>%s</unit>" \
+             "<timestamp>%s</timestamp></sample>"
+COMPACT_SAMPLE_XML = "<sample name=\"%s\" value=\"%s\" unit=\"%s\" " \
+                     "timestamp=\"%s\" />"
+
 # exception classes
 
 # interface functions
@@ -99,6 +113,10 @@ class iDigi_DB(PresentationBase, threading.Thread):
          # compact_xml: (when set to True) will produce output XML with the
          #     information stored as attributes to the sample node instead of
          #     separately tagged, resulting in smaller XML output.
+         # format: "xml" or "csv", the format of the uploaded files.
+         # buffer_size: the number of samples kept per channel between
+         #     uploads.  Once a channel's buffer is full its oldest samples
+         #     are dropped.
 
         settings_list = [
            Setting(
@@ -128,11 +146,31 @@ class iDigi_DB(PresentationBase, threading.Thread):
            Setting(
               name='compact_xml', type=bool, required=False,
               default_value=False),
+           Setting(
+              name='format', type=str, required=False,
+              default_value=FORMAT_XML),
+           Setting(
+              name='buffer_size', type=int, required=False,
+              default_value=100),
         ]
 
         PresentationBase.__init__(self, name=name,
                                    settings_list=settings_list)
         self.__stopevent = threading.Event()
+
+        # Samples received since the last upload, channel name -> deque
+        # of samples, oldest first:
+        self.__history = {}
+        self.__history_lock = threading.Lock()
+        self.__sample_count = 0
+        self.__dropped = 0
+
+        # Set to wake the upload thread: by receive() when the sample
+        # threshold is met, by the scheduler when the interval expires
+        # and by stop():
+        self.__upload_event = threading.Event()
+        self.__interval_handle = None
+
         threading.Thread.__init__(self, name=name)
         threading.Thread.setDaemon(self, True)
 
@@ -149,26 +187,18 @@ class iDigi_DB(PresentationBase, threading.Thread):
         # Start by appending 1 to filename of pushed data
         self.__current_file_number = 1
 
-        # Event to use for notification of meeting the sample threshold
-        self.__threshold_event = threading.Event()
-
-        # Count of samples since last data push
-        self.__sample_count = 0
-
         # Here we grab the channel publisher
         channels = SettingsBase.get_setting(self, "channels")
         cm = self.__core.get_service("channel_manager")
         cp = cm.channel_publisher_get()
 
-        # And subscribe to receive notification about new samples
-        # as long as sample_threshold is not 0
-        sample_threshold = SettingsBase.get_setting(self, "sample_threshold")
-        if sample_threshold:
-            if len(channels) > 0:
-                for channel in channels:
-                    cp.subscribe(channel, self.receive)
-            else:
-                cp.subscribe_to_all(self.receive)
+        # And subscribe to receive every new sample, they are buffered
+        # until the next upload
+        if len(channels) > 0:
+            for channel in channels:
+                cp.subscribe(channel, self.receive)
+        else:
+            cp.subscribe_to_all(self.receive)
 
         threading.Thread.start(self)
         self.apply_settings()
@@ -177,6 +207,7 @@ class iDigi_DB(PresentationBase, threading.Thread):
 
     def stop(self):
         self.__stopevent.set()
+        self.__upload_event.set()
         return True
 
     def apply_settings(self):
@@ -190,151 +221,168 @@ class iDigi_DB(PresentationBase, threading.Thread):
                                 rejected, not_found)
             return (accepted, rejected, not_found)
 
+        if accepted.get('format', FORMAT_XML) not in CONTENT_TYPES:
+            rejected['format'] = accepted['format']
+            del accepted['format']
+            self.__tracer.error("format must be one of %s",
+                                ", ".join(CONTENT_TYPES.keys()))
+            return (accepted, rejected, not_found)
+
         SettingsBase.commit_settings(self, accepted)
         return (accepted, rejected, not_found)
 
     def receive(self, channel):
-        # Check how many samples it takes to meet the sample threshold
-        sample_threshold = SettingsBase.get_setting(self, "sample_threshold")
-        self.__sample_count += 1
-        # self.__tracer.info("idigi_db (%s): Received sample %i", \
-        #       self.__name, self.__sample_count)
+        sample = channel.get()
+        channel_name = channel.name()
+        buffer_size = SettingsBase.get_setting(self, "buffer_size")
 
-        # If we have exceeded the sample threshold, notify the thread
-        # responsible for pushing up data
-        if self.__sample_count >= sample_threshold:
+        self.__history_lock.acquire()
+        try:
+            samples = self.__history.get(channel_name)
+            if samples is None:
+                samples = self.__history[channel_name] = deque()
+            samples.append(sample)
+            if len(samples) > buffer_size:
+                samples.popleft()
+                self.__dropped += 1
+            self.__sample_count += 1
+            sample_count = self.__sample_count
+        finally:
+            self.__history_lock.release()
+
+        # If we have met the sample threshold, wake the thread responsible
+        # for pushing up data
+        sample_threshold = SettingsBase.get_setting(self, "sample_threshold")
+        if sample_threshold and sample_count == sample_threshold:
             self.__tracer.info("Reached threshold of %i, setting event flag",
                                sample_threshold)
-            self.__sample_count = 0
-            self.__threshold_event.set()
+            self.__upload_event.set()
 
     def run(self):
 
         interval = SettingsBase.get_setting(self, "initial_upload")
         if interval is None:
             interval = SettingsBase.get_setting(self, "interval")
-        self.__last_upload_clock = 0
-        self.__last_upload_time = 0
+        self.__first_upload = True
+        self.__schedule_upload(interval)
         while not self.__stopevent.isSet():
+            self.__upload_event.wait()
+            self.__upload_event.clear()
+            if self.__stopevent.isSet():
+                break
             try:
-                # 32 bit modulo math to account for an NDS bug :-(
-                now = int(time.clock()) & 0xffffffff
-                time_passed = (now - self.__last_upload_clock) & 0xffffffff
-                interval_met = (interval > 0 and
-                                time_passed > interval)
-                threshold_met = self.__threshold_event.isSet()
-                if interval_met:
-                    interval = SettingsBase.get_setting(self, "interval")
-                    self.__sample_count = 0
-                    self.__threshold_event.clear()
-                    self.__upload_data()
-                elif threshold_met:
-                    interval = SettingsBase.get_setting(self, "interval")
-                    self.__threshold_event.clear()
-                    self.__upload_data()
-                time.sleep(1)
+                self.__upload_data()
             except Exception, e:
                 self.__tracer.error("exception while uploading: %s", str(e))
+            self.__schedule_upload(SettingsBase.get_setting(self, "interval"))
 
         self.__tracer.warning("Out of run loop.  Shutting down...")
+        self.__schedule_upload(0)
 
         # Clean up channel registration
         cm = self.__core.get_service("channel_manager")
         cp = cm.channel_publisher_get()
         cp.unsubscribe_from_all(self.receive)
 
+    def __schedule_upload(self, delay):
+        # (Re)start the interval timer; a delay of 0 disables it
+        sched = self.__core.get_service("scheduler")
+        if self.__interval_handle is not None:
+            try:
+                sched.cancel(self.__interval_handle)
+            except ValueError:
+                # the timer has already gone off
+                pass
+            self.__interval_handle = None
+        if delay > 0:
+            self.__interval_handle = sched.schedule_after(delay,
+                                                self.__upload_event.set)
+
     def __upload_data(self):
 
-        xml = cStringIO.StringIO()
+        self.__history_lock.acquire()
+        try:
+            history = self.__history
+            dropped = self.__dropped
+            self.__history = {}
+            self.__sample_count = 0
+            self.__dropped = 0
+        finally:
+            self.__history_lock.release()
+
+        if dropped:
+            self.__tracer.warning("%d samples dropped since the last upload, "
+                                  "buffer_size is too small", dropped)
+
+        if self.__first_upload:
+            # the first upload also carries the present value of channels
+            # that have not changed since Dia started
+            self.__first_upload = False
+            self.__add_current_values(history)
 
-        xml.write("<?xml version=\"1.0\"?>")
-        compact_xml = SettingsBase.get_setting(self, "compact_xml")
-        if compact_xml:
-            xml.write("<idigi_data compact=\"True\">")
+        if not history:
+            self.__tracer.debug("No new Sample data to send to iDigi")
+            return
+
+        out = cStringIO.StringIO()
+        format = SettingsBase.get_setting(self, "format")
+        if format == FORMAT_CSV:
+            writer = _CSVWriter(out)
+        else:
+            writer = _XMLWriter(out,
+                                SettingsBase.get_setting(self, "compact_xml"))
+        writer.start()
+        sample_count = 0
+        channel_names = history.keys()
+        channel_names.sort()
+        for channel_name in channel_names:
+            for sample in history[channel_name]:
+                writer.write_sample(channel_name, sample)
+                sample_count += 1
+        writer.finish()
+
+        self.__tracer.debug("Starting upload of %d samples to iDigi",
+                            sample_count)
+        success = self.__send_to_idigi(out.getvalue(), format)
+        if success == True:
+            self.__tracer.debug("Finished upload to iDigi")
         else:
-            xml.write("<idigi_data>")
+            self.__tracer.debug("Upload failed to iDigi")
+        out.close()
+
+    def __add_current_values(self, history):
 
         cm = self.__core.get_service("channel_manager")
         cdb = cm.channel_database_get()
 
         channel_list = SettingsBase.get_setting(self, "channels")
+        snapshot = cdb.snapshot()
         if len(channel_list) == 0:
-            channel_list = cdb.channel_list()
-
-        new_sample_count = 0
+            channel_list = snapshot.channel_list()
 
         for channel_name in channel_list:
-            try:
-                channel = cdb.channel_get(channel_name)
-                sample = channel.get()
-                if sample.timestamp >= self.__last_upload_time:
-                    self.__tracer.debug("Channel %s was updated since last " +
-                           "push", channel_name)
-                    new_sample_count += 1
-                    compact_xml = SettingsBase.get_setting(self, "compact_xml")
-                    if compact_xml:
-                        xml.write(self.__make_compact_xml(channel_name, sample))
-                    else:
-                        xml.write(self.__make_xml(channel_name, sample))
-                else:
-                    self.__tracer.debug("Channel %s was not updated since " +
-                          "last push", channel_name)
-            except Exception, e:
+            if channel_name in history:
+                continue
+            entry = snapshot.get(channel_name)
+            if entry is None or entry.sample is None:
                 # Failed to retrieve the data
-                self.__tracer.error("Exception in getting sample data: %s",
-                                    str(e))
+                self.__tracer.error("Unable to get sample data of '%s'",
+                                    channel_name)
+                continue
+            history[channel_name] = [ entry.sample ]
 
-        xml.write("</idigi_data>")
-
-        if new_sample_count > 0:
-            self.__tracer.debug("Starting upload to iDigi")
-            # Due to an NDS issue, clock may roll over, we'll just
-            # keep track modulo 32-bit to allow for that.
-            self.__last_upload_clock = int(time.clock()) & 0xffffffff
-            self.__last_upload_time = time.time()
-
-            success = self.__send_to_idigi(xml.getvalue())
-            if success == True:
-                self.__tracer.debug("Finished upload to iDigi")
-            else:
-                self.__tracer.debug("Upload failed to iDigi")
-        else:
-            self.__tracer.debug("No new Sample data to send to iDigi")
-
-        xml.close()
-
-    def __make_xml(self, channel_name, sample):
-
-        data = "<sample>"
-        data += "<name>%s</name>"
-        data += "<value>%s</value>"
-        data += "<unit>%s</unit>"
-        data += "<timestamp>%s</timestamp>"
-        data += "</sample>"
-
-        return data % (channel_name, self.__escape_entities(sample.value),
-                       sample.unit, iso_date(sample.timestamp))
-
-
-    def __make_compact_xml(self, channel_name, sample):
-
-        data = "<sample name=\"%s\" value=\"%s\" unit=\"%s\" timestamp=\"%s\" />"
-
-        return data % (channel_name, self.__escape_entities(sample.value),
-                       sample.unit, iso_date(sample.timestamp))
-
-
-    def __send_to_idigi(self, data):
+    def __send_to_idigi(self, data, format):
 
         success = False
         filename = SettingsBase.get_setting(self, "filename")
-        filename = filename + "%i.xml" % self.__current_file_number
+        filename = filename + "%i.%s" % (self.__current_file_number, format)
         collection = SettingsBase.get_setting(self, "collection")
         secure = SettingsBase.get_setting(self, "secure")
         try:
             self.__tracer.debug("Attempting to upload %s to iDigi", filename)
-            success, err, errmsg = idigi_data.send_idigi_data(data, filename,
-                                                           collection, secure)
+            success, err, errmsg = idigi_data.send_idigi_data_with_type(data,
+                                filename, collection, CONTENT_TYPES[format],
+                                secure)
             if success == True:
                 self.__tracer.debug("Successfully uploaded %s to iDigi",
                                     filename)
@@ -355,11 +403,71 @@ class iDigi_DB(PresentationBase, threading.Thread):
 
         return success
 
-    def __escape_entities(self, sample_value):
 
-        if not isinstance(sample_value, str):
-            return sample_value
-        for ch in ENTITY_MAP:
-            sample_value = sample_value.replace(ch, ENTITY_MAP[ch])
 
+# internal functions & classes
+class _XMLWriter:
+    """\
+    Writes samples to a file-like object as an idigi_data XML document.
+    """
+
+    def __init__(self, out, compact):
+        self.__write = out.write
+        self.__compact = compact
+
+    def start(self):
+        self.__write("<?xml version=\"1.0\"?>")
+        if self.__compact:
+            self.__write("<idigi_data compact=\"True\">")
+        else:
+            self.__write("<idigi_data>")
+
+    def write_sample(self, channel_name, sample):
+        if self.__compact:
+            fmt = COMPACT_SAMPLE_XML
+        else:
+            fmt = SAMPLE_XML
+        self.__write(fmt % (channel_name, _escape_entities(sample.value),
+                            sample.unit, iso_date(sample.timestamp)))
+
+    def finish(self):
+        self.__write("</idigi_data>")
+
+
+class _CSVWriter:
+    """\
+    Writes samples to a file-like object as CSV, one row per sample.
+    """
+
+    def __init__(self, out):
+        self.__write = out.write
+
+    def start(self):
+        self.__write("name,value,unit,timestamp\r\n")
+
+    def write_sample(self, channel_name, sample):
+        self.__write("%s,%s,%s,%s\r\n" % (_csv_field(channel_name),
+                                          _csv_field(sample.value),
+                                          _csv_field(sample.unit),
+                                          iso_date(sample.timestamp)))
+
+    def finish(self):
+        pass
+
+
+def _escape_entities(sample_value):
+
+    if not isinstance(sample_value, str):
         return sample_value
+    for ch in ENTITY_MAP:
+        sample_value = sample_value.replace(ch, ENTITY_MAP[ch])
+
+    return sample_value
+
+def _csv_field(value):
+
+    value = str(value)
+    for ch in ",\"\r\n":
+        if ch in value:
+            return "\"%s\"" % value.replace("\"", "\"\"")
+    return value
@@ -945,6 +945,47 @@ class RCIHandler(PresentationBase):
 
     def __generate_channel_database(self, cdb):
 
+        if hasattr(cdb, 'snapshot'):
+            devices = self.__snapshot_devices(cdb.snapshot())
+        else:
+            devices = self.__channel_devices(cdb)
+
+        device_string = StringIO()
+
+        for device, channels in devices:
+            device_string.write('<device name="%s">' % device)
+            for channel in channels:
+                value = self.__escape_entities(channel[1])
+                device_string.write('<channel name="%s" value="%s"'
+                    ' units="%s" timestamp="%s"'
+                    ' type="%s"/>' % (channel[0], value, channel[2],
+                                        channel[3], channel[4]))
+            device_string.write('</device>')
+
+        return device_string.getvalue()
+
+    def __snapshot_devices(self, snapshot):
+        # [(device, [channel tuple, ...]), ...] of a channel database
+        # snapshot.
+        devices = []
+        for device, entries in snapshot.devices():
+            channels = []
+            for entry in entries:
+                if entry.dumpable():
+                    sample = entry.sample
+                    channels.append((entry.channel,
+                                     sample.value,
+                                     sample.unit,
+                                     time.asctime(
+                                         time.localtime(sample.timestamp)),
+                                     str(entry.type.__name__)))
+                else:
+                    channels.append((entry.channel, "(N/A)", "", "", ""))
+            devices.append((device, channels))
+        return devices
+
+    def __channel_devices(self, cdb):
+        # The same for a database without snapshots, e.g. a logger's.
         channel_list = cdb.channel_list()
         channel_list.sort()
 
@@ -972,16 +1013,4 @@ class RCIHandler(PresentationBase):
             except Exception, e:
                 devices[device].append((channel_name, "(N/A)", "", "", ""))
 
-        device_string = StringIO()
-
-        for device in devices.keys():
-            device_string.write('<device name="%s">' % device)
-            for channel in devices[device]:
-                value = self.__escape_entities(channel[1])
-                device_string.write('<channel name="%s" value="%s"'
-                    ' units="%s" timestamp="%s"'
-                    ' type="%s"/>' % (channel[0], value, channel[2],
-                                        channel[3], channel[4]))
-            device_string.write('</device>')
-
-        return device_string.getvalue()
+        return devices.items()
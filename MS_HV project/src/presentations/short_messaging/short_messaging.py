@@ -80,12 +80,21 @@ This presentation allows for the iDigi Dia to send short messages about
 channel updates and channel alarms over certain transports like
 iDigi SMS and regular SMS.
 
+An alarm 'condition' is a Python expression in which %c stands for the
+value of the channel.  Inside a string literal, %c stands for the value
+converted with str(), e.g. "'%c' == 'open'".  The condition is compiled
+once, when the settings are applied, and may only use the names in
+ALARM_CONDITION_NAMES.
+
 """
 
 # imports
 import time
 import copy
 import threading
+import types
+import tokenize
+from StringIO import StringIO
 
 from settings.settings_base import SettingsBase, Setting
 from presentations.presentation_base import PresentationBase
@@ -93,14 +102,54 @@ from presentations.presentation_base import PresentationBase
 from presentations.short_messaging.clients.idigi import iDigiClient
 from presentations.short_messaging.clients.enduser import EnduserClient
 from presentations.short_messaging.transports.sms import SMSTransportManager
-from common.utils import wild_match
+from channels.channel_publisher import pattern_match
 from common.shutdown import SHUTDOWN_WAIT
 
 # constants
 
+# The names an alarm condition may use besides %c:
+ALARM_CONDITION_NAMES = {
+    'True': True, 'False': False, 'None': None,
+    'abs': abs, 'min': min, 'max': max, 'round': round,
+    'int': int, 'float': float, 'str': str, 'len': len,
+}
+
+# The name %c is replaced with in a compiled alarm condition:
+ALARM_VALUE_NAME = '_value_'
+
 # exception classes
 
 # interface functions
+def compile_alarm_condition(condition):
+    """\
+        Compile an alarm condition string, e.g. "%c <= 10.0 or %c > 30.0",
+        into a function of the channel value returning a true value when
+        the alarm condition is met.
+
+        Raises ValueError if the condition is not a valid expression, or
+        uses names, attributes or function definitions it may not.
+    """
+    try:
+        expression = _substitute_alarm_value(condition)
+        code = compile(expression, '<alarm condition>', 'eval')
+    except (SyntaxError, tokenize.TokenError), e:
+        raise ValueError, "invalid alarm condition '%s': %s" % (condition, e)
+
+    # co_names holds every global and attribute name the expression
+    # uses; nested code objects would be lambdas or generators.
+    for name in code.co_names:
+        if name != ALARM_VALUE_NAME and name not in ALARM_CONDITION_NAMES:
+            raise ValueError, "alarm condition '%s' may not use '%s'" % \
+                  (condition, name)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            raise ValueError, "alarm condition '%s' may not define " \
+                  "functions" % condition
+
+    namespace = dict(ALARM_CONDITION_NAMES)
+    namespace['__builtins__'] = {}
+    return eval('lambda %s: (%s)' % (ALARM_VALUE_NAME, expression),
+                namespace)
 
 # classes
 class ShortMessaging(PresentationBase, threading.Thread):
@@ -133,12 +182,17 @@ class ShortMessaging(PresentationBase, threading.Thread):
         # Our dictionary of Transport Managers.
         self.__transport_managers = {}
 
-        # Our cached list of clients.
+        # Our cached list of clients, and the same by name.
         self.client_list = []
+        self.__clients_by_name = {}
+
+        # The updates and alarms settings entries, with their alarm
+        # conditions compiled, see apply_settings().
+        self.__filter_definitions = []
 
-        # The list of Dia channels that have matched our filters and so we have
-        # subscribed to getting channel updates from Dia as they come in.
-        self.__channels_being_watched = []
+        # The Dia channels that have matched our filters, keyed by channel
+        # name.  Entries are added as the first sample of a channel arrives.
+        self.__channels_being_watched = {}
 
         # The following list will contain a list of messages that should
         # be sent out at the next interval time.
@@ -195,7 +249,17 @@ class ShortMessaging(PresentationBase, threading.Thread):
             del accepted['alarms']
             return (accepted, rejected, not_found)
 
+        try:
+            filter_definitions = self.__compile_filters(updates_list,
+                                                        alarms_list)
+        except ValueError, e:
+            self.__tracer.error("%s", str(e))
+            rejected['alarms'] = accepted['alarms']
+            del accepted['alarms']
+            return (accepted, rejected, not_found)
+
         SettingsBase.commit_settings(self, accepted)
+        self.__filter_definitions = filter_definitions
         return (accepted, rejected, not_found)
 
 
@@ -206,7 +270,6 @@ class ShortMessaging(PresentationBase, threading.Thread):
         """
         cm = self.__core.get_service("channel_manager")
         cp = cm.channel_publisher_get()
-        cdb = cm.channel_database_get()
 
         # Get our SMS Settings values.
         #
@@ -237,6 +300,8 @@ class ShortMessaging(PresentationBase, threading.Thread):
             client_list = []
 
         self.client_list = self.__allocate_clients(client_list)
+        for client in self.client_list:
+            self.__clients_by_name[client.name()] = client
 
         # Tell each client to announce that we are running.
         # This allows each client to send notification out (if desired)
@@ -244,21 +309,10 @@ class ShortMessaging(PresentationBase, threading.Thread):
         for client in self.client_list:
             client.announce_device()
 
-        # We want to register for all new channels that might be added
-        # during the Dia runtime.
-        cp.subscribe_new_channels(self.new_channel_added)
-
-        # Get a listing of all current Dia channels already in existence,
-        # and walk through each of them.
-        # If they match any of our filters, subscribe to receive notification
-        # about new samples as they arrive on the channel.
-        current_dia_channels = cdb.channel_list()
-        for channel in current_dia_channels:
-            filters = self.__match_filter(channel)
-            if filters != None and len(filters) > 0:
-                cp.subscribe(channel, self.receive)
-                data = dict(channel = channel, filters = filters)
-                self.__add_new_channel_to_channels_being_watched(data)
+        # Subscribe to the samples of all channels matching one of our
+        # filters, including channels added later during the Dia runtime.
+        for pattern in self.__filter_patterns():
+            cp.subscribe_pattern(pattern, self.receive)
         threading.Thread.start(self)
         return True
 
@@ -275,9 +329,11 @@ class ShortMessaging(PresentationBase, threading.Thread):
         # Create a shorthand list of our stored clients, along with any
         # stored messages we want to send to each client.
         client_message_list = []
+        client_messages = {}
         for client in self.client_list:
             e = dict(name = client.name(), client = client, message_list = [])
             client_message_list.append(e)
+            client_messages[e['name']] = e
 
         wait_time = SHUTDOWN_WAIT
         while not self.__stopevent.isSet():
@@ -296,7 +352,7 @@ class ShortMessaging(PresentationBase, threading.Thread):
 
                 #self.__tracer.info("ShortMessaging: Len of Watched List: %d", \
                 #       len(self.__channels_being_watched))
-                #for entry in self.__channels_being_watched:
+                #for entry in self.__channels_being_watched.itervalues():
                 #    for filter in entry['filters']:
                 #        self.__print_statistics(entry['channel'], filter)
 
@@ -320,10 +376,8 @@ class ShortMessaging(PresentationBase, threading.Thread):
                         for message in messages:
 
                             # Find the correct client entry.
-                            for client in client_message_list:
-                                if message['client'] == client['name']:
-                                    break
-                            else:
+                            client = client_messages.get(message['client'])
+                            if client is None:
                                 self.__tracer.warning("Run: Unable to find " \
                                       "Client in Client List")
                                 continue
@@ -357,30 +411,59 @@ class ShortMessaging(PresentationBase, threading.Thread):
                 self.__tracer.error("exception while uploading: %s", str(e))
 
 
-    def new_channel_added(self, channel):
+    def __watch_channel(self, channel):
         """\
-            Called whenever there is a new channel added into Dia.
+            Add a channel to the channels being watched, along with the
+            filters it matches.  Returns the new entry.
 
             Keyword arguments:
 
-            channel -- the channel name that Dia just added.
+            channel -- the name of the channel.
+        """
+        self.__tracer.info("Watching channel %s", channel)
+        data = dict(channel = channel, filters = self.__match_filter(channel))
+        return self.__channels_being_watched.setdefault(channel, data)
+
+
+    def __filter_patterns(self):
+        """\
+            Returns the list of distinct channel name patterns used by our
+            updates and alarms filters.
         """
-        filters = self.__match_filter(channel)
-        if filters != None and len(filters) > 0:
-            self.__tracer.info("Adding subscription to new channel %s", channel)
+        patterns = []
+        for definition in self.__filter_definitions:
+            if definition['filter'] not in patterns:
+                patterns.append(definition['filter'])
 
-            cm = self.__core.get_service("channel_manager")
-            cp = cm.channel_publisher_get()
-            cp.subscribe(channel, self.receive)
-            data = dict(channel = channel, filters = filters)
-            self.__add_new_channel_to_channels_being_watched(data)
+        return patterns
 
 
-    def __add_new_channel_to_channels_being_watched(self, data):
+    def __compile_filters(self, updates_list, alarms_list):
         """\
-            Add a new channel to our list of channels that are being watched.
+            Returns the list of filter definitions of our updates and
+            alarms settings entries, with their alarm conditions compiled.
+            Raises ValueError if a condition cannot be compiled.
         """
-        self.__channels_being_watched.append(data)
+        definitions = []
+        for update_type, entry_list in [ ("updates", updates_list),
+                                         ("alarms", alarms_list) ]:
+            for entry in entry_list:
+                if 'settings' not in entry or entry['settings'] == None:
+                    continue
+
+                settings = entry['settings']
+                if not settings.get('filter'):
+                    continue
+
+                check = None
+                if update_type == "alarms":
+                    check = compile_alarm_condition(settings['condition'])
+                definitions.append(dict(type     = update_type,
+                                        filter   = settings['filter'],
+                                        settings = settings,
+                                        check    = check))
+
+        return definitions
 
 
     def receive(self, channel):
@@ -392,7 +475,10 @@ class ShortMessaging(PresentationBase, threading.Thread):
             channel -- the channel with the new sample
         """
         #self.__tracer.info("ShortMessaging: Received new sample on channel %s", channel.name())
-        self.__match_filter_and_send_message(channel)
+        entry = self.__channels_being_watched.get(channel.name())
+        if entry is None:
+            entry = self.__watch_channel(channel.name())
+        self.__send_message_based_on_filter_entry(channel, entry)
 
 
     def __match_filter(self, channel):
@@ -404,79 +490,58 @@ class ShortMessaging(PresentationBase, threading.Thread):
         current_time = time.time()
 
         filters = []
-        for update_type in [ "updates", "alarms" ]:
-
-            # Get our updates and alarms list.
-            #
-            # Because of the way Dia requires defining a list in its
-            # configuration file, the get_setting() call below will first
-            # return this value in a dictionary with the actual updates and
-            # alarms list stored under the key name of 'instance_list'.
-            entry_list = SettingsBase.get_setting(self, update_type)
-
-            # It's possible the user doesn't have any of the given type set up.
-            # This is fine, and we should just continue to the next type.
-            if len(entry_list) == 0:
-                continue
+        for definition in self.__filter_definitions:
 
-            try:
-                entry_list = entry_list['instance_list']
-            except Exception, e:
-                self.__tracer.error("Exception trying to get instance_list: %s", \
-                       str(e))
+            # If this filter matches something we care about,
+            # add it to our list.
+            if not pattern_match(definition['filter'], channel):
                 continue
 
-            for entry in entry_list:
+            update_type = definition['type']
+            settings = definition['settings']
+            self.__tracer.info("Match (%s) Filter of %s and Dia channel name of %s", \
+                        update_type, settings['filter'], channel)
 
-                if 'settings' not in entry or entry['settings'] == None:
+            # Look up the clients now, rather than for every sample.
+            clients = []
+            for send_to_client in settings['clients']:
+                client = self.__clients_by_name.get(send_to_client)
+                if client == None:
+                    self.__tracer.warning("Unable to find Client in Client List")
                     continue
-
-                settings = entry['settings']
-                if 'filter' in settings:
-
-                    # If this filter matches something we care about,
-                    # add it to our list.
-                    if wild_match(settings['filter'], channel) == True:
-                        self.__tracer.info("Match (%s) Filter of %s and Dia channel name of %s", \
-                                    update_type, settings['filter'], channel)
-                        if update_type == "updates":
-                            data = dict(type           = update_type,
-                                        filter         = settings['filter'],
-                                        clients        = settings['clients'],
-                                        interval       = settings['interval'],
-                                        condition      = None,
-                                        synched        = False,
-                                        total_sent     = 0,
-                                        last_sent      = current_time)
-                        else:
-                            data = dict(type           = update_type,
-                                        filter         = settings['filter'],
-                                        clients        = settings['clients'],
-                                        interval       = 0,
-                                        condition      = settings['condition'],
-                                        synched        = False,
-                                        total_sent     = 0,
-                                        last_sent       = 0.0)
-
-                        filters.append(data)
+                if not isinstance(client, iDigiClient) and \
+                   not isinstance(client, EnduserClient):
+                    raise Exception, "Unknown Client Type"
+                clients.append(client)
+
+            if update_type == "updates":
+                data = dict(type           = update_type,
+                            filter         = settings['filter'],
+                            clients        = settings['clients'],
+                            client_objects = clients,
+                            interval       = settings['interval'],
+                            condition      = None,
+                            check          = None,
+                            synched        = False,
+                            total_sent     = 0,
+                            last_sent      = current_time)
+            else:
+                data = dict(type           = update_type,
+                            filter         = settings['filter'],
+                            clients        = settings['clients'],
+                            client_objects = clients,
+                            interval       = 0,
+                            condition      = settings['condition'],
+                            check          = definition['check'],
+                            synched        = False,
+                            total_sent     = 0,
+                            last_sent       = 0.0)
+
+            filters.append(data)
 
         return filters
 
 
-    def __match_filter_and_send_message(self, channel):
-        """\
-            This function will determine if the supply channel is one that
-            we are watching, and if so, it will initiate sending
-            notifications as needed.
-        """
-
-        for entry in self.__channels_being_watched:
-
-            # If the channel matches, walk through each filter we have stored.
-            if channel.name() == entry['channel']:
-                self.__send_message_based_on_filter_entry(channel, entry)
-
-
     def __send_message_based_on_filter_entry(self, channel, entry):
         """\
             This function will determine if the supplied channel is one that
@@ -485,60 +550,37 @@ class ShortMessaging(PresentationBase, threading.Thread):
         """
         for filter in entry['filters']:
 
-            message_list = []
-
-            for send_to_client in filter['clients']:
-                message = ""
-                client = None
-
-                # Find the correct client entry.
-                for client in self.client_list:
-                    if send_to_client == client.name():
-                        break
-                else:
-                    continue
-
-                if client == None:
-                    self.__tracer.warning("Unable to find Client in Client List")
-                    continue
-
-                if isinstance(client, iDigiClient) or \
-                   isinstance(client, EnduserClient):
-
-                    # If this type is an alarm, we should create a new
-                    # message, and then send it out as soon as possible.
-                    if filter['type'] == "alarms":
-
-                        # Check to see if the condition has been met...
-                        try:
-                            ret = self.__check_for_alarm_condition(channel,
-                                                         filter['condition'])
-                            if ret == True:
-                                tmp_message_list = []
-                                tmp_message = client.create_alarm_message(channel)
-                                tmp_message_list.append(tmp_message)
-                                ret = client.send_message(tmp_message_list)
-                        except Exception, e:
-                            self.__tracer.error("Exception during Alarm condition check: %s", 
-                                    str(e))
-                            
-                    # If the type of filter is an update, we should create
-                    # a new message, and then add it to our coalesce list.
-                    if filter['type'] == "updates":
-                        message = client.create_update_message(channel)
-                        d = dict(client = send_to_client, message = message)
-                        message_list.append(d)
-                
-                else:
-                    raise Exception, "Unknown Client Type"
-                  
-            # If there were any messages stored in our message_list,
-            # these are "update" messages, and should be added to the
-            # coalesce list.
-            if len(message_list):
-                d = dict(channel = channel.name(), filter = filter,
-                         messages = message_list)
-                self.__add_to_coalesce_list(d)
+            # If this type is an alarm, we should create a new
+            # message for each client, and then send it out as soon
+            # as possible.
+            if filter['type'] == "alarms":
+
+                # Check to see if the condition has been met...
+                try:
+                    if filter['check'](channel.get().value):
+                        for client in filter['client_objects']:
+                            tmp_message = client.create_alarm_message(channel)
+                            client.send_message([ tmp_message ])
+                except Exception, e:
+                    self.__tracer.error("Exception during Alarm condition check: %s", 
+                            str(e))
+
+            # If the type of filter is an update, we should create
+            # a new message, and then add it to our coalesce list.
+            elif filter['type'] == "updates":
+                message_list = []
+                for client in filter['client_objects']:
+                    message = client.create_update_message(channel)
+                    d = dict(client = client.name(), message = message)
+                    message_list.append(d)
+
+                # If there were any messages stored in our message_list,
+                # these are "update" messages, and should be added to the
+                # coalesce list.
+                if len(message_list):
+                    d = dict(channel = channel.name(), filter = filter,
+                             messages = message_list)
+                    self.__add_to_coalesce_list(d)
 
 
     def __add_to_coalesce_list(self, data):
@@ -609,47 +651,6 @@ class ShortMessaging(PresentationBase, threading.Thread):
         self.__coalesce_list.append(data)
 
 
-    def __check_for_alarm_condition(self, channel, condition):
-        """\
-            Given a channel structure and a condition string,
-            decide whether an alarm condition has been triggerd.
-            Returns True of False
-        """
-        condition_string = ""
-        escape = False
-        for i in condition:
-            if escape == True and i == 'c':
-                condition_string += str(channel.get().value)
-                escape = False
-            elif i == '%':
-                # If we are already in escaped mode, then the previous
-                # escape was not used.
-                # Reinsert the previous escape into the stream, and keep
-                # ourselves in escape mode for the next character.
-                if escape == True:
-                    condition_string += '%'
-                escape = True
-            else:
-                # If we are in escaped mode, and we get an escape
-                # character that we don't recognize, make sure
-                # we put back the escape character into our stream.
-                if escape == True:
-                    escape = False
-                    condition_string += '%'
-                condition_string += i
-
-        # If user had the last character as an escape character,
-        # then we should reinsert said escape character into the
-        # stream, as it is unused for our parsing.
-        if escape == True:
-            condition_string += '%'
-
-        #self.__tracer.info("ShortMessaging: condition: ", condition_string)
-        value = eval(condition_string)
-        #self.__tracer.info("ShortMessaging: result: ", value)
-        return value
-
-
     def __print_statistics(self, channel, filter):
         """\
             Print SMS and Satellite Statistics.
@@ -893,3 +894,31 @@ class ShortMessaging(PresentationBase, threading.Thread):
                     return False
         
         return True
+
+
+# internal functions & classes
+def _substitute_alarm_value(condition):
+    """\
+        Returns the alarm condition with each %c replaced by
+        ALARM_VALUE_NAME, and each string literal holding %c replaced
+        by the concatenation of its parts and str(ALARM_VALUE_NAME),
+        as if the value were pasted into the text of the condition.
+    """
+    tokens = [] # (text, end) pairs
+    for token in tokenize.generate_tokens(StringIO(condition).readline):
+        tok_type, tok_string, start, end = token[:4]
+        if tok_type in (tokenize.COMMENT, tokenize.NL, tokenize.NEWLINE,
+                        tokenize.ENDMARKER):
+            continue
+        if (tok_type == tokenize.NAME and tok_string == 'c' and tokens and
+            tokens[-1] == ('%', start)):
+            # "%c": OP '%' ending where NAME 'c' starts
+            tokens[-1] = (ALARM_VALUE_NAME, end)
+        elif tok_type == tokenize.STRING and '%c' in tok_string:
+            parts = eval(tok_string, {'__builtins__': {}}).split('%c')
+            literal = ' + str(%s) + ' % ALARM_VALUE_NAME
+            tokens.append(('(%s)' % literal.join(map(repr, parts)), end))
+        else:
+            tokens.append((tok_string, end))
+    # tokenize.untokenize() is not available before Python 2.5:
+    return ' '.join([ text for text, end in tokens ])
@@ -145,9 +145,10 @@ class TCPCSV(PresentationBase, threading.Thread):
         cm = self.__core.get_service("channel_manager")
         cdb = cm.channel_database_get()
         channel_list = SettingsBase.get_setting(self, "channels")
+        snapshot = cdb.snapshot()
 
         if len(channel_list) == 0:
-            channel_list = cdb.channel_list()
+            channel_list = snapshot.channel_list()
 
         # Each row of the CSV data is given as:
         #     channel_name,timestamp,value,unit``
@@ -156,12 +157,14 @@ class TCPCSV(PresentationBase, threading.Thread):
         
         for channel_name in channel_list:
             try:
-                channel = cdb.channel_get(channel_name)
-                if not channel.perm_mask() & PERM_GET:
+                entry = snapshot.get(channel_name)
+                if entry is None:
+                    raise Exception, "Channel does not exist"
+                elif not entry.perm & PERM_GET:
                     raise Exception, "Does not have GET permission"
-                elif channel.options_mask() & OPT_DONOTDUMPDATA:
+                elif entry.options & OPT_DONOTDUMPDATA:
                     raise Exception, "Do not dump option set on channel"
-                sample = channel.get()
+                sample = entry.sample
                 row_data = (channel_name,
                             time.strftime("%Y-%m-%d %H:%M:%S",
                                     time.gmtime(sample.timestamp)),
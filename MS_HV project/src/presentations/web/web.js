@@ -29,6 +29,10 @@ var NOT_BUSY_BG = 'white';
 // (long_update).  If we get a response, we request again after polling
 // seconds, otherwise we multiply by LONG_UPDATE_SCALE.
 var polling = 0;  // Set by load_table()
+// Token ("<epoch>:<seq>") of the last answer from the server.  Requests
+// pass it back as "since", so that only the channels changed since are
+// sent.
+var seq = "";  // Set by load_table() and apply_get()
 var short_update;
 var LONG_UPDATE_SCALE = 5;
 var long_update;
@@ -181,6 +185,7 @@ function load_table(data) {
    // by the server (in this case) is fairly well sanitized (strings and
    // numbers only).  However, if the server were ever hijacked ....
    var datahash = eval('('+data+')');
+   seq = datahash['seq'];
    if (datahash['settings']['polling']) {
       polling = datahash['settings']['polling'];
    } else {
@@ -290,7 +295,8 @@ function value_keyup(evnt, id) {
 //    device.  Calls auto_update() to send request.
 //
 // auto_update(command, xml_request_handler):
-//    Sends the command as the URL, and uses the xml_request_handler to
+//    Sends the command as the URL, asking for the channels changed since
+//    the last answer only, and uses the xml_request_handler to
 //    wait for the callback.  If polling is enabled, we start (or
 //    continue) with auto updates of the table data.  Uses a callback to
 //    apply_get() to update the table.
@@ -298,6 +304,7 @@ function value_keyup(evnt, id) {
 function apply_get(data) {
    var c;
    datahash = eval('('+data+')');
+   seq = datahash['seq'];
    devices = datahash['devices'];
    for (var d in devices) {
       device = devices[d];
@@ -305,6 +312,10 @@ function apply_get(data) {
       for (c in device['channels']) {
          channel = device['channels'][c];
          name = dname+'.'+channel['name'];
+         if (!$(name+'.set')) {
+            // Channel created after the table was loaded
+            continue;
+         }
          perm = $(name+'.set').value;
          val = $(name+'.value');
          time = $(name+'.time');
@@ -354,7 +365,7 @@ function auto_update(command, request) {
    // If we're here, we can cancel outstanding update requests:
    clearTimeout(short_update);
    clearTimeout(long_update);
-   request.open('GET', command, true);
+   request.open('GET', command+'&since='+escape(seq), true);
    request.onreadystatechange = function() {
       if (request.readyState == 4 && request.status == 200) {
          if (request.responseText) {
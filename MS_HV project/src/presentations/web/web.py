@@ -206,6 +206,8 @@ class Web(PresentationBase, HTTPServer, threading.Thread):
                  ).split('\n')))
         elif path.endswith(page) and args:
             refresh_all = self.handle_args_list(args)
+            if args.has_key('since'):
+                refresh_all += '&since=%s' % args['since']
             return (TextPlain, self.get_table(refresh_all))
         else:
             return None
@@ -263,19 +265,13 @@ class Web(PresentationBase, HTTPServer, threading.Thread):
         table = []
         cm = self.__core.get_service("channel_manager")
         cdb = cm.channel_database_get()
-        channel_list = cdb.channel_list()
-        channel_list.sort()
-        for channel_name in channel_list:
-            sample = { 'channel_name': channel_name }
-            try:
-                channel = cdb.channel_get(channel_name)
-                if channel.options_mask() & OPT_DONOTDUMPDATA:
-                    raise Exception, "honoring do not dump"
-                sample_val = channel.get()
-                sample['timestamp'] = sample_val.timestamp
-                sample['value'] = sample_val.value
-                sample['permission'] = channel.perm_mask()
-            except Exception:
+        for entry in cdb.snapshot():
+            sample = { 'channel_name': entry.name }
+            if entry.dumpable():
+                sample['timestamp'] = entry.sample.timestamp
+                sample['value'] = entry.sample.value
+                sample['permission'] = entry.perm
+            else:
                 sample['timestamp'] = 0
                 sample['value'] = "Not Available"
                 sample['permission'] = 0x0
@@ -288,9 +284,11 @@ class Web(PresentationBase, HTTPServer, threading.Thread):
         return table
 
     def handle_args_list(self, args):
+        retval = ''
         for channel, value in args.items():
-            retval = ''
-            if channel:
+            if channel == 'since':
+                continue
+            elif channel:
                 try:
                     self.set_channel(channel, args[channel])
                 except:
@@ -309,6 +307,7 @@ class Web(PresentationBase, HTTPServer, threading.Thread):
             return ''.join(words)
 
         refresh_all = False
+        since = None
         if args:
             argpairs = [s2 for s1 in args.split('&') for s2 in s1.split(';')]
             argslist = [tuple(kv.split('=')) for kv in argpairs]
@@ -320,7 +319,9 @@ class Web(PresentationBase, HTTPServer, threading.Thread):
                     val = ''
                 else:
                     key, val = "", "kv: len==%d, should be 1 or 2" % len(kv)
-                if key:
+                if key == 'since':
+                    since = unescape(val)
+                elif key:
                     channel = unescape(key)
                     value = unescape(val)
                     self.set_channel(channel, value)
@@ -335,43 +336,32 @@ class Web(PresentationBase, HTTPServer, threading.Thread):
             data_table['settings']['polling'] = 0
         cm = self.__core.get_service("channel_manager")
         cdb = cm.channel_database_get()
-        channel_list = cdb.channel_list()
-        channel_list.sort()
-        old_device = ''
+        if refresh_all:
+            # only changed channels may be sent, but all are refreshed:
+            for entry in cdb.snapshot():
+                if entry.perm & PERM_REFRESH:
+                    self.refresh_channel(entry.name)
+        snapshot = cdb.snapshot(since=since)
+        data_table['seq'] = snapshot.token
         devices = []
         data_table['devices'] = devices
-        for channel_name in channel_list:
-            #sample = { 'channel_name': channel_name }
-            device, name = channel_name.split('.', 1)
-            if device != old_device:
-                old_device = device
-                devices.append({})
-                db,=devices[-1:]
-                db['name'] = device
-                db['channels'] = []
-            try:
-                channel = cdb.channel_get(channel_name)
-                perm = channel.perm_mask()
-                options = channel.options_mask()
-                if (perm & PERM_GET and
-                    not options & OPT_DONOTDUMPDATA):
-                    sample = channel.get()
+        for device, entries in snapshot.devices():
+            db = {'name': device, 'channels': []}
+            devices.append(db)
+            for entry in entries:
+                if entry.dumpable():
+                    sample = entry.sample
                 else:
                     sample = Sample(0, 0)
-                if refresh_all and (perm & PERM_REFRESH):
-                    self.refresh_channel(channel_name)
                 if sample.timestamp > 0:
                     timestr = self.iso_date(sample.timestamp)
                 else:
                     timestr = "None"
-                db['channels'].append({'name':name,
+                db['channels'].append({'name':entry.channel,
                     'value':sample.value,
                     'time':timestr,
-                    'perm':channel.perm_mask(),
+                    'perm':entry.perm,
                     'unit':sample.unit})
-            except Exception:
-                self.__tracer.error("exception on channel_name '%s': %s",
-                                    channel_name, traceback.format_exc())
 
         return json(data_table.__repr__() + '\n')
 
@@ -379,6 +369,8 @@ class Web(PresentationBase, HTTPServer, threading.Thread):
         #
         #    {
         #        'settings': {'polling': 1, ...}, # Other to be defined
+        #        'seq': '4f2a1c3e9d1b:42', # pass back as since= to get
+        #                   # only the channels changed after this answer
         #        'devices': [
         #            {
         #                'name': 'foo_device',
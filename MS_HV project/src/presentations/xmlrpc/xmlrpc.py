@@ -115,7 +115,8 @@ class XMLRPCAPI:
     # channel_get, channel_set, channel_dump, channel_info,
     # channel_refresh, logger_list, logger_set, logger_next,
     # logger_prev, logger_rewind, logger_seek, logger_dump,
-    # logger_channel_get, logger_pos, device_dump, shutdown
+    # logger_channel_get, logger_pos, logger_aggregate, device_dump,
+    # shutdown
 
     # Instance Variables:
     #     __core
@@ -144,12 +145,7 @@ class XMLRPCAPI:
 
     def channel_list(self, startswith=""):
 
-        channel_list = self.__cdb.channel_list()
-        if len(startswith) > 0:
-            channel_list = filter(lambda li: li.startswith(startswith),
-                                  channel_list)
-
-        return channel_list
+        return self.__cdb.snapshot(prefix=startswith).channel_list()
 
     def _marshal_sample(self, sample):
         """
@@ -185,9 +181,18 @@ class XMLRPCAPI:
 
     def __write_channel_database(self, chdb, channel_prefix=""):
 
+        channels = { }
+        if hasattr(chdb, 'snapshot'):
+            for entry in chdb.snapshot(prefix=channel_prefix):
+                sample = entry.sample
+                if sample is None:
+                    sample = Sample(value="(N/A)")
+                channels[entry.name] = self._marshal_sample(sample)
+            return channels
+
+        # a database without snapshots, e.g. a logger's:
         channel_list = filter(lambda c: c.startswith(channel_prefix),
                               chdb.channel_list())
-        channels = { }
         for channel_name in channel_list:
             try:
                 sample = chdb.channel_get(channel_name).get()
@@ -383,6 +388,30 @@ class XMLRPCAPI:
 
         return position
 
+    def logger_aggregate(self, bucket_size, start_time=0, end_time=0,
+                         channel_names=[]):
+        # XML-RPC has no None: an end_time of 0 and an empty list of
+        # channel names select all samples.
+
+        # Check if there is a logger set
+        if self.__logger is None:
+            raise Exception, self.ERR_UNSELECTED_LOGGER
+
+        if not hasattr(self.__logger_cdb, 'log_aggregate'):
+            raise Exception, "Error: Logger does not support aggregation"
+
+        if not end_time:
+            end_time = None
+        if not channel_names:
+            channel_names = None
+        try:
+            return self.__logger_cdb.log_aggregate(bucket_size,
+                                                   start_time=start_time,
+                                                   end_time=end_time,
+                                                   channel_names=channel_names)
+        except Exception, e:
+            raise Exception, "Error: Unable to aggregate: %s" % str(e)
+
     def device_dump(self):
         return get_drivers(self.__core)
 
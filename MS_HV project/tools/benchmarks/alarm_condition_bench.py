@@ -0,0 +1,161 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, Digi International (Digi). All Rights Reserved.       #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice, and the following   #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+
+"""\
+Benchmark of short_messaging alarm checks.
+
+Watches 1000 channels, each matching one alarm filter with three
+clients, and delivers samples to them the way ShortMessaging used to
+(condition string rebuilt and eval()ed for every client, clients found
+by scanning the client list) and the way it does now (condition
+compiled once by compile_alarm_condition(), clients resolved when the
+channel is first watched).  Reports samples checked per second.
+
+To run this, use command line from the project directory:
+    python tools/benchmarks/alarm_condition_bench.py [seconds per case]
+"""
+
+# imports
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'lib'))
+
+from presentations.short_messaging.short_messaging import \
+    compile_alarm_condition
+from samples.sample import Sample
+
+# constants
+DEFAULT_SECONDS = 2.0
+WATCHED_CHANNELS = 1000
+CLIENT_COUNT = 8
+FILTER_CLIENTS = [ "client1", "client4", "client7" ]
+CONDITION = "%c <= 10.0 or %c > 30.0"
+
+# internal functions & classes
+
+class ClientStub:
+    def __init__(self, name):
+        self.__name = name
+
+    def name(self):
+        return self.__name
+
+class ChannelStub:
+    def __init__(self, name, value):
+        self.__name = name
+        self.sample = Sample(0, value)
+
+    def name(self):
+        return self.__name
+
+    def get(self):
+        return self.sample
+
+def legacy_condition(channel, condition):
+    condition_string = ""
+    escape = False
+    for i in condition:
+        if escape == True and i == 'c':
+            condition_string += str(channel.get().value)
+            escape = False
+        elif i == '%':
+            if escape == True:
+                condition_string += '%'
+            escape = True
+        else:
+            if escape == True:
+                escape = False
+                condition_string += '%'
+            condition_string += i
+    if escape == True:
+        condition_string += '%'
+    return eval(condition_string)
+
+def legacy_receive(channel, entry, client_list):
+    alarms = 0
+    for filter in entry['filters']:
+        for send_to_client in filter['clients']:
+            for client in client_list:
+                if send_to_client == client.name():
+                    break
+            else:
+                continue
+            if legacy_condition(channel, filter['condition']) == True:
+                alarms += 1
+    return alarms
+
+def compiled_receive(channel, entry):
+    alarms = 0
+    for filter in entry['filters']:
+        if filter['check'](channel.get().value):
+            alarms += len(filter['client_objects'])
+    return alarms
+
+def bench(receive, seconds):
+    client_list = [ ClientStub("client%d" % i) for i in xrange(CLIENT_COUNT) ]
+    clients_by_name = dict([ (c.name(), c) for c in client_list ])
+    check = compile_alarm_condition(CONDITION)
+
+    channels = []
+    watched = {}
+    for i in xrange(WATCHED_CHANNELS):
+        channel = ChannelStub("massa%d.distance" % i, float(i % 40))
+        channels.append(channel)
+        watched[channel.name()] = dict(filters = [ dict(
+            type = "alarms", condition = CONDITION, check = check,
+            clients = FILTER_CLIENTS,
+            client_objects = [ clients_by_name[name]
+                               for name in FILTER_CLIENTS ]) ])
+
+    count = 0
+    begin = time.time()
+    while time.time() - begin < seconds:
+        for channel in channels:
+            entry = watched[channel.name()]
+            if receive is legacy_receive:
+                receive(channel, entry, client_list)
+            else:
+                receive(channel, entry)
+        count += len(channels)
+    return count / (time.time() - begin)
+
+def main():
+    seconds = DEFAULT_SECONDS
+    if len(sys.argv) > 1:
+        seconds = float(sys.argv[1])
+
+    print "%-10s %14s" % ("method", "samples/s")
+    for method, receive in [ ("eval", legacy_receive),
+                             ("compiled", compiled_receive) ]:
+        print "%-10s %14.0f" % (method, bench(receive, seconds))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, Digi International (Digi). All Rights Reserved.       #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice, and the following   #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+
+"""\
+Benchmark of CCR document generation.
+
+Streams CCR documents of 10k, 100k and 1M samples through a CCRWriter
+into a sink that only counts bytes, and builds the 10k and 100k
+documents as strings with CCR_gen(), reporting samples per second.
+
+To run this, use command line from the project directory:
+    python tools/benchmarks/ccr_creator_bench.py [sample counts...]
+"""
+
+# imports
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'lib'))
+
+from python_ccr_creator import CCRWriter, CCR_gen
+from samples.sample import Sample
+
+# constants
+DEFAULT_SAMPLE_COUNTS = [ 10000, 100000, 1000000 ]
+
+# CCR_gen() holds the whole document in memory, skip it for large counts:
+MAX_STRING_SAMPLES = 100000
+
+CHANNELS = [ ("ecg0.ecg", "mV"), ("spo2.spo2", "%"), ("spo2.pulse", "bpm") ]
+
+# internal functions & classes
+
+class CountingSink:
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, data):
+        self.bytes += len(data)
+
+def make_samples(count):
+    # 250 Hz, as from an ECG channel
+    start = time.time() - count / 250.0
+    samples = {}
+    for i in xrange(count):
+        name, unit = CHANNELS[i % len(CHANNELS)]
+        samples[i] = (Sample(start + i / 250.0, i % 512, unit), name)
+    return samples
+
+def bench_writer(samples):
+    sink = CountingSink()
+    begin = time.time()
+    writer = CCRWriter(sink, "John Smith", "1970-1-1")
+    writer.start()
+    for i in xrange(len(samples)):
+        sample, name = samples[i]
+        writer.add_sample(sample, name)
+    writer.finish()
+    return time.time() - begin, sink.bytes
+
+def bench_string(samples):
+    begin = time.time()
+    ccr, ccr_id = CCR_gen("John Smith", "1970-1-1", samples)
+    return time.time() - begin, len(ccr)
+
+def main():
+    counts = DEFAULT_SAMPLE_COUNTS
+    if len(sys.argv) > 1:
+        counts = [ int(arg) for arg in sys.argv[1:] ]
+
+    print "%-10s %-10s %14s %12s" % ("samples", "method", "samples/s", "MB")
+    for count in counts:
+        samples = make_samples(count)
+        methods = [ ("writer", bench_writer) ]
+        if count <= MAX_STRING_SAMPLES:
+            methods.append(("CCR_gen", bench_string))
+        for method, fn in methods:
+            span, size = fn(samples)
+            print "%-10d %-10s %14.0f %12.1f" % (count, method, count / span,
+                                                 size / 1048576.0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, Digi International (Digi). All Rights Reserved.       #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice, and the following   #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+
+"""\
+Benchmark of ChannelPublisher sample notification.
+
+Creates a number of channels, each with one synchronous subscriber,
+and reports how many new sample notifications per second the
+publisher delivers as the number of channels grows.
+
+To run this, use command line from the project directory:
+    python tools/benchmarks/channel_publisher_bench.py [notifications]
+"""
+
+# imports
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'lib'))
+
+from channels.channel import Channel
+from channels.channel_publisher import ChannelPublisher
+from channels.channel_source_device_property import \
+    ChannelSourceDeviceProperty, DPROP_PERM_GET, DPROP_PERM_SET, \
+    DPROP_OPT_AUTOTIMESTAMP
+from samples.sample import Sample
+
+# constants
+DEFAULT_NOTIFICATIONS = 50000
+CHANNEL_COUNTS = [ 1, 10, 100, 1000 ]
+
+# internal functions & classes
+
+class CoreServicesStub:
+    def get_service(self, name):
+        return None
+
+def subscriber(channel):
+    pass
+
+def bench_channels(channel_count, notifications):
+    cp = ChannelPublisher(CoreServicesStub())
+    channels = []
+    for i in xrange(channel_count):
+        source = ChannelSourceDeviceProperty(name="channel%d" % i,
+                    type=int, initial=Sample(0, i),
+                    perms_mask=DPROP_PERM_GET | DPROP_PERM_SET,
+                    options=DPROP_OPT_AUTOTIMESTAMP)
+        channel = Channel("bench.channel%d" % i, source)
+        cp.subscribe(channel.name(), subscriber)
+        channels.append(channel)
+
+    notify = cp.new_sample_cb
+    rounds = max(1, notifications // channel_count)
+    begin = time.time()
+    for i in xrange(rounds):
+        for channel in channels:
+            notify(channel)
+    span = time.time() - begin
+
+    return rounds * channel_count / span
+
+def main():
+    notifications = DEFAULT_NOTIFICATIONS
+    if len(sys.argv) > 1:
+        notifications = int(sys.argv[1])
+
+    print "%-10s %18s" % ("channels", "notifications/s")
+    for channel_count in CHANNEL_COUNTS:
+        print "%-10d %18.0f" % (channel_count,
+                                bench_channels(channel_count, notifications))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, Digi International (Digi). All Rights Reserved.       #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice, and the following   #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+
+"""\
+Benchmark of channel database dumps.
+
+Dumps every channel the way the presentations used to (sorted
+channel_list(), then channel_get() and get() per channel) and with
+ChannelDatabase.snapshot(), while a few channels change between dumps.
+Reports dumps per second as the number of channels grows.
+
+To run this, use command line from the project directory:
+    python tools/benchmarks/channel_snapshot_bench.py [seconds per case]
+"""
+
+# imports
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'lib'))
+
+from channels.channel import Channel
+from channels.channel_publisher import ChannelPublisher
+from channels.channel_source_device_property import \
+    ChannelSourceDeviceProperty, DPROP_PERM_GET, DPROP_PERM_SET, \
+    DPROP_OPT_AUTOTIMESTAMP
+from samples.sample import Sample
+
+# constants
+DEFAULT_SECONDS = 2.0
+CHANNEL_COUNTS = [ 10, 100, 1000 ]
+CHANGES_PER_DUMP = 5
+
+# internal functions & classes
+
+class CoreServicesStub:
+    def get_service(self, name):
+        return None
+
+class ChannelDatabaseStub:
+    def __init__(self, channel_publisher):
+        self.channels = {}
+        self.publisher = channel_publisher
+
+    def channel_list(self):
+        return [cn for cn in self.channels]
+
+    def channel_get(self, channel_name):
+        return self.channels[channel_name]
+
+    def snapshot(self, prefix=None, since=None):
+        return self.publisher.snapshot(prefix, since)
+
+def make_database(channel_count):
+    cdb = ChannelDatabaseStub(ChannelPublisher(CoreServicesStub()))
+    for i in xrange(channel_count):
+        source = ChannelSourceDeviceProperty(name="channel%d" % i,
+                    type=int, initial=Sample(0, i),
+                    perms_mask=DPROP_PERM_GET | DPROP_PERM_SET,
+                    options=DPROP_OPT_AUTOTIMESTAMP)
+        channel = Channel("device%d.channel%d" % (i % 10, i), source)
+        cdb.channels[channel.name()] = channel
+        cdb.publisher.new_channel(channel)
+    return cdb
+
+def dump_legacy(cdb):
+    channel_list = cdb.channel_list()
+    channel_list.sort()
+    rows = []
+    for channel_name in channel_list:
+        sample = cdb.channel_get(channel_name).get()
+        rows.append((channel_name, sample.value))
+    return rows
+
+def dump_snapshot(cdb):
+    rows = []
+    for entry in cdb.snapshot():
+        rows.append((entry.name, entry.sample.value))
+    return rows
+
+def bench(cdb, dump, seconds):
+    channels = cdb.channels.values()
+    count = 0
+    begin = time.time()
+    while time.time() - begin < seconds:
+        for i in xrange(CHANGES_PER_DUMP):
+            channels[(count + i) % len(channels)].producer_set(
+                Sample(0, count))
+        dump(cdb)
+        count += 1
+    return count / (time.time() - begin)
+
+def main():
+    seconds = DEFAULT_SECONDS
+    if len(sys.argv) > 1:
+        seconds = float(sys.argv[1])
+
+    print "%-10s %-12s %10s" % ("channels", "method", "dumps/s")
+    for channel_count in CHANNEL_COUNTS:
+        cdb = make_database(channel_count)
+        for method, dump in [ ("per-channel", dump_legacy),
+                              ("snapshot", dump_snapshot) ]:
+            print "%-10d %-12s %10.0f" % (channel_count, method,
+                                          bench(cdb, dump, seconds))
+
+if __name__ == '__main__':
+    main()
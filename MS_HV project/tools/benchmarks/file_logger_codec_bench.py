@@ -0,0 +1,97 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, Digi International (Digi). All Rights Reserved.       #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice, and the following   #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+"""\
+Benchmark of the FileLogger sample serialization formats.
+
+Serializes and parses a mix of typical sample values with the pickle
+based format version 0 and the compact format version 1, reporting
+events per second and bytes per NEW_SAMPLE event for each.
+
+To run this, use command line from the project directory:
+    python tools/benchmarks/file_logger_codec_bench.py [iterations]
+"""
+
+# imports
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'lib'))
+
+from channels.logging.file_logger.file_logger_storage_manager import \
+    SAMPLE_FORMATTERS, EVENT_HEADER_SIZE, CHANNEL_OFF_SIZE
+from common.types.boolean import Boolean
+
+# constants
+DEFAULT_ITERATIONS = 20000
+
+# Representative sample values: vital sign readings, counters, status
+# flags and short strings.
+VALUES = [ 72, 98.6, 1234567, -12, True, Boolean(False), "OK",
+           u"normal", 0.0, 3.14159 ]
+UNIT_OFF = 0x2a3f
+TIMESTAMP = int(time.time())
+
+# internal functions & classes
+
+def bench_version(version, iterations):
+    format_fn, parse_fn = SAMPLE_FORMATTERS[version]
+    values = VALUES * (iterations // len(VALUES))
+    event_overhead = EVENT_HEADER_SIZE + CHANNEL_OFF_SIZE
+
+    begin = time.time()
+    encoded = [ format_fn(UNIT_OFF, TIMESTAMP, v) for v in values ]
+    encode_span = time.time() - begin
+
+    begin = time.time()
+    for data in encoded:
+        parse_fn(data, 0)
+    decode_span = time.time() - begin
+
+    total_bytes = 0
+    for data in encoded:
+        total_bytes += event_overhead + len(data)
+
+    return (len(values) / encode_span, len(values) / decode_span,
+            float(total_bytes) / len(values))
+
+def main():
+    iterations = DEFAULT_ITERATIONS
+    if len(sys.argv) > 1:
+        iterations = int(sys.argv[1])
+
+    print "%-10s %16s %16s %14s" % (
+        "format", "encode events/s", "decode events/s", "bytes/event")
+    for version in sorted(SAMPLE_FORMATTERS.keys()):
+        encode_rate, decode_rate, size = bench_version(version, iterations)
+        print "%-10s %16.0f %16.0f %14.1f" % (
+            "v%d" % version, encode_rate, decode_rate, size)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, Digi International (Digi). All Rights Reserved.       #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice, and the following   #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+"""\
+Benchmark of HealthVault request signing.
+
+Signs PutThings requests the way HealthVaultConn used to (hmac.new()
+per request from the bundled hmac module, header built by string
+concatenation) and with an HVSigner, one request at a time and in
+batches, for small and CCR sized payloads.  Reports signatures per
+second.
+
+To run this, use command line from the project directory:
+    python tools/benchmarks/hv_signing_bench.py [seconds per case]
+"""
+
+# imports
+import sys
+import os
+import time
+import base64
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..',
+                                'lib', 'healthvaultlib'))
+
+# the bundled hmac module imports the deprecated sha module:
+warnings.filterwarnings('ignore', category=DeprecationWarning)
+
+import hmac
+from hvsigner import HVSigner
+try:
+    from hashlib import sha1
+except:
+    from sha import sha as sha1
+
+# constants
+DEFAULT_SECONDS = 2.0
+BATCH_SIZE = 16
+
+SECRET = 'k9Vx2QmLr7TfZpA3cWdE1yHu'
+AUTH_TOKEN = 'ASAAAOv6vTgMZyVDkLrNEXAMPLETOKEN' * 8
+PERSON_ID = 'c3a3b8f2-2d34-4c6b-9c2e-1d2e3f4a5b6c'
+RECORD_ID = '7e4f9a1b-5c6d-4e8f-a0b1-c2d3e4f5a6b7'
+MSG_TIME = '2013-01-13T13:12:26.6310000Z'
+CCR_TYPE = '1e1ccbfc-a55d-4d91-8940-fa2fbf73c195'
+
+PAYLOADS = [ ("1 KB", 'x' * 1024), ("64 KB", 'x' * 65536) ]
+
+# internal functions & classes
+
+def info_for(data_xml):
+    return '<info><thing><type-id>' + CCR_TYPE + '</type-id><data-xml>' + \
+           data_xml + '</data-xml></thing></info>'
+
+def sign_legacy(info):
+    header = '<header><method>PutThings</method><method-version>1</method-version><record-id>' + RECORD_ID + '</record-id><auth-session><auth-token>' + AUTH_TOKEN + '</auth-token><offline-person-info><offline-person-id>' + PERSON_ID + '</offline-person-id></offline-person-info></auth-session><language>en</language><country>US</country><msg-time>' + MSG_TIME + '</msg-time><msg-ttl>36000</msg-ttl><version>0.0.0.1</version>'
+    infodigest = base64.encodestring(sha1(info).digest())
+    headerinfo = '<info-hash><hash-data algName="SHA1">' + infodigest.strip() + '</hash-data></info-hash>'
+    header = header + headerinfo + '</header>'
+    hashedheader = hmac.new(SECRET, header, 'sha1')
+    hashedheader64 = base64.encodestring(hashedheader.digest())
+    hauthxml = '<auth><hmac-data algName="HMACSHA1">' + hashedheader64.strip() + '</hmac-data></auth>'
+    return '<wc-request:request xmlns:wc-request="urn:com.microsoft.wc.request">' + hauthxml + header + info + '</wc-request:request>'
+
+def auth_session():
+    return '<auth-token>' + AUTH_TOKEN + '</auth-token><offline-person-info><offline-person-id>' + PERSON_ID + '</offline-person-id></offline-person-info>'
+
+def bench_legacy(info, seconds):
+    count = 0
+    begin = time.time()
+    while time.time() - begin < seconds:
+        for i in xrange(BATCH_SIZE):
+            sign_legacy(info)
+        count += BATCH_SIZE
+    return count / (time.time() - begin)
+
+def bench_signer(info, seconds):
+    signer = HVSigner(SECRET)
+    count = 0
+    begin = time.time()
+    while time.time() - begin < seconds:
+        for i in xrange(BATCH_SIZE):
+            signer.sign(signer.header_start('PutThings', RECORD_ID,
+                                            auth_session()),
+                        MSG_TIME, info)
+        count += BATCH_SIZE
+    return count / (time.time() - begin)
+
+def bench_batch(info, seconds):
+    signer = HVSigner(SECRET)
+    infos = [ info ] * BATCH_SIZE
+    count = 0
+    begin = time.time()
+    while time.time() - begin < seconds:
+        signer.sign_many(signer.header_start('PutThings', RECORD_ID,
+                                             auth_session()),
+                         MSG_TIME, infos)
+        count += BATCH_SIZE
+    return count / (time.time() - begin)
+
+def main():
+    seconds = DEFAULT_SECONDS
+    if len(sys.argv) > 1:
+        seconds = float(sys.argv[1])
+
+    print "%-8s %-12s %14s" % ("payload", "method", "signatures/s")
+    for label, data_xml in PAYLOADS:
+        info = info_for(data_xml)
+        for method, fn in [ ("hmac.new", bench_legacy),
+                            ("HVSigner", bench_signer),
+                            ("sign_many", bench_batch) ]:
+            print "%-8s %-12s %14.0f" % (label, method, fn(info, seconds))
+
+if __name__ == '__main__':
+    main()
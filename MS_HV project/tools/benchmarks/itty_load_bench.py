@@ -0,0 +1,151 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, Digi International (Digi). All Rights Reserved.       #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice, and the following   #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+
+"""\
+Load test of the itty web server adapters.
+
+Registers a page that answers at once and a page that waits as if on a
+HealthVault round trip, starts the 'wsgiref' and 'threadpool' servers on
+local ports and drives each with concurrent keep-alive clients.  One
+client in every CLIENTS keeps asking for the slow page.  Reports the
+requests per second and the p99 latency of the fast page.
+
+To run this, use command line from the project directory:
+    python tools/benchmarks/itty_load_bench.py [seconds per case]
+"""
+
+# imports
+import sys
+import os
+import time
+import threading
+import httplib
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'lib'))
+
+import itty
+
+# constants
+DEFAULT_SECONDS = 5.0
+CLIENTS = 8
+SLOW_CLIENTS = 1
+SLOW_SECONDS = 0.5
+HOST = '127.0.0.1'
+BASE_PORT = 18081
+
+# internal functions & classes
+
+@itty.get('/bench/fast')
+def fast_page(request):
+    return 'ok'
+
+@itty.get('/bench/slow')
+def slow_page(request):
+    time.sleep(SLOW_SECONDS)
+    return 'ok'
+
+@itty.get('/bench/(?P<name>\w+)/item')
+def pattern_page(request, name):
+    return name
+
+def start_server(server, port):
+    thread = threading.Thread(target=itty.WSGI_ADAPTERS[server],
+                              args=(HOST, port))
+    thread.setDaemon(True)
+    thread.start()
+
+    # wait until the server accepts connections:
+    while True:
+        try:
+            conn = httplib.HTTPConnection(HOST, port)
+            conn.request('GET', '/bench/fast')
+            conn.getresponse().read()
+            conn.close()
+            return
+        except Exception:
+            time.sleep(0.1)
+
+def client(port, path, deadline, latencies):
+    conn = httplib.HTTPConnection(HOST, port)
+    while time.time() < deadline:
+        begin = time.time()
+        try:
+            conn.request('GET', path)
+            conn.getresponse().read()
+        except Exception:
+            # the server closed the connection, start a new one:
+            conn.close()
+            conn = httplib.HTTPConnection(HOST, port)
+            continue
+        latencies.append(time.time() - begin)
+    conn.close()
+
+def bench_server(server, port, path, seconds):
+    start_server(server, port)
+
+    deadline = time.time() + seconds
+    latencies = []
+    threads = []
+    for i in xrange(CLIENTS):
+        if i < SLOW_CLIENTS:
+            args = (port, '/bench/slow', deadline, [])
+        else:
+            args = (port, path, deadline, latencies)
+        thread = threading.Thread(target=client, args=args)
+        thread.setDaemon(True)
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join()
+
+    latencies.sort()
+    if not latencies:
+        return 0.0, 0.0
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return len(latencies) / seconds, p99 * 1000.0
+
+def main():
+    seconds = DEFAULT_SECONDS
+    if len(sys.argv) > 1:
+        seconds = float(sys.argv[1])
+
+    # keep the wsgiref request log off the output:
+    from wsgiref.simple_server import WSGIRequestHandler
+    WSGIRequestHandler.log_message = lambda self, *args: None
+
+    print "%-12s %-20s %12s %12s" % ("server", "path", "requests/s", "p99 ms")
+    port = BASE_PORT
+    for server in [ 'wsgiref', 'threadpool' ]:
+        for path in [ '/bench/fast', '/bench/abc/item' ]:
+            rate, p99 = bench_server(server, port, path, seconds)
+            print "%-12s %-20s %12.0f %12.1f" % (server, path, rate, p99)
+            port += 1
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, Digi International (Digi). All Rights Reserved.       #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice, and the following   #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+
+
+"""\
+Benchmark of periodic device polling.
+
+Runs a number of drivers with a one second update_rate, first each
+with its own thread looping on time.sleep() as the drivers used to,
+then each as a PolledDeviceBase polled from one SchedAsync scheduler.
+It reports the threads alive, the wakeups per second (a sleeping
+thread returning, or the scheduler thread running a batch of polls),
+the polls per second and how late the polls started.
+
+To run this, use command line from the project directory:
+    python tools/benchmarks/polled_devices_bench.py [drivers] [seconds]
+"""
+
+# imports
+import sys
+import os
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'lib'))
+
+from common.sched_async import SchedAsync
+from devices.polled_device_base import PolledDeviceBase
+
+# constants
+DEFAULT_DRIVERS = 50
+DEFAULT_SECONDS = 10.0
+UPDATE_RATE = 1.0
+
+# internal functions & classes
+
+class CoreServicesStub:
+    def __init__(self):
+        self.services = {}
+
+    def set_service(self, name, service):
+        self.services[name] = service
+
+    def get_service(self, name):
+        return self.services.get(name)
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.times = []
+        self.late = []
+
+    def record(self, due):
+        now = time.time()
+        self.lock.acquire()
+        self.times.append(now)
+        if due is not None:
+            self.late.append(now - due)
+        self.lock.release()
+
+def work():
+    # stands for reading a value and setting a channel
+    return sum(xrange(200))
+
+class ThreadedDriver(threading.Thread):
+    def __init__(self, name, recorder):
+        threading.Thread.__init__(self, name=name)
+        threading.Thread.setDaemon(self, True)
+        self.recorder = recorder
+        self.stopevent = threading.Event()
+
+    def run(self):
+        due = time.time()
+        while not self.stopevent.isSet():
+            self.recorder.record(due)
+            work()
+            time.sleep(UPDATE_RATE)
+            due += UPDATE_RATE
+
+class PolledDriver(PolledDeviceBase):
+    def __init__(self, name, core, recorder):
+        self.__name = name
+        self.recorder = recorder
+        PolledDeviceBase.__init__(self, core)
+
+    def get_name(self):
+        return self.__name
+
+    def poll_interval(self):
+        return UPDATE_RATE
+
+    def poll(self):
+        self.recorder.record(None)
+        work()
+
+def bench_threads(drivers, seconds):
+    recorder = Recorder()
+    threads = [ ThreadedDriver("driver%d" % i, recorder)
+                for i in xrange(drivers) ]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    alive = threading.activeCount()
+    for thread in threads:
+        thread.stopevent.set()
+    # each loop iteration is a wakeup of its thread:
+    wakeups = len(recorder.times)
+    return alive, wakeups, recorder.times, recorder.late
+
+def bench_polled(drivers, seconds):
+    recorder = Recorder()
+    core = CoreServicesStub()
+    scheduler = SchedAsync("bench_scheduler", core)
+    core.set_service("scheduler", scheduler)
+    scheduler.start()
+    devices = [ PolledDriver("driver%d" % i, core, recorder)
+                for i in xrange(drivers) ]
+    for device in devices:
+        device.poll_start()
+    time.sleep(seconds)
+    alive = threading.activeCount()
+    for device in devices:
+        device.poll_stop()
+    scheduler.stop()
+    scheduler.join(1.0)
+
+    # polls run back to back in one pass of the scheduler share a wakeup:
+    wakeups = 0
+    last = None
+    for t in recorder.times:
+        if last is None or t - last > 0.002:
+            wakeups += 1
+        last = t
+    late = []
+    for device in devices:
+        late.append(device.poll_stats()['max_late'])
+    return alive, wakeups, recorder.times, late
+
+def main():
+    drivers = DEFAULT_DRIVERS
+    seconds = DEFAULT_SECONDS
+    if len(sys.argv) > 1:
+        drivers = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        seconds = float(sys.argv[2])
+
+    print "%d drivers, update_rate %.1fs, %.0fs per case" % (
+        drivers, UPDATE_RATE, seconds)
+    print "%-18s %8s %10s %8s %12s" % ("method", "threads", "wakeups/s",
+                                        "polls/s", "max late ms")
+    for method, fn in [ ("thread per driver", bench_threads),
+                        ("PolledDeviceBase", bench_polled) ]:
+        alive, wakeups, times, late = fn(drivers, seconds)
+        print "%-18s %8d %10.1f %8.1f %12.1f" % (
+            method, alive, wakeups / seconds, len(times) / seconds,
+            max(late or [0.0]) * 1000.0)
+
+if __name__ == '__main__':
+    main()
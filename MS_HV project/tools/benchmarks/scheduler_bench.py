@@ -0,0 +1,134 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, Digi International (Digi). All Rights Reserved.       #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice, and the following   #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+
+
+"""\
+Benchmark of the digi_sched scheduler.
+
+Keeps a queue of pending timers, as XBee drivers do with a few timers
+per node, and measures how many timers per second can be scheduled
+and canceled again, next to the old queue (cancel by list.remove()
+and heapify()).  Then runs a 50ms periodic event on SchedAsync with a
+500ms action which blocks, run inline and on the blocking worker
+pool, and reports how late the periodic event fired.
+
+To run this, use command line from the project directory:
+    python tools/benchmarks/scheduler_bench.py [seconds per case]
+"""
+
+# imports
+import sys
+import os
+import heapq
+from collections import deque
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'lib'))
+
+import digi_sched
+from common.sched_async import SchedAsync
+
+# constants
+DEFAULT_SECONDS = 2.0
+DEPTHS = [ 100, 1000, 10000 ]
+
+# internal functions & classes
+
+class LegacyScheduler:
+    def __init__(self):
+        self.queue = []
+
+    def enter(self, delay, priority, action, argument):
+        event = time.time() + delay, priority, action, argument
+        heapq.heappush(self.queue, event)
+        return event
+
+    def cancel(self, event):
+        self.queue.remove(event)
+        heapq.heapify(self.queue)
+
+def nothing():
+    pass
+
+def bench_cancel(sched, depth, seconds):
+    pending = deque([ sched.enter(3600 + i, 8, nothing, ())
+                      for i in xrange(depth) ])
+    timers = 0
+    begin = time.time()
+    while time.time() - begin < seconds:
+        for i in xrange(100):
+            # reschedule the oldest timer, as a retry timer is:
+            sched.cancel(pending.popleft())
+            pending.append(sched.enter(3600, 8, nothing, ()))
+        timers += 100
+    return timers / (time.time() - begin)
+
+def bench_blocking(blocking, seconds):
+    sched = SchedAsync("bench_scheduler")
+    sched.start()
+    handle = sched.schedule_periodic(0.05, nothing)
+    def block():
+        time.sleep(0.5)
+    if blocking:
+        schedule = sched.schedule_blocking_after
+    else:
+        schedule = sched.schedule_after
+    begin = time.time()
+    while time.time() - begin < seconds:
+        schedule(0, block)
+        time.sleep(1.0)
+    sched.cancel(handle)
+    stats = sched.stats()
+    sched.stop()
+    sched.join(1.0)
+    return stats
+
+def main():
+    seconds = DEFAULT_SECONDS
+    if len(sys.argv) > 1:
+        seconds = float(sys.argv[1])
+
+    print "%-8s %16s %16s" % ("timers", "old timers/s", "new timers/s")
+    for depth in DEPTHS:
+        print "%-8d %16.0f %16.0f" % (
+            depth, bench_cancel(LegacyScheduler(), depth, seconds),
+            bench_cancel(digi_sched.scheduler(), depth, seconds))
+
+    print
+    print "%-18s %8s %12s %12s" % ("500ms action", "fired",
+                                   "late avg ms", "late max ms")
+    for method, blocking in [ ("schedule_after", False),
+                              ("blocking pool", True) ]:
+        stats = bench_blocking(blocking, max(seconds, 3.0))
+        print "%-18s %8d %12.1f %12.1f" % (
+            method, stats['fired'], stats['late_avg'] * 1000.0,
+            stats['late_max'] * 1000.0)
+
+if __name__ == '__main__':
+    main()
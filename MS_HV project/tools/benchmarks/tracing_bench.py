@@ -0,0 +1,96 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, Digi International (Digi). All Rights Reserved.       #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice, and the following   #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+
+"""\
+Benchmark of the per-call overhead of core.tracing.
+
+Reports the cost in microseconds of a trace call suppressed by the
+Tracer's level, of one suppressed by a level filter, of an
+is_enabled_for() guard, and of a call that is written out to a
+handler discarding its output.
+
+To run this, use command line from the project directory:
+    python tools/benchmarks/tracing_bench.py [calls]
+"""
+
+# imports
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'lib'))
+
+from core.tracing import Tracer, Filter, LEVELS
+
+# constants
+DEFAULT_CALLS = 100000
+
+# internal functions & classes
+
+class NullHandler:
+    def write(self, trace_event):
+        str(trace_event)
+
+def time_calls(fn, calls):
+    begin = time.time()
+    for i in xrange(calls):
+        fn("sample %d on channel %s", i, "device.channel")
+    return (time.time() - begin) * 1e6 / calls
+
+def main():
+    calls = DEFAULT_CALLS
+    if len(sys.argv) > 1:
+        calls = int(sys.argv[1])
+
+    handlers = [ NullHandler() ]
+    by_level = Tracer("bench", LEVELS['WARNING'], handlers, None)
+    level_filter = Filter(">=warning", None, None, True)
+    by_filter = Tracer("bench", LEVELS['NOTSET'], handlers, [ level_filter ])
+
+    guarded = getattr(by_level, "is_enabled_for", None)
+    if guarded is not None:
+        debug = LEVELS['DEBUG']
+        def guard(msg, *args):
+            if by_level.is_enabled_for(debug):
+                by_level.debug(msg, *args)
+    else:
+        guard = None
+
+    results = [ ("suppressed by level", time_calls(by_level.debug, calls)),
+                ("suppressed by filter", time_calls(by_filter.debug, calls)) ]
+    if guard is not None:
+        results.append(("is_enabled_for guard", time_calls(guard, calls)))
+    results.append(("written to handler", time_calls(by_level.warning, calls)))
+
+    print "%-24s %12s" % ("trace call", "us/call")
+    for name, us in results:
+        print "%-24s %12.2f" % (name, us)
+
+if __name__ == '__main__':
+    main()
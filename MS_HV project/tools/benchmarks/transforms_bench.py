@@ -0,0 +1,163 @@
+############################################################################
+#                                                                          #
+# Copyright (c)2008, Digi International (Digi). All Rights Reserved.       #
+#                                                                          #
+# Permission to use, copy, modify, and distribute this software and its    #
+# documentation, without fee and without a signed licensing agreement, is  #
+# hereby granted, provided that the software is used on Digi products only #
+# and that the software contain this copyright notice, and the following   #
+# two paragraphs appear in all copies, modifications, and distributions as #
+# well. Contact Product Management, Digi International, Inc., 11001 Bren   #
+# Road East, Minnetonka, MN, +1 952-912-3444, for commercial licensing     #
+# opportunities for non-Digi products.                                     #
+#                                                                          #
+# DIGI SPECIFICALLY DISCLAIMS ANY WARRANTIES, INCLUDING, BUT NOT LIMITED   #
+# TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A          #
+# PARTICULAR PURPOSE. THE SOFTWARE AND ACCOMPANYING DOCUMENTATION, IF ANY, #
+# PROVIDED HEREUNDER IS PROVIDED "AS IS" AND WITHOUT WARRANTY OF ANY KIND. #
+# DIGI HAS NO OBLIGATION TO PROVIDE MAINTENANCE, SUPPORT, UPDATES,         #
+# ENHANCEMENTS, OR MODIFICATIONS.                                          #
+#                                                                          #
+# IN NO EVENT SHALL DIGI BE LIABLE TO ANY PARTY FOR DIRECT, INDIRECT,      #
+# SPECIAL, INCIDENTAL, OR CONSEQUENTIAL DAMAGES, INCLUDING LOST PROFITS,   #
+# ARISING OUT OF THE USE OF THIS SOFTWARE AND ITS DOCUMENTATION, EVEN IF   #
+# DIGI HAS BEEN ADVISED OF THE POSSIBILITY OF SUCH DAMAGES.                #
+#                                                                          #
+############################################################################
+
+
+"""\
+Benchmark of TransformsDevice evaluation.
+
+Runs a TransformsDevice with a transform of four input channels and a
+second transform using the first one.  Each round updates all four
+inputs and runs the scheduler once.  It reports rounds per second and
+transform evaluations per round, next to the cost of the old
+evaluation (globals() copied into a fresh namespace, the expression
+string eval()ed and every input looked up with channel_get() on each
+input update).
+
+To run this, use command line from the project directory:
+    python tools/benchmarks/transforms_bench.py [seconds per case]
+"""
+
+# imports
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'lib'))
+
+from channels.channel_manager import ChannelManager
+from channels.channel_source_device_property import \
+    ChannelSourceDeviceProperty, DPROP_PERM_GET
+from samples.sample import Sample
+from settings.settings_base import SettingsBase
+from devices.transforms_device import TransformsDevice
+
+# constants
+DEFAULT_SECONDS = 2.0
+INPUTS = [ "in.a", "in.b", "in.c", "in.d" ]
+EXPR = "(c[0] + c[1] + c[2] + c[3]) / 4.0"
+
+# internal functions & classes
+
+class SchedulerStub:
+    def __init__(self):
+        self.queue = []
+
+    def schedule_after(self, delay, action, *args):
+        self.queue.append((action, args))
+
+    def run_pending(self):
+        queue, self.queue = self.queue, []
+        for action, args in queue:
+            action(*args)
+
+class CoreServicesStub:
+    def __init__(self):
+        self.services = {}
+
+    def set_service(self, name, service):
+        self.services[name] = service
+
+    def get_service(self, name):
+        return self.services.get(name)
+
+def make_device():
+    core = CoreServicesStub()
+    sched = SchedulerStub()
+    core.set_service("scheduler", sched)
+    cm = ChannelManager(core)
+    cdb = cm.channel_database_get()
+    for channel_name in INPUTS:
+        cdb.channel_add(channel_name, ChannelSourceDeviceProperty(
+            name=channel_name.split('.')[1], type=float,
+            initial=Sample(0, 1.0), perms_mask=DPROP_PERM_GET, options=0))
+
+    SettingsBase._settings_global_pending_registry['devices'] = {
+        'instance_list': [ { 'name': 'bench', 'settings': {
+            'instance_list': [
+                dict(name='mean', channels=INPUTS, expr=EXPR),
+                dict(name='scaled', channels=['bench.mean'],
+                     expr='c[0] * 1.8 + 32'),
+            ] } } ] }
+    device = TransformsDevice('bench', core)
+    device.start()
+    sched.run_pending()
+    return cdb, sched, device
+
+def legacy_eval(cdb, expr):
+    c = []
+    for channel_name in INPUTS:
+        c.append(cdb.channel_get(channel_name).get().value)
+    eval_ns = { }
+    eval_ns.update(globals())
+    eval_ns["c"] = c
+    return eval(expr, eval_ns)
+
+def bench_legacy(seconds):
+    cdb, sched, device = make_device()
+    rounds = 0
+    begin = time.time()
+    while time.time() - begin < seconds:
+        # each input update evaluated both transforms:
+        for i in xrange(len(INPUTS)):
+            legacy_eval(cdb, EXPR)
+            legacy_eval(cdb, 'c[0] * 1.8 + 32')
+        rounds += 1
+    return rounds / (time.time() - begin), 2 * len(INPUTS)
+
+def bench_device(seconds):
+    cdb, sched, device = make_device()
+    channels = [ cdb.channel_get(channel_name) for channel_name in INPUTS ]
+    evaluations = [ 0 ]
+    property_set = device.property_set
+    def counting_property_set(name, sample):
+        evaluations[0] += 1
+        property_set(name, sample)
+    device.property_set = counting_property_set
+
+    rounds = 0
+    begin = time.time()
+    while time.time() - begin < seconds:
+        for channel in channels:
+            channel.producer_set(Sample(0, float(rounds)))
+        sched.run_pending()
+        rounds += 1
+    return rounds / (time.time() - begin), evaluations[0] / float(rounds)
+
+def main():
+    seconds = DEFAULT_SECONDS
+    if len(sys.argv) > 1:
+        seconds = float(sys.argv[1])
+
+    print "%-18s %10s %18s" % ("method", "rounds/s", "evaluations/round")
+    for method, fn in [ ("eval per update", bench_legacy),
+                        ("TransformsDevice", bench_device) ]:
+        rate, evaluations = fn(seconds)
+        print "%-18s %10.0f %18.1f" % (method, rate, evaluations)
+
+if __name__ == '__main__':
+    main()